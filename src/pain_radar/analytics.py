@@ -0,0 +1,232 @@
+"""Weekly trend aggregations over live and archived signals, run by DuckDB.
+
+TrendEngine gives DuckDB one ``signals`` relation covering the SQLite database
+and every archived Parquet file (see archive.py), then runs grouped
+aggregations on it in DuckDB's columnar engine. Only the handful of columns
+the trends need are read.
+
+SQLite is attached through DuckDB's sqlite extension, so its rows never pass
+through Python. Where the extension can't be installed (e.g. offline), the
+needed columns are copied into DuckDB through Arrow instead.
+
+Needs duckdb and pyarrow: ``pip install 'pain-radar[analytics]'``.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import closing
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .archive import archived_files
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Columns the trend queries use, from signals joined to their posts
+_LIVE_SIGNALS = """
+SELECT p.subreddit, p.created_utc AS post_created_utc, i.total_score, i.disqualified, i.distribution_wedge
+FROM {prefix}signals i
+JOIN {prefix}posts p ON p.id = i.post_id
+"""
+
+_COLUMNS = "subreddit, post_created_utc, total_score, disqualified, distribution_wedge"
+
+# Aggregations by name; each gets the filtered rows as "s" with a "week" column
+METRICS = {
+    # Signals per subreddit per week
+    "signals": """
+        SELECT week, subreddit, COUNT(*) AS signals,
+               COUNT(*) FILTER (WHERE disqualified = 0) AS qualified,
+               ROUND(AVG(total_score) FILTER (WHERE disqualified = 0), 2) AS avg_score
+        FROM s
+        GROUP BY week, subreddit
+        ORDER BY week, signals DESC, subreddit
+    """,
+    # Distribution of qualified signals' scores per week
+    "scores": """
+        SELECT week, COUNT(*) AS signals, MIN(total_score) AS min,
+               quantile_cont(total_score, 0.25) AS p25, median(total_score) AS median,
+               quantile_cont(total_score, 0.75) AS p75, quantile_cont(total_score, 0.9) AS p90,
+               MAX(total_score) AS max
+        FROM s
+        WHERE disqualified = 0
+        GROUP BY week
+        ORDER BY week
+    """,
+    # Qualified signals per distribution wedge per week
+    "wedges": """
+        SELECT week, COALESCE(distribution_wedge, 'none') AS wedge, COUNT(*) AS signals
+        FROM s
+        WHERE disqualified = 0
+        GROUP BY ALL
+        ORDER BY week, signals DESC, wedge
+    """,
+}
+
+
+def _import_duckdb():
+    try:
+        import duckdb
+    except ImportError as e:
+        raise ImportError("Trend analytics require duckdb: pip install 'pain-radar[analytics]'") from e
+    return duckdb
+
+
+def _sql_string(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+class TrendEngine:
+    """DuckDB connection over a SQLite database and its Parquet archive."""
+
+    def __init__(self, db_path: str, archive_dir: str | None = None):
+        """Initialize the engine.
+
+        Args:
+            db_path: Path to the SQLite database
+            archive_dir: Archive directory to include (None = live data only)
+        """
+        self.db_path = db_path
+        self.archive_dir = archive_dir
+        self._con = None
+
+    def __enter__(self) -> TrendEngine:
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Connect DuckDB and define the signals relation."""
+        duckdb = _import_duckdb()
+        self._con = duckdb.connect()
+        # Weeks start on Monday in UTC, whatever the server's zone
+        self._con.execute("SET TimeZone = 'UTC'")
+        live = self._attach_live(duckdb)
+
+        files = archived_files(self.archive_dir, "signals") if self.archive_dir else []
+        if files:
+            # DDL can't take parameters, so the file list is inlined as literals
+            paths = ", ".join(_sql_string(str(f)) for f in files)
+            archived = f"SELECT {_COLUMNS} FROM read_parquet([{paths}], union_by_name = true)"
+            self._con.execute(f"CREATE VIEW signals AS {live} UNION ALL BY NAME {archived}")
+        else:
+            self._con.execute(f"CREATE VIEW signals AS {live}")
+
+    def _attach_live(self, duckdb) -> str:
+        """Make the SQLite data queryable and return a SELECT over it."""
+        try:
+            self._con.execute("INSTALL sqlite")
+            self._con.execute("LOAD sqlite")
+            self._con.execute(f"ATTACH {_sql_string(self.db_path)} AS live (TYPE sqlite, READ_ONLY)")
+            return _LIVE_SIGNALS.format(prefix="live.")
+        except duckdb.Error as e:
+            logger.warning("duckdb_sqlite_unavailable", error=str(e)[:200])
+
+        import pyarrow as pa
+
+        with closing(sqlite3.connect(f"file:{Path(self.db_path).resolve()}?mode=ro", uri=True)) as conn:
+            cursor = conn.execute(_LIVE_SIGNALS.format(prefix=""))
+            schema = pa.schema(
+                [
+                    ("subreddit", pa.string()),
+                    ("post_created_utc", pa.int64()),
+                    ("total_score", pa.int64()),
+                    ("disqualified", pa.int64()),
+                    ("distribution_wedge", pa.string()),
+                ]
+            )
+            batches = []
+            while rows := cursor.fetchmany(50_000):
+                columns = [
+                    pa.array(values, type=field.type)
+                    for values, field in zip(zip(*rows, strict=True), schema, strict=True)
+                ]
+                batches.append(pa.RecordBatch.from_arrays(columns, schema=schema))
+            table = pa.Table.from_batches(batches, schema=schema)
+        self._con.register("live_signals_arrow", table)
+        self._con.execute("CREATE TABLE live_signals AS SELECT * FROM live_signals_arrow")
+        self._con.unregister("live_signals_arrow")
+        return f"SELECT {_COLUMNS} FROM live_signals"
+
+    def close(self) -> None:
+        """Close the DuckDB connection."""
+        if self._con is not None:
+            self._con.close()
+            self._con = None
+
+    def query(self, metric: str, weeks: int = 12, subreddit: str | None = None) -> list[dict]:
+        """Run one trend aggregation.
+
+        Args:
+            metric: Name from METRICS ("signals", "scores" or "wedges")
+            weeks: How many weeks back from now, by post creation time
+            subreddit: Only this subreddit
+
+        Returns:
+            One dict per row; "week" is the ISO date of the week's Monday
+
+        Raises:
+            ValueError: If the metric is unknown
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric {metric!r}: choose from {', '.join(METRICS)}")
+        if self._con is None:
+            self.open()
+
+        since = int((datetime.now(UTC) - timedelta(weeks=weeks)).timestamp())
+        conditions = ["post_created_utc >= ?"]
+        params: list[Any] = [since]
+        if subreddit:
+            conditions.append("subreddit = ?")
+            params.append(subreddit)
+
+        cursor = self._con.execute(
+            f"""
+            WITH s AS (
+                SELECT *, CAST(date_trunc('week', to_timestamp(post_created_utc)) AS DATE) AS week
+                FROM signals
+                WHERE {" AND ".join(conditions)}
+            )
+            {METRICS[metric]}
+            """,
+            params,
+        )
+        names = [d[0] for d in cursor.description]
+        return [
+            {
+                name: value.isoformat() if isinstance(value, date) else value
+                for name, value in zip(names, row, strict=True)
+            }
+            for row in cursor.fetchall()
+        ]
+
+
+def trends(
+    db_path: str,
+    metric: str,
+    weeks: int = 12,
+    subreddit: str | None = None,
+    archive_dir: str | None = None,
+) -> list[dict]:
+    """Run one trend aggregation with a short-lived engine.
+
+    Args:
+        db_path: Path to the SQLite database
+        metric: Name from METRICS
+        weeks: How many weeks back from now
+        subreddit: Only this subreddit
+        archive_dir: Archive directory to include
+
+    Returns:
+        Rows as dicts (see TrendEngine.query)
+
+    Raises:
+        ValueError: If the metric is unknown
+    """
+    with TrendEngine(db_path, archive_dir=archive_dir) as engine:
+        return engine.query(metric, weeks=weeks, subreddit=subreddit)
@@ -1,13 +1,30 @@
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
 
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from ...analytics import trends
 from ...config import get_settings
-from ...store import AsyncStore
+from ...query import QuerySyntaxError
+from ...store import AsyncStore, PostgresStore
+from ...store.core import SIGNAL_SUMMARY_FIELDS
 
 router = APIRouter()
 settings = get_settings()
 
 
+# Shared across requests: the pool outlives them and lends each a connection
+_postgres_store: PostgresStore | None = None
+
+
 async def get_store():
+    global _postgres_store
+    if settings.database_url:
+        if _postgres_store is None:
+            _postgres_store = PostgresStore(settings.database_url)
+            await _postgres_store.connect()
+        yield _postgres_store
+        return
+
     store = AsyncStore(settings.db_path)
     await store.connect()
     try:
@@ -17,12 +34,43 @@ async def get_store():
 
 
 @router.get("/signals", response_model=list[dict])
-async def list_signals(limit: int = 10, store: AsyncStore = Depends(get_store)):
-    """List recent pain signals."""
-    signals = await store.get_top_signals(limit=limit)
+async def list_signals(
+    response: Response,
+    limit: int = Query(10, ge=1, le=100),
+    cursor: str | None = None,
+    fields: str | None = None,
+    store: AsyncStore = Depends(get_store),
+):
+    """List top pain signals, one page at a time.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` for the next
+    page; ``fields`` is a comma-separated column list (default: summary columns).
+    """
+    columns = [f.strip() for f in fields.split(",") if f.strip()] if fields else SIGNAL_SUMMARY_FIELDS
+    try:
+        signals, next_cursor = await store.get_signals_page(limit=limit, after=cursor, fields=columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
     return signals
 
 
+@router.get("/signals/search", response_model=list[dict])
+async def search_signals(
+    q: str,
+    subreddit: str | None = None,
+    min_score: int | None = None,
+    limit: int = 20,
+    store: AsyncStore = Depends(get_store),
+):
+    """Full-text search over signals, best match first."""
+    try:
+        return await store.search_signals(q, subreddit=subreddit, min_score=min_score, limit=limit)
+    except QuerySyntaxError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
 @router.get("/signals/{signal_id}", response_model=dict)
 async def get_signal(signal_id: int, store: AsyncStore = Depends(get_store)):
     """Get a specific signal."""
@@ -30,3 +78,24 @@ async def get_signal(signal_id: int, store: AsyncStore = Depends(get_store)):
     if not signal:
         raise HTTPException(status_code=404, detail="Signal not found")
     return signal
+
+
+@router.get("/trends", response_model=list[dict])
+async def get_trends(
+    metric: str = "signals",
+    weeks: int = Query(12, ge=1, le=520),
+    subreddit: str | None = None,
+):
+    """Weekly aggregated series over live and archived signals.
+
+    ``metric`` is ``signals`` (per subreddit), ``scores`` (score distribution)
+    or ``wedges`` (per distribution wedge).
+    """
+    try:
+        return await asyncio.to_thread(
+            trends, settings.db_path, metric, weeks=weeks, subreddit=subreddit, archive_dir=settings.archive_dir
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except ImportError as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
@@ -0,0 +1,234 @@
+"""Cold storage for old posts and signals.
+
+``pain-radar db-archive`` moves posts older than a cutoff, with their
+signals, out of SQLite into Parquet files partitioned by month and subreddit:
+
+    <archive_dir>/posts/<YYYY-MM>/<subreddit>/part-<timestamp>.parquet
+    <archive_dir>/signals/<YYYY-MM>/<subreddit>/part-<timestamp>.parquet
+
+``manifest.json`` lists every file with its table, partition, row count and
+time range, so readers pick the files they need without listing directories.
+A partition's rows are deleted from SQLite only after its files and the
+manifest entry are written.
+
+Parquet support needs pyarrow: ``pip install 'pain-radar[archive]'``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from .logging_config import get_logger
+from .store import AsyncStore
+
+logger = get_logger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+ARCHIVE_TABLES = ("posts", "signals")
+
+_AGE = re.compile(r"(\d+)\s*([dw])")
+
+
+@dataclass
+class ArchiveResult:
+    """Outcome of one archive pass."""
+
+    partitions: int = 0
+    posts: int = 0
+    signals: int = 0
+    files: int = 0
+    bytes_written: int = 0
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet archives require pyarrow: pip install 'pain-radar[archive]'") from e
+    return pa, pq
+
+
+def parse_age(text: str) -> timedelta:
+    """Parse an age like "90d" or "12w".
+
+    Args:
+        text: Number followed by d (days) or w (weeks)
+
+    Returns:
+        The age as a timedelta
+
+    Raises:
+        ValueError: If the text is not a valid age
+    """
+    match = _AGE.fullmatch(text.strip().lower())
+    if not match:
+        raise ValueError(f"Invalid age {text!r}: use e.g. 90d or 12w")
+    count, unit = int(match.group(1)), match.group(2)
+    return timedelta(days=count) if unit == "d" else timedelta(weeks=count)
+
+
+def load_manifest(archive_dir: str | Path) -> dict:
+    """Load an archive's manifest (an empty one if there is no archive yet).
+
+    Args:
+        archive_dir: Archive directory
+
+    Returns:
+        Manifest dict with a "files" list
+    """
+    path = Path(archive_dir) / MANIFEST_FILE
+    if not path.exists():
+        return {"version": 1, "files": []}
+    return json.loads(path.read_text())
+
+
+def _save_manifest(archive_dir: Path, manifest: dict) -> None:
+    # Written next to the manifest and renamed over it, so readers never see half a file
+    path = archive_dir / MANIFEST_FILE
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp, path)
+
+
+def archived_files(
+    archive_dir: str | Path,
+    table: str,
+    since_month: str | None = None,
+    subreddit: str | None = None,
+) -> list[Path]:
+    """List archive files of a table, optionally narrowed by partition.
+
+    Args:
+        archive_dir: Archive directory
+        table: "posts" or "signals"
+        since_month: Only months from this one on ("YYYY-MM")
+        subreddit: Only this subreddit
+
+    Returns:
+        Paths of matching Parquet files, oldest month first
+    """
+    archive_dir = Path(archive_dir)
+    entries = [
+        entry
+        for entry in load_manifest(archive_dir)["files"]
+        if entry["table"] == table
+        and (since_month is None or entry["month"] >= since_month)
+        and (subreddit is None or entry["subreddit"] == subreddit)
+    ]
+    return [archive_dir / entry["path"] for entry in sorted(entries, key=lambda e: (e["month"], e["path"]))]
+
+
+def read_archive(
+    archive_dir: str | Path,
+    table: str,
+    since_month: str | None = None,
+    subreddit: str | None = None,
+) -> list[dict]:
+    """Read archived rows back, for reports that reach past the live database.
+
+    Args:
+        archive_dir: Archive directory
+        table: "posts" or "signals"
+        since_month: Only months from this one on ("YYYY-MM")
+        subreddit: Only this subreddit
+
+    Returns:
+        Row dicts, in the shape they had in SQLite
+    """
+    files = archived_files(archive_dir, table, since_month=since_month, subreddit=subreddit)
+    if not files:
+        return []
+    pa, pq = _import_pyarrow()
+    # Columns that were all null in one file are typed null there; promotion unifies them
+    return pa.concat_tables([pq.read_table(f) for f in files], promote_options="default").to_pylist()
+
+
+def _write_parquet(pa, pq, rows: list[dict], path: Path) -> int:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".parquet.tmp")
+    pq.write_table(pa.Table.from_pylist(rows), tmp, compression="zstd")
+    os.replace(tmp, path)
+    return path.stat().st_size
+
+
+async def archive_older_than(
+    store: AsyncStore,
+    archive_dir: str | Path,
+    older_than: timedelta,
+    vacuum: bool = True,
+) -> ArchiveResult:
+    """Move posts older than a cutoff, and their signals, to Parquet.
+
+    Partitions are archived one at a time, so memory is bounded by the
+    largest month of one subreddit.
+
+    Args:
+        store: Connected store
+        archive_dir: Archive directory (created if missing)
+        older_than: Posts created longer ago than this are archived
+        vacuum: Return the freed pages to the OS afterwards
+
+    Returns:
+        ArchiveResult with counts
+    """
+    pa, pq = _import_pyarrow()
+    archive_dir = Path(archive_dir)
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest(archive_dir)
+
+    before_utc = int((datetime.now(UTC) - older_than).timestamp())
+    result = ArchiveResult()
+
+    for partition in await store.get_archive_partitions(before_utc):
+        month, subreddit = partition["month"], partition["subreddit"]
+        posts, signals = await store.get_archive_rows(month, subreddit, before_utc)
+        if not posts:
+            continue
+
+        archived_at = datetime.now(UTC)
+        name = f"part-{archived_at.strftime('%Y%m%dT%H%M%S%f')}.parquet"
+        for table, rows in (("posts", posts), ("signals", signals)):
+            if not rows:
+                continue
+            relative = Path(table) / month / subreddit / name
+            size = _write_parquet(pa, pq, rows, archive_dir / relative)
+            manifest["files"].append(
+                {
+                    "path": relative.as_posix(),
+                    "table": table,
+                    "month": month,
+                    "subreddit": subreddit,
+                    "rows": len(rows),
+                    "created_utc_min": min(p["created_utc"] for p in posts),
+                    "created_utc_max": max(p["created_utc"] for p in posts),
+                    "archived_at": archived_at.isoformat(),
+                }
+            )
+            result.files += 1
+            result.bytes_written += size
+        _save_manifest(archive_dir, manifest)
+
+        deleted = await store.delete_posts([p["id"] for p in posts])
+        result.partitions += 1
+        result.posts += deleted["posts"]
+        result.signals += deleted["signals"]
+        logger.info("partition_archived", month=month, subreddit=subreddit, posts=len(posts), signals=len(signals))
+
+    if vacuum and result.posts:
+        await store.incremental_vacuum()
+
+    logger.info(
+        "archive_completed",
+        partitions=result.partitions,
+        posts=result.posts,
+        signals=result.signals,
+        bytes_written=result.bytes_written,
+    )
+    return result
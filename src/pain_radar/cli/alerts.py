@@ -6,7 +6,10 @@ import typer
 from rich.table import Table
 
 from ..config import get_settings
+from ..embeddings import embed_signals, get_embedder
+from ..query import QuerySyntaxError, compile_query
 from ..store import AsyncStore
+from ..workers.delivery_worker import deliver_pending
 from . import app, console
 
 
@@ -46,6 +49,10 @@ def alerts_list(
             keywords = ", ".join(wl["keywords"][:3])
             if len(wl["keywords"]) > 3:
                 keywords += f" (+{len(wl['keywords']) - 3})"
+            if wl.get("query"):
+                keywords = ", ".join(filter(None, [keywords, f"[bold]{wl['query'][:40]}[/bold]"]))
+            if wl.get("description"):
+                keywords = ", ".join(filter(None, [keywords, f"[italic]~ {wl['description'][:40]}[/italic]"]))
 
             subreddits = ", ".join(wl["subreddits"][:2]) if wl["subreddits"] else "All"
             if wl["subreddits"] and len(wl["subreddits"]) > 2:
@@ -70,7 +77,16 @@ def alerts_list(
 
 @app.command("alerts-add")
 def alerts_add(
-    keywords: str = typer.Argument(..., help="Comma-separated keywords to track."),
+    keywords: str = typer.Argument("", help="Comma-separated keywords to track."),
+    describe: str | None = typer.Option(
+        None, "--describe", "-d", help="Natural-language description to match by meaning."
+    ),
+    threshold: float | None = typer.Option(
+        None, "--threshold", help="Minimum similarity for --describe matches (default 0.45)."
+    ),
+    query: str | None = typer.Option(
+        None, "--query", "-q", help="Boolean query, e.g. 'stripe AND (payout OR \"bank transfer\") -refund'."
+    ),
     name: str = typer.Option(None, "--name", "-n", help="Name for the watchlist."),
     subreddits: str | None = typer.Option(None, "--subreddits", "-s", help="Comma-separated subreddits to filter."),
     email: str | None = typer.Option(None, "--email", "-e", help="Email for notifications."),
@@ -80,6 +96,11 @@ def alerts_add(
     """Add a new keyword watchlist.
 
     Create a watchlist that tracks specific keywords in pain signals.
+    With --describe, signals are also matched by similarity to a
+    description, so "payment failures" catches "Stripe keeps declining cards".
+    With --query, signals are matched by a boolean query: AND/OR/NOT (or
+    -word), "quoted phrases", and field prefixes summary:, pain:, user:,
+    quote:, title: and sub:.
     When a match is found, you can be notified via email or webhook.
 
     Examples:
@@ -87,15 +108,25 @@ def alerts_add(
         pain-radar alerts-add "stripe, payment" --name "Payment Pain"
 
         pain-radar alerts-add "onboarding, churn" -s "SaaS,IndieHackers" -e "me@email.com"
+
+        pain-radar alerts-add --describe "payment failures" --name "Payments"
+
+        pain-radar alerts-add -q 'pain:"cash flow" AND (stripe OR paypal) -refund'
     """
     settings = get_settings()
     path = db_path or settings.db_path
 
     # Parse keywords
     keyword_list = [k.strip() for k in keywords.split(",") if k.strip()]
-    if not keyword_list:
-        console.print("[red]Error: At least one keyword is required.[/red]")
+    if not keyword_list and not describe and not query:
+        console.print("[red]Error: At least one keyword, a --query or a --describe description is required.[/red]")
         raise typer.Exit(1)
+    if query:
+        try:
+            compile_query(query)
+        except QuerySyntaxError as e:
+            console.print(f"[red]Error: Invalid query: {e}[/red]")
+            raise typer.Exit(1) from e
 
     # Parse subreddits
     subreddit_list = None
@@ -104,24 +135,45 @@ def alerts_add(
 
     # Generate name if not provided
     if not name:
-        name = f"Watch: {', '.join(keyword_list[:2])}"
-        if len(keyword_list) > 2:
-            name += f" (+{len(keyword_list) - 2})"
+        if keyword_list:
+            name = f"Watch: {', '.join(keyword_list[:2])}"
+            if len(keyword_list) > 2:
+                name += f" (+{len(keyword_list) - 2})"
+        else:
+            name = f"Watch: {(query or describe)[:40]}"
 
     async def _add():
         store = AsyncStore(path)
         await store.connect()
 
+        semantic = {}
+        if describe:
+            # Embedded once here; checks compare signal vectors against it
+            embedder = get_embedder(settings)
+            semantic = {
+                "description": describe,
+                "description_vector": (await embedder.embed([describe]))[0],
+                "embedding_model": embedder.name,
+                "semantic_threshold": threshold,
+            }
+
         watchlist_id = await store.create_watchlist(
             name=name,
             keywords=keyword_list,
             subreddits=subreddit_list,
             notification_email=email,
             notification_webhook=webhook,
+            query=query,
+            **semantic,
         )
 
         console.print(f"[green]✓ Created watchlist #{watchlist_id}:[/green] {name}")
-        console.print(f"  Keywords: {', '.join(keyword_list)}")
+        if keyword_list:
+            console.print(f"  Keywords: {', '.join(keyword_list)}")
+        if query:
+            console.print(f"  Query: {query}")
+        if describe:
+            console.print(f"  Description: {describe}")
         if subreddit_list:
             console.print(f"  Subreddits: {', '.join(subreddit_list)}")
         if email:
@@ -168,14 +220,16 @@ def alerts_remove(
 
 @app.command("alerts-check")
 def alerts_check(
-    hours: int = typer.Option(24, "--hours", "-h", help="Check signals from the last N hours."),
-    notify: bool = typer.Option(False, "--notify", help="Send notifications for matches."),
+    hours: int = typer.Option(24, "--hours", "-h", help="Window for watchlists that were never checked."),
+    rescan: bool = typer.Option(False, "--rescan", help="Re-check the whole window instead of only new signals."),
+    notify: bool = typer.Option(False, "--notify", help="Send pending matches to watchlist webhooks."),
     db_path: str | None = typer.Option(None, "--db", help="Path to database file."),
 ):
     """Check watchlists for matching signals.
 
-    Scans recent pain signals against all active watchlists
-    and reports any keyword matches.
+    Scans pain signals added since the previous check against all active
+    watchlists and reports any keyword matches. Signals are embedded first
+    when any watchlist matches by description.
     """
     settings = get_settings()
     path = db_path or settings.db_path
@@ -184,16 +238,29 @@ def alerts_check(
         store = AsyncStore(path)
         await store.connect()
 
-        console.print(f"[bold blue]Checking watchlists against last {hours}h of signals...[/bold blue]")
-
-        matches = await store.check_watchlists(since_hours=hours)
-
-        if not matches:
+        if rescan:
+            console.print(f"[bold blue]Re-checking watchlists against last {hours}h of signals...[/bold blue]")
+        else:
+            console.print("[bold blue]Checking watchlists against new signals...[/bold blue]")
+
+        embedding_model = None
+        models = await store.get_semantic_watchlist_models()
+        if models:
+            embedder = get_embedder(settings)
+            if models - {embedder.name}:
+                console.print(
+                    f"[yellow]Skipping watchlists described with another embedding model: "
+                    f"{', '.join(sorted(models - {embedder.name}))}[/yellow]"
+                )
+            await embed_signals(store, embedder)
+            embedding_model = embedder.name
+
+        matches = await store.check_watchlists(since_hours=hours, rescan=rescan, embedding_model=embedding_model)
+
+        if matches:
+            console.print(f"[green]✓ Found {len(matches)} matches![/green]\n")
+        else:
             console.print("[yellow]No matches found.[/yellow]")
-            await store.close()
-            return
-
-        console.print(f"[green]✓ Found {len(matches)} matches![/green]\n")
 
         # Group by watchlist
         by_watchlist = {}
@@ -216,13 +283,16 @@ def alerts_check(
 
             console.print()
 
+        # Matches recorded earlier (e.g. when signals were saved) are delivered too
         if notify:
-            # Get unnotified matches
-            unnotified = await store.get_unnotified_matches()
-            if unnotified:
-                console.print("[yellow]Notification sending not yet implemented.[/yellow]")
-                console.print(f"[dim]Would notify {len(unnotified)} matches.[/dim]")
-                # TODO: Implement email/webhook sending
+            result = await deliver_pending(store)
+            console.print(
+                f"[green]✓ Delivered {result.matches_notified} matches in {result.digests_sent} webhook digests[/green]"
+            )
+            for url, error in result.failures.items():
+                console.print(f"  [red]✗ {url}: {error}[/red]")
+            if result.matches_pending:
+                console.print(f"[dim]{result.matches_pending} matches left pending (failed or no webhook).[/dim]")
 
         await store.close()
 
@@ -7,6 +7,7 @@ from pathlib import Path
 import typer
 from rich.markdown import Markdown
 from rich.panel import Panel
+from rich.table import Table
 
 from ..cluster import Clusterer
 from ..config import get_settings
@@ -15,6 +16,8 @@ from ..digest import (
     generate_digest_title,
     generate_weekly_digest,
 )
+from ..embeddings import find_similar_signals, get_embedder
+from ..recurrence import track_recurrence
 from ..store import AsyncStore
 from . import app, console
 
@@ -24,12 +27,16 @@ def cluster(
     days: int = typer.Option(7, help="Days to look back."),
     subreddit: str | None = typer.Option(None, "--subreddit", "-s", help="Filter by subreddit."),
     dry_run: bool = typer.Option(False, "--dry-run", help="Don't save clusters."),
+    full: bool = typer.Option(False, "--full", help="Skip attaching signals to existing clusters."),
     db_path: str | None = typer.Option(None, "--db", help="Path to database file."),
 ):
     """Cluster recent pain signals into themes.
 
     This is the core Pain Radar workflow - grouping individual pain points
     into actionable clusters with quotes and links.
+
+    New signals similar to an existing cluster from the same window are
+    attached to it first; only the leftovers are clustered from scratch.
     """
     settings = get_settings()
     path = db_path or settings.db_path
@@ -46,9 +53,34 @@ def cluster(
             await store.close()
             return
 
+        clusterer = Clusterer(model_name=settings.openai_model)
+        touched_weeks: set[str] = set()
+
+        if not full:
+            existing = await store.get_cluster_centroids(days=days)
+            assignment = clusterer.assign_incremental(items, existing)
+            if assignment.attached:
+                attached = sum(len(v) for v in assignment.attached.values())
+                console.print(
+                    f"[green]✓ Attached {attached} signals to {len(assignment.attached)} existing clusters[/green]"
+                )
+                if not dry_run:
+                    await store.attach_signals_to_clusters(
+                        {cid: [item.id for item in members] for cid, members in assignment.attached.items()},
+                        assignment.centroids,
+                    )
+                    touched_weeks = {c["week_start"] for c in existing if c["id"] in assignment.attached}
+            items = assignment.leftovers
+
+        if not items:
+            console.print("[yellow]No new signals left to cluster.[/yellow]")
+            if touched_weeks:
+                await track_recurrence(store, weeks=sorted(touched_weeks))
+            await store.close()
+            return
+
         console.print(f"Found {len(items)} signals. Clustering with AI...")
 
-        clusterer = Clusterer(model_name=settings.openai_model)
         clusters = await clusterer.cluster_items(items)
 
         if not clusters:
@@ -69,6 +101,10 @@ def cluster(
             await store.save_clusters(clusters, week_start)
             console.print(f"[green]Saved clusters for week of {week_start}[/green]")
 
+            recurrence = await track_recurrence(store, weeks=sorted(touched_weeks | {week_start}))
+            if recurrence.linked:
+                console.print(f"[green]✓ {recurrence.linked} clusters continue a pain seen in earlier weeks[/green]")
+
             # Generate digest preview
             if subreddit:
                 digest = generate_weekly_digest(clusters, subreddit, format_type="reddit")
@@ -80,6 +116,58 @@ def cluster(
     asyncio.run(_cluster())
 
 
+@app.command("clusters-growing")
+def clusters_growing(
+    min_streak: int = typer.Option(3, "--min-streak", "-m", help="Minimum consecutive weeks of growth."),
+    weeks: int = typer.Option(4, "--weeks", "-w", help="Only show clusters seen within this many weeks."),
+    limit: int = typer.Option(20, "--limit", "-l", help="Maximum clusters to show."),
+    db_path: str | None = typer.Option(None, "--db", help="Path to database file."),
+):
+    """Show pain clusters that grew week over week.
+
+    Clusters are linked across weeks when they are saved, so this is a
+    single lookup rather than a re-analysis of past weeks.
+    """
+    settings = get_settings()
+    path = db_path or settings.db_path
+    since_week = (datetime.now() - timedelta(weeks=weeks)).strftime("%Y-%m-%d")
+
+    async def _growing():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            return await store.get_growing_lineages(min_streak=min_streak, since_week=since_week, limit=limit)
+        finally:
+            await store.close()
+
+    lineages = asyncio.run(_growing())
+
+    if not lineages:
+        console.print(f"[yellow]No clusters grew {min_streak}+ weeks in a row.[/yellow]")
+        return
+
+    table = Table(title=f"Pain clusters growing {min_streak}+ weeks in a row", show_header=True, header_style="bold")
+    table.add_column("Cluster", width=40)
+    table.add_column("Streak", width=6)
+    table.add_column("Signals", width=7)
+    table.add_column("Growth", width=7)
+    table.add_column("Since", width=10)
+    table.add_column("Last Week", width=10)
+
+    for lineage in lineages:
+        rate = lineage.get("growth_rate")
+        table.add_row(
+            lineage["title"],
+            str(lineage["growth_streak"]),
+            str(lineage["last_signal_count"]),
+            f"+{rate:.0%}" if rate is not None else "-",
+            lineage["first_week"],
+            lineage["last_week"],
+        )
+
+    console.print(table)
+
+
 @app.command()
 def digest(
     subreddit: str = typer.Argument(..., help="Subreddit to generate digest for."),
@@ -158,6 +246,13 @@ def reply_template(
     pattern: str = typer.Argument(..., help="Brief description of the pain pattern."),
     count: int = typer.Option(10, "--count", "-c", help="Number of similar threads tracked."),
     approaches: str = typer.Option("", "--approaches", "-a", help="Comma-separated common approaches."),
+    signal_id: int | None = typer.Option(
+        None,
+        "--signal",
+        "-s",
+        help="Signal ID to pull similar thread links for (requires 'pain-radar embed').",
+    ),
+    db_path: str | None = typer.Option(None, "--db", help="Path to database file."),
 ):
     """Generate a helpful comment reply template.
 
@@ -170,10 +265,29 @@ def reply_template(
         "Custom scripts",
     ]
 
+    thread_links = None
+    if signal_id is not None:
+        settings = get_settings()
+        path = db_path or settings.db_path
+        embedder = get_embedder(settings)
+
+        async def _links():
+            store = AsyncStore(path)
+            await store.connect()
+            try:
+                neighbours = await find_similar_signals(store, embedder, signal_id, k=3)
+                details = [await store.get_signal_detail(nid) for nid, _ in neighbours]
+            finally:
+                await store.close()
+            return [d["permalink"] for d in details if d and d.get("permalink")]
+
+        thread_links = asyncio.run(_links())
+
     reply = generate_comment_reply(
         pattern_summary=pattern,
         similar_count=count,
         common_approaches=approaches_list,
+        thread_links=thread_links,
     )
 
     console.print("\n[bold]Comment Reply Template:[/bold]\n")
@@ -1,4 +1,4 @@
-"""Database commands - init-db, stats."""
+"""Database commands - init-db, stats, db-compress, db-size, db-archive, shards."""
 
 from __future__ import annotations
 
@@ -7,8 +7,9 @@ import asyncio
 import typer
 from rich.table import Table
 
+from ..archive import archive_older_than, parse_age
 from ..config import get_settings
-from ..store import AsyncStore
+from ..store import AsyncStore, ShardRouter
 from . import app, console
 
 
@@ -44,6 +45,11 @@ def stats(
         "--db",
         help="Path to database file.",
     ),
+    recompute: bool = typer.Option(
+        False,
+        "--recompute",
+        help="Recount posts and signals and reset the stored counters.",
+    ),
 ):
     """Show database statistics."""
     settings = get_settings()
@@ -52,7 +58,11 @@ def stats(
     async def _stats():
         store = AsyncStore(path)
         await store.connect()
-        stats = await store.get_stats()
+        if recompute:
+            await store.init_db()
+            stats = await store.recompute_stats()
+        else:
+            stats = await store.get_stats()
         await store.close()
         return stats
 
@@ -64,8 +74,220 @@ def stats(
 
     table.add_row("Total Posts", str(stats.get("total_posts", 0)))
     table.add_row("Processed Posts", str(stats.get("processed_posts", 0)))
-    table.add_row("Total Ideas", str(stats.get("total_ideas", 0)))
-    table.add_row("Qualified Ideas", str(stats.get("qualified_ideas", 0)))
+    table.add_row("Total Signals", str(stats.get("total_signals", 0)))
+    table.add_row("Qualified Signals", str(stats.get("qualified_signals", 0)))
     table.add_row("Average Score", f"{stats.get('avg_score', 0):.1f}")
 
     console.print(table)
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+@app.command("db-compress")
+def db_compress(
+    retrain: bool = typer.Option(
+        False,
+        "--retrain",
+        help="Train new dictionaries from current data before compressing.",
+    ),
+    vacuum: bool = typer.Option(
+        True,
+        "--vacuum/--no-vacuum",
+        help="Rebuild the file afterwards so freed space is returned to the OS.",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Compress large JSON columns with zstd dictionaries trained on this database.
+
+    New values of those columns are compressed on write from then on.
+    """
+    settings = get_settings()
+    path = db_path or settings.db_path
+
+    async def _compress():
+        store = AsyncStore(path)
+        await store.connect()
+        await store.init_db()
+        report = await store.compress_blobs(retrain=retrain)
+        if vacuum:
+            await store.vacuum()
+        await store.close()
+        return report
+
+    report = asyncio.run(_compress())
+
+    table = Table(title="Compressed Columns", show_header=True)
+    table.add_column("Column", style="bold")
+    table.add_column("Rows", justify="right")
+    table.add_column("Before", justify="right")
+    table.add_column("After", justify="right")
+    table.add_column("Ratio", justify="right")
+
+    for column, stats in report.items():
+        ratio = f"{stats['before'] / stats['after']:.1f}x" if stats["after"] else "-"
+        table.add_row(column, str(stats["rows"]), _format_bytes(stats["before"]), _format_bytes(stats["after"]), ratio)
+
+    console.print(table)
+
+
+@app.command("db-size")
+def db_size(
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Show database size by table and for compressible columns."""
+    settings = get_settings()
+    path = db_path or settings.db_path
+
+    async def _size():
+        store = AsyncStore(path)
+        await store.connect()
+        report = await store.get_storage_report()
+        await store.close()
+        return report
+
+    report = asyncio.run(_size())
+
+    console.print(
+        f"[bold]File:[/bold] {_format_bytes(report['file_bytes'])} "
+        f"([dim]{_format_bytes(report['free_bytes'])} free[/dim])"
+    )
+
+    if report["tables"]:
+        tables = Table(title="Tables and Indexes", show_header=True)
+        tables.add_column("Name", style="bold")
+        tables.add_column("Size", justify="right")
+        for name, size in list(report["tables"].items())[:15]:
+            tables.add_row(name, _format_bytes(size))
+        console.print(tables)
+
+    columns = Table(title="Compressible Columns", show_header=True)
+    columns.add_column("Column", style="bold")
+    columns.add_column("Rows", justify="right")
+    columns.add_column("Compressed", justify="right")
+    columns.add_column("Size", justify="right")
+    for column in report["columns"]:
+        columns.add_row(
+            f"{column['table']}.{column['column']}",
+            str(column["rows"]),
+            str(column["compressed"]),
+            _format_bytes(column["bytes"]),
+        )
+    console.print(columns)
+
+
+@app.command("db-archive")
+def db_archive(
+    older_than: str = typer.Option(
+        "90d",
+        "--older-than",
+        help="Archive posts created longer ago than this (e.g. 90d, 12w).",
+    ),
+    archive_dir: str | None = typer.Option(
+        None,
+        "--dir",
+        help="Archive directory (default: PAIN_RADAR_ARCHIVE_DIR).",
+    ),
+    vacuum: bool = typer.Option(
+        True,
+        "--vacuum/--no-vacuum",
+        help="Return freed pages to the OS afterwards (incremental VACUUM).",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Move old posts and their signals to Parquet files partitioned by month and subreddit.
+
+    Archived rows are deleted from the database; manifest.json in the archive
+    directory lists the files so reports can still read them.
+    """
+    settings = get_settings()
+    path = db_path or settings.db_path
+    directory = archive_dir or settings.archive_dir
+
+    try:
+        age = parse_age(older_than)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    async def _archive():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            await store.init_db()
+            return await archive_older_than(store, directory, age, vacuum=vacuum)
+        finally:
+            await store.close()
+
+    try:
+        result = asyncio.run(_archive())
+    except ImportError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    if not result.partitions:
+        console.print(f"[dim]No posts older than {older_than} to archive.[/dim]")
+        return
+    console.print(
+        f"[green]✓ Archived {result.posts} posts and {result.signals} signals[/green] "
+        f"from {result.partitions} partitions to {directory} ({_format_bytes(result.bytes_written)})"
+    )
+
+
+@app.command()
+def shards(
+    shard_dir: str | None = typer.Option(
+        None,
+        "--dir",
+        help="Shard directory (default: PAIN_RADAR_SHARD_DIR).",
+    ),
+):
+    """Show statistics for every tenant shard and their total."""
+    settings = get_settings()
+    path = shard_dir or settings.shard_dir
+
+    async def _shards():
+        router = ShardRouter(path)
+        await router.connect()
+        try:
+            return await router.get_stats()
+        finally:
+            await router.close()
+
+    stats = asyncio.run(_shards())
+
+    table = Table(title=f"Tenant Shards ({path})", show_header=True)
+    table.add_column("Tenant", style="bold")
+    table.add_column("Posts", justify="right")
+    table.add_column("Signals", justify="right")
+    table.add_column("Qualified", justify="right")
+    table.add_column("Avg Score", justify="right")
+
+    rows = [*stats["tenants"].items(), ("Total", stats["total"])]
+    for tenant_id, tenant_stats in rows:
+        table.add_row(
+            tenant_id,
+            str(tenant_stats["total_posts"]),
+            str(tenant_stats["total_signals"]),
+            str(tenant_stats["qualified_signals"]),
+            f"{tenant_stats['avg_score']:.1f}",
+        )
+
+    console.print(table)
@@ -1,16 +1,21 @@
-"""Fetch command - fetch posts from Reddit without AI processing."""
+"""Fetch, poll and import commands - load posts from Reddit or dump files without AI processing."""
 
 from __future__ import annotations
 
 import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Annotated
 
 import typer
+from rich.table import Table
 
 from ..config import get_settings
 from ..logging_config import configure_logging
 from ..pipeline import run_fetch_only
+from ..reddit_dumps import IMPORT_BATCH_SIZE, import_dumps
 from ..store import AsyncStore
+from ..workers.scheduler import MAX_INTERVAL, MIN_INTERVAL, PollScheduler
 from . import app, console
 
 
@@ -75,6 +80,7 @@ def fetch(
     if subreddits:
         # Explicit subreddits override everything
         fetch_subreddits = list(subreddits)
+        fetchers = dict.fromkeys(fetch_subreddits, settings.fetcher)
     elif source_set:
         # Fetch from specific source set
         async def _get_source_set():
@@ -89,6 +95,7 @@ def fetch(
             console.print(f"[red]Source set {source_set} not found[/red]")
             raise typer.Exit(1)
         fetch_subreddits = ss["subreddits"]
+        fetchers = dict.fromkeys(fetch_subreddits, ss.get("fetcher") or settings.fetcher)
         fetch_limit = limit or ss.get("limit_per_sub", settings.posts_per_subreddit)
         console.print(f"Using source set: [bold]{ss['name']}[/bold]")
     else:
@@ -96,11 +103,12 @@ def fetch(
         async def _get_all_subreddits():
             store = AsyncStore(path)
             await store.connect()
-            subs = await store.get_all_active_subreddits()
+            active = await store.get_active_subreddit_fetchers()
             await store.close()
-            return subs
+            return active
 
-        fetch_subreddits = asyncio.run(_get_all_subreddits())
+        fetchers = asyncio.run(_get_all_subreddits())
+        fetch_subreddits = list(fetchers)
 
         if not fetch_subreddits:
             console.print("[yellow]No active source sets found.[/yellow]")
@@ -119,10 +127,13 @@ def fetch(
         def __init__(self):
             self.subreddits = fetch_subreddits
             self.listing = settings.listing
+            self.fetchers = fetchers
             self.posts_per_subreddit = fetch_limit
             self.top_comments = settings.top_comments
             self.max_concurrency = settings.max_concurrency
             self.db_path = path
+            # An explicit --db means the SQLite file even when Postgres is configured
+            self.database_url = None if db_path else settings.database_url
             self.user_agent = settings.user_agent
 
     fetch_settings = FetchSettings()
@@ -133,3 +144,215 @@ def fetch(
     except Exception as e:
         console.print(f"[red]Fetch failed:[/red] {e}")
         raise typer.Exit(1) from e
+
+
+def _utc_timestamp(value: datetime | None) -> int | None:
+    return int(value.replace(tzinfo=UTC).timestamp()) if value else None
+
+
+@app.command("import")
+def import_(
+    paths: Annotated[
+        list[Path],
+        typer.Argument(
+            exists=True,
+            dir_okay=False,
+            help="Dump files: zstd-compressed (.zst) or plain NDJSON submissions and comments.",
+        ),
+    ],
+    subreddits: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--subreddit",
+            "-s",
+            help="Only import these subreddits (can specify multiple).",
+        ),
+    ] = None,
+    since: Annotated[
+        datetime | None,
+        typer.Option(
+            "--since",
+            formats=["%Y-%m-%d"],
+            help="Only posts created on or after this date (UTC).",
+        ),
+    ] = None,
+    until: Annotated[
+        datetime | None,
+        typer.Option(
+            "--until",
+            formats=["%Y-%m-%d"],
+            help="Only posts created before this date (UTC).",
+        ),
+    ] = None,
+    comments: Annotated[
+        int | None,
+        typer.Option(
+            "--comments",
+            help="Top-level comments kept per post (default: PAIN_RADAR_TOP_COMMENTS).",
+        ),
+    ] = None,
+    batch_size: Annotated[
+        int,
+        typer.Option(
+            "--batch-size",
+            help="Rows written per transaction.",
+        ),
+    ] = IMPORT_BATCH_SIZE,
+    db_path: Annotated[
+        str | None,
+        typer.Option(
+            "--db",
+            help="Path to database file.",
+        ),
+    ] = None,
+):
+    """Backfill posts and their top comments from Reddit dump files.
+
+    Posts already in the database are kept as they are; imported posts are
+    analyzed by the next run like fetched ones.
+    """
+    settings = get_settings()
+    path = db_path or settings.db_path
+
+    async def _import():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            await store.init_db()
+            return await import_dumps(
+                store,
+                paths,
+                subreddits=subreddits,
+                since_utc=_utc_timestamp(since),
+                until_utc=_utc_timestamp(until),
+                comments_per_post=settings.top_comments if comments is None else comments,
+                batch_size=batch_size,
+            )
+        finally:
+            await store.close()
+
+    try:
+        result = asyncio.run(_import())
+    except Exception as e:
+        console.print(f"[red]Import failed:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    console.print(
+        f"[green]✓ Imported {result.posts} posts and {result.comments} comments[/green] "
+        f"from {result.lines:,} lines in {result.seconds:.1f}s ({result.lines_per_second:,.0f} lines/s)"
+    )
+
+
+@app.command()
+def poll(
+    subreddits: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--subreddit",
+            "-s",
+            help="Subreddits to poll (can specify multiple). Overrides source sets.",
+        ),
+    ] = None,
+    once: Annotated[
+        bool,
+        typer.Option(
+            "--once",
+            help="Poll the subreddits that are due, show the schedule and exit.",
+        ),
+    ] = False,
+    min_interval: Annotated[
+        int,
+        typer.Option(
+            "--min-interval",
+            help="Shortest time between polls of a subreddit, in seconds.",
+        ),
+    ] = MIN_INTERVAL,
+    max_interval: Annotated[
+        int,
+        typer.Option(
+            "--max-interval",
+            help="Longest time between polls of a subreddit, in seconds.",
+        ),
+    ] = MAX_INTERVAL,
+    log_level: Annotated[
+        str,
+        typer.Option(
+            "--log-level",
+            help="Logging level.",
+        ),
+    ] = "INFO",
+    db_path: Annotated[
+        str | None,
+        typer.Option(
+            "--db",
+            help="Path to database file.",
+        ),
+    ] = None,
+):
+    """Keep fetching new posts, polling each subreddit as often as it gets them.
+
+    Each subreddit's post rate is learned from the posts already stored, and
+    it is polled again when about half a page of new posts is expected. Runs
+    until interrupted unless --once is given.
+    """
+    configure_logging(log_level, False)
+    settings = get_settings()
+    path = db_path or settings.db_path
+    fetchers = dict.fromkeys(subreddits, settings.fetcher) if subreddits else None
+
+    async def _poll():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            await store.init_db()
+            scheduler = PollScheduler(
+                store, settings, fetchers=fetchers, min_interval=min_interval, max_interval=max_interval
+            )
+            await scheduler.refresh()
+            if not scheduler.schedules:
+                return scheduler, None
+            if once:
+                return scheduler, await scheduler.run_once()
+            await scheduler.run_forever()
+            return scheduler, None
+        finally:
+            await store.close()
+
+    if not once:
+        console.print("Polling subreddits as they get new posts (Ctrl+C to stop)...")
+    try:
+        scheduler, result = asyncio.run(_poll())
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped[/yellow]")
+        raise typer.Exit(130) from None
+    except Exception as e:
+        console.print(f"[red]Poll failed:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    if not scheduler.schedules:
+        console.print("[yellow]No subreddits to poll.[/yellow]")
+        console.print("Add a source set with: [cyan]pain-radar sources-add indie_saas[/cyan]")
+        raise typer.Exit(1)
+    if result is None:
+        return
+
+    console.print(f"[green]✓ Polled {result.subreddits_polled} subreddits, {result.posts_new} new posts[/green]")
+    if result.saturated:
+        console.print(f"[yellow]Full pages (polled sooner next time): {', '.join(result.saturated)}[/yellow]")
+
+    now = scheduler.clock()
+    table = Table(title="Poll Schedule")
+    table.add_column("Subreddit", style="cyan")
+    table.add_column("Fetcher")
+    table.add_column("Posts/hour", justify="right")
+    table.add_column("Interval", justify="right")
+    table.add_column("Next poll in", justify="right")
+    for schedule in sorted(scheduler.schedules.values(), key=lambda s: s.next_poll):
+        table.add_row(
+            schedule.subreddit,
+            schedule.fetcher,
+            f"{schedule.posts_per_hour:.1f}",
+            f"{scheduler.interval(schedule) / 60:.0f}m",
+            f"{max(schedule.next_poll - now, 0) / 60:.0f}m",
+        )
+    console.print(table)
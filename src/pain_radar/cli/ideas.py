@@ -1,9 +1,8 @@
-"""Signals commands - top, show, export."""
+"""Signals commands - top, show, export, embed, similar, evidence."""
 
 from __future__ import annotations
 
 import asyncio
-import csv
 import json
 from pathlib import Path
 
@@ -11,6 +10,9 @@ import typer
 from rich.table import Table
 
 from ..config import get_settings
+from ..embeddings import embed_signals, find_similar_signals, get_embedder
+from ..export import export_signals
+from ..models import SignalType
 from ..store import AsyncStore
 from . import app, console
 
@@ -36,7 +38,9 @@ def top(
     async def _top():
         store = AsyncStore(path)
         await store.connect()
-        signals = await store.get_top_signals(limit=limit)
+        signals = await store.get_top_signals(
+            limit=limit, fields=["total_score", "profitability", "competition", "signal_summary", "subreddit"]
+        )
         await store.close()
         return signals
 
@@ -170,7 +174,7 @@ def export(
         "signals.json",
         "--output",
         "-o",
-        help="Output file path (.json or .csv).",
+        help="Output file path (.json, .ndjson, .jsonl, .csv or .parquet).",
     ),
     limit: int = typer.Option(
         50,
@@ -178,6 +182,11 @@ def export(
         "-l",
         help="Number of signals to export.",
     ),
+    export_all: bool = typer.Option(
+        False,
+        "--all",
+        help="Export every signal, ignoring --limit.",
+    ),
     include_disqualified: bool = typer.Option(
         False,
         "--include-disqualified",
@@ -189,33 +198,186 @@ def export(
         help="Path to database file.",
     ),
 ):
-    """Export top signals to JSON or CSV."""
+    """Export top signals, streamed to JSON, NDJSON, CSV or Parquet."""
     settings = get_settings()
     path = db_path or settings.db_path
 
     async def _export():
         store = AsyncStore(path)
         await store.connect()
-        signals = await store.get_top_signals(limit=limit, include_disqualified=include_disqualified)
-        await store.close()
-        return signals
+        try:
+            return await export_signals(
+                store,
+                output,
+                limit=None if export_all else limit,
+                include_disqualified=include_disqualified,
+            )
+        finally:
+            await store.close()
+
+    try:
+        count = asyncio.run(_export())
+    except (ValueError, ImportError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    if not count:
+        Path(output).unlink(missing_ok=True)
+        console.print("[yellow]No signals to export[/yellow]")
+        return
 
-    signals = asyncio.run(_export())
+    console.print(f"[green]✓ Exported {count} signals to {output}[/green]")
 
-    if not signals:
-        console.print("[yellow]No signals to export[/yellow]")
+
+@app.command()
+def embed(
+    limit: int | None = typer.Option(
+        None,
+        "--limit",
+        "-l",
+        help="Maximum number of signals to embed (default: all missing).",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Compute embeddings for signals that don't have one yet."""
+    settings = get_settings()
+    path = db_path or settings.db_path
+    embedder = get_embedder(settings)
+
+    async def _embed():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            return await embed_signals(store, embedder, limit=limit)
+        finally:
+            await store.close()
+
+    count = asyncio.run(_embed())
+    console.print(f"[green]✓ Embedded {count} signals with {embedder.name}[/green]")
+
+
+@app.command()
+def similar(
+    signal_id: int = typer.Argument(..., help="Signal ID to find neighbours for."),
+    limit: int = typer.Option(
+        5,
+        "--limit",
+        "-l",
+        help="Number of similar signals to show.",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Show the signals most similar to a given signal."""
+    settings = get_settings()
+    path = db_path or settings.db_path
+    embedder = get_embedder(settings)
+
+    async def _similar():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            neighbours = await find_similar_signals(store, embedder, signal_id, k=limit)
+            details = [(await store.get_signal_detail(nid), score) for nid, score in neighbours]
+        finally:
+            await store.close()
+        return [(sig, score) for sig, score in details if sig]
+
+    results = asyncio.run(_similar())
+
+    if not results:
+        console.print("[yellow]No similar signals found (run 'pain-radar embed' first)[/yellow]")
         return
 
-    output_path = Path(output)
+    table = Table(title=f"Signals similar to #{signal_id}", show_header=True, header_style="bold")
+    table.add_column("ID", width=6)
+    table.add_column("Sim", width=5)
+    table.add_column("Signal", width=50)
+    table.add_column("Subreddit", width=12)
 
-    if output.endswith(".csv"):
-        with open(output_path, "w", newline="") as f:
-            if signals:
-                writer = csv.DictWriter(f, fieldnames=signals[0].keys())
-                writer.writeheader()
-                writer.writerows(signals)
-    else:
-        with open(output_path, "w") as f:
-            json.dump(signals, f, indent=2, default=str)
+    for sig, score in results:
+        summary = sig.get("signal_summary") or ""
+        table.add_row(
+            str(sig.get("id", "-")),
+            f"{score:.2f}",
+            (summary[:47] + "...") if len(summary) > 50 else summary,
+            (sig.get("subreddit") or "")[:12],
+        )
+
+    console.print(table)
 
-    console.print(f"[green]✓ Exported {len(signals)} signals to {output}[/green]")
+
+@app.command()
+def evidence(
+    signal_type: SignalType | None = typer.Option(
+        None,
+        "--type",
+        "-t",
+        help="Only quotes of this signal type.",
+    ),
+    days: int | None = typer.Option(
+        7,
+        "--days",
+        "-d",
+        help="Only signals from the last N days.",
+    ),
+    subreddit: str | None = typer.Option(
+        None,
+        "--subreddit",
+        "-s",
+        help="Only signals from this subreddit.",
+    ),
+    limit: int = typer.Option(
+        50,
+        "--limit",
+        "-l",
+        help="Number of quotes to show.",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Show evidence quotes, e.g. this week's willingness-to-pay mentions."""
+    settings = get_settings()
+    path = db_path or settings.db_path
+
+    async def _evidence():
+        store = AsyncStore(path)
+        await store.connect()
+        try:
+            return await store.get_evidence(
+                signal_type=signal_type.value if signal_type else None, days=days, subreddit=subreddit, limit=limit
+            )
+        finally:
+            await store.close()
+
+    quotes = asyncio.run(_evidence())
+
+    if not quotes:
+        console.print("[yellow]No evidence found[/yellow]")
+        return
+
+    table = Table(title="Evidence", show_header=True, header_style="bold")
+    table.add_column("Signal", width=6)
+    table.add_column("Type", width=18)
+    table.add_column("Quote", width=60)
+    table.add_column("Subreddit", width=12)
+
+    for quote in quotes:
+        table.add_row(
+            str(quote["signal_id"]),
+            quote.get("signal_type") or "-",
+            f'"{quote["quote"]}"',
+            (quote.get("subreddit") or "")[:12],
+        )
+
+    console.print(table)
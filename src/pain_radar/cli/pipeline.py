@@ -110,6 +110,7 @@ def run(
     if subreddits:
         # Explicit subreddits override everything
         run_subreddits = list(subreddits)
+        fetchers = dict.fromkeys(run_subreddits, settings.fetcher)
     elif source_set:
         # Use specific source set
         async def _get_source_set():
@@ -124,6 +125,7 @@ def run(
             console.print(f"[red]Source set {source_set} not found[/red]")
             raise typer.Exit(1)
         run_subreddits = ss["subreddits"]
+        fetchers = dict.fromkeys(run_subreddits, ss.get("fetcher") or settings.fetcher)
         fetch_limit = limit or ss.get("limit_per_sub", settings.posts_per_subreddit)
         console.print(f"Using source set: [bold]{ss['name']}[/bold]")
     else:
@@ -131,11 +133,12 @@ def run(
         async def _get_all_subreddits():
             store = AsyncStore(path)
             await store.connect()
-            subs = await store.get_all_active_subreddits()
+            active = await store.get_active_subreddit_fetchers()
             await store.close()
-            return subs
+            return active
 
-        run_subreddits = asyncio.run(_get_all_subreddits())
+        fetchers = asyncio.run(_get_all_subreddits())
+        run_subreddits = list(fetchers)
 
         if not run_subreddits:
             console.print("[yellow]No active source sets found.[/yellow]")
@@ -168,10 +171,13 @@ def run(
         def __init__(self):
             self.subreddits = run_subreddits
             self.listing = settings.listing
+            self.fetchers = fetchers
             self.posts_per_subreddit = fetch_limit
             self.top_comments = settings.top_comments
             self.max_concurrency = settings.max_concurrency
             self.db_path = path
+            # An explicit --db means the SQLite file even when Postgres is configured
+            self.database_url = None if db_path else settings.database_url
             self.user_agent = settings.user_agent
             self.openai_api_key = settings.openai_api_key
             self.openai_model = settings.openai_model
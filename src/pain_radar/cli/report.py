@@ -1,4 +1,4 @@
-"""Report commands - report generation and run history."""
+"""Report commands - report generation, run history and trends."""
 
 from __future__ import annotations
 
@@ -8,6 +8,7 @@ from pathlib import Path
 import typer
 from rich.table import Table
 
+from ..analytics import trends as compute_trends
 from ..config import get_settings
 from ..report import generate_json_report, generate_report
 from ..store import AsyncStore
@@ -137,3 +138,63 @@ def runs(
 
     console.print(table)
     console.print("\nGenerate a report with: pain-radar report --run <ID>")
+
+
+@app.command()
+def trends(
+    metric: str = typer.Option(
+        "signals",
+        "--metric",
+        "-m",
+        help="signals (per subreddit), scores (distribution) or wedges (distribution channels).",
+    ),
+    weeks: int = typer.Option(
+        12,
+        "--weeks",
+        "-w",
+        help="Weeks to look back, by post date.",
+    ),
+    subreddit: str | None = typer.Option(
+        None,
+        "--subreddit",
+        "-s",
+        help="Only this subreddit.",
+    ),
+    archive: bool = typer.Option(
+        True,
+        "--archive/--no-archive",
+        help="Include posts moved to the archive by db-archive.",
+    ),
+    db_path: str | None = typer.Option(
+        None,
+        "--db",
+        help="Path to database file.",
+    ),
+):
+    """Show weekly trends over live and archived signals."""
+    settings = get_settings()
+    path = db_path or settings.db_path
+
+    try:
+        rows = compute_trends(
+            path,
+            metric,
+            weeks=weeks,
+            subreddit=subreddit,
+            archive_dir=settings.archive_dir if archive else None,
+        )
+    except (ValueError, ImportError) as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1) from e
+
+    if not rows:
+        console.print(f"[yellow]No signals in the last {weeks} weeks[/yellow]")
+        return
+
+    table = Table(title=f"Weekly Trends: {metric}", show_header=True, header_style="bold")
+    for name in rows[0]:
+        table.add_column(name, justify="left" if name in ("week", "subreddit", "wedge") else "right")
+    for row in rows:
+        table.add_row(*("-" if value is None else str(value) for value in row.values()))
+
+    console.print(table)
@@ -9,6 +9,7 @@ from rich.table import Table
 
 from ..config import get_settings
 from ..presets import PRESETS, get_preset
+from ..reddit_async import FETCHERS
 from ..store import AsyncStore
 from . import app, console
 
@@ -48,6 +49,7 @@ def sources(
         table.add_column("Name", width=25)
         table.add_column("Subreddits", width=40)
         table.add_column("Preset", width=12)
+        table.add_column("Fetcher", width=8)
 
         for ss in source_sets:
             subs = ", ".join(ss["subreddits"][:4])
@@ -58,6 +60,7 @@ def sources(
                 ss["name"],
                 subs,
                 ss.get("preset_key") or "custom",
+                ss.get("fetcher") or "rss",
             )
         console.print(table)
     else:
@@ -104,6 +107,11 @@ def sources_add(
         "-s",
         help="Comma-separated subreddits (required if preset_key='custom').",
     ),
+    fetcher: str = typer.Option(
+        "rss",
+        "--fetcher",
+        help="How posts are fetched: rss (one ~25-post page) or json (paginated, with scores).",
+    ),
     db_path: str | None = typer.Option(
         None,
         "--db",
@@ -114,6 +122,10 @@ def sources_add(
     settings = get_settings()
     path = db_path or settings.db_path
 
+    if fetcher not in FETCHERS:
+        console.print(f"[red]Error: --fetcher must be one of {', '.join(FETCHERS)}[/red]")
+        raise typer.Exit(1)
+
     # Handle preset vs custom
     if preset_key == "custom":
         if not subreddits:
@@ -151,6 +163,7 @@ def sources_add(
             subreddits=sub_list,
             description=description,
             preset_key=pkey,
+            fetcher=fetcher,
         )
         await store.close()
         return source_set_id
@@ -184,16 +197,25 @@ def sources_edit(
         "-n",
         help="New name.",
     ),
+    fetcher: str | None = typer.Option(
+        None,
+        "--fetcher",
+        help="New fetcher: rss or json.",
+    ),
     db_path: str | None = typer.Option(
         None,
         "--db",
         help="Path to database file.",
     ),
 ):
-    """Edit a source set - add or remove subreddits."""
+    """Edit a source set - add or remove subreddits, rename it or change its fetcher."""
     settings = get_settings()
     path = db_path or settings.db_path
 
+    if fetcher is not None and fetcher not in FETCHERS:
+        console.print(f"[red]Error: --fetcher must be one of {', '.join(FETCHERS)}[/red]")
+        raise typer.Exit(1)
+
     async def _edit():
         store = AsyncStore(path)
         await store.connect()
@@ -221,6 +243,7 @@ def sources_edit(
             source_set_id,
             subreddits=sorted(list(current_subs)),
             name=name,
+            fetcher=fetcher,
         )
         await store.close()
         return sorted(list(current_subs))
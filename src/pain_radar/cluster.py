@@ -1,20 +1,95 @@
-"""Logic for clustering pain signals into Pain Pattern Clusters."""
+"""Logic for clustering pain signals into Pain Pattern Clusters.
 
+Signals are grouped locally and deterministically (see vectors.py); the LLM is
+only asked to name each group, with one small prompt per cluster.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
 import json
+from dataclasses import dataclass, field
 
+import numpy as np
 from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_openai import ChatOpenAI
 
 from .config import settings
-from .models import Cluster, ClusterItem
-from .prompts import CLUSTER_SYSTEM_PROMPT, CLUSTER_USER_TEMPLATE
+from .logging_config import get_logger
+from .models import Cluster, ClusterItem, ClusterName, SignalType
+from .prompts import CLUSTER_NAME_SYSTEM_PROMPT, CLUSTER_NAME_USER_TEMPLATE
+from .vectors import (
+    DEFAULT_SIMILARITY_THRESHOLD,
+    HashingVectorizer,
+    agglomerative_groups,
+    centroid,
+    signal_text,
+)
+
+logger = get_logger(__name__)
+
+# Maximum signals shown to the LLM when naming a cluster (closest to the centroid first)
+MAX_NAMING_ITEMS = 8
+
+# Maximum quotes kept per cluster
+MAX_QUOTES = 3
+
+# Minimum cosine similarity to an existing centroid for a signal to join that cluster
+DEFAULT_ASSIGN_THRESHOLD = 0.35
+
+CLUSTER_NAME_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", CLUSTER_NAME_SYSTEM_PROMPT),
+        ("user", CLUSTER_NAME_USER_TEMPLATE),
+    ]
+)
+
+
+def _rank_by_centrality(vectors: np.ndarray) -> list[int]:
+    """Order row indices by similarity to the group's mean vector, most central first."""
+    scores = vectors @ vectors.mean(axis=0)
+    return sorted(range(len(scores)), key=lambda i: (-float(scores[i]), i))
+
+
+def _select_quotes(items: list[ClusterItem]) -> list[str]:
+    """Pick up to MAX_QUOTES quotes, preferring pain quotes from central items."""
+    pain = [e.quote for item in items for e in item.evidence if e.signal_type == SignalType.PAIN]
+    other = [e.quote for item in items for e in item.evidence if e.signal_type != SignalType.PAIN]
+    quotes: list[str] = []
+    for quote in pain + other:
+        if quote not in quotes:
+            quotes.append(quote)
+        if len(quotes) >= MAX_QUOTES:
+            break
+    return quotes
+
+
+@dataclass
+class IncrementalAssignment:
+    """Result of attaching new items to existing clusters."""
+
+    # Cluster ID -> items attached to it
+    attached: dict[str, list[ClusterItem]] = field(default_factory=dict)
+    # Cluster ID -> centroid after attaching
+    centroids: dict[str, np.ndarray] = field(default_factory=dict)
+    # Items that matched no existing cluster
+    leftovers: list[ClusterItem] = field(default_factory=list)
 
 
 class Clusterer:
     """Groups ideas/findings into semantic clusters."""
 
-    def __init__(self, model_name: str = "gpt-4o", llm: BaseChatModel | None = None):
+    def __init__(
+        self,
+        model_name: str = "gpt-4o",
+        llm: BaseChatModel | None = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        assign_threshold: float = DEFAULT_ASSIGN_THRESHOLD,
+        min_cluster_size: int = 2,
+        max_concurrency: int = 4,
+    ):
         if llm:
             self.llm = llm
         else:
@@ -23,66 +98,153 @@ class Clusterer:
                 api_key=settings.openai_api_key,
                 temperature=0.0,
             )
+        self.similarity_threshold = similarity_threshold
+        self.assign_threshold = assign_threshold
+        self.min_cluster_size = min_cluster_size
+        self.max_concurrency = max_concurrency
+        self.vectorizer = HashingVectorizer()
+        self._name_cache: dict[str, ClusterName] = {}
+
+    def vectorize(self, items: list[ClusterItem]) -> np.ndarray:
+        """Vectorize items from their summary and pain point.
+
+        Args:
+            items: Items to vectorize
+
+        Returns:
+            Matrix with one row per item
+        """
+        return self.vectorizer.transform([signal_text(item.summary, item.pain_point) for item in items])
+
+    def assign_incremental(self, items: list[ClusterItem], existing: list[dict]) -> IncrementalAssignment:
+        """Attach items to the most similar existing cluster above the threshold.
+
+        Args:
+            items: Newly arrived, unclustered items
+            existing: Clusters with "id", "centroid" and "signal_count" (see AsyncStore.get_cluster_centroids)
+
+        Returns:
+            IncrementalAssignment with attached items, updated centroids and leftovers
+        """
+        result = IncrementalAssignment()
+        if not items:
+            return result
+        if not existing:
+            result.leftovers = list(items)
+            return result
+
+        vectors = self.vectorize(items)
+        centroids = np.vstack([c["centroid"] for c in existing])
+        sims = vectors @ centroids.T
+        best = sims.argmax(axis=1)
+
+        members: dict[int, list[int]] = {}
+        for row, col in enumerate(best):
+            if sims[row, col] >= self.assign_threshold:
+                members.setdefault(int(col), []).append(row)
+            else:
+                result.leftovers.append(items[row])
+
+        for col, rows in members.items():
+            cluster = existing[col]
+            weight = max(int(cluster.get("signal_count") or 1), 1)
+            total = cluster["centroid"] * weight + vectors[rows].sum(axis=0)
+            result.attached[cluster["id"]] = [items[r] for r in rows]
+            result.centroids[cluster["id"]] = centroid(total[np.newaxis, :])
+
+        logger.info(
+            "items_assigned_incrementally",
+            items=len(items),
+            attached=len(items) - len(result.leftovers),
+            leftovers=len(result.leftovers),
+        )
+        return result
 
-    async def cluster_items(self, items: list[ClusterItem]) -> list[Cluster]:
-        """Cluster a list of items into groups."""
+    def group_items(self, items: list[ClusterItem]) -> list[list[ClusterItem]]:
+        """Group items locally by text similarity.
+
+        Args:
+            items: Items to group
+
+        Returns:
+            Groups of items, largest first, each ordered most-central first
+        """
         if not items:
             return []
 
-        # Prepare items for prompt
+        ordered = sorted(items, key=lambda item: item.id)
+        vectors = self.vectorize(ordered)
+        groups = agglomerative_groups(vectors, threshold=self.similarity_threshold, min_size=self.min_cluster_size)
+
+        result = []
+        for indices in groups:
+            ranked = _rank_by_centrality(vectors[indices])
+            result.append([ordered[indices[r]] for r in ranked])
+        return result
+
+    async def name_group(self, group: list[ClusterItem]) -> ClusterName:
+        """Ask the LLM to name a single group of items.
+
+        Results are cached by group content, so re-running over the same
+        grouping does not repeat LLM calls.
+
+        Args:
+            group: Items in the cluster, most central first
+
+        Returns:
+            ClusterName with title, summary, audience and rationale
+        """
         items_data = [
             {
-                "id": item.id,
                 "summary": item.summary,
                 "pain_point": item.pain_point,
                 "subreddit": item.subreddit,
-                "quotes": [e.quote for e in item.evidence if e.signal_type == "pain"],
+                "quotes": [e.quote for e in item.evidence if e.signal_type == SignalType.PAIN][:2],
             }
-            for item in items
+            for item in group[:MAX_NAMING_ITEMS]
         ]
-
         items_json = json.dumps(items_data, indent=2)
 
-        prompt = ChatPromptTemplate.from_messages(
-            [
-                ("system", CLUSTER_SYSTEM_PROMPT),
-                ("user", CLUSTER_USER_TEMPLATE),
-            ]
-        )
-
-        structured_llm = self.llm.with_structured_output(
-            schema={
-                "name": "ClusterOutput",
-                "description": "List of pain clusters",
-                "parameters": {
-                    "type": "object",
-                    "properties": {"clusters": {"type": "array", "items": Cluster.model_json_schema()}},
-                    "required": ["clusters"],
-                },
-            }
-        )
-
-        chain = prompt | structured_llm
-
-        try:
-            result = await chain.ainvoke({"items_json": items_json})
+        cache_key = hashlib.sha256(items_json.encode("utf-8")).hexdigest()
+        if cache_key in self._name_cache:
+            return self._name_cache[cache_key]
 
-            # The result might be a dict (if using json schema) or object (if pydantic)
-            # LangChain with_structured_output usually returns the Pydantic object if passed class,
-            # or dict if passed schema. Here I passed schema manually because I wanted to wrap it in a "clusters" list.
-            # Wait, better to define a wrapper model for simpler Pydantic usage.
+        chain = CLUSTER_NAME_PROMPT | self.llm.with_structured_output(ClusterName)
+        result = await chain.ainvoke({"items_json": items_json})
+        if isinstance(result, dict):
+            result = ClusterName(**result)
 
-            # Let's retry with a wrapper model approach in the next iteration or right now in code content.
-            # Actually, the result from `with_structured_output(schema=...)` is usually a dict.
+        self._name_cache[cache_key] = result
+        return result
 
-            clusters_data = result.get("clusters", [])
-            clusters = [Cluster(**c) for c in clusters_data]
-
-            return clusters
-
-        except Exception as e:
-            print(f"Error during clustering: {e}")
+    async def cluster_items(self, items: list[ClusterItem]) -> list[Cluster]:
+        """Cluster a list of items into groups."""
+        if not items:
             return []
 
+        groups = self.group_items(items)
+        logger.info("items_grouped", items=len(items), groups=len(groups))
+
+        sem = asyncio.Semaphore(self.max_concurrency)
+
+        async def _build(group: list[ClusterItem]) -> Cluster | None:
+            async with sem:
+                try:
+                    name = await self.name_group(group)
+                except Exception as e:
+                    logger.error("cluster_naming_failed", size=len(group), error=str(e))
+                    return None
+
+            return Cluster(
+                title=name.title,
+                summary=name.summary,
+                target_audience=name.target_audience,
+                why_it_matters=name.why_it_matters,
+                signal_ids=[item.id for item in group],
+                quotes=_select_quotes(group),
+                urls=list(dict.fromkeys(item.url for item in group if item.url)),
+                centroid=centroid(self.vectorize(group)).tolist(),
+            )
 
-# Wrapper model helper if we needed it, but dict access is fine.
+        results = await asyncio.gather(*(_build(group) for group in groups))
+        return [c for c in results if c is not None]
@@ -25,6 +25,11 @@ class Settings(BaseSettings):
         default="new",
         description="Default Reddit listing type: hot, new, top, rising",
     )
+    fetcher: str = Field(
+        default="rss",
+        pattern="^(rss|json)$",
+        description="Default fetcher: rss (one ~25-post page) or json (paginated listing with scores)",
+    )
     posts_per_subreddit: int = Field(
         default=25,
         ge=1,
@@ -51,6 +56,14 @@ class Settings(BaseSettings):
         default="pain_radar.sqlite3",
         description="Path to SQLite database file (CLI mode)",
     )
+    shard_dir: str = Field(
+        default="shards",
+        description="Directory of per-tenant SQLite shards and their catalog (multi-tenant SQLite mode)",
+    )
+    archive_dir: str = Field(
+        default="archive",
+        description="Directory of Parquet files holding archived posts and signals",
+    )
 
     # ==========================================================================
     # SAAS CONFIGURATION (used when running as multi-tenant service)
@@ -135,6 +148,16 @@ class Settings(BaseSettings):
         description="OpenAI model to use for pain signal analysis",
     )
 
+    # Embeddings (similarity lookups, semantic matching)
+    embedding_provider: str = Field(
+        default="hashing",
+        description="Embedding provider: hashing (local, no API calls) or openai",
+    )
+    embedding_model: str = Field(
+        default="text-embedding-3-small",
+        description="Embedding model name when embedding_provider is openai",
+    )
+
     # Logging
     log_level: str = Field(
         default="INFO",
@@ -0,0 +1,242 @@
+"""Streaming signal exports.
+
+Signals are read from the store in chunks (see AsyncStore.iter_signals) and
+each chunk is written out before the next is fetched, so an export holds one
+chunk in memory however large the table is. The format follows the output
+file's extension:
+
+    .json            one JSON array
+    .ndjson, .jsonl  one JSON object per line
+    .csv             header row plus one row per signal
+    .parquet         columnar, written one row group per chunk
+
+JSON-encoded columns (evidence_signals, why, ...) are decoded into nested
+values in the JSON formats and kept as JSON text in CSV and Parquet.
+
+Parquet output needs pyarrow: ``pip install 'pain-radar[archive]'``.
+"""
+
+from __future__ import annotations
+
+import csv
+import functools
+from collections.abc import AsyncIterator, Sequence
+from pathlib import Path
+from typing import IO, Any
+
+import orjson
+
+from .logging_config import get_logger
+from .store import AsyncStore
+
+logger = get_logger(__name__)
+
+# Signal columns holding JSON text
+JSON_FIELDS = (
+    "evidence_signals",
+    "risk_flags",
+    "disqualify_reasons",
+    "why",
+    "next_validation_steps",
+    "top_comments",
+)
+
+EXPORT_FORMATS = {
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+# Rows fetched and written per chunk
+EXPORT_CHUNK_SIZE = 1000
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet exports require pyarrow: pip install 'pain-radar[archive]'") from e
+    return pa, pq
+
+
+def export_format(path: str | Path) -> str:
+    """Pick the export format for an output path from its extension.
+
+    Args:
+        path: Output file path
+
+    Returns:
+        "json", "ndjson", "csv" or "parquet"
+
+    Raises:
+        ValueError: If the extension is not a supported format
+    """
+    suffix = Path(path).suffix.lower()
+    if suffix not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {suffix or path!r}: use {', '.join(EXPORT_FORMATS)}")
+    return EXPORT_FORMATS[suffix]
+
+
+def decode_json_fields(signal: dict) -> dict:
+    """Replace a signal's JSON text columns with their decoded values, in place.
+
+    Args:
+        signal: Signal row
+
+    Returns:
+        The same dict
+    """
+    for field in JSON_FIELDS:
+        value = signal.get(field)
+        if value and isinstance(value, str):
+            try:
+                signal[field] = orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+    return signal
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize to JSON bytes; values orjson can't encode are written as strings."""
+    return orjson.dumps(value, default=str)
+
+
+async def write_json_array(f: IO[bytes], chunks: AsyncIterator[list[dict]], first: bool = True) -> int:
+    """Write signal chunks as the elements of an already opened JSON array.
+
+    Args:
+        f: Binary file positioned inside the array
+        chunks: Signal chunks
+        first: Whether no element has been written yet
+
+    Returns:
+        Number of signals written
+    """
+    count = 0
+    async for chunk in chunks:
+        for signal in chunk:
+            f.write(b"\n" if first else b",\n")
+            f.write(dumps(decode_json_fields(signal)))
+            first = False
+        count += len(chunk)
+    return count
+
+
+async def _write_json(path: Path, chunks: AsyncIterator[list[dict]]) -> int:
+    with open(path, "wb") as f:
+        f.write(b"[")
+        count = await write_json_array(f, chunks)
+        f.write(b"\n]\n" if count else b"]\n")
+    return count
+
+
+async def _write_ndjson(path: Path, chunks: AsyncIterator[list[dict]]) -> int:
+    count = 0
+    with open(path, "wb") as f:
+        async for chunk in chunks:
+            f.write(b"".join(dumps(decode_json_fields(signal)) + b"\n" for signal in chunk))
+            count += len(chunk)
+    return count
+
+
+async def _write_csv(path: Path, chunks: AsyncIterator[list[dict]]) -> int:
+    count = 0
+    with open(path, "w", newline="") as f:
+        writer = None
+        async for chunk in chunks:
+            if writer is None:
+                writer = csv.DictWriter(f, fieldnames=list(chunk[0].keys()))
+                writer.writeheader()
+            writer.writerows(chunk)
+            count += len(chunk)
+    return count
+
+
+def _arrow_type(pa, declared: str | None):
+    """Arrow type for a declared SQL column type, by SQLite's affinity rules."""
+    declared = (declared or "").upper()
+    if "INT" in declared:
+        return pa.int64()
+    if any(name in declared for name in ("REAL", "FLOA", "DOUB")):
+        return pa.float64()
+    return pa.string()
+
+
+async def _write_parquet(
+    path: Path, chunks: AsyncIterator[list[dict]], column_types: dict[str, str] | None = None
+) -> int:
+    pa, pq = _import_pyarrow()
+    column_types = column_types or {}
+    count = 0
+    writer = None
+    schema = None
+    try:
+        async for chunk in chunks:
+            if writer is None:
+                # Types come from the table definition, not the values, so a chunk
+                # of NULLs can't fix a column's type; post columns are text
+                schema = pa.schema([pa.field(name, _arrow_type(pa, column_types.get(name))) for name in chunk[0]])
+                writer = pq.ParquetWriter(path, schema, compression="zstd")
+            writer.write_table(pa.Table.from_pylist(chunk, schema=schema))
+            count += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        # Nothing to export: still leave a readable, empty file
+        pq.write_table(pa.table({}), path)
+    return count
+
+
+_WRITERS = {
+    "json": _write_json,
+    "ndjson": _write_ndjson,
+    "csv": _write_csv,
+    "parquet": _write_parquet,
+}
+
+
+async def export_signals(
+    store: AsyncStore,
+    path: str | Path,
+    limit: int | None = None,
+    include_disqualified: bool = False,
+    run_id: int | None = None,
+    fields: Sequence[str] | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """Stream signals, best first, into a file.
+
+    Args:
+        store: Connected store
+        path: Output file; its extension picks the format (see export_format)
+        limit: Maximum signals (None = all)
+        include_disqualified: Whether to include disqualified signals
+        run_id: Only signals from this run
+        fields: Columns to export (None = every signal column plus post info)
+        chunk_size: Rows fetched and written at a time
+
+    Returns:
+        Number of signals exported
+
+    Raises:
+        ValueError: If the format or a field name is invalid
+    """
+    path = Path(path)
+    fmt = export_format(path)
+    write = _WRITERS[fmt]
+    if fmt == "parquet":
+        write = functools.partial(write, column_types=await store.get_signal_column_types())
+    chunks = store.iter_signals(
+        fields=fields,
+        include_disqualified=include_disqualified,
+        run_id=run_id,
+        limit=limit,
+        chunk_size=chunk_size,
+    )
+    count = await write(path, chunks)
+    logger.info("signals_exported", path=str(path), count=count)
+    return count
@@ -0,0 +1,302 @@
+"""Keyword and semantic matching for watchlists.
+
+All keywords from all active watchlists are compiled into one Aho-Corasick
+automaton, so each signal's text is scanned once no matter how many
+watchlists or keywords exist. Hits are mapped back to watchlists, with
+subreddit filters applied per watchlist. Boolean watchlist queries (see
+query.py) add their required words to the same automaton, so a query is only
+evaluated for signals that contain at least one of them.
+
+Watchlists with a natural-language description are matched by vector
+similarity instead: their description vectors are stacked into one matrix and
+compared with signal vectors in a single matrix product.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+
+from .logging_config import get_logger
+from .query import Document, Node, compile_query
+
+logger = get_logger(__name__)
+
+# Target kw_index marking a query anchor rather than a keyword
+_QUERY_ANCHOR = -1
+
+# Document fields scanned for query anchors besides the keyword text
+_QUERY_EXTRA_FIELDS = ("target_user", "evidence")
+
+# Cosine similarity a signal needs to match a semantic watchlist by default
+DEFAULT_SEMANTIC_THRESHOLD = 0.45
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton over a fixed set of string patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            patterns: Patterns to match; empty patterns are ignored. Pattern IDs
+                are positions in this iterable.
+        """
+        self.patterns = list(patterns)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern_id)
+
+        # Breadth-first pass to compute failure links and merge outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(char, 0)
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str) -> Iterable[tuple[int, int]]:
+        """Yield every pattern occurrence in text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            (end index exclusive, pattern ID) for each occurrence
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for pattern_id in out[state]:
+                yield i + 1, pattern_id
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class WatchlistMatcher:
+    """Compiled matcher for a set of keyword watchlists.
+
+    By default matching is case-insensitive substring matching, the same as
+    ``keyword.lower() in text.lower()``. With ``word_boundary=True`` a keyword
+    only matches when it is not surrounded by other word characters.
+
+    A watchlist with a "query" also matches when its query matches the
+    signal's fields; queries always match whole words case-insensitively.
+    """
+
+    def __init__(
+        self,
+        watchlists: list[dict],
+        case_sensitive: bool = False,
+        word_boundary: bool = False,
+    ):
+        """Compile the matcher.
+
+        Args:
+            watchlists: Watchlist dicts with "id", "keywords" and optional
+                "subreddits" and "query"
+            case_sensitive: Match keywords with their exact case
+            word_boundary: Only match whole words/phrases
+
+        Raises:
+            QuerySyntaxError: If a watchlist query is malformed
+        """
+        self.watchlists = watchlists
+        self.case_sensitive = case_sensitive
+        self.word_boundary = word_boundary
+        self._subreddits = [frozenset(wl.get("subreddits") or ()) for wl in watchlists]
+
+        # Identical keywords across watchlists share one pattern
+        pattern_ids: dict[str, int] = {}
+        self._targets: list[list[tuple[int, int]]] = []
+
+        def _add(pattern: str, wl_index: int, kw_index: int) -> None:
+            if pattern not in pattern_ids:
+                pattern_ids[pattern] = len(self._targets)
+                self._targets.append([])
+            self._targets[pattern_ids[pattern]].append((wl_index, kw_index))
+
+        self._queries: dict[int, Node] = {}
+        self._unanchored: list[int] = []
+        for wl_index, wl in enumerate(watchlists):
+            for kw_index, keyword in enumerate(wl.get("keywords") or []):
+                pattern = self._fold(keyword)
+                if pattern:
+                    _add(pattern, wl_index, kw_index)
+            if wl.get("query"):
+                query = compile_query(wl["query"])
+                self._queries[wl_index] = query
+                anchors = query.anchors()
+                if anchors is None or case_sensitive:
+                    self._unanchored.append(wl_index)
+                else:
+                    for anchor in anchors:
+                        _add(anchor, wl_index, _QUERY_ANCHOR)
+
+        self._automaton = AhoCorasick(pattern_ids)
+        logger.debug(
+            "watchlist_matcher_compiled",
+            watchlists=len(watchlists),
+            patterns=len(pattern_ids),
+            queries=len(self._queries),
+        )
+
+    def _fold(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def match(
+        self, text: str, subreddit: str | None = None, fields: dict[str, str | None] | None = None
+    ) -> list[tuple[dict, str]]:
+        """Find the watchlists a text matches.
+
+        Args:
+            text: Signal text to scan for keywords
+            subreddit: Subreddit of the signal, checked against watchlist filters
+            fields: Signal fields for watchlist queries (see query.FIELDS);
+                defaults to the text as the summary
+
+        Returns:
+            (watchlist, keyword) pairs in watchlist order, one per matching
+            watchlist. The keyword is the first of that watchlist's keywords
+            that occurs in the text, or the watchlist's query if only the
+            query matched.
+        """
+        folded = self._fold(text)
+        scanned = folded
+        if self._queries and fields:
+            # Keyword hits must end inside the keyword text; anchors may be anywhere
+            extra = " ".join(fields.get(name) or "" for name in _QUERY_EXTRA_FIELDS)
+            scanned = f"{folded}\x00{self._fold(extra)}"
+        patterns = self._automaton.patterns
+        best: dict[int, int] = {}
+        candidates = set(self._unanchored)
+
+        for end, pattern_id in self._automaton.iter_matches(scanned):
+            keyword_hit = end <= len(folded)
+            if keyword_hit and self.word_boundary:
+                start = end - len(patterns[pattern_id])
+                if (start > 0 and _is_word_char(folded[start - 1])) or (
+                    end < len(folded) and _is_word_char(folded[end])
+                ):
+                    keyword_hit = False
+            for wl_index, kw_index in self._targets[pattern_id]:
+                if kw_index == _QUERY_ANCHOR:
+                    candidates.add(wl_index)
+                elif keyword_hit and kw_index < best.get(wl_index, kw_index + 1):
+                    best[wl_index] = kw_index
+
+        matched: dict[int, str] = {}
+        for wl_index, kw_index in best.items():
+            matched[wl_index] = self.watchlists[wl_index]["keywords"][kw_index]
+        if candidates - matched.keys():
+            doc = Document(fields or {"signal_summary": text})
+            for wl_index in candidates - matched.keys():
+                if self._queries[wl_index].matches(doc):
+                    matched[wl_index] = self.watchlists[wl_index]["query"]
+
+        results = []
+        for wl_index in sorted(matched):
+            allowed = self._subreddits[wl_index]
+            if allowed and subreddit not in allowed:
+                continue
+            results.append((self.watchlists[wl_index], matched[wl_index]))
+        return results
+
+
+class SemanticMatcher:
+    """Vector-similarity matcher for watchlists with a description.
+
+    Matching a batch of signals is one ``(signals, dim) @ (dim, watchlists)``
+    product followed by a threshold comparison, so cost grows with the matrix
+    size rather than with per-watchlist Python work.
+    """
+
+    def __init__(self, watchlists: list[dict], default_threshold: float = DEFAULT_SEMANTIC_THRESHOLD):
+        """Stack the description vectors.
+
+        Args:
+            watchlists: Watchlist dicts; those without a "description_vector"
+                are ignored. An optional "semantic_threshold" overrides the default.
+            default_threshold: Threshold for watchlists that don't set one
+        """
+        self.watchlists = [wl for wl in watchlists if wl.get("description_vector") is not None]
+        if self.watchlists:
+            self._matrix = np.ascontiguousarray(
+                np.vstack([wl["description_vector"] for wl in self.watchlists]), dtype=np.float32
+            )
+        else:
+            self._matrix = np.zeros((0, 0), dtype=np.float32)
+        self._thresholds = np.array(
+            [
+                default_threshold if wl.get("semantic_threshold") is None else wl["semantic_threshold"]
+                for wl in self.watchlists
+            ],
+            dtype=np.float32,
+        )
+        self._subreddits = [frozenset(wl.get("subreddits") or ()) for wl in self.watchlists]
+
+    def __len__(self) -> int:
+        return len(self.watchlists)
+
+    def match_many(
+        self, vectors: np.ndarray, subreddits: Sequence[str | None] | None = None
+    ) -> list[list[tuple[dict, float]]]:
+        """Find the semantic watchlists each signal vector matches.
+
+        Args:
+            vectors: (signals, dim) matrix of normalized signal vectors
+            subreddits: Subreddit of each signal, checked against watchlist filters
+
+        Returns:
+            One list of (watchlist, similarity) pairs per signal, in watchlist order
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if not len(self) or not len(vectors):
+            return [[] for _ in range(len(vectors))]
+
+        scores = vectors @ self._matrix.T
+        results: list[list[tuple[dict, float]]] = [[] for _ in range(len(vectors))]
+        for row, col in zip(*np.nonzero(scores >= self._thresholds), strict=True):
+            allowed = self._subreddits[col]
+            if allowed and (subreddits is None or subreddits[row] not in allowed):
+                continue
+            results[row].append((self.watchlists[col], float(scores[row, col])))
+        return results
+
+    def match(self, vector: np.ndarray, subreddit: str | None = None) -> list[tuple[dict, float]]:
+        """Find the semantic watchlists one signal vector matches.
+
+        Args:
+            vector: Normalized signal vector
+            subreddit: Subreddit of the signal
+
+        Returns:
+            (watchlist, similarity) pairs in watchlist order
+        """
+        return self.match_many(np.asarray(vector, dtype=np.float32)[None, :], [subreddit])[0]
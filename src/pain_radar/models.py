@@ -184,6 +184,15 @@ class ClusterItem(BaseModel):
     evidence: list[EvidenceSignal]
 
 
+class ClusterName(BaseModel):
+    """Structured output for naming a pre-grouped Pain Cluster."""
+
+    title: str = Field(..., description="Catchy title for the pain cluster")
+    summary: str = Field(..., description="1-sentence summary of the pattern")
+    target_audience: str = Field(..., description="Who is affected")
+    why_it_matters: str = Field(..., description="Why this is a good opportunity")
+
+
 class Cluster(BaseModel):
     """A grouped set of pain points (Pain Cluster)."""
 
@@ -201,6 +210,9 @@ class Cluster(BaseModel):
     # URLs for the digest
     urls: list[str] = Field(..., description="URLs to the source threads")
 
+    # Mean vector of member signals, used for incremental assignment (not serialized)
+    centroid: list[float] | None = Field(default=None, exclude=True)
+
 
 # Backward compatibility aliases (deprecated, use new names)
 IdeaExtraction = PainSignal
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+from typing import Protocol
 
 from langchain_core.language_models import BaseChatModel
 
@@ -18,8 +19,8 @@ from .progress import (
     start_analyze_task,
     start_fetch_task,
 )
-from .reddit_async import RedditPost, fetch_all_subreddits
-from .store import AsyncStore
+from .reddit_async import INCREMENTAL_LISTINGS, RedditPost, fetch_all_subreddits, high_water_marks
+from .store import AsyncStore, PostgresStore
 
 logger = get_logger(__name__)
 
@@ -37,6 +38,18 @@ class PipelineResult:
     top_signals: list[dict]
 
 
+class FetchSettings(Protocol):
+    """The settings fetch_and_store reads."""
+
+    subreddits: list[str]
+    listing: str
+    fetchers: dict[str, str]
+    posts_per_subreddit: int
+    top_comments: int
+    max_concurrency: int
+    user_agent: str
+
+
 async def process_post(
     llm: BaseChatModel,
     store: AsyncStore,
@@ -72,6 +85,39 @@ async def process_post(
             return (post.id, None, str(e))
 
 
+async def fetch_and_store(store: AsyncStore, settings: FetchSettings) -> list[RedditPost]:
+    """Fetch new posts for the configured subreddits and store them.
+
+    For newest-first listings, each subreddit's high-water mark is read
+    before fetching and advanced only after the posts are stored, so a
+    failed run never skips posts.
+
+    Args:
+        store: Connected store
+        settings: Subreddits to fetch and how (see FetchSettings)
+
+    Returns:
+        The new posts
+    """
+    incremental = settings.listing in INCREMENTAL_LISTINGS
+    marks = await store.get_high_water_marks(settings.listing) if incremental else None
+
+    posts = await fetch_all_subreddits(
+        subreddits=settings.subreddits,
+        listing=settings.listing,
+        limit=settings.posts_per_subreddit,
+        top_comments=settings.top_comments,
+        max_concurrency=settings.max_concurrency,
+        user_agent=settings.user_agent,
+        fetchers=settings.fetchers,
+        marks=marks,
+    )
+    await store.upsert_posts(posts)
+    if incremental:
+        await store.update_high_water_marks(settings.listing, high_water_marks(posts))
+    return posts
+
+
 async def run_pipeline(
     settings: Settings,
     llm: BaseChatModel,
@@ -97,7 +143,7 @@ async def run_pipeline(
     )
 
     # Initialize storage
-    store = AsyncStore(settings.db_path)
+    store = PostgresStore(settings.database_url) if settings.database_url else AsyncStore(settings.db_path)
     await store.connect()
     await store.init_db()
 
@@ -115,16 +161,8 @@ async def run_pipeline(
             estimated_posts = len(settings.subreddits) * settings.posts_per_subreddit
             start_fetch_task(estimated_posts)
 
-            posts = await fetch_all_subreddits(
-                subreddits=settings.subreddits,
-                listing=settings.listing,
-                limit=settings.posts_per_subreddit,
-                top_comments=settings.top_comments,
-                max_concurrency=settings.max_concurrency,
-                user_agent=settings.user_agent,
-            )
+            posts = await fetch_and_store(store, settings)
             complete_fetch()
-            await store.upsert_posts(posts)
         else:
             # Load unprocessed posts from database
             limit = process_limit or 1000
@@ -242,20 +280,12 @@ async def run_fetch_only(settings: Settings) -> int:
     """
     logger.info("fetch_only_starting", subreddits=settings.subreddits)
 
-    store = AsyncStore(settings.db_path)
+    store = PostgresStore(settings.database_url) if settings.database_url else AsyncStore(settings.db_path)
     await store.connect()
     await store.init_db()
 
     try:
-        posts = await fetch_all_subreddits(
-            subreddits=settings.subreddits,
-            listing=settings.listing,
-            limit=settings.posts_per_subreddit,
-            top_comments=settings.top_comments,
-            max_concurrency=settings.max_concurrency,
-            user_agent=settings.user_agent,
-        )
-        await store.upsert_posts(posts)
+        posts = await fetch_and_store(store, settings)
         return len(posts)
     finally:
         await store.close()
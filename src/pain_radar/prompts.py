@@ -156,61 +156,38 @@ Risk Flags:
 Score this pain signal's quality. Be conservative."""
 
 
-# Clustering Prompt - THE CORE OF PAIN RADAR
-CLUSTER_SYSTEM_PROMPT = """You are PainRadar, a signal intelligence tool that groups recurring pain points into actionable clusters.
+# Cluster Naming Prompt - THE CORE OF PAIN RADAR
+# Grouping is done locally (see vectors.py); the LLM only names each group.
+CLUSTER_NAME_SYSTEM_PROMPT = """You are PainRadar, a signal intelligence tool that turns recurring pain points into actionable clusters.
 
-TASK: Group the provided Reddit findings into 3-7 tight "Pain Clusters".
+TASK: Name ONE "Pain Cluster" - a group of Reddit posts that were already grouped together
+because they point to the **same underlying frustration or unmet need**.
 
-A "Pain Cluster" is a group of posts that all point to the **same underlying frustration or unmet need**.
-
-INPUT: A list of pain signals, each with: ID, Summary, Pain Point, Subreddit, Quotes.
-
-═══════════════════════════════════════════════════════════════
-CLUSTERING GUIDELINES
-═══════════════════════════════════════════════════════════════
-
-1. Find COMMON PATTERNS - look for:
-   - Same tool/service mentioned as painful
-   - Same workflow/process that's broken
-   - Same type of user struggling with the same type of problem
-
-2. Create TIGHT clusters:
-   - A cluster must have at least 2 items
-   - Don't force-fit isolated signals
-   - Better to have fewer, tighter clusters than many loose ones
-
-3. For each Cluster, provide:
-   - **title**: Catchy, describes the theme (e.g., "Stripe Connect is a nightmare for marketplaces")
-   - **summary**: 1 sentence synthesis of the problem pattern
-   - **target_audience**: Who cares about this? Be specific.
-   - **why_it_matters**: Why is this a real opportunity?
-   - **quotes**: 2-3 of the BEST verbatim quotes that illustrate the pain (emotionally resonant)
-   - **signal_ids**: The IDs of signals in this cluster
-   - **urls**: The URLs of the source threads
+INPUT: The signals in the cluster, each with: Summary, Pain Point, Subreddit, Quotes.
 
 ═══════════════════════════════════════════════════════════════
-QUOTE SELECTION
+NAMING GUIDELINES
 ═══════════════════════════════════════════════════════════════
 
-Select quotes that are:
-- Emotionally resonant ("I've wasted 3 weeks on this")
-- Specific ("Every checkout plugin breaks with Shopify 2.0")
-- Quotable (would work in a weekly digest post)
+Look for what the signals have in common:
+- Same tool/service mentioned as painful
+- Same workflow/process that's broken
+- Same type of user struggling with the same type of problem
 
-Avoid quotes that are:
-- Generic ("this is frustrating")
-- Too long
-- Technical jargon without context
+Provide:
+- **title**: Catchy, describes the theme (e.g., "Stripe Connect is a nightmare for marketplaces")
+- **summary**: 1 sentence synthesis of the problem pattern
+- **target_audience**: Who cares about this? Be specific.
+- **why_it_matters**: Why is this a real opportunity?
 
-OUTPUT:
-A JSON object with a list of `clusters`.
+Ground every field in the signals provided. Do not invent details.
 """
 
-CLUSTER_USER_TEMPLATE = """Here are the pain signals to cluster:
+CLUSTER_NAME_USER_TEMPLATE = """Here are the pain signals in this cluster:
 
 {items_json}
 
-Group them into high-signal Pain Clusters. Select the best quotes for each cluster."""
+Name this Pain Cluster."""
 
 
 # Weekly Digest Generation Prompt
@@ -0,0 +1,295 @@
+"""Boolean query language for watchlists and search.
+
+Queries combine words and quoted phrases with ``AND``, ``OR``, ``NOT`` (or a
+leading ``-``) and parentheses; adjacent terms are ANDed. Terms can be scoped
+to one field with a prefix, and a trailing ``*`` matches word prefixes::
+
+    stripe AND (payout OR "bank transfer") -refund
+    pain:"cash flow" sub:SaaS
+    title:invoic*
+
+Queries are parsed once into a tree (``compile_query`` caches by text). The
+tree is evaluated in Python against a signal's fields for watchlist checks,
+or translated into an FTS5 expression for ``AsyncStore.search_signals``
+(``PostgresStore.search_signals`` builds tsquery conditions from it instead).
+Matching is on whole words, case-insensitively; search additionally stems
+words, so it can return a few more results than a watchlist.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Query field prefixes -> signal fields (and signals_fts columns)
+FIELDS = {
+    "summary": "signal_summary",
+    "pain": "pain_point",
+    "user": "target_user",
+    "quote": "evidence",
+    "title": "post_title",
+    "sub": "subreddit",
+}
+
+# Fields searched by terms without a prefix
+DEFAULT_FIELDS = ("signal_summary", "pain_point", "evidence", "post_title")
+
+_WORD_RE = re.compile(r"\w+")
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+
+
+class QuerySyntaxError(ValueError):
+    """Raised when a query can't be parsed or translated."""
+
+
+def _words(text: str) -> tuple[str, ...]:
+    return tuple(_WORD_RE.findall(text.lower()))
+
+
+class Document:
+    """A signal's searchable fields, tokenized lazily and cached per field."""
+
+    def __init__(self, fields: dict[str, str | None]):
+        """Initialize the document.
+
+        Args:
+            fields: Field name (see FIELDS values) to text
+        """
+        self.fields = fields
+        self._tokens: dict[str, tuple[str, ...]] = {}
+        self._joined: dict[str, str] = {}
+
+    def tokens(self, field: str) -> tuple[str, ...]:
+        """Lowercased words of a field."""
+        if field not in self._tokens:
+            self._tokens[field] = _words(self.fields.get(field) or "")
+        return self._tokens[field]
+
+    def joined(self, field: str) -> str:
+        """Words of a field joined by single spaces and padded, for phrase lookups."""
+        if field not in self._joined:
+            self._joined[field] = f" {' '.join(self.tokens(field))} "
+        return self._joined[field]
+
+
+@dataclass(frozen=True)
+class Term:
+    """A word or phrase, optionally scoped to a field and/or a prefix match."""
+
+    words: tuple[str, ...]
+    field: str | None = None
+    prefix: bool = False
+
+    def matches(self, doc: Document) -> bool:
+        for field in (self.field,) if self.field else DEFAULT_FIELDS:
+            if self.prefix:
+                needle = " ".join(self.words)
+                haystack = doc.joined(field)
+                if f" {needle}" in haystack:
+                    return True
+            elif len(self.words) == 1:
+                if self.words[0] in doc.tokens(field):
+                    return True
+            elif f" {' '.join(self.words)} " in doc.joined(field):
+                return True
+        return False
+
+    def anchors(self) -> frozenset[str] | None:
+        # The subreddit isn't part of the scanned text, so it can't anchor a match
+        if self.field == "subreddit":
+            return None
+        return frozenset({max(self.words, key=len)})
+
+    def to_fts(self) -> str:
+        phrase = '"' + " ".join(self.words) + '"' + ("*" if self.prefix else "")
+        columns = self.field or " ".join(DEFAULT_FIELDS)
+        return f"{{{columns}}} : {phrase}"
+
+
+@dataclass(frozen=True)
+class Not:
+    """Negation of a sub-query."""
+
+    child: Node
+
+    def matches(self, doc: Document) -> bool:
+        return not self.child.matches(doc)
+
+    def anchors(self) -> frozenset[str] | None:
+        return None
+
+    def to_fts(self) -> str:
+        raise QuerySyntaxError("NOT needs a positive term to apply to in search queries")
+
+
+@dataclass(frozen=True)
+class And:
+    """Conjunction of sub-queries."""
+
+    children: tuple[Node, ...]
+
+    def matches(self, doc: Document) -> bool:
+        return all(child.matches(doc) for child in self.children)
+
+    def anchors(self) -> frozenset[str] | None:
+        # Any one child's anchors are required; the smallest set filters best
+        candidates = [a for a in (child.anchors() for child in self.children) if a is not None]
+        return min(candidates, key=len) if candidates else None
+
+    def to_fts(self) -> str:
+        positive = [child for child in self.children if not isinstance(child, Not)]
+        negative = [child for child in self.children if isinstance(child, Not)]
+        if not positive:
+            raise QuerySyntaxError("NOT needs a positive term to apply to in search queries")
+        expr = " AND ".join(f"({child.to_fts()})" for child in positive)
+        for child in negative:
+            expr = f"({expr}) NOT ({child.child.to_fts()})"
+        return expr
+
+
+@dataclass(frozen=True)
+class Or:
+    """Disjunction of sub-queries."""
+
+    children: tuple[Node, ...]
+
+    def matches(self, doc: Document) -> bool:
+        return any(child.matches(doc) for child in self.children)
+
+    def anchors(self) -> frozenset[str] | None:
+        anchors: set[str] = set()
+        for child in self.children:
+            child_anchors = child.anchors()
+            if child_anchors is None:
+                return None
+            anchors |= child_anchors
+        return frozenset(anchors)
+
+    def to_fts(self) -> str:
+        return " OR ".join(f"({child.to_fts()})" for child in self.children)
+
+
+Node = Term | Not | And | Or
+
+
+class _Parser:
+    """Recursive-descent parser: or := and (OR and)*; and := unary+; unary := NOT unary | -atom | atom."""
+
+    def __init__(self, text: str):
+        self.tokens: list[tuple[str, str]] = []
+        pos = 0
+        text = text.strip()
+        while pos < len(text):
+            match = _TOKEN_RE.match(text, pos)
+            if not match or match.end() == pos:
+                raise QuerySyntaxError(f"Unterminated quote in query: {text!r}")
+            pos = match.end()
+            lparen, rparen, phrase, word = match.groups()
+            if lparen:
+                self.tokens.append(("(", lparen))
+            elif rparen:
+                self.tokens.append((")", rparen))
+            elif phrase is not None:
+                self.tokens.append(("phrase", phrase))
+            elif word in ("AND", "OR", "NOT"):
+                self.tokens.append((word, word))
+            else:
+                self.tokens.append(("word", word))
+        self.pos = 0
+
+    def peek(self) -> str | None:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self) -> tuple[str, str]:
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise QuerySyntaxError("Empty query")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"Unexpected {self.tokens[self.pos][1]!r} in query")
+        return node
+
+    def parse_or(self) -> Node:
+        children = [self.parse_and()]
+        while self.peek() == "OR":
+            self.take()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def parse_and(self) -> Node:
+        children = [self.parse_unary()]
+        while self.peek() not in (None, ")", "OR"):
+            if self.peek() == "AND":
+                self.take()
+            children.append(self.parse_unary())
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def parse_unary(self) -> Node:
+        if self.peek() == "NOT":
+            self.take()
+            return Not(self.parse_unary())
+        return self.parse_atom()
+
+    def parse_atom(self) -> Node:
+        kind = self.peek()
+        if kind is None:
+            raise QuerySyntaxError("Query ends where a term was expected")
+        if kind == "(":
+            self.take()
+            node = self.parse_or()
+            if self.peek() != ")":
+                raise QuerySyntaxError("Missing closing parenthesis in query")
+            self.take()
+            return node
+        if kind == "phrase":
+            return self._term(self.take()[1], None)
+        if kind != "word":
+            raise QuerySyntaxError(f"Unexpected {self.tokens[self.pos][1]!r} in query")
+
+        word = self.take()[1]
+        if word == "-" and self.peek() == "phrase":
+            return Not(self._term(self.take()[1], None))
+        if word.startswith("-") and len(word) > 1:
+            return Not(self._scoped(word[1:]))
+        return self._scoped(word)
+
+    def _scoped(self, word: str) -> Node:
+        field = None
+        prefix, sep, rest = word.partition(":")
+        if sep and prefix.lower() in FIELDS:
+            field = FIELDS[prefix.lower()]
+            if not rest:
+                # Scoped phrase or group: pain:"cash flow"
+                if self.peek() == "phrase":
+                    return self._term(self.take()[1], field)
+                raise QuerySyntaxError(f"Expected a term after {word!r}")
+            word = rest
+        return self._term(word, field)
+
+    def _term(self, text: str, field: str | None) -> Term:
+        prefix = text.endswith("*")
+        words = _words(text.rstrip("*"))
+        if not words:
+            raise QuerySyntaxError(f"No searchable words in {text!r}")
+        return Term(words, field=field, prefix=prefix)
+
+
+@lru_cache(maxsize=4096)
+def compile_query(text: str) -> Node:
+    """Parse a query into an evaluable tree, caching by query text.
+
+    Args:
+        text: Query text
+
+    Returns:
+        Root node with ``matches(Document)``, ``anchors()`` and ``to_fts()``
+
+    Raises:
+        QuerySyntaxError: If the query is malformed
+    """
+    return _Parser(text).parse()
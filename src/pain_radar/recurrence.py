@@ -0,0 +1,194 @@
+"""Cross-week recurrence tracking for pain clusters.
+
+Each week's clusters are linked to a persisted lineage: the chain of clusters
+describing the same pain across weeks. A new cluster joins the lineage whose
+centroid is most similar, with a small bonus when it is voiced in the same
+subreddits; otherwise it starts a new lineage. Growth metrics (signals per
+week, week-over-week growth streak) are updated incrementally on the lineage
+row, so trend questions are answered from an index instead of re-analysing
+history.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .logging_config import get_logger
+
+if TYPE_CHECKING:
+    from .store import AsyncStore
+
+logger = get_logger(__name__)
+
+# Minimum combined score for a cluster to continue an existing lineage
+DEFAULT_LINEAGE_THRESHOLD = 0.5
+
+# Score bonus for full subreddit overlap between a cluster and a lineage. Posts
+# are analysed once, so member posts never repeat across weeks; the subreddits
+# a pain is voiced in do.
+SUBREDDIT_BONUS = 0.1
+
+# Lineages not seen for longer than this are not matched against
+DEFAULT_LOOKBACK_DAYS = 28
+
+
+@dataclass
+class RecurrenceResult:
+    """Summary of one recurrence tracking pass."""
+
+    weeks: list[str]
+    linked: int = 0
+    created: int = 0
+
+
+def _jaccard(a: set[str], b: set[str]) -> float:
+    """Jaccard overlap of two sets (0.0 when both are empty)."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def match_lineages(
+    clusters: list[dict],
+    lineages: list[dict],
+    threshold: float = DEFAULT_LINEAGE_THRESHOLD,
+) -> dict[str, int]:
+    """Match new clusters to existing lineages one-to-one.
+
+    Pairs are scored as ``cosine + SUBREDDIT_BONUS * jaccard`` over the
+    subreddits of member signals, then accepted greedily from the highest
+    score down, so each cluster and each lineage is used at most once.
+
+    Args:
+        clusters: New clusters with "id", "centroid" and "subreddits"
+        lineages: Candidate lineages with "id", "centroid" and "subreddits"
+        threshold: Minimum combined score for a match
+
+    Returns:
+        Mapping of cluster ID to matched lineage ID (unmatched clusters are absent)
+    """
+    if not clusters or not lineages:
+        return {}
+
+    cluster_vecs = np.vstack([c["centroid"] for c in clusters])
+    lineage_vecs = np.vstack([lin["centroid"] for lin in lineages])
+    scores = cluster_vecs @ lineage_vecs.T
+
+    for i, cluster in enumerate(clusters):
+        for j, lineage in enumerate(lineages):
+            scores[i, j] += SUBREDDIT_BONUS * _jaccard(cluster["subreddits"], lineage["subreddits"])
+
+    pairs = sorted(
+        ((float(scores[i, j]), i, j) for i in range(len(clusters)) for j in range(len(lineages))),
+        key=lambda p: (-p[0], p[1], p[2]),
+    )
+
+    matches: dict[str, int] = {}
+    used: set[int] = set()
+    for score, i, j in pairs:
+        if score < threshold:
+            break
+        cluster_id = clusters[i]["id"]
+        if cluster_id in matches or j in used:
+            continue
+        matches[cluster_id] = lineages[j]["id"]
+        used.add(j)
+    return matches
+
+
+def advance_growth(lineage: dict, week_start: str, total: int) -> dict | None:
+    """Compute a lineage's growth metrics after observing a week's signal total.
+
+    The streak counts consecutive week-over-week increases ending at the
+    lineage's latest week. A skipped week breaks the streak. Re-observing the
+    latest week (e.g. after more signals were attached) recomputes it from the
+    previous week's values instead of double counting.
+
+    Args:
+        lineage: Lineage row with last_week, last_signal_count, prev_signal_count,
+            prev_streak, growth_streak and weeks_seen
+        week_start: Week being observed (ISO date)
+        total: Signals in the lineage's clusters for that week
+
+    Returns:
+        Updated metric columns, or None if the week is older than the lineage's latest week
+    """
+    last_week = lineage.get("last_week")
+    if last_week and week_start < last_week:
+        return None
+
+    prev_count = lineage.get("prev_signal_count")
+    prev_streak = lineage.get("prev_streak") or 0
+    weeks_seen = lineage.get("weeks_seen") or 0
+
+    if last_week != week_start:
+        consecutive = bool(last_week) and (
+            date.fromisoformat(week_start) - date.fromisoformat(last_week) <= timedelta(days=7)
+        )
+        if consecutive:
+            prev_count = lineage.get("last_signal_count")
+            prev_streak = lineage.get("growth_streak") or 0
+        else:
+            prev_count = None
+            prev_streak = 0
+        weeks_seen += 1
+
+    grew = prev_count is not None and total > prev_count
+    return {
+        "last_week": week_start,
+        "weeks_seen": weeks_seen,
+        "last_signal_count": total,
+        "prev_signal_count": prev_count,
+        "prev_streak": prev_streak,
+        "growth_streak": prev_streak + 1 if grew else 0,
+        "growth_rate": (total - prev_count) / prev_count if prev_count else None,
+    }
+
+
+async def track_recurrence(
+    store: AsyncStore,
+    weeks: list[str] | None = None,
+    threshold: float = DEFAULT_LINEAGE_THRESHOLD,
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS,
+) -> RecurrenceResult:
+    """Link clusters to lineages and refresh lineage growth metrics.
+
+    Args:
+        store: Connected store
+        weeks: Extra weeks to refresh; weeks with clusters not yet linked are always processed
+        threshold: Minimum combined score for continuing a lineage
+        lookback_days: How far back a lineage may have last been seen
+
+    Returns:
+        RecurrenceResult with counts of linked clusters and new lineages
+    """
+    pending = await store.get_weeks_with_unlinked_clusters()
+    result = RecurrenceResult(weeks=sorted(set(pending) | set(weeks or [])))
+
+    for week_start in result.weeks:
+        clusters = await store.get_unlinked_clusters(week_start)
+        if clusters:
+            lineages = await store.get_lineage_candidates(week_start, lookback_days=lookback_days)
+            matches = match_lineages(clusters, lineages, threshold=threshold)
+            centroids = {lineage["id"]: lineage["centroid"] for lineage in lineages}
+            result.created += await store.link_clusters_to_lineages(clusters, matches, week_start, centroids)
+            result.linked += len(matches)
+
+        updates = {}
+        for lineage in await store.get_lineage_week_totals(week_start):
+            metrics = advance_growth(lineage, week_start, lineage["week_total"])
+            if metrics is not None:
+                updates[lineage["id"]] = metrics
+        await store.update_lineage_metrics(updates)
+
+    logger.info(
+        "recurrence_tracked",
+        weeks=len(result.weeks),
+        linked=result.linked,
+        created=result.created,
+    )
+    return result
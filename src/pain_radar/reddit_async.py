@@ -1,5 +1,9 @@
 """Reddit scraping using RSS feeds and HTTP requests (no API required).
 
+Posts come from a subreddit's RSS feed (one page of about 25 posts, without
+engagement data) or its public JSON listing (pages of up to 100 posts with
+scores, comment counts and timestamps), chosen per source set.
+
 Uses centralized HTTP client and retry policies for robustness.
 """
 
@@ -31,6 +35,18 @@ REDDIT_BASE = "https://www.reddit.com"
 # Polite delay between requests (seconds)
 REQUEST_DELAY = 0.5
 
+# Ways to fetch a subreddit's posts
+FETCHERS = ("rss", "json")
+
+# Posts per JSON listing page (Reddit's maximum)
+LISTING_PAGE_SIZE = 100
+
+# Posts per RSS feed; feeds are not paginated
+RSS_PAGE_SIZE = 25
+
+# Listings ordered newest first, where a high-water mark separates seen posts from new ones
+INCREMENTAL_LISTINGS = ("new",)
+
 
 @dataclass
 class RedditPost:
@@ -152,6 +168,162 @@ async def _fetch_rss(
     return posts
 
 
+def _post_key(created_utc: int, post_id: str) -> tuple[int, int, str]:
+    # Base36 IDs grow with time; without leading zeros, longer means newer
+    return created_utc, len(post_id), post_id
+
+
+def is_seen(post: RedditPost, mark: tuple[int, str] | None) -> bool:
+    """Check whether a post is at or below a high-water mark.
+
+    Args:
+        post: Fetched post
+        mark: (created_utc, post ID) of the newest post already fetched
+
+    Returns:
+        True if the post was already fetched (posts without a timestamp never are)
+    """
+    if mark is None or post.created_utc <= 0:
+        return False
+    return _post_key(post.created_utc, post.id) <= _post_key(*mark)
+
+
+def high_water_marks(posts: list[RedditPost]) -> dict[str, tuple[int, str]]:
+    """Find the newest post of each subreddit.
+
+    Args:
+        posts: Fetched posts
+
+    Returns:
+        Lowercased subreddit name to (created_utc, post ID)
+    """
+    marks: dict[str, tuple[int, str]] = {}
+    for post in posts:
+        sub = post.subreddit.lower()
+        if post.created_utc > 0 and (sub not in marks or _post_key(post.created_utc, post.id) > _post_key(*marks[sub])):
+            marks[sub] = (post.created_utc, post.id)
+    return marks
+
+
+def _parse_listing_child(child: dict, subreddit: str) -> RedditPost | None:
+    """Parse a JSON listing child into a RedditPost."""
+    if child.get("kind") != "t3":  # t3 = post
+        return None
+    data = child.get("data") or {}
+    post_id = data.get("id")
+    if not post_id:
+        return None
+
+    permalink = REDDIT_BASE + (data.get("permalink") or f"/r/{subreddit}/comments/{post_id}/")
+    body = data.get("selftext") or ""
+    return RedditPost(
+        id=post_id,
+        subreddit=data.get("subreddit") or subreddit,
+        title=data.get("title") or "",
+        body="" if body in ("[deleted]", "[removed]") else body,
+        created_utc=int(data.get("created_utc") or 0),
+        score=int(data.get("score") or 0),
+        num_comments=int(data.get("num_comments") or 0),
+        url=data.get("url") or permalink,
+        permalink=permalink,
+        top_comments=[],
+    )
+
+
+@http_retry
+async def _fetch_listing_page(
+    client: httpx.AsyncClient,
+    subreddit: str,
+    listing: str,
+    limit: int,
+    after: str | None = None,
+) -> tuple[list[RedditPost], str | None]:
+    """Fetch one page of a subreddit's JSON listing.
+
+    Args:
+        client: HTTP client
+        subreddit: Subreddit name
+        listing: Listing type (hot, new, top, rising)
+        limit: Posts on the page (at most LISTING_PAGE_SIZE)
+        after: Cursor from the previous page
+
+    Returns:
+        (posts, cursor for the next page or None on the last page)
+    """
+    url = f"{REDDIT_BASE}/r/{subreddit}/{listing}.json"
+    # raw_json=1 returns text unescaped instead of HTML-entity encoded
+    params: dict[str, str | int] = {"limit": limit, "raw_json": 1}
+    if after:
+        params["after"] = after
+    logger.debug("fetching_listing_page", url=url, after=after)
+
+    response = await client.get(url, params=params)
+
+    # Handle special cases (don't retry these)
+    if response.status_code == 403:
+        logger.warning("subreddit_private_or_banned", subreddit=subreddit)
+        return [], None
+    if response.status_code == 404:
+        logger.warning("subreddit_not_found", subreddit=subreddit)
+        return [], None
+
+    # Check for retryable errors (429, 5xx)
+    check_response_for_retry(response)
+
+    try:
+        data = response.json().get("data") or {}
+    except Exception as e:
+        logger.warning("json_parse_failed", subreddit=subreddit, error=str(e))
+        return [], None
+
+    posts = []
+    for child in data.get("children") or []:
+        post = _parse_listing_child(child, subreddit)
+        if post:
+            posts.append(post)
+    return posts, data.get("after")
+
+
+async def _fetch_json_listing(
+    client: httpx.AsyncClient,
+    subreddit: str,
+    listing: str,
+    limit: int,
+    mark: tuple[int, str] | None = None,
+) -> list[RedditPost]:
+    """Fetch posts from a subreddit's JSON listing, following its cursors.
+
+    Args:
+        client: HTTP client
+        subreddit: Subreddit name
+        listing: Listing type (hot, new, top, rising)
+        limit: Maximum posts to fetch
+        mark: High-water mark of a newest-first listing; paging stops at the
+            first post at or below it
+
+    Returns:
+        List of RedditPost objects with score, comment count and creation time
+    """
+    posts: list[RedditPost] = []
+    after = None
+    pages = 0
+    while len(posts) < limit:
+        if pages:
+            # Polite delay between pages
+            await asyncio.sleep(REQUEST_DELAY)
+        page, after = await _fetch_listing_page(
+            client, subreddit, listing, min(LISTING_PAGE_SIZE, limit - len(posts)), after
+        )
+        pages += 1
+        new = [post for post in page if not is_seen(post, mark)]
+        posts.extend(new)
+        if len(new) < len(page) or not after:
+            break
+
+    logger.info("json_listing_fetched", subreddit=subreddit, posts=len(posts), pages=pages)
+    return posts[:limit]
+
+
 @http_retry
 async def _scrape_comments(
     client: httpx.AsyncClient,
@@ -301,36 +473,49 @@ async def fetch_posts(
     limit: int,
     top_comments: int,
     sem: asyncio.Semaphore,
+    fetcher: str = "rss",
+    mark: tuple[int, str] | None = None,
 ) -> list[RedditPost]:
-    """Fetch posts from a subreddit using RSS and optionally scrape comments.
+    """Fetch posts from a subreddit using RSS or its JSON listing and optionally scrape comments.
 
     Args:
         client: Shared HTTP client
         subreddit: Subreddit name (without r/)
         listing: Listing type (hot, new, top, rising)
-        limit: Maximum posts to fetch (RSS limited to ~25)
+        limit: Maximum posts to fetch (RSS returns at most RSS_PAGE_SIZE)
         top_comments: Number of comments to scrape per post (0 to skip)
         sem: Semaphore for concurrency control
+        fetcher: "rss" or "json" (see FETCHERS)
+        mark: High-water mark (created_utc, post ID) of a newest-first listing;
+            posts at or below it were fetched before and are skipped
 
     Returns:
-        List of RedditPost objects
+        List of new RedditPost objects
     """
-    logger.info("fetching_subreddit", subreddit=subreddit, listing=listing)
+    logger.info("fetching_subreddit", subreddit=subreddit, listing=listing, fetcher=fetcher)
+
+    async def _fetch() -> list[RedditPost]:
+        if fetcher == "json":
+            return await _fetch_json_listing(client, subreddit, listing, limit, mark=mark)
+        return await _fetch_rss(client, subreddit, listing)
 
-    # Fetch RSS feed
+    # Fetch RSS feed or JSON listing
     async with sem:
         try:
-            posts = await _fetch_rss(client, subreddit, listing)
+            posts = await _fetch()
         except RateLimitError as e:
             logger.warning("rate_limited", subreddit=subreddit, retry_after=e.retry_after)
             await adaptive_sleep(e.retry_after, default=30.0)
-            posts = await _fetch_rss(client, subreddit, listing)
+            posts = await _fetch()
         except Exception as e:
-            logger.error("rss_fetch_failed", subreddit=subreddit, error=str(e))
+            logger.error("posts_fetch_failed", subreddit=subreddit, fetcher=fetcher, error=str(e))
             return []
 
-    # Limit posts
-    posts = posts[:limit]
+    # Drop posts fetched before, so their comments aren't scraped again, and limit posts
+    fetched = len(posts)
+    posts = [post for post in posts if not is_seen(post, mark)][:limit]
+    if fetched > len(posts):
+        logger.debug("seen_posts_skipped", subreddit=subreddit, skipped=fetched - len(posts))
 
     # Scrape comments if requested
     if top_comments > 0:
@@ -359,6 +544,8 @@ async def fetch_all_subreddits(
     top_comments: int,
     max_concurrency: int,
     user_agent: str,
+    fetchers: dict[str, str] | None = None,
+    marks: dict[str, tuple[int, str]] | None = None,
 ) -> list[RedditPost]:
     """Fetch posts from multiple subreddits.
 
@@ -369,15 +556,32 @@ async def fetch_all_subreddits(
         top_comments: Comments per post
         max_concurrency: Maximum concurrent requests
         user_agent: User agent string
+        fetchers: Fetcher per subreddit, "rss" where missing (see FETCHERS)
+        marks: High-water marks by lowercased subreddit (see high_water_marks);
+            only used for INCREMENTAL_LISTINGS
 
     Returns:
         Combined list of all posts
     """
     sem = asyncio.Semaphore(max_concurrency)
+    if listing not in INCREMENTAL_LISTINGS:
+        marks = None
 
     # Use shared HTTP client for all requests
     async with create_http_client(user_agent=user_agent) as client:
-        tasks = [fetch_posts(client, sr, listing, limit, top_comments, sem) for sr in subreddits]
+        tasks = [
+            fetch_posts(
+                client,
+                sr,
+                listing,
+                limit,
+                top_comments,
+                sem,
+                fetcher=(fetchers or {}).get(sr, "rss"),
+                mark=(marks or {}).get(sr.lower()),
+            )
+            for sr in subreddits
+        ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -0,0 +1,229 @@
+"""Offline ingestion of Reddit dump files.
+
+Reddit dumps are NDJSON files with one submission or comment per line, usually
+zstd-compressed (``RS_2024-01.zst``, ``RC_2024-01.zst`` or per-subreddit
+``<name>_submissions.zst`` / ``<name>_comments.zst``). ``pain-radar import``
+streams them through an incremental decompressor and keeps the lines that
+match the subreddit and date filters.
+
+Posts are inserted in batches, one transaction each. Top-level comments are
+staged in a temporary table and joined to their posts by ``link_id`` at the
+end, keeping each post's highest-scored comments. Memory stays bounded by
+the batch size, whatever the size of the dumps.
+"""
+
+from __future__ import annotations
+
+import io
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from pathlib import Path
+
+import orjson
+import zstandard
+
+from .logging_config import get_logger
+from .reddit_async import REDDIT_BASE, RedditPost
+from .store import AsyncStore
+
+logger = get_logger(__name__)
+
+# Dumps are compressed with long-distance matching (--long=31)
+DUMP_WINDOW_SIZE = 2**31
+
+# Posts or comments written per transaction
+IMPORT_BATCH_SIZE = 5000
+
+_READ_SIZE = 1 << 20
+
+# Bodies of deleted and removed content
+_DELETED = {"", "[deleted]", "[removed]"}
+
+
+@dataclass
+class ImportResult:
+    """Outcome of one import."""
+
+    lines: int = 0
+    posts: int = 0
+    comments: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+
+    @property
+    def lines_per_second(self) -> float:
+        """Dump lines read per second."""
+        return self.lines / self.seconds if self.seconds else 0.0
+
+
+def iter_dump_lines(path: str | Path) -> Iterator[bytes]:
+    """Stream the lines of a dump file, decompressing as it goes.
+
+    Args:
+        path: Dump file; ``.zst`` files are zstd-decompressed, anything else
+            is read as plain NDJSON
+
+    Yields:
+        Raw lines, newline included
+    """
+    path = Path(path)
+    with open(path, "rb") as fh:
+        if path.suffix == ".zst":
+            reader = zstandard.ZstdDecompressor(max_window_size=DUMP_WINDOW_SIZE).stream_reader(
+                fh, read_size=_READ_SIZE
+            )
+            yield from io.BufferedReader(reader, buffer_size=_READ_SIZE)
+        else:
+            yield from fh
+
+
+def _created_utc(entry: dict) -> int:
+    # Older dumps store timestamps as strings
+    return int(float(entry.get("created_utc") or 0))
+
+
+def parse_submission(entry: dict) -> RedditPost | None:
+    """Map a dump submission to a RedditPost.
+
+    Args:
+        entry: Decoded submission line
+
+    Returns:
+        RedditPost, or None if the entry has no ID or subreddit
+    """
+    post_id, subreddit = entry.get("id"), entry.get("subreddit")
+    if not post_id or not subreddit:
+        return None
+    body = entry.get("selftext") or ""
+    permalink = entry.get("permalink") or f"/r/{subreddit}/comments/{post_id}/"
+    if permalink.startswith("/"):
+        permalink = REDDIT_BASE + permalink
+    return RedditPost(
+        id=post_id,
+        subreddit=subreddit,
+        title=entry.get("title") or "",
+        body="" if body in _DELETED else body,
+        created_utc=_created_utc(entry),
+        score=int(entry.get("score") or 0),
+        num_comments=int(entry.get("num_comments") or 0),
+        url=entry.get("url") or permalink,
+        permalink=permalink,
+    )
+
+
+def parse_comment(entry: dict) -> tuple[str, int, str] | None:
+    """Map a dump comment to a staged (post_id, score, body) row.
+
+    Args:
+        entry: Decoded comment line
+
+    Returns:
+        The row, or None for replies and deleted or removed comments
+    """
+    link_id, body = entry.get("link_id") or "", entry.get("body") or ""
+    parent_id = entry.get("parent_id")
+    if not link_id.startswith("t3_") or body in _DELETED or (parent_id and parent_id != link_id):
+        return None
+    return link_id[3:], int(entry.get("score") or 0), body
+
+
+async def import_dumps(
+    store: AsyncStore,
+    paths: Iterable[str | Path],
+    subreddits: Iterable[str] | None = None,
+    since_utc: int | None = None,
+    until_utc: int | None = None,
+    comments_per_post: int = 15,
+    batch_size: int = IMPORT_BATCH_SIZE,
+) -> ImportResult:
+    """Import submissions and comments from Reddit dump files.
+
+    Files may hold submissions, comments or both, in any order; each line is
+    told apart by its ``link_id``, which only comments have.
+
+    Args:
+        store: Connected store
+        paths: Dump files
+        subreddits: Only these subreddits, case-insensitive (None = all)
+        since_utc: Only posts created at or after this timestamp
+        until_utc: Only posts created before this timestamp
+        comments_per_post: Top-level comments kept per post, by score
+        batch_size: Posts or comments written per transaction
+
+    Returns:
+        ImportResult with counts and timing
+    """
+    wanted = {s.lower() for s in subreddits} if subreddits else None
+    # A line can only match if its lowercased bytes contain a quoted wanted name;
+    # checking that first skips JSON decoding for most lines of a full dump
+    needles = [orjson.dumps(s) for s in wanted] if wanted else None
+
+    result = ImportResult()
+    posts: list[RedditPost] = []
+    comments: list[tuple[str, int, str]] = []
+    started = time.perf_counter()
+
+    for path in paths:
+        logger.info("import_file_started", path=str(path))
+        for line in iter_dump_lines(path):
+            result.lines += 1
+            if needles and not any(needle in line.lower() for needle in needles):
+                result.skipped += 1
+                continue
+            try:
+                entry = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                result.skipped += 1
+                continue
+            if wanted and str(entry.get("subreddit", "")).lower() not in wanted:
+                result.skipped += 1
+                continue
+
+            if "link_id" in entry:
+                # Comments are kept whatever their date; the join keeps those of imported posts
+                row = parse_comment(entry) if comments_per_post > 0 else None
+                if row is None:
+                    result.skipped += 1
+                    continue
+                comments.append(row)
+                if len(comments) >= batch_size:
+                    await store.stage_import_comments(comments)
+                    comments.clear()
+            else:
+                post = parse_submission(entry)
+                if (
+                    post is None
+                    or (since_utc is not None and post.created_utc < since_utc)
+                    or (until_utc is not None and post.created_utc >= until_utc)
+                ):
+                    result.skipped += 1
+                    continue
+                posts.append(post)
+                if len(posts) >= batch_size:
+                    result.posts += await store.import_posts(posts)
+                    posts.clear()
+                    logger.info(
+                        "import_progress",
+                        lines=result.lines,
+                        posts=result.posts,
+                        lines_per_second=round(result.lines / (time.perf_counter() - started)),
+                    )
+
+    if posts:
+        result.posts += await store.import_posts(posts)
+    if comments:
+        await store.stage_import_comments(comments)
+    if comments_per_post > 0:
+        result.comments = await store.attach_import_comments(comments_per_post)
+
+    result.seconds = time.perf_counter() - started
+    logger.info(
+        "import_completed",
+        lines=result.lines,
+        posts=result.posts,
+        comments=result.comments,
+        skipped=result.skipped,
+        lines_per_second=round(result.lines_per_second),
+    )
+    return result
@@ -6,6 +6,7 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from .export import dumps, write_json_array
 from .store import AsyncStore
 
 
@@ -252,38 +253,9 @@ async def generate_json_report(
         if not run:
             raise ValueError(f"Run {run_id} not found")
 
-    # Get signals
-    ideas = await store.get_signals_for_run(run_id)
-    if not ideas:
-        ideas = await store.get_top_signals(limit=50, include_disqualified=True)
-
     # Get stats
     stats = await store.get_stats()
 
-    # Build report object
-    report = {
-        "run": run,
-        "stats": stats,
-        "ideas": ideas,
-        "generated_at": datetime.now().isoformat(),
-    }
-
-    # Parse JSON fields in ideas
-    for idea in report["ideas"]:
-        for field in [
-            "evidence_signals",
-            "risk_flags",
-            "disqualify_reasons",
-            "why",
-            "next_validation_steps",
-            "top_comments",
-        ]:
-            if idea.get(field) and isinstance(idea[field], str):
-                try:
-                    idea[field] = json.loads(idea[field])
-                except json.JSONDecodeError:
-                    pass
-
     # Save report
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True)
@@ -292,6 +264,15 @@ async def generate_json_report(
     filename = f"signal_report_{run_id}_{timestamp}.json"
     report_path = output_path / filename
 
-    report_path.write_text(json.dumps(report, indent=2, default=str))
+    # Ideas are streamed into the file chunk by chunk rather than built up in memory
+    with open(report_path, "wb") as f:
+        f.write(b'{\n"run": ' + dumps(run) + b',\n"stats": ' + dumps(stats) + b',\n"ideas": [')
+        count = await write_json_array(
+            f, store.iter_signals(run_id=run_id, include_disqualified=True, with_post_text=True)
+        )
+        if not count:
+            count = await write_json_array(f, store.iter_signals(limit=50, include_disqualified=True))
+        f.write(b"\n]" if count else b"]")
+        f.write(b',\n"generated_at": ' + dumps(datetime.now().isoformat()) + b"\n}\n")
 
     return str(report_path)
@@ -1,8 +1,12 @@
 """Store subpackage for Pain Radar.
 
-Re-exports AsyncStore for backward compatibility.
+Re-exports AsyncStore for backward compatibility, and PostgresStore, which
+replaces it when a database URL is configured, and ShardRouter, which gives
+each tenant its own SQLite file.
 """
 
 from .core import AsyncStore
+from .postgres import PostgresStore
+from .sharding import ShardRouter
 
-__all__ = ["AsyncStore"]
+__all__ = ["AsyncStore", "PostgresStore", "ShardRouter"]
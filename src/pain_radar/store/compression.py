@@ -0,0 +1,137 @@
+"""Transparent zstd compression for large JSON columns.
+
+Compression is off until ``pain-radar db-compress`` trains a zstd dictionary
+per column from the database's own rows (stored in ``compression_dicts``) and
+rewrites existing values. From then on the store compresses new values of
+those columns on write.
+
+Compressed values are stored as BLOBs holding a zstd frame, plain values stay
+TEXT, so both can coexist and readers tell them apart by type. Frames record
+the dictionary they were made with, which keeps old rows readable after a
+retrain. Values are only decompressed by reads that select the column; list
+views that project summary fields never touch them.
+"""
+
+from __future__ import annotations
+
+import zstandard as zstd
+
+# Columns stored compressed once a database has dictionaries, per table.
+# signals.evidence stays plain: the full-text triggers read it with json_each.
+# posts.top_comments was compressed before comments moved to their own table;
+# the comments backfill still decodes those values.
+COMPRESSED_COLUMNS: dict[str, tuple[str, ...]] = {
+    "signals": ("raw_extraction", "raw_score", "evidence_signals", "competition_landscape"),
+}
+
+# Column names decode_row decompresses
+_COMPRESSED_NAMES = frozenset(c for columns in COMPRESSED_COLUMNS.values() for c in columns)
+
+# Values shorter than this are left as text; frame overhead outweighs the gain
+MIN_COMPRESS_BYTES = 64
+
+# Dictionary size and sample count used when training
+DICT_SIZE = 64 * 1024
+TRAIN_SAMPLES = 2000
+
+COMPRESSION_LEVEL = 9
+
+
+def train_dictionary(samples: list[bytes], dict_size: int = DICT_SIZE) -> zstd.ZstdCompressionDict | None:
+    """Train a zstd dictionary from sample values.
+
+    Args:
+        samples: Encoded column values
+        dict_size: Target dictionary size in bytes
+
+    Returns:
+        Trained dictionary, or None if there are too few samples to train one
+    """
+    if len(samples) < 8:
+        return None
+    try:
+        return zstd.train_dictionary(dict_size, samples)
+    except zstd.ZstdError:
+        return None
+
+
+class BlobCodec:
+    """Compresses column values with per-column dictionaries and decompresses any known frame."""
+
+    def __init__(
+        self, dictionaries: dict[int, bytes], active: dict[tuple[str, str], int], level: int = COMPRESSION_LEVEL
+    ):
+        """Initialize the codec.
+
+        Args:
+            dictionaries: Dictionary ID to raw dictionary bytes
+            active: (table, column) to the dictionary ID new values are compressed
+                with (0 = plain zstd, for columns with too little data to train on)
+            level: zstd compression level
+        """
+        self._dicts = {dict_id: zstd.ZstdCompressionDict(data) for dict_id, data in dictionaries.items()}
+        self._compressors = {
+            key: zstd.ZstdCompressor(level=level, dict_data=self._dicts.get(dict_id)) for key, dict_id in active.items()
+        }
+        self._decompressors: dict[int, zstd.ZstdDecompressor] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any column is compressed on write."""
+        return bool(self._compressors)
+
+    def encode(self, table: str, column: str, value: str | None) -> str | bytes | None:
+        """Compress a value if its column is compressed and it gets smaller.
+
+        Args:
+            table: Table name
+            column: Column name
+            value: Text value
+
+        Returns:
+            zstd frame bytes, or the value unchanged
+        """
+        compressor = self._compressors.get((table, column))
+        if compressor is None or value is None:
+            return value
+        raw = value.encode("utf-8")
+        if len(raw) < MIN_COMPRESS_BYTES:
+            return value
+        frame = compressor.compress(raw)
+        return frame if len(frame) < len(raw) else value
+
+    def decode(self, value: str | bytes | None) -> str | None:
+        """Decompress a stored value; text passes through.
+
+        Args:
+            value: Stored column value
+
+        Returns:
+            Text value
+
+        Raises:
+            ValueError: If the frame needs a dictionary this database doesn't have
+        """
+        if not isinstance(value, bytes):
+            return value
+        dict_id = zstd.get_frame_parameters(value).dict_id
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            if dict_id and dict_id not in self._dicts:
+                raise ValueError(f"Missing compression dictionary {dict_id}")
+            decompressor = zstd.ZstdDecompressor(dict_data=self._dicts.get(dict_id))
+            self._decompressors[dict_id] = decompressor
+        return decompressor.decompress(value).decode("utf-8")
+
+    def decode_row(self, row: dict) -> dict:
+        """Decompress the compressed columns of a row dict, in place.
+
+        Args:
+            row: Row as a dict
+
+        Returns:
+            The same dict
+        """
+        for key in _COMPRESSED_NAMES.intersection(row):
+            row[key] = self.decode(row[key])
+        return row
@@ -2,38 +2,382 @@
 
 from __future__ import annotations
 
+import base64
+import hashlib
 import json
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from contextlib import asynccontextmanager
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import aiosqlite
+import numpy as np
 
 from ..logging_config import get_logger
+from ..matching import SemanticMatcher, WatchlistMatcher
 from ..models import Cluster, ClusterItem, EvidenceSignal
+from ..query import compile_query
 from ..reddit_async import RedditPost
-from .schema import SCHEMA
+from ..vectors import centroid, from_blob, to_blob
+from .compression import COMPRESSED_COLUMNS, TRAIN_SAMPLES, BlobCodec, train_dictionary
+from .schema import (
+    COLUMN_MIGRATIONS,
+    COMMENTS_BACKFILL,
+    COMMENTS_JSON,
+    EVIDENCE_BACKFILL,
+    FTS_BACKFILL,
+    FTS_COLUMNS,
+    FTS_SCHEMA,
+    MIGRATED_INDEXES,
+    NORMALIZED_SCHEMA,
+    SCHEMA,
+    STATS_AGGREGATE,
+    STATS_SCHEMA,
+    UNIQUE_INDEX_MIGRATIONS,
+)
 
 logger = get_logger(__name__)
 
 
+def cluster_id_for(week_start: str, signal_ids: list[int]) -> str:
+    """Build a deterministic cluster ID from its week and member signals.
+
+    Args:
+        week_start: ISO date string for the week
+        signal_ids: Member signal IDs (order does not matter)
+
+    Returns:
+        ID of the form "<week_start>_<12 hex chars>"
+    """
+    members = ",".join(str(i) for i in sorted(signal_ids))
+    digest = hashlib.sha256(f"{week_start}:{members}".encode()).hexdigest()
+    return f"{week_start}_{digest[:12]}"
+
+
+# Columns returned by list views: enough to render a row and link to the detail
+SIGNAL_SUMMARY_FIELDS = (
+    "id",
+    "signal_summary",
+    "pain_point",
+    "target_user",
+    "total_score",
+    "disqualified",
+    "extraction_state",
+    "distribution_wedge",
+    "created_at",
+    "post_title",
+    "subreddit",
+    "permalink",
+)
+
+# Post columns that signal listings can project, by the name they are returned under
+_POST_FIELDS = {
+    "post_title": "p.title",
+    "subreddit": "p.subreddit",
+    "permalink": "p.permalink",
+    "post_body": "p.body",
+    "top_comments": COMMENTS_JSON.format(post="p"),
+}
+
+
+def encode_cursor(total_score: int, signal_id: int) -> str:
+    """Encode the position after a signal in score order as an opaque cursor.
+
+    Args:
+        total_score: Score of the last signal on the page
+        signal_id: ID of the last signal on the page
+
+    Returns:
+        URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(f"{total_score}:{signal_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, int]:
+    """Decode a cursor made by encode_cursor.
+
+    Args:
+        cursor: Cursor string
+
+    Returns:
+        (total_score, signal_id) of the last signal on the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        score, signal_id = raw.split(":")
+        return int(score), int(signal_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+# Signal fields watchlists are matched against (see query.FIELDS)
+_MATCH_FIELDS = ("signal_summary", "pain_point", "target_user", "evidence", "post_title", "subreddit")
+
+
+def _keyword_text(fields: dict[str, str | None]) -> str:
+    """Text watchlist keywords are matched against."""
+    return f"{fields['signal_summary']} {fields['pain_point']} {fields['post_title']}"
+
+
+def evidence_text(evidence: str | list | None) -> str:
+    """Join a signal's evidence quotes into one text for matching.
+
+    Args:
+        evidence: Evidence as stored (JSON) or as EvidenceSignal objects/dicts
+
+    Returns:
+        Quotes separated by spaces
+    """
+    if isinstance(evidence, str):
+        try:
+            evidence = json.loads(evidence)
+        except json.JSONDecodeError:
+            return ""
+    quotes = []
+    for item in evidence or []:
+        if isinstance(item, EvidenceSignal):
+            quotes.append(item.quote)
+        elif isinstance(item, dict):
+            quotes.append(item.get("quote") or "")
+        elif isinstance(item, str):
+            quotes.append(item)
+    return " ".join(quotes)
+
+
+def match_watchlists(
+    signals: Sequence[Any],
+    watchlists: list[dict],
+    starts: dict[int, int],
+    semantic: SemanticMatcher,
+    embedding_model: str | None = None,
+) -> list[dict]:
+    """Match signal rows against watchlists, for check_watchlists.
+
+    Args:
+        signals: Rows with id, url, embedding (float16 blob or None) and the
+            fields watchlists match (see _MATCH_FIELDS), in ID order
+        watchlists: Active watchlists
+        starts: Watchlist ID -> highest signal ID it was already checked against
+        semantic: Matcher for the watchlists with a description
+        embedding_model: Model of the embeddings, for logging
+
+    Returns:
+        Matches with watchlist and signal info
+    """
+    # Semantic watchlists: one matrix product over every embedded signal
+    semantic_hits: dict[int, list[tuple[dict, float]]] = {}
+    embedded = [signal for signal in signals if signal["embedding"] is not None]
+    if len(semantic) and embedded:
+        vectors = np.vstack([from_blob(signal["embedding"], dtype="<f2") for signal in embedded])
+        hits = semantic.match_many(vectors, [signal["subreddit"] for signal in embedded])
+        semantic_hits = {signal["id"]: signal_hits for signal, signal_hits in zip(embedded, hits, strict=True)}
+        if len(embedded) < len(signals):
+            logger.warning("signals_missing_embeddings", model=embedding_model, count=len(signals) - len(embedded))
+
+    matches = []
+    matcher = WatchlistMatcher(watchlists)
+    for signal in signals:
+        fields = {name: signal[name] for name in _MATCH_FIELDS}
+        fields["evidence"] = evidence_text(signal["evidence"])
+        hits = matcher.match(_keyword_text(fields), signal["subreddit"], fields)
+        found = {wl["id"]: (wl, keyword) for wl, keyword in hits}
+        for wl, similarity in semantic_hits.get(signal["id"], []):
+            found.setdefault(wl["id"], (wl, f"semantic:{similarity:.2f}"))
+        for wl, keyword in found.values():
+            if signal["id"] <= starts[wl["id"]]:
+                continue
+            matches.append(
+                {
+                    "watchlist_id": wl["id"],
+                    "watchlist_name": wl["name"],
+                    "signal_id": signal["id"],
+                    "keyword_matched": keyword,
+                    "signal_summary": signal["signal_summary"],
+                    "pain_point": signal["pain_point"],
+                    "subreddit": signal["subreddit"],
+                    "url": signal["url"],
+                }
+            )
+    return matches
+
+
+def signal_values(
+    post: RedditPost,
+    extraction: Any,
+    score: Any | None,
+    cluster_id: str | None,
+    run_id: int | None,
+    created_at: str,
+) -> dict[str, Any]:
+    """Build the signals row for an extracted and scored post.
+
+    Args:
+        post: Source Reddit post
+        extraction: PainSignal Pydantic model
+        score: SignalScore Pydantic model (None if not_extractable)
+        cluster_id: Optional cluster identifier
+        run_id: Optional run ID
+        created_at: ISO timestamp to store
+
+    Returns:
+        Column name to value, JSON columns serialized and not compressed
+    """
+    # Serialize evidence with attribution
+    evidence_json = json.dumps([e.model_dump() for e in extraction.evidence]) if extraction.evidence else "[]"
+
+    # Build legacy evidence_signals for backward compatibility
+    legacy_signals = [e.quote for e in extraction.evidence] if extraction.evidence else []
+
+    extraction_state = (
+        extraction.extraction_state.value
+        if hasattr(extraction.extraction_state, "value")
+        else str(extraction.extraction_state)
+    )
+
+    values: dict[str, Any] = {
+        "post_id": post.id,
+        "run_id": run_id,
+        "cluster_id": cluster_id,
+        "extraction_state": extraction_state,
+        "not_extractable_reason": extraction.not_extractable_reason,
+        "signal_summary": extraction.signal_summary,
+        "target_user": extraction.target_user,
+        "pain_point": extraction.pain_point,
+        "proposed_solution": extraction.proposed_solution,
+        "evidence": evidence_json,
+        "evidence_strength": extraction.evidence_strength,
+        "evidence_strength_reason": extraction.evidence_strength_reason,
+        "evidence_signals": json.dumps(legacy_signals),
+        "risk_flags": json.dumps(extraction.risk_flags),
+    }
+
+    # Score fields may be None for not_extractable
+    if score:
+        values.update(
+            disqualified=1 if score.disqualified else 0,
+            disqualify_reasons=json.dumps(score.disqualify_reasons),
+            practicality=score.practicality,
+            profitability=score.profitability,
+            distribution=score.distribution,
+            competition=score.competition,
+            moat=score.moat,
+            total_score=score.total,
+            confidence=score.confidence,
+            distribution_wedge=(
+                score.distribution_wedge.value
+                if hasattr(score.distribution_wedge, "value")
+                else str(score.distribution_wedge)
+            ),
+            distribution_wedge_detail=score.distribution_wedge_detail,
+            competition_landscape=(
+                json.dumps([c.model_dump() for c in score.competition_landscape])
+                if score.competition_landscape
+                else "[]"
+            ),
+            why=json.dumps(score.why),
+            next_validation_steps=json.dumps(score.next_validation_steps),
+            raw_score=score.model_dump_json(),
+        )
+    else:
+        values.update(
+            disqualified=0,
+            disqualify_reasons="[]",
+            practicality=0,
+            profitability=0,
+            distribution=0,
+            competition=0,
+            moat=0,
+            total_score=0,
+            confidence=0.0,
+            distribution_wedge=None,
+            distribution_wedge_detail=None,
+            competition_landscape="[]",
+            why="[]",
+            next_validation_steps="[]",
+            raw_score="{}",
+        )
+
+    values["created_at"] = created_at
+    values["raw_extraction"] = extraction.model_dump_json()
+    return values
+
+
+def evidence_rows(extraction: Any) -> list[tuple]:
+    """Build evidence table rows for an extraction.
+
+    Args:
+        extraction: PainSignal Pydantic model
+
+    Returns:
+        (position, quote, source, comment_index, signal_type) tuples
+    """
+    return [
+        (
+            position,
+            e.quote,
+            e.source,
+            e.comment_index,
+            e.signal_type.value if hasattr(e.signal_type, "value") else str(e.signal_type),
+        )
+        for position, e in enumerate(extraction.evidence or [])
+    ]
+
+
+def signal_select_list(
+    fields: Sequence[str] | None, signal_columns: frozenset[str], post_fields: dict[str, str] = _POST_FIELDS
+) -> str:
+    """Build the SELECT list for a signal listing.
+
+    Args:
+        fields: Requested columns (None = every signal column plus post info)
+        signal_columns: Columns of the signals table
+        post_fields: Projectable post columns and their SQL expressions
+
+    Returns:
+        SQL column list over signals ``i`` joined to posts ``p``
+
+    Raises:
+        ValueError: If a field is not a signal or projectable post column
+    """
+    if fields is None:
+        return "i.*, p.title as post_title, p.subreddit, p.permalink"
+
+    unknown = [f for f in fields if f not in signal_columns and f not in post_fields]
+    if unknown:
+        raise ValueError(f"Unknown signal field(s): {', '.join(unknown)}")
+    if not fields:
+        raise ValueError("At least one field is required")
+    return ", ".join(f"{post_fields[f]} AS {f}" if f in post_fields else f"i.{f}" for f in dict.fromkeys(fields))
+
+
 class AsyncStore:
     """Async SQLite storage for posts and signals."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, match_on_write: bool = True):
         """Initialize the store.
 
         Args:
             db_path: Path to SQLite database file
+            match_on_write: Record keyword and query watchlist matches as
+                signals are saved (semantic watchlists wait for check_watchlists)
         """
         self.db_path = db_path
+        self.match_on_write = match_on_write
         self._connection: aiosqlite.Connection | None = None
+        self._watchlist_matcher: WatchlistMatcher | None = None
+        self._watchlist_fingerprint: tuple | None = None
+        self._signal_columns: frozenset[str] | None = None
+        self._codec: BlobCodec | None = None
 
     async def connect(self) -> None:
         """Open database connection."""
         self._connection = await aiosqlite.connect(self.db_path)
         self._connection.row_factory = aiosqlite.Row
+        # Makes INSERT OR REPLACE fire delete triggers, which stats_counters relies on
+        await self._connection.execute("PRAGMA recursive_triggers = ON")
         logger.info("database_connected", path=self.db_path)
 
     async def close(self) -> None:
@@ -54,9 +398,128 @@ class AsyncStore:
         """Initialize database schema."""
         async with self.connection() as conn:
             await conn.executescript(SCHEMA)
+            await self._apply_column_migrations(conn)
+            await conn.executescript(MIGRATED_INDEXES)
+            await self._apply_unique_index_migrations(conn)
+            await self._create_fts_index(conn)
+            await self._create_stats_counters(conn)
+            await self._create_normalized_tables(conn)
             await conn.commit()
         logger.info("database_initialized")
 
+    async def _create_fts_index(self, conn: aiosqlite.Connection) -> None:
+        """Create the full-text index and its triggers, backfilling it on first creation.
+
+        An index built with an older column set is dropped and rebuilt.
+
+        Args:
+            conn: Open database connection
+        """
+        cursor = await conn.execute("PRAGMA table_info(signals_fts)")
+        columns = [row[1] for row in await cursor.fetchall()]
+        exists = columns == [c.strip() for c in FTS_COLUMNS.split(",")]
+        if columns and not exists:
+            await conn.execute("DROP TABLE signals_fts")
+        await conn.executescript(FTS_SCHEMA)
+        if not exists:
+            cursor = await conn.execute(FTS_BACKFILL)
+            logger.info("fts_index_created", signals=cursor.rowcount)
+
+    async def _create_stats_counters(self, conn: aiosqlite.Connection) -> None:
+        """Create the stats counters and their triggers, seeding them on first creation.
+
+        Args:
+            conn: Open database connection
+        """
+        await conn.executescript(STATS_SCHEMA)
+        cursor = await conn.execute("SELECT 1 FROM stats_counters WHERE id = 1")
+        if not await cursor.fetchone():
+            await self._write_stats_counters(conn)
+            logger.info("stats_counters_created")
+
+    async def _write_stats_counters(self, conn: aiosqlite.Connection) -> tuple:
+        """Recount posts and signals into the stats_counters row.
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            The recounted values, in stats_counters column order
+        """
+        cursor = await conn.execute(STATS_AGGREGATE)
+        counts = tuple(await cursor.fetchone())
+        await conn.execute(
+            """
+            INSERT OR REPLACE INTO stats_counters
+            (id, total_posts, processed_posts, total_signals, qualified_signals,
+             scored_signals, score_sum, updated_at)
+            VALUES (1, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (*counts, datetime.now(UTC).isoformat()),
+        )
+        return counts
+
+    async def _create_normalized_tables(self, conn: aiosqlite.Connection) -> None:
+        """Create the evidence and comments tables, backfilling them from JSON on first creation.
+
+        Args:
+            conn: Open database connection
+        """
+        cursor = await conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'evidence'")
+        exists = await cursor.fetchone() is not None
+        await conn.executescript(NORMALIZED_SCHEMA)
+        if exists:
+            return
+
+        cursor = await conn.execute(EVIDENCE_BACKFILL)
+        evidence_rows = cursor.rowcount
+        cursor = await conn.execute(COMMENTS_BACKFILL)
+        comment_rows = cursor.rowcount
+
+        # Comments compressed by db-compress can only be decoded here
+        codec = await self._get_codec(conn)
+        cursor = await conn.execute("SELECT id, top_comments FROM posts WHERE typeof(top_comments) = 'blob'")
+        rows = [
+            (row["id"], position, body)
+            for row in await cursor.fetchall()
+            for position, body in enumerate(json.loads(codec.decode(row["top_comments"]) or "[]"))
+        ]
+        await conn.executemany("INSERT INTO comments (post_id, position, body) VALUES (?, ?, ?)", rows)
+        await conn.execute("UPDATE posts SET top_comments = NULL WHERE top_comments IS NOT NULL")
+        logger.info("normalized_tables_created", evidence=evidence_rows, comments=comment_rows + len(rows))
+
+    async def _apply_column_migrations(self, conn: aiosqlite.Connection) -> None:
+        """Add columns introduced after a table was first created.
+
+        Args:
+            conn: Open database connection
+        """
+        columns_by_table: dict[str, set[str]] = {}
+        for table, column, definition in COLUMN_MIGRATIONS:
+            if table not in columns_by_table:
+                cursor = await conn.execute(f"PRAGMA table_info({table})")
+                columns_by_table[table] = {row[1] for row in await cursor.fetchall()}
+            if column not in columns_by_table[table]:
+                await conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                columns_by_table[table].add(column)
+                logger.info("column_added", table=table, column=column)
+
+    async def _apply_unique_index_migrations(self, conn: aiosqlite.Connection) -> None:
+        """Create unique indexes added later, removing duplicate rows first.
+
+        Args:
+            conn: Open database connection
+        """
+        for index, table, columns in UNIQUE_INDEX_MIGRATIONS:
+            cursor = await conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (index,))
+            if await cursor.fetchone():
+                continue
+            cursor = await conn.execute(
+                f"DELETE FROM {table} WHERE rowid NOT IN (SELECT MIN(rowid) FROM {table} GROUP BY {columns})"
+            )
+            await conn.execute(f"CREATE UNIQUE INDEX {index} ON {table}({columns})")
+            logger.info("unique_index_added", index=index, duplicates_removed=cursor.rowcount)
+
     async def upsert_posts(self, posts: list[RedditPost]) -> int:
         """Insert or update posts.
 
@@ -74,8 +537,8 @@ class AsyncStore:
                     """
                     INSERT OR REPLACE INTO posts
                     (id, subreddit, title, body, created_utc, score,
-                     num_comments, url, permalink, top_comments, fetched_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                     num_comments, url, permalink, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     """,
                     (
                         post.id,
@@ -87,10 +550,15 @@ class AsyncStore:
                         post.num_comments,
                         post.url,
                         post.permalink,
-                        json.dumps(post.top_comments),
                         now,
                     ),
                 )
+                # A refetch replaces the post's comments
+                await conn.execute("DELETE FROM comments WHERE post_id = ?", (post.id,))
+                await conn.executemany(
+                    "INSERT INTO comments (post_id, position, body) VALUES (?, ?, ?)",
+                    [(post.id, position, body) for position, body in enumerate(post.top_comments)],
+                )
                 count += 1
             await conn.commit()
         logger.info("posts_upserted", count=count)
@@ -117,6 +585,18 @@ class AsyncStore:
             )
             rows = await cursor.fetchall()
 
+            comments: dict[str, list[str]] = {}
+            cursor = await conn.execute(
+                """
+                SELECT post_id, body FROM comments
+                WHERE post_id IN (SELECT value FROM json_each(?))
+                ORDER BY post_id, position
+                """,
+                (json.dumps([row["id"] for row in rows]),),
+            )
+            for comment in await cursor.fetchall():
+                comments.setdefault(comment["post_id"], []).append(comment["body"])
+
         posts = []
         for row in rows:
             posts.append(
@@ -130,7 +610,7 @@ class AsyncStore:
                     num_comments=row["num_comments"],
                     url=row["url"] or "",
                     permalink=row["permalink"] or "",
-                    top_comments=json.loads(row["top_comments"] or "[]"),
+                    top_comments=comments.get(row["id"], []),
                 )
             )
         return posts
@@ -166,175 +646,630 @@ class AsyncStore:
             ID of the inserted signal
         """
         async with self.connection() as conn:
+            codec = await self._get_codec(conn)
             now = datetime.now(UTC).isoformat()
-
-            # Serialize evidence with attribution
-            evidence_json = json.dumps([e.model_dump() for e in extraction.evidence]) if extraction.evidence else "[]"
-
-            # Build legacy evidence_signals for backward compatibility
-            legacy_signals = [e.quote for e in extraction.evidence] if extraction.evidence else []
-
-            # Get extraction state
-            extraction_state = (
-                extraction.extraction_state.value
-                if hasattr(extraction.extraction_state, "value")
-                else str(extraction.extraction_state)
-            )
-
-            # Handle score fields (may be None for not_extractable)
-            if score:
-                disqualified = 1 if score.disqualified else 0
-                disqualify_reasons = json.dumps(score.disqualify_reasons)
-                practicality = score.practicality
-                profitability = score.profitability
-                distribution = score.distribution
-                competition = score.competition
-                moat = score.moat
-                total_score = score.total
-                confidence = score.confidence
-                distribution_wedge = (
-                    score.distribution_wedge.value
-                    if hasattr(score.distribution_wedge, "value")
-                    else str(score.distribution_wedge)
-                )
-                distribution_wedge_detail = score.distribution_wedge_detail
-                competition_landscape = (
-                    json.dumps([c.model_dump() for c in score.competition_landscape])
-                    if score.competition_landscape
-                    else "[]"
-                )
-                why = json.dumps(score.why)
-                next_validation_steps = json.dumps(score.next_validation_steps)
-                raw_score = score.model_dump_json()
-            else:
-                disqualified = 0
-                disqualify_reasons = "[]"
-                practicality = profitability = distribution = competition = moat = 0
-                total_score = 0
-                confidence = 0.0
-                distribution_wedge = None
-                distribution_wedge_detail = None
-                competition_landscape = "[]"
-                why = "[]"
-                next_validation_steps = "[]"
-                raw_score = "{}"
+            values = signal_values(post, extraction, score, cluster_id=cluster_id, run_id=run_id, created_at=now)
+            for column in COMPRESSED_COLUMNS["signals"]:
+                values[column] = codec.encode("signals", column, values[column])
 
             cursor = await conn.execute(
+                f"INSERT INTO signals ({', '.join(values)}) VALUES ({', '.join('?' * len(values))})",
+                tuple(values.values()),
+            )
+            signal_id = cursor.lastrowid
+
+            await conn.executemany(
                 """
-                INSERT INTO signals (
-                    post_id, run_id, cluster_id,
-                    extraction_state, not_extractable_reason,
-                    signal_summary, target_user, pain_point,
-                    proposed_solution, evidence, evidence_strength, evidence_strength_reason,
-                    evidence_signals, risk_flags,
-                    disqualified, disqualify_reasons, practicality, profitability,
-                    distribution, competition, moat, total_score, confidence,
-                    distribution_wedge, distribution_wedge_detail, competition_landscape,
-                    why, next_validation_steps, created_at, raw_extraction, raw_score
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                INSERT INTO evidence (signal_id, position, quote, source, comment_index, signal_type)
+                VALUES (?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    post.id,
-                    run_id,
-                    cluster_id,
-                    extraction_state,
-                    extraction.not_extractable_reason,
-                    extraction.signal_summary,
-                    extraction.target_user,
-                    extraction.pain_point,
-                    extraction.proposed_solution,
-                    evidence_json,
-                    extraction.evidence_strength,
-                    extraction.evidence_strength_reason,
-                    json.dumps(legacy_signals),
-                    json.dumps(extraction.risk_flags),
-                    disqualified,
-                    disqualify_reasons,
-                    practicality,
-                    profitability,
-                    distribution,
-                    competition,
-                    moat,
-                    total_score,
-                    confidence,
-                    distribution_wedge,
-                    distribution_wedge_detail,
-                    competition_landscape,
-                    why,
-                    next_validation_steps,
-                    now,
-                    extraction.model_dump_json(),
-                    raw_score,
-                ),
+                [(signal_id, *row) for row in evidence_rows(extraction)],
             )
+
+            if self.match_on_write and not values["disqualified"]:
+                await self._record_write_time_matches(
+                    conn,
+                    signal_id,
+                    {
+                        "signal_summary": extraction.signal_summary,
+                        "pain_point": extraction.pain_point,
+                        "target_user": extraction.target_user,
+                        "evidence": evidence_text(extraction.evidence),
+                        "post_title": post.title,
+                        "subreddit": post.subreddit,
+                    },
+                    now,
+                )
             await conn.commit()
 
             # Mark the post as processed
             await self.mark_post_processed(post.id)
 
-            signal_id = cursor.lastrowid
             logger.info(
                 "signal_saved",
                 signal_id=signal_id,
                 post_id=post.id,
-                extraction_state=extraction_state,
-                total_score=total_score,
+                extraction_state=values["extraction_state"],
+                total_score=values["total_score"],
                 evidence_strength=extraction.evidence_strength,
-                disqualified=bool(disqualified),
+                disqualified=bool(values["disqualified"]),
             )
             return signal_id
 
-    async def get_top_signals(self, limit: int = 20, include_disqualified: bool = False) -> list[dict]:
+    async def get_top_signals(
+        self,
+        limit: int = 20,
+        include_disqualified: bool = False,
+        fields: Sequence[str] | None = None,
+        after: str | None = None,
+    ) -> list[dict]:
         """Get top-scored signals.
 
         Args:
             limit: Maximum number of signals to return
             include_disqualified: Whether to include disqualified signals
+            fields: Columns to return (None = every signal column plus post info)
+            after: Cursor from a previous page (see get_signals_page)
 
         Returns:
             List of signal dictionaries
         """
+        signals, _ = await self.get_signals_page(
+            limit=limit, include_disqualified=include_disqualified, fields=fields, after=after
+        )
+        return signals
+
+    async def get_signals_page(
+        self,
+        limit: int = 20,
+        after: str | None = None,
+        fields: Sequence[str] | None = None,
+        include_disqualified: bool = False,
+        run_id: int | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Get one page of signals in score order, using keyset pagination.
+
+        Pages are ordered by (total_score DESC, id) and each one continues
+        after the previous page's last row, so deep pages cost the same as the
+        first. idx_signals_rank and idx_signals_run_rank serve the order.
+
+        Args:
+            limit: Maximum number of signals to return
+            after: Cursor returned with the previous page (None = first page)
+            fields: Columns to return (None = every signal column plus post info)
+            include_disqualified: Whether to include disqualified signals
+            run_id: Only return signals from this run
+
+        Returns:
+            (signals, cursor for the next page or None if this is the last page)
+
+        Raises:
+            ValueError: If the cursor or a field name is invalid
+        """
         async with self.connection() as conn:
-            query = """
-                SELECT i.*, p.title as post_title, p.subreddit, p.permalink
-                FROM signals i
-                JOIN posts p ON i.post_id = p.id
-            """
+            columns = await self._signal_select_list(conn, fields)
+            conditions: list[str] = []
+            params: list[Any] = []
+            if run_id is not None:
+                conditions.append("i.run_id = ?")
+                params.append(run_id)
             if not include_disqualified:
-                query += " WHERE i.disqualified = 0"
-            query += " ORDER BY i.total_score DESC LIMIT ?"
+                conditions.append("i.disqualified = 0")
+            if after:
+                score, last_id = decode_cursor(after)
+                conditions.append("i.total_score <= ? AND (i.total_score < ? OR i.id > ?)")
+                params.extend([score, score, last_id])
 
-            cursor = await conn.execute(query, (limit,))
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            cursor = await conn.execute(
+                f"""
+                SELECT {columns}, i.total_score AS _rank_score, i.id AS _rank_id
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                {where}
+                ORDER BY i.total_score DESC, i.id
+                LIMIT ?
+                """,
+                (*params, limit + 1),
+            )
             rows = await cursor.fetchall()
+            codec = await self._get_codec(conn)
 
-        return [dict(row) for row in rows]
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["_rank_score"], rows[-1]["_rank_id"])
+
+        signals = []
+        for row in rows:
+            signal = codec.decode_row(dict(row))
+            del signal["_rank_score"], signal["_rank_id"]
+            signals.append(signal)
+        return signals, next_cursor
+
+    async def _signal_select_list(self, conn: aiosqlite.Connection, fields: Sequence[str] | None) -> str:
+        """Build the SELECT list for a signal listing (see signal_select_list)."""
+        if fields is not None and self._signal_columns is None:
+            cursor = await conn.execute("PRAGMA table_info(signals)")
+            self._signal_columns = frozenset(row[1] for row in await cursor.fetchall())
+        return signal_select_list(fields, self._signal_columns or frozenset())
+
+    async def get_signal_column_types(self) -> dict[str, str]:
+        """Get the declared SQL type of each signals column.
+
+        Returns:
+            Column name to declared type (e.g. "INTEGER", "TEXT")
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute("PRAGMA table_info(signals)")
+            return {row[1]: row[2] for row in await cursor.fetchall()}
 
     async def get_stats(self) -> dict:
         """Get database statistics.
 
+        Reads the trigger-maintained stats_counters row, so the cost doesn't
+        grow with the database. Databases created before the counters existed
+        (init_db not yet run) fall back to a full count.
+
         Returns:
             Dictionary of statistics
         """
         async with self.connection() as conn:
-            stats = {}
+            try:
+                cursor = await conn.execute(
+                    """
+                    SELECT total_posts, processed_posts, total_signals, qualified_signals,
+                           scored_signals, score_sum
+                    FROM stats_counters WHERE id = 1
+                    """
+                )
+                row = await cursor.fetchone()
+            except aiosqlite.OperationalError:
+                row = None
+            if row is None:
+                cursor = await conn.execute(STATS_AGGREGATE)
+                row = await cursor.fetchone()
 
-            cursor = await conn.execute("SELECT COUNT(*) FROM posts")
-            stats["total_posts"] = (await cursor.fetchone())[0]
+        return self._stats_from_counts(tuple(row))
 
-            cursor = await conn.execute("SELECT COUNT(*) FROM posts WHERE processed = 1")
-            stats["processed_posts"] = (await cursor.fetchone())[0]
+    async def recompute_stats(self) -> dict:
+        """Recount posts and signals and reset the stats counters.
 
-            cursor = await conn.execute("SELECT COUNT(*) FROM signals")
-            stats["total_signals"] = (await cursor.fetchone())[0]
+        Escape hatch for counters that drifted, e.g. after rows were changed
+        by a connection without recursive_triggers.
 
-            cursor = await conn.execute("SELECT COUNT(*) FROM signals WHERE disqualified = 0")
-            stats["qualified_signals"] = (await cursor.fetchone())[0]
+        Returns:
+            Dictionary of statistics
+        """
+        async with self.connection() as conn:
+            try:
+                await conn.executescript(STATS_SCHEMA)
+                counts = await self._write_stats_counters(conn)
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        logger.info("stats_recomputed", total_posts=counts[0], total_signals=counts[2])
+        return self._stats_from_counts(counts)
+
+    @staticmethod
+    def _stats_from_counts(counts: tuple) -> dict:
+        total_posts, processed_posts, total_signals, qualified_signals, scored_signals, score_sum = counts
+        return {
+            "total_posts": total_posts,
+            "processed_posts": processed_posts,
+            "total_signals": total_signals,
+            "qualified_signals": qualified_signals,
+            "avg_score": round(score_sum / scored_signals, 2) if scored_signals and score_sum else 0,
+        }
+
+    # --- Storage / Compression Methods ---
+
+    async def _get_codec(self, conn: aiosqlite.Connection) -> BlobCodec:
+        """Get the codec for compressed columns, loading its dictionaries once per store."""
+        if self._codec is None:
+            self._codec = await self._load_codec(conn)
+        return self._codec
+
+    async def _load_codec(self, conn: aiosqlite.Connection) -> BlobCodec:
+        """Build a codec from the dictionaries stored in the database.
 
-            cursor = await conn.execute("SELECT AVG(total_score) FROM signals WHERE disqualified = 0")
-            avg = (await cursor.fetchone())[0]
-            stats["avg_score"] = round(avg, 2) if avg else 0
+        Args:
+            conn: Open database connection
 
-            return stats
+        Returns:
+            BlobCodec (compressing nothing if db-compress was never run)
+        """
+        try:
+            cursor = await conn.execute(
+                "SELECT table_name, column_name, dict_id, dictionary FROM compression_dicts ORDER BY id"
+            )
+            rows = await cursor.fetchall()
+        except aiosqlite.OperationalError:
+            rows = []  # Database predates compression_dicts
+        dictionaries = {row["dict_id"]: row["dictionary"] for row in rows if row["dictionary"]}
+        # Later rows are newer; the newest dictionary per column compresses new values
+        active = {(row["table_name"], row["column_name"]): row["dict_id"] for row in rows}
+        return BlobCodec(dictionaries, active)
+
+    async def _train_dictionaries(self, conn: aiosqlite.Connection, codec: BlobCodec, sample_size: int) -> None:
+        """Train and store a dictionary for each compressed column from its newest values.
+
+        Args:
+            conn: Open database connection
+            codec: Current codec, to read values that are already compressed
+            sample_size: Values sampled per column
+        """
+        now = datetime.now(UTC).isoformat()
+        for table, columns in COMPRESSED_COLUMNS.items():
+            for column in columns:
+                cursor = await conn.execute(
+                    f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL ORDER BY rowid DESC LIMIT ?",
+                    (sample_size,),
+                )
+                samples = [codec.decode(row[0]).encode("utf-8") for row in await cursor.fetchall()]
+                dictionary = train_dictionary(samples)
+                await conn.execute(
+                    """
+                    INSERT INTO compression_dicts (table_name, column_name, dict_id, dictionary, created_at)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    (
+                        table,
+                        column,
+                        dictionary.dict_id() if dictionary else 0,
+                        dictionary.as_bytes() if dictionary else None,
+                        now,
+                    ),
+                )
+                logger.info(
+                    "compression_dictionary_trained",
+                    table=table,
+                    column=column,
+                    samples=len(samples),
+                    size=len(dictionary.as_bytes()) if dictionary else 0,
+                )
+
+    async def compress_blobs(
+        self, retrain: bool = False, sample_size: int = TRAIN_SAMPLES, batch_size: int = 500
+    ) -> dict[str, dict]:
+        """Turn on compression for the large JSON columns and compress existing values.
+
+        Dictionaries are trained on first use (or when retrain is set); values
+        already compressed are left alone. Each batch is committed separately,
+        so an interrupted run can simply be restarted.
+
+        Args:
+            retrain: Train new dictionaries even if the database has some
+            sample_size: Values sampled per column for training
+            batch_size: Rows rewritten per transaction
+
+        Returns:
+            "table.column" -> {"rows": values compressed, "before": bytes, "after": bytes}
+        """
+        report: dict[str, dict] = {}
+        async with self.connection() as conn:
+            codec = await self._get_codec(conn)
+            if retrain or not codec.enabled:
+                try:
+                    await self._train_dictionaries(conn, codec, sample_size)
+                    await conn.commit()
+                except Exception:
+                    await conn.rollback()
+                    raise
+                self._codec = codec = await self._load_codec(conn)
+
+            for table, columns in COMPRESSED_COLUMNS.items():
+                for column in columns:
+                    stats = {"rows": 0, "before": 0, "after": 0}
+                    last_rowid = 0
+                    while True:
+                        cursor = await conn.execute(
+                            f"""
+                            SELECT rowid, {column} FROM {table}
+                            WHERE rowid > ? AND typeof({column}) = 'text'
+                            ORDER BY rowid LIMIT ?
+                            """,
+                            (last_rowid, batch_size),
+                        )
+                        rows = await cursor.fetchall()
+                        if not rows:
+                            break
+                        last_rowid = rows[-1][0]
+
+                        updates = []
+                        for rowid, value in rows:
+                            encoded = codec.encode(table, column, value)
+                            if isinstance(encoded, bytes):
+                                updates.append((encoded, rowid))
+                                stats["rows"] += 1
+                                stats["before"] += len(value.encode("utf-8"))
+                                stats["after"] += len(encoded)
+                        try:
+                            await conn.executemany(f"UPDATE {table} SET {column} = ? WHERE rowid = ?", updates)
+                            await conn.commit()
+                        except Exception:
+                            await conn.rollback()
+                            raise
+                    report[f"{table}.{column}"] = stats
+
+        logger.info("blobs_compressed", rows=sum(s["rows"] for s in report.values()))
+        return report
+
+    async def vacuum(self) -> None:
+        """Rebuild the database file, returning pages freed by compression or deletes to the OS."""
+        async with self.connection() as conn:
+            await conn.execute("VACUUM")
+
+    async def incremental_vacuum(self) -> None:
+        """Return free pages to the OS without rebuilding the whole file.
+
+        The first call switches the database to incremental auto-vacuum, which
+        takes one full VACUUM; later calls only truncate the free pages.
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute("PRAGMA auto_vacuum")
+            mode = (await cursor.fetchone())[0]
+            if mode != 2:
+                await conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                await conn.execute("VACUUM")
+            else:
+                await conn.execute("PRAGMA incremental_vacuum")
+
+    async def get_storage_report(self) -> dict:
+        """Report database file size, per-table size and compressed column sizes.
+
+        Returns:
+            Dict with file_bytes, free_bytes, tables (name -> bytes; empty if
+            SQLite lacks the dbstat table) and columns (one dict per
+            compressible column with rows, compressed and bytes)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT (SELECT page_count FROM pragma_page_count()), (SELECT freelist_count FROM pragma_freelist_count()),"
+                " (SELECT page_size FROM pragma_page_size())"
+            )
+            page_count, free_pages, page_size = await cursor.fetchone()
+
+            try:
+                cursor = await conn.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name ORDER BY 2 DESC")
+                tables = {row[0]: row[1] for row in await cursor.fetchall()}
+            except aiosqlite.OperationalError:
+                tables = {}
+
+            columns = []
+            for table, names in COMPRESSED_COLUMNS.items():
+                for column in names:
+                    cursor = await conn.execute(
+                        f"""
+                        SELECT COUNT({column}), COALESCE(SUM(typeof({column}) = 'blob'), 0),
+                               COALESCE(SUM(length(CAST({column} AS BLOB))), 0)
+                        FROM {table}
+                        """
+                    )
+                    rows, compressed, size = await cursor.fetchone()
+                    columns.append(
+                        {"table": table, "column": column, "rows": rows, "compressed": compressed, "bytes": size}
+                    )
+
+        return {
+            "file_bytes": page_count * page_size,
+            "free_bytes": free_pages * page_size,
+            "tables": tables,
+            "columns": columns,
+        }
+
+    # --- Archive Methods ---
+
+    async def get_archive_partitions(self, before_utc: int) -> list[dict]:
+        """Group posts created before a cutoff by month and subreddit.
+
+        Args:
+            before_utc: Unix timestamp; older posts are due for archiving
+
+        Returns:
+            Dicts with month ("YYYY-MM"), subreddit and posts, oldest month first
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT strftime('%Y-%m', created_utc, 'unixepoch') AS month, subreddit, COUNT(*) AS posts
+                FROM posts
+                WHERE created_utc < ?
+                GROUP BY month, subreddit
+                ORDER BY month, subreddit
+                """,
+                (before_utc,),
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_archive_rows(self, month: str, subreddit: str, before_utc: int) -> tuple[list[dict], list[dict]]:
+        """Get one archive partition's posts and their signals.
+
+        Args:
+            month: Month as "YYYY-MM"
+            subreddit: Subreddit name
+            before_utc: Same cutoff the partitions were listed with
+
+        Returns:
+            (posts with top_comments as JSON, signals with compressed columns
+            decoded and the post's subreddit, title and created_utc)
+        """
+        condition = "p.subreddit = ? AND p.created_utc < ? AND strftime('%Y-%m', p.created_utc, 'unixepoch') = ?"
+        params = (subreddit, before_utc, month)
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT p.id, p.subreddit, p.title, p.body, p.created_utc, p.score, p.num_comments,
+                       p.url, p.permalink, {COMMENTS_JSON.format(post="p")} AS top_comments,
+                       p.fetched_at, p.processed
+                FROM posts p
+                WHERE {condition}
+                ORDER BY p.created_utc
+                """,
+                params,
+            )
+            posts = [dict(row) for row in await cursor.fetchall()]
+            cursor = await conn.execute(
+                f"""
+                SELECT i.*, p.subreddit, p.title AS post_title, p.created_utc AS post_created_utc
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE {condition}
+                ORDER BY i.id
+                """,
+                params,
+            )
+            rows = await cursor.fetchall()
+            codec = await self._get_codec(conn)
+        return posts, [codec.decode_row(dict(row)) for row in rows]
+
+    async def delete_posts(self, post_ids: list[str]) -> dict:
+        """Delete posts with their signals and everything attached to them.
+
+        Comments, evidence, search and stats rows follow through triggers;
+        embeddings, watchlist matches and processing log rows are deleted here.
+        The version of every embedding model that loses vectors is bumped, so
+        cached vector indexes (see embeddings.load_index) are rebuilt.
+
+        Args:
+            post_ids: Reddit post IDs
+
+        Returns:
+            Dict with the posts and signals deleted
+        """
+        ids = json.dumps(post_ids)
+        signal_ids = "SELECT id FROM signals WHERE post_id IN (SELECT value FROM json_each(?))"
+        async with self.connection() as conn:
+            try:
+                await conn.execute(
+                    f"""
+                    UPDATE embedding_models SET version = version + 1, updated_at = ?
+                    WHERE model IN (SELECT DISTINCT model FROM signal_embeddings WHERE signal_id IN ({signal_ids}))
+                    """,
+                    (datetime.now(UTC).isoformat(), ids),
+                )
+                await conn.execute(f"DELETE FROM signal_embeddings WHERE signal_id IN ({signal_ids})", (ids,))
+                await conn.execute(f"DELETE FROM alert_matches WHERE signal_id IN ({signal_ids})", (ids,))
+                cursor = await conn.execute(
+                    "DELETE FROM signals WHERE post_id IN (SELECT value FROM json_each(?))", (ids,)
+                )
+                signals = cursor.rowcount
+                await conn.execute(
+                    "DELETE FROM processing_log WHERE post_id IN (SELECT value FROM json_each(?))", (ids,)
+                )
+                cursor = await conn.execute("DELETE FROM posts WHERE id IN (SELECT value FROM json_each(?))", (ids,))
+                posts = cursor.rowcount
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        logger.info("posts_deleted", posts=posts, signals=signals)
+        return {"posts": posts, "signals": signals}
+
+    # --- Bulk Import Methods ---
+
+    async def import_posts(self, posts: Sequence[RedditPost]) -> int:
+        """Insert a batch of posts from an offline dump in one transaction.
+
+        Unlike upsert_posts, posts already stored are left untouched, so a
+        backfill never resets live posts or their processing state. Comments
+        are attached separately (see stage_import_comments).
+
+        Args:
+            posts: Posts to insert
+
+        Returns:
+            Number of new posts inserted
+        """
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn:
+            try:
+                cursor = await conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO posts
+                    (id, subreddit, title, body, created_utc, score,
+                     num_comments, url, permalink, fetched_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    [
+                        (
+                            post.id,
+                            post.subreddit,
+                            post.title,
+                            post.body,
+                            post.created_utc,
+                            post.score,
+                            post.num_comments,
+                            post.url,
+                            post.permalink,
+                            now,
+                        )
+                        for post in posts
+                    ],
+                )
+                inserted = cursor.rowcount
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return inserted
+
+    async def stage_import_comments(self, comments: Sequence[tuple[str, int, str]]) -> None:
+        """Stage top-level comments from a dump until their posts are imported.
+
+        Comments go to a temporary table (on disk, like all of SQLite's temp
+        storage by default), so a dump's comments never have to fit in memory.
+
+        Args:
+            comments: (post_id, score, body) tuples
+        """
+        async with self.connection() as conn:
+            await conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS import_comments (post_id TEXT NOT NULL, score INTEGER, body TEXT)"
+            )
+            await conn.executemany("INSERT INTO import_comments (post_id, score, body) VALUES (?, ?, ?)", comments)
+            await conn.commit()
+
+    async def attach_import_comments(self, per_post: int) -> int:
+        """Join staged comments to their posts and drop the staging table.
+
+        Each post gets its highest-scored staged comments. Posts that already
+        have comments (e.g. scraped live) keep them.
+
+        Args:
+            per_post: Comments kept per post
+
+        Returns:
+            Number of comments stored
+        """
+        async with self.connection() as conn:
+            try:
+                await conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS import_comments (post_id TEXT NOT NULL, score INTEGER, body TEXT)"
+                )
+                cursor = await conn.execute(
+                    """
+                    INSERT INTO comments (post_id, position, body)
+                    SELECT post_id, rank - 1, body FROM (
+                        SELECT s.post_id, s.body,
+                               ROW_NUMBER() OVER (PARTITION BY s.post_id ORDER BY s.score DESC, s.rowid) AS rank
+                        FROM import_comments s
+                        WHERE s.post_id IN (SELECT id FROM posts)
+                          AND s.post_id NOT IN (SELECT post_id FROM comments)
+                    )
+                    WHERE rank <= ?
+                    """,
+                    (per_post,),
+                )
+                attached = cursor.rowcount
+                await conn.execute("DROP TABLE temp.import_comments")
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+        return attached
 
     # --- Run Management ---
 
@@ -409,174 +1344,875 @@ class AsyncStore:
                     run_id,
                 ),
             )
-            await conn.commit()
+            await conn.commit()
+
+    async def get_runs(self, limit: int = 10) -> list[dict]:
+        """Get recent pipeline runs.
+
+        Args:
+            limit: Maximum runs to return
+
+        Returns:
+            List of run dictionaries
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT * FROM runs
+                ORDER BY started_at DESC
+                LIMIT ?
+                """,
+                (limit,),
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_run(self, run_id: int) -> dict | None:
+        """Get a specific run by ID.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run dictionary or None
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,))
+            row = await cursor.fetchone()
+        return dict(row) if row else None
+
+    async def get_signals_for_run(self, run_id: int, fields: Sequence[str] | None = None) -> list[dict]:
+        """Get all signals from a specific run.
+
+        Args:
+            run_id: Run ID
+            fields: Columns to return (None = every signal column plus post info,
+                including the post body and top comments)
+
+        Returns:
+            List of signal dictionaries with post info
+        """
+        async with self.connection() as conn:
+            columns = await self._signal_select_list(conn, fields)
+            if fields is None:
+                columns += f", p.body as post_body, {COMMENTS_JSON.format(post='p')} AS top_comments"
+            cursor = await conn.execute(
+                f"""
+                SELECT {columns}
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE i.run_id = ?
+                ORDER BY i.total_score DESC, i.id
+                """,
+                (run_id,),
+            )
+            rows = await cursor.fetchall()
+            codec = await self._get_codec(conn)
+        return [codec.decode_row(dict(row)) for row in rows]
+
+    async def iter_signals(
+        self,
+        fields: Sequence[str] | None = None,
+        include_disqualified: bool = False,
+        run_id: int | None = None,
+        limit: int | None = None,
+        with_post_text: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream signals in score order, a chunk of rows at a time.
+
+        Rows are read from one query with fetchmany, so memory stays bounded
+        by the chunk size however many signals are exported.
+
+        Args:
+            fields: Columns to return (None = every signal column plus post info)
+            include_disqualified: Whether to include disqualified signals
+            run_id: Only signals from this run
+            limit: Maximum signals (None = all)
+            with_post_text: Add post_body and top_comments (only when fields is None)
+            chunk_size: Rows per yielded chunk
+
+        Yields:
+            Lists of up to chunk_size signal dicts
+
+        Raises:
+            ValueError: If a field name is invalid
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if run_id is not None:
+            conditions.append("i.run_id = ?")
+            params.append(run_id)
+        if not include_disqualified:
+            conditions.append("i.disqualified = 0")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        async with self.connection() as conn:
+            columns = await self._signal_select_list(conn, fields)
+            if fields is None and with_post_text:
+                columns += f", p.body as post_body, {COMMENTS_JSON.format(post='p')} AS top_comments"
+            codec = await self._get_codec(conn)
+            cursor = await conn.execute(
+                f"""
+                SELECT {columns}
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                {where}
+                ORDER BY i.total_score DESC, i.id
+                LIMIT ?
+                """,
+                (*params, -1 if limit is None else limit),
+            )
+            try:
+                while rows := await cursor.fetchmany(chunk_size):
+                    yield [codec.decode_row(dict(row)) for row in rows]
+            finally:
+                await cursor.close()
+
+    async def get_signal_detail(self, signal_id: int) -> dict | None:
+        """Get detailed information about a specific signal.
+
+        Args:
+            signal_id: Signal ID
+
+        Returns:
+            Detailed signal dictionary or None
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT i.*, p.title as post_title, p.subreddit, p.permalink,
+                       p.body as post_body, {COMMENTS_JSON.format(post="p")} AS top_comments, p.url as post_url
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE i.id = ?
+                """,
+                (signal_id,),
+            )
+            row = await cursor.fetchone()
+            codec = await self._get_codec(conn)
+        return codec.decode_row(dict(row)) if row else None
+
+    async def search_signals(
+        self,
+        query: str,
+        subreddit: str | None = None,
+        min_score: int | None = None,
+        include_disqualified: bool = False,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Full-text search over signals and their post titles, best match first.
+
+        The query uses the watchlist query language (see query.py): plain
+        words must all appear, and AND/OR/NOT, phrases and field prefixes
+        narrow it down. Matching is stemmed and case and accent insensitive;
+        results are ranked with BM25, weighting summaries and pain points above
+        evidence and post titles.
+
+        Args:
+            query: Search query
+            subreddit: Only return signals from this subreddit
+            min_score: Only return signals scoring at least this much
+            include_disqualified: Whether to include disqualified signals
+            limit: Maximum number of results
+
+        Returns:
+            List of signal dicts with post info, rank (lower is better) and a
+            highlighted snippet
+
+        Raises:
+            QuerySyntaxError: If the query is malformed or only negative
+        """
+        if not query.strip():
+            return []
+        match = compile_query(query).to_fts()
+
+        conditions = ["signals_fts MATCH ?"]
+        params: list[Any] = [match]
+        if subreddit:
+            conditions.append("p.subreddit = ?")
+            params.append(subreddit)
+        if min_score is not None:
+            conditions.append("i.total_score >= ?")
+            params.append(min_score)
+        if not include_disqualified:
+            conditions.append("i.disqualified = 0")
+
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT i.id, i.signal_summary, i.pain_point, i.target_user, i.total_score,
+                       i.disqualified, i.created_at, p.title as post_title, p.subreddit, p.permalink,
+                       bm25(signals_fts, 4.0, 4.0, 2.0, 1.0, 1.0, 0.5) AS rank,
+                       snippet(signals_fts, -1, '[', ']', '...', 12) AS snippet
+                FROM signals_fts
+                JOIN signals i ON i.id = signals_fts.rowid
+                JOIN posts p ON i.post_id = p.id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY rank
+                LIMIT ?
+                """,
+                [*params, limit],
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def get_unclustered_pain_points(self, subreddit: str | None = None, days: int = 7) -> list[ClusterItem]:
+        """Get extraction items available for clustering.
+
+        Evidence comes from the evidence table in the same query; rows were
+        validated when saved, so they are not re-validated here.
+
+        Args:
+            subreddit: Filter by subreddit
+            days: Look back days
+
+        Returns:
+            List of ClusterItems
+        """
+        async with self.connection() as conn:
+            query = """
+                SELECT i.id, i.signal_summary, i.pain_point, p.subreddit, p.url,
+                       e.quote, e.source, e.comment_index, e.signal_type
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                LEFT JOIN evidence e ON e.signal_id = i.id
+                WHERE i.cluster_id IS NULL
+                AND i.disqualified = 0
+                AND i.created_at > ?
+            """
+            params = [(datetime.now(UTC) - timedelta(days=days)).isoformat()]
+
+            if subreddit:
+                query += " AND p.subreddit = ?"
+                params.append(subreddit)
+            query += " ORDER BY i.id, e.position"
+
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
+
+        items: dict[int, ClusterItem] = {}
+        for row in rows:
+            item = items.get(row["id"])
+            if item is None:
+                item = items[row["id"]] = ClusterItem(
+                    id=row["id"],
+                    summary=row["signal_summary"],
+                    pain_point=row["pain_point"],
+                    subreddit=row["subreddit"],
+                    url=row["url"],
+                    evidence=[],
+                )
+            if row["quote"] is not None:
+                item.evidence.append(
+                    EvidenceSignal.model_construct(
+                        quote=row["quote"],
+                        source=row["source"],
+                        comment_index=row["comment_index"],
+                        signal_type=row["signal_type"],
+                    )
+                )
+
+        return list(items.values())
+
+    async def get_evidence(
+        self,
+        signal_type: str | None = None,
+        days: int | None = None,
+        subreddit: str | None = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        """Get evidence quotes of qualified signals, newest first.
+
+        Args:
+            signal_type: Only this SignalType value (e.g. "willingness_to_pay")
+            days: Only signals saved in the last N days
+            subreddit: Only signals from this subreddit
+            limit: Maximum number of quotes
+
+        Returns:
+            Quote dicts with the signal's summary, score, subreddit and permalink
+        """
+        conditions = ["i.disqualified = 0"]
+        params: list[Any] = []
+        if signal_type:
+            conditions.append("e.signal_type = ?")
+            params.append(signal_type)
+        if days is not None:
+            conditions.append("i.created_at > ?")
+            params.append((datetime.now(UTC) - timedelta(days=days)).isoformat())
+        if subreddit:
+            conditions.append("p.subreddit = ?")
+            params.append(subreddit)
+
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                f"""
+                SELECT e.quote, e.signal_type, e.source, e.comment_index, e.signal_id,
+                       i.signal_summary, i.total_score, i.created_at, p.subreddit, p.permalink
+                FROM evidence e
+                JOIN signals i ON i.id = e.signal_id
+                JOIN posts p ON p.id = i.post_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY e.signal_id DESC, e.position
+                LIMIT ?
+                """,
+                (*params, limit),
+            )
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    async def save_clusters(self, clusters: list[Cluster], week_start: str) -> list[str]:
+        """Save generated clusters and link signals in a single transaction.
+
+        Cluster IDs are derived from the week and member signal IDs, so saving
+        the same clustering again updates the existing rows instead of failing
+        on a duplicate key. When signals are re-clustered into different groups,
+        the clusters they leave (and the rest of the week's clusters) are
+        recounted, and those left without member signals are removed.
+
+        Args:
+            clusters: List of Cluster objects
+            week_start: ISO date string for the week
+
+        Returns:
+            IDs of the saved clusters, in input order
+        """
+        if not clusters:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        cluster_ids = [cluster_id_for(week_start, cluster.signal_ids) for cluster in clusters]
+
+        member_ids = json.dumps([signal_id for cluster in clusters for signal_id in cluster.signal_ids])
+
+        async with self.connection() as conn:
+            try:
+                # Clusters the members belonged to before, possibly from another week
+                cursor = await conn.execute(
+                    """
+                    SELECT DISTINCT cluster_id FROM signals
+                    WHERE id IN (SELECT value FROM json_each(?)) AND cluster_id IS NOT NULL
+                    """,
+                    (member_ids,),
+                )
+                previous = json.dumps([row["cluster_id"] for row in await cursor.fetchall()])
+
+                await conn.executemany(
+                    """
+                    INSERT INTO clusters (id, title, summary, week_start, target_audience, why_it_matters,
+                                          generated_report, created_at, centroid, signal_count)
+                    VALUES (?, ?, ?, ?, ?, ?, '', ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        title = excluded.title,
+                        summary = excluded.summary,
+                        target_audience = excluded.target_audience,
+                        why_it_matters = excluded.why_it_matters,
+                        centroid = excluded.centroid,
+                        signal_count = excluded.signal_count,
+                        updated_at = ?
+                    """,
+                    [
+                        (
+                            cluster_id,
+                            cluster.title,
+                            cluster.summary,
+                            week_start,
+                            cluster.target_audience,
+                            cluster.why_it_matters,
+                            now,
+                            to_blob(cluster.centroid) if cluster.centroid is not None else None,
+                            len(cluster.signal_ids),
+                            now,
+                        )
+                        for cluster_id, cluster in zip(cluster_ids, clusters, strict=True)
+                    ],
+                )
+                await conn.executemany(
+                    "UPDATE signals SET cluster_id = ? WHERE id = ?",
+                    [
+                        (cluster_id, signal_id)
+                        for cluster_id, cluster in zip(cluster_ids, clusters, strict=True)
+                        for signal_id in cluster.signal_ids
+                    ],
+                )
+                affected = "week_start = ? OR id IN (SELECT value FROM json_each(?))"
+                await conn.execute(
+                    f"""
+                    DELETE FROM clusters
+                    WHERE ({affected}) AND NOT EXISTS (SELECT 1 FROM signals s WHERE s.cluster_id = clusters.id)
+                    """,
+                    (week_start, previous),
+                )
+                await conn.execute(
+                    f"""
+                    UPDATE clusters
+                    SET signal_count = (SELECT COUNT(*) FROM signals s WHERE s.cluster_id = clusters.id)
+                    WHERE {affected}
+                    """,
+                    (week_start, previous),
+                )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
+        logger.info("clusters_saved", week_start=week_start, clusters=len(clusters))
+        return cluster_ids
+
+    async def get_cluster_centroids(self, days: int = 7) -> list[dict]:
+        """Get persisted cluster centroids for incremental assignment.
+
+        Args:
+            days: Only include clusters whose week started within this many days
+
+        Returns:
+            List of dicts with id, title, week_start, signal_count and centroid (numpy array)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT id, title, week_start, signal_count, centroid
+                FROM clusters
+                WHERE centroid IS NOT NULL
+                AND week_start >= date('now', ?)
+                ORDER BY week_start DESC, id
+                """,
+                (f"-{days} days",),
+            )
+            rows = await cursor.fetchall()
+
+        clusters = []
+        for row in rows:
+            cluster = dict(row)
+            cluster["centroid"] = from_blob(row["centroid"])
+            clusters.append(cluster)
+        return clusters
+
+    async def attach_signals_to_clusters(
+        self,
+        assignments: dict[str, list[int]],
+        centroids: dict[str, Any],
+    ) -> int:
+        """Attach signals to existing clusters and store their updated centroids.
+
+        Args:
+            assignments: Mapping of cluster ID to signal IDs to attach
+            centroids: Mapping of cluster ID to its updated centroid vector
+
+        Returns:
+            Number of signals attached
+        """
+        if not assignments:
+            return 0
+
+        async with self.connection() as conn:
+            try:
+                now = datetime.now(UTC).isoformat()
+                await conn.executemany(
+                    "UPDATE signals SET cluster_id = ? WHERE id = ?",
+                    [(cluster_id, signal_id) for cluster_id, ids in assignments.items() for signal_id in ids],
+                )
+                await conn.executemany(
+                    """
+                    UPDATE clusters
+                    SET centroid = ?, signal_count = COALESCE(signal_count, 0) + ?, updated_at = ?
+                    WHERE id = ?
+                    """,
+                    [
+                        (to_blob(centroids[cluster_id]), len(ids), now, cluster_id)
+                        for cluster_id, ids in assignments.items()
+                    ],
+                )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
+        attached = sum(len(ids) for ids in assignments.values())
+        logger.info("signals_attached", clusters=len(assignments), signals=attached)
+        return attached
+
+    # --- Cluster Lineage Methods ---
+
+    async def get_weeks_with_unlinked_clusters(self) -> list[str]:
+        """Get weeks that have clusters not yet linked to a lineage.
+
+        Returns:
+            ISO week start dates, oldest first
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT DISTINCT week_start FROM clusters
+                WHERE lineage_id IS NULL AND centroid IS NOT NULL
+                ORDER BY week_start
+                """
+            )
+            rows = await cursor.fetchall()
+        return [row["week_start"] for row in rows]
+
+    async def _get_member_subreddits(
+        self, conn: aiosqlite.Connection, query: str, params: tuple
+    ) -> dict[Any, set[str]]:
+        """Collect member subreddits keyed by the first selected column."""
+        cursor = await conn.execute(query, params)
+        subreddits: dict[Any, set[str]] = {}
+        for key, subreddit in await cursor.fetchall():
+            subreddits.setdefault(key, set()).add(subreddit)
+        return subreddits
+
+    async def get_unlinked_clusters(self, week_start: str) -> list[dict]:
+        """Get a week's clusters that are not yet linked to a lineage.
+
+        Args:
+            week_start: ISO week start date
+
+        Returns:
+            List of dicts with id, title, signal_count, centroid (numpy array) and subreddits (set)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT id, title, signal_count, centroid FROM clusters
+                WHERE week_start = ? AND lineage_id IS NULL AND centroid IS NOT NULL
+                ORDER BY id
+                """,
+                (week_start,),
+            )
+            rows = await cursor.fetchall()
+            subreddits = await self._get_member_subreddits(
+                conn,
+                """
+                SELECT DISTINCT s.cluster_id, p.subreddit FROM signals s
+                JOIN clusters c ON s.cluster_id = c.id
+                JOIN posts p ON s.post_id = p.id
+                WHERE c.week_start = ? AND c.lineage_id IS NULL
+                """,
+                (week_start,),
+            )
 
-    async def get_runs(self, limit: int = 10) -> list[dict]:
-        """Get recent pipeline runs.
+        return [
+            {**dict(row), "centroid": from_blob(row["centroid"]), "subreddits": subreddits.get(row["id"], set())}
+            for row in rows
+        ]
+
+    async def get_lineage_candidates(self, week_start: str, lookback_days: int = 28) -> list[dict]:
+        """Get lineages recent enough to be continued by a week's clusters.
 
         Args:
-            limit: Maximum runs to return
+            week_start: ISO week start date being linked
+            lookback_days: Only include lineages last seen within this many days before week_start
 
         Returns:
-            List of run dictionaries
+            List of dicts with id, title, last_week, centroid (numpy array) and subreddits (set)
         """
         async with self.connection() as conn:
+            window = (week_start, f"-{lookback_days} days", week_start)
             cursor = await conn.execute(
                 """
-                SELECT * FROM runs
-                ORDER BY started_at DESC
-                LIMIT ?
+                SELECT id, title, last_week, centroid FROM cluster_lineages
+                WHERE last_week >= date(?, ?) AND last_week <= ? AND centroid IS NOT NULL
+                ORDER BY id
                 """,
-                (limit,),
+                window,
             )
             rows = await cursor.fetchall()
-        return [dict(row) for row in rows]
+            subreddits = await self._get_member_subreddits(
+                conn,
+                """
+                SELECT DISTINCT c.lineage_id, p.subreddit FROM signals s
+                JOIN clusters c ON s.cluster_id = c.id
+                JOIN posts p ON s.post_id = p.id
+                WHERE c.lineage_id IS NOT NULL AND c.week_start >= date(?, ?) AND c.week_start <= ?
+                """,
+                window,
+            )
 
-    async def get_run(self, run_id: int) -> dict | None:
-        """Get a specific run by ID.
+        return [
+            {**dict(row), "centroid": from_blob(row["centroid"]), "subreddits": subreddits.get(row["id"], set())}
+            for row in rows
+        ]
+
+    async def link_clusters_to_lineages(
+        self,
+        clusters: list[dict],
+        matches: dict[str, int],
+        week_start: str,
+        lineage_centroids: dict[int, np.ndarray],
+    ) -> int:
+        """Link clusters to lineages, starting new lineages for unmatched clusters.
+
+        Matched lineages have their centroid blended with the cluster's centroid
+        so they follow gradual drift in wording.
 
         Args:
-            run_id: Run ID
+            clusters: Clusters from get_unlinked_clusters
+            matches: Mapping of cluster ID to existing lineage ID
+            week_start: ISO week start date of the clusters
+            lineage_centroids: Current centroids of the matched lineages (from get_lineage_candidates)
 
         Returns:
-            Run dictionary or None
+            Number of new lineages created
         """
+        if not clusters:
+            return 0
+
         async with self.connection() as conn:
-            cursor = await conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,))
-            row = await cursor.fetchone()
-        return dict(row) if row else None
+            now = datetime.now(UTC).isoformat()
+            links: list[tuple[int, str]] = []
+            blended: list[tuple[bytes, str, int]] = []
+            created = 0
 
-    async def get_signals_for_run(self, run_id: int) -> list[dict]:
-        """Get all signals from a specific run.
+            for cluster in clusters:
+                lineage_id = matches.get(cluster["id"])
+                if lineage_id is None:
+                    cursor = await conn.execute(
+                        """
+                        INSERT INTO cluster_lineages (title, centroid, first_week, last_week, created_at, updated_at)
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        """,
+                        (cluster["title"], to_blob(cluster["centroid"]), week_start, week_start, now, now),
+                    )
+                    lineage_id = cursor.lastrowid
+                    created += 1
+                else:
+                    mixed = centroid(np.vstack([lineage_centroids[lineage_id], cluster["centroid"]]))
+                    blended.append((to_blob(mixed), now, lineage_id))
+                links.append((lineage_id, cluster["id"]))
+
+            await conn.executemany("UPDATE cluster_lineages SET centroid = ?, updated_at = ? WHERE id = ?", blended)
+            await conn.executemany("UPDATE clusters SET lineage_id = ? WHERE id = ?", links)
+            await conn.commit()
+
+        logger.info("clusters_linked", week_start=week_start, clusters=len(clusters), new_lineages=created)
+        return created
+
+    async def get_lineage_week_totals(self, week_start: str) -> list[dict]:
+        """Get lineages with clusters in a week, with that week's signal total.
 
         Args:
-            run_id: Run ID
+            week_start: ISO week start date
 
         Returns:
-            List of signal dictionaries with post info
+            Lineage rows plus week_total
         """
         async with self.connection() as conn:
             cursor = await conn.execute(
                 """
-                SELECT i.*, p.title as post_title, p.subreddit, p.permalink,
-                       p.body as post_body, p.top_comments
-                FROM signals i
-                JOIN posts p ON i.post_id = p.id
-                WHERE i.run_id = ?
-                ORDER BY i.total_score DESC
+                SELECT l.id, l.last_week, l.weeks_seen, l.last_signal_count, l.prev_signal_count,
+                       l.prev_streak, l.growth_streak, SUM(c.signal_count) AS week_total
+                FROM cluster_lineages l
+                JOIN clusters c ON c.lineage_id = l.id
+                WHERE c.week_start = ?
+                GROUP BY l.id
                 """,
-                (run_id,),
+                (week_start,),
             )
             rows = await cursor.fetchall()
         return [dict(row) for row in rows]
 
-    async def get_signal_detail(self, signal_id: int) -> dict | None:
-        """Get detailed information about a specific signal.
+    async def update_lineage_metrics(self, updates: dict[int, dict]) -> None:
+        """Store recomputed lineage growth metrics.
 
         Args:
-            signal_id: Signal ID
-
-        Returns:
-            Detailed signal dictionary or None
+            updates: Mapping of lineage ID to metric columns (see recurrence.advance_growth)
         """
+        if not updates:
+            return
+
         async with self.connection() as conn:
-            cursor = await conn.execute(
+            now = datetime.now(UTC).isoformat()
+            await conn.executemany(
                 """
-                SELECT i.*, p.title as post_title, p.subreddit, p.permalink,
-                       p.body as post_body, p.top_comments, p.url as post_url
-                FROM signals i
-                JOIN posts p ON i.post_id = p.id
-                WHERE i.id = ?
+                UPDATE cluster_lineages
+                SET last_week = ?, weeks_seen = ?, last_signal_count = ?, prev_signal_count = ?,
+                    prev_streak = ?, growth_streak = ?, growth_rate = ?, updated_at = ?
+                WHERE id = ?
                 """,
-                (signal_id,),
+                [
+                    (
+                        m["last_week"],
+                        m["weeks_seen"],
+                        m["last_signal_count"],
+                        m["prev_signal_count"],
+                        m["prev_streak"],
+                        m["growth_streak"],
+                        m["growth_rate"],
+                        now,
+                        lineage_id,
+                    )
+                    for lineage_id, m in updates.items()
+                ],
             )
-            row = await cursor.fetchone()
-        return dict(row) if row else None
+            await conn.commit()
 
-    async def get_unclustered_pain_points(self, subreddit: str | None = None, days: int = 7) -> list[ClusterItem]:
-        """Get extraction items available for clustering.
+    async def get_growing_lineages(
+        self,
+        min_streak: int = 3,
+        since_week: str | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Get pain clusters that grew week over week for at least min_streak weeks.
 
         Args:
-            subreddit: Filter by subreddit
-            days: Look back days
+            min_streak: Minimum consecutive weeks of growth
+            since_week: Only include lineages last seen on or after this ISO date
+            limit: Maximum lineages to return
 
         Returns:
-            List of ClusterItems
+            Lineage rows, longest streak first
+        """
+        query = """
+            SELECT id, title, first_week, last_week, weeks_seen, last_signal_count,
+                   prev_signal_count, growth_streak, growth_rate
+            FROM cluster_lineages
+            WHERE growth_streak >= ?
+        """
+        params: list[Any] = [min_streak]
+        if since_week:
+            query += " AND last_week >= ?"
+            params.append(since_week)
+        query += " ORDER BY growth_streak DESC, last_week DESC LIMIT ?"
+        params.append(limit)
+
+        async with self.connection() as conn:
+            cursor = await conn.execute(query, params)
+            rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
+
+    # --- Embedding Methods ---
+
+    async def get_signals_missing_embeddings(self, model: str, limit: int | None = None) -> list[dict]:
+        """Get signals that have no stored embedding for a model.
+
+        Args:
+            model: Embedder name
+            limit: Maximum signals to return (None = all)
+
+        Returns:
+            List of dicts with id, signal_summary and pain_point
         """
         async with self.connection() as conn:
             query = """
-                SELECT i.id, i.signal_summary, i.pain_point, i.evidence,
-                       p.subreddit, p.url
+                SELECT i.id, i.signal_summary, i.pain_point
                 FROM signals i
-                JOIN posts p ON i.post_id = p.id
-                WHERE i.cluster_id IS NULL
-                AND i.disqualified = 0
-                AND datetime(i.created_at) > datetime('now', ?)
+                LEFT JOIN signal_embeddings e ON e.signal_id = i.id AND e.model = ?
+                WHERE e.signal_id IS NULL
+                ORDER BY i.id
             """
-            params = [f"-{days} days"]
-
-            if subreddit:
-                query += " AND p.subreddit = ?"
-                params.append(subreddit)
-
+            params: list[Any] = [model]
+            if limit:
+                query += " LIMIT ?"
+                params.append(limit)
             cursor = await conn.execute(query, params)
             rows = await cursor.fetchall()
+        return [dict(row) for row in rows]
 
-        items = []
-        for row in rows:
-            evidence_data = json.loads(row["evidence"] or "[]")
-            evidence = [EvidenceSignal(**e) for e in evidence_data]
+    async def get_cached_embeddings(self, model: str, content_hashes: list[str]) -> dict[str, np.ndarray]:
+        """Look up already-computed vectors by content hash.
 
-            items.append(
-                ClusterItem(
-                    id=row["id"],
-                    summary=row["signal_summary"],
-                    pain_point=row["pain_point"],
-                    subreddit=row["subreddit"],
-                    url=row["url"],
-                    evidence=evidence,
-                )
-            )
+        Args:
+            model: Embedder name
+            content_hashes: Content hashes to look up
 
-        return items
+        Returns:
+            Mapping of content hash to vector for the hashes found
+        """
+        if not content_hashes:
+            return {}
+
+        found: dict[str, np.ndarray] = {}
+        async with self.connection() as conn:
+            # Stay well under SQLite's bound-parameter limit
+            for start in range(0, len(content_hashes), 500):
+                chunk = content_hashes[start : start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"""
+                    SELECT content_hash, vector FROM signal_embeddings
+                    WHERE model = ? AND content_hash IN ({placeholders})
+                    """,
+                    [model, *chunk],
+                )
+                for row in await cursor.fetchall():
+                    found[row["content_hash"]] = from_blob(row["vector"], dtype="<f2")
+        return found
 
-    async def save_clusters(self, clusters: list[Cluster], week_start: str) -> None:
-        """Save generated clusters and link signals.
+    async def save_embeddings(self, model: str, rows: list[tuple[int, str, np.ndarray]]) -> int:
+        """Store signal embeddings as float16 blobs.
 
         Args:
-            clusters: List of Cluster objects
-            week_start: ISO date string for the week
+            model: Embedder name
+            rows: (signal_id, content_hash, vector) tuples
+
+        Returns:
+            Number of embeddings stored
         """
+        if not rows:
+            return 0
+
         async with self.connection() as conn:
             now = datetime.now(UTC).isoformat()
+            await conn.executemany(
+                """
+                INSERT OR REPLACE INTO signal_embeddings (signal_id, model, content_hash, dim, vector, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (signal_id, model, content_hash, len(vector), to_blob(vector, dtype="<f2"), now)
+                    for signal_id, content_hash, vector in rows
+                ],
+            )
+            # Bump the model's version so cached vector indexes know they are stale
+            await conn.execute(
+                """
+                INSERT INTO embedding_models (model, version, updated_at) VALUES (?, 1, ?)
+                ON CONFLICT(model) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at
+                """,
+                (model, now),
+            )
+            await conn.commit()
+        logger.info("embeddings_saved", model=model, count=len(rows))
+        return len(rows)
 
-            for cluster in clusters:
-                # Generate a simple ID if not present (handled by caller usually, but let's make one)
-                cluster_id = f"{week_start}_{cluster.title[:10].replace(' ', '_').lower()}_{len(cluster.signal_ids)}"
+    async def get_embedding_version(self, model: str) -> int:
+        """Get a counter that changes whenever a model's embeddings are written.
 
-                # Insert cluster
-                await conn.execute(
-                    """
-                    INSERT INTO clusters (id, title, summary, week_start, target_audience, why_it_matters, generated_report, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        cluster_id,
-                        cluster.title,
-                        cluster.summary,
-                        week_start,
-                        cluster.target_audience,
-                        cluster.why_it_matters,
-                        "",  # No report initially, generated later or on fly
-                        now,
-                    ),
-                )
+        Args:
+            model: Embedder name
+
+        Returns:
+            Version number (0 if nothing was stored yet)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute("SELECT version FROM embedding_models WHERE model = ?", (model,))
+            row = await cursor.fetchone()
+        return row["version"] if row else 0
 
-                # Update signals with cluster_id
-                for signal_id in cluster.signal_ids:
-                    await conn.execute("UPDATE signals SET cluster_id = ? WHERE id = ?", (cluster_id, signal_id))
+    async def get_embeddings(self, model: str) -> tuple[np.ndarray, np.ndarray]:
+        """Load all stored embeddings for a model into a contiguous matrix.
 
-            await conn.commit()
+        Args:
+            model: Embedder name
+
+        Returns:
+            Tuple of (signal IDs as int64 array, float32 matrix with one row per ID)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT signal_id, dim, vector FROM signal_embeddings WHERE model = ? ORDER BY signal_id",
+                (model,),
+            )
+            rows = await cursor.fetchall()
+
+        if not rows:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0), dtype=np.float32)
+
+        ids = np.fromiter((row["signal_id"] for row in rows), dtype=np.int64, count=len(rows))
+        dim = rows[0]["dim"]
+        matrix = np.frombuffer(b"".join(row["vector"] for row in rows), dtype="<f2").reshape(len(rows), dim)
+        return ids, matrix.astype(np.float32)
 
     # --- Watchlist / Alerting Methods ---
 
@@ -588,6 +2224,11 @@ class AsyncStore:
         notification_email: str | None = None,
         notification_webhook: str | None = None,
         tier: str = "free",
+        description: str | None = None,
+        description_vector: np.ndarray | None = None,
+        embedding_model: str | None = None,
+        semantic_threshold: float | None = None,
+        query: str | None = None,
     ) -> int:
         """Create a new watchlist for keyword alerts.
 
@@ -598,17 +2239,30 @@ class AsyncStore:
             notification_email: Email for notifications
             notification_webhook: Webhook URL for notifications
             tier: Pricing tier (free/paid)
+            description: Natural-language description for semantic matching
+            description_vector: Embedding of the description
+            embedding_model: Model that produced description_vector
+            semantic_threshold: Minimum cosine similarity for a semantic match (None = default)
+            query: Boolean query (see query.py), matched in addition to keywords
 
         Returns:
             Watchlist ID
+
+        Raises:
+            QuerySyntaxError: If the query is malformed
         """
+        if query:
+            # Validate now; the compiled query is cached for matching
+            compile_query(query)
+
         async with self.connection() as conn:
             now = datetime.now(UTC).isoformat()
             cursor = await conn.execute(
                 """
                 INSERT INTO watchlists
-                (name, keywords, subreddits, notification_email, notification_webhook, tier, is_active, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                (name, keywords, subreddits, notification_email, notification_webhook, tier, is_active, created_at,
+                 description, description_vector, embedding_model, semantic_threshold, query)
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     name,
@@ -618,6 +2272,11 @@ class AsyncStore:
                     notification_webhook,
                     tier,
                     now,
+                    description,
+                    to_blob(description_vector) if description_vector is not None else None,
+                    embedding_model,
+                    semantic_threshold,
+                    query,
                 ),
             )
             await conn.commit()
@@ -643,13 +2302,17 @@ class AsyncStore:
             cursor = await conn.execute(query)
             rows = await cursor.fetchall()
 
-        watchlists = []
-        for row in rows:
-            wl = dict(row)
-            wl["keywords"] = json.loads(wl["keywords"])
-            wl["subreddits"] = json.loads(wl["subreddits"]) if wl["subreddits"] else None
-            watchlists.append(wl)
-        return watchlists
+        return [self._decode_watchlist(row) for row in rows]
+
+    @staticmethod
+    def _decode_watchlist(row: aiosqlite.Row) -> dict:
+        """Decode a watchlists row's JSON and vector columns."""
+        wl = dict(row)
+        wl["keywords"] = json.loads(wl["keywords"])
+        wl["subreddits"] = json.loads(wl["subreddits"]) if wl["subreddits"] else None
+        if wl.get("description_vector") is not None:
+            wl["description_vector"] = from_blob(wl["description_vector"])
+        return wl
 
     async def get_watchlist(self, watchlist_id: int) -> dict | None:
         """Get a specific watchlist by ID.
@@ -664,12 +2327,22 @@ class AsyncStore:
             cursor = await conn.execute("SELECT * FROM watchlists WHERE id = ?", (watchlist_id,))
             row = await cursor.fetchone()
 
-        if not row:
-            return None
-        wl = dict(row)
-        wl["keywords"] = json.loads(wl["keywords"])
-        wl["subreddits"] = json.loads(wl["subreddits"]) if wl["subreddits"] else None
-        return wl
+        return self._decode_watchlist(row) if row else None
+
+    async def get_semantic_watchlist_models(self) -> set[str]:
+        """Get the embedding models used by active semantic watchlists.
+
+        Returns:
+            Set of embedding model names (empty if no watchlist has a description)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT DISTINCT embedding_model FROM watchlists
+                WHERE is_active = 1 AND description_vector IS NOT NULL
+                """
+            )
+            return {row[0] for row in await cursor.fetchall()}
 
     async def delete_watchlist(self, watchlist_id: int) -> bool:
         """Delete (deactivate) a watchlist.
@@ -681,92 +2354,208 @@ class AsyncStore:
             True if deleted
         """
         async with self.connection() as conn:
-            await conn.execute("UPDATE watchlists SET is_active = 0 WHERE id = ?", (watchlist_id,))
+            await conn.execute(
+                "UPDATE watchlists SET is_active = 0, updated_at = ? WHERE id = ?",
+                (datetime.now(UTC).isoformat(), watchlist_id),
+            )
             await conn.commit()
             logger.info("watchlist_deleted", id=watchlist_id)
         return True
 
-    async def check_watchlists(self, since_hours: int = 24) -> list[dict]:
-        """Check all active watchlists against recent signals.
+    async def check_watchlists(
+        self, since_hours: int = 24, rescan: bool = False, embedding_model: str | None = None
+    ) -> list[dict]:
+        """Check active watchlists against signals added since their last check.
+
+        Each watchlist keeps a cursor (the highest signal ID it has been checked
+        against), so a check only reads signals added since the previous one.
+        Watchlists that were never checked start from the last ``since_hours``.
+        Counters are incremented by the matches each check records.
+
+        Semantic watchlists (those with a description) are matched against the
+        stored signal embeddings of ``embedding_model``; signals must be
+        embedded (see embeddings.embed_signals) before the check.
 
         Args:
-            since_hours: Only check signals from the last N hours
+            since_hours: Window for watchlists that have not been checked yet
+            rescan: Ignore cursors and re-check every watchlist over the window
+            embedding_model: Embedding model for semantic watchlists (None = keywords only)
 
         Returns:
             List of matches with watchlist and signal info
         """
+        watchlists = await self.get_watchlists(active_only=True)
+        if not watchlists:
+            return []
+
+        cutoff = (datetime.now(UTC) - timedelta(hours=since_hours)).isoformat()
+        semantic = SemanticMatcher(
+            [wl for wl in watchlists if embedding_model and wl.get("embedding_model") == embedding_model]
+        )
+
         async with self.connection() as conn:
-            # Get all active watchlists
-            watchlists = await self.get_watchlists(active_only=True)
+            cursor = await conn.execute("SELECT COALESCE(MAX(id), 0) FROM signals")
+            high_water = (await cursor.fetchone())[0]
 
-            if not watchlists:
-                return []
+            # Resolve the window to a signal ID once (IDs grow with created_at),
+            # so the scan below is a plain rowid range
+            cursor = await conn.execute(
+                "SELECT id FROM signals WHERE created_at > ? ORDER BY created_at, id LIMIT 1", (cutoff,)
+            )
+            row = await cursor.fetchone()
+            window_start = row["id"] - 1 if row else high_water
 
-            # Get recent signals
+            starts = {
+                wl["id"]: window_start if rescan or not wl.get("last_signal_id") else wl["last_signal_id"]
+                for wl in watchlists
+            }
             cursor = await conn.execute(
                 """
-                SELECT i.id, i.signal_summary, i.pain_point, i.evidence,
-                       p.subreddit, p.url, p.title as post_title
+                SELECT i.id, i.signal_summary, i.pain_point, i.target_user, i.evidence,
+                       p.subreddit, p.url, p.title as post_title, e.vector AS embedding
                 FROM signals i
                 JOIN posts p ON i.post_id = p.id
-                WHERE datetime(i.created_at) > datetime('now', ?)
+                LEFT JOIN signal_embeddings e ON e.signal_id = i.id AND e.model = ?
+                WHERE i.id > ? AND i.id <= ?
                 AND i.disqualified = 0
+                ORDER BY i.id
                 """,
-                (f"-{since_hours} hours",),
+                (embedding_model if len(semantic) else None, min(starts.values()), high_water),
             )
             signals = await cursor.fetchall()
 
-        matches = []
-        now = datetime.now(UTC).isoformat()
+        matches = match_watchlists(signals, watchlists, starts, semantic, embedding_model)
 
-        for signal in signals:
-            signal_text = f"{signal['signal_summary']} {signal['pain_point']} {signal['post_title']}".lower()
-
-            for wl in watchlists:
-                # Check subreddit filter
-                if wl["subreddits"] and signal["subreddit"] not in wl["subreddits"]:
-                    continue
-
-                # Check keyword matches
-                for keyword in wl["keywords"]:
-                    if keyword.lower() in signal_text:
-                        matches.append(
-                            {
-                                "watchlist_id": wl["id"],
-                                "watchlist_name": wl["name"],
-                                "signal_id": signal["id"],
-                                "keyword_matched": keyword,
-                                "signal_summary": signal["signal_summary"],
-                                "pain_point": signal["pain_point"],
-                                "subreddit": signal["subreddit"],
-                                "url": signal["url"],
-                            }
-                        )
-                        break  # One match per signal per watchlist
+        by_watchlist: dict[int, list[dict]] = {}
+        for m in matches:
+            by_watchlist.setdefault(m["watchlist_id"], []).append(m)
 
-        # Save matches to database
+        # Record matches, advance cursors and counters in one transaction
         async with self.connection() as conn:
-            for match in matches:
-                # Check if already recorded
-                cursor = await conn.execute(
-                    "SELECT id FROM alert_matches WHERE watchlist_id = ? AND signal_id = ?",
-                    (match["watchlist_id"], match["signal_id"]),
-                )
-                existing = await cursor.fetchone()
-
-                if not existing:
-                    await conn.execute(
+            now = datetime.now(UTC).isoformat()
+            recorded = 0
+            try:
+                if signals:
+                    updates = []
+                    for wl_id in starts:
+                        inserted = 0
+                        wl_matches = by_watchlist.get(wl_id)
+                        if wl_matches:
+                            cursor = await conn.executemany(
+                                """
+                                INSERT OR IGNORE INTO alert_matches
+                                    (watchlist_id, signal_id, keyword_matched, created_at)
+                                VALUES (?, ?, ?, ?)
+                                """,
+                                [(wl_id, m["signal_id"], m["keyword_matched"], now) for m in wl_matches],
+                            )
+                            inserted = cursor.rowcount
+                        recorded += inserted
+                        updates.append((high_water, now, inserted, wl_id))
+                    await conn.executemany(
                         """
-                        INSERT INTO alert_matches (watchlist_id, signal_id, keyword_matched, created_at)
-                        VALUES (?, ?, ?, ?)
+                        UPDATE watchlists
+                        SET last_signal_id = MAX(COALESCE(last_signal_id, 0), ?),
+                            last_checked_at = ?,
+                            total_matches = COALESCE(total_matches, 0) + ?
+                        WHERE id = ?
                         """,
-                        (match["watchlist_id"], match["signal_id"], match["keyword_matched"], now),
+                        updates,
+                    )
+                else:
+                    await conn.executemany(
+                        "UPDATE watchlists SET last_checked_at = ? WHERE id = ?",
+                        [(now, wl_id) for wl_id in starts],
                     )
+                await conn.commit()
+            except Exception:
+                await conn.rollback()
+                raise
+
+        logger.info(
+            "watchlists_checked",
+            watchlists=len(watchlists),
+            signals_scanned=len(signals),
+            total_matches=len(matches),
+            new_matches=recorded,
+        )
+        return matches
 
-            await conn.commit()
+    async def _get_watchlist_matcher(self, conn: aiosqlite.Connection) -> WatchlistMatcher | None:
+        """Get the compiled matcher for write-time watchlists, rebuilding it when they change.
 
-        logger.info("watchlists_checked", total_matches=len(matches))
-        return matches
+        Changes are detected from a cheap fingerprint of the watchlists table,
+        so watchlists edited by another process are picked up too.
+
+        Semantic watchlists (those with a description vector) are left out: a
+        signal has no embedding yet when it is saved, so they are matched only
+        by check_watchlists, keywords included.
+
+        Args:
+            conn: Open database connection
+
+        Returns:
+            Compiled matcher, or None if there are no active watchlists
+        """
+        cursor = await conn.execute(
+            """
+            SELECT COUNT(*), COALESCE(MAX(id), 0), MAX(COALESCE(updated_at, created_at))
+            FROM watchlists WHERE is_active = 1
+            """
+        )
+        fingerprint = tuple(await cursor.fetchone())
+        if fingerprint != self._watchlist_fingerprint:
+            watchlists = [
+                wl for wl in await self.get_watchlists(active_only=True) if wl.get("description_vector") is None
+            ]
+            self._watchlist_matcher = WatchlistMatcher(watchlists) if watchlists else None
+            self._watchlist_fingerprint = fingerprint
+            logger.debug("watchlist_matcher_rebuilt", watchlists=len(watchlists))
+        return self._watchlist_matcher
+
+    async def _record_write_time_matches(
+        self,
+        conn: aiosqlite.Connection,
+        signal_id: int,
+        fields: dict[str, str | None],
+        now: str,
+    ) -> int:
+        """Match a just-saved signal against watchlists and record the hits.
+
+        Runs inside the signal's write transaction. Watchlist cursors are not
+        advanced; the next check_watchlists pass skips these via INSERT OR IGNORE.
+        Semantic watchlists are not matched here (see _get_watchlist_matcher).
+
+        Args:
+            conn: Open database connection
+            signal_id: ID of the saved signal
+            fields: Signal fields to match (see query.FIELDS)
+            now: Timestamp for the match rows
+
+        Returns:
+            Number of matches recorded
+        """
+        matcher = await self._get_watchlist_matcher(conn)
+        if matcher is None:
+            return 0
+
+        hits = matcher.match(_keyword_text(fields), fields["subreddit"], fields)
+        if not hits:
+            return 0
+
+        await conn.executemany(
+            """
+            INSERT OR IGNORE INTO alert_matches (watchlist_id, signal_id, keyword_matched, created_at)
+            VALUES (?, ?, ?, ?)
+            """,
+            [(wl["id"], signal_id, keyword, now) for wl, keyword in hits],
+        )
+        await conn.executemany(
+            "UPDATE watchlists SET total_matches = COALESCE(total_matches, 0) + 1 WHERE id = ?",
+            [(wl["id"],) for wl, _ in hits],
+        )
+        logger.info("alerts_matched_on_write", signal_id=signal_id, watchlists=[wl["id"] for wl, _ in hits])
+        return len(hits)
 
     async def get_unnotified_matches(self, watchlist_id: int | None = None) -> list[dict]:
         """Get alert matches that haven't been notified yet.
@@ -780,10 +2569,10 @@ class AsyncStore:
         async with self.connection() as conn:
             query = """
                 SELECT am.*, w.name as watchlist_name, w.notification_email, w.notification_webhook,
-                       i.signal_summary, i.pain_point, p.subreddit, p.url
+                       s.signal_summary, s.pain_point, p.subreddit, p.url
                 FROM alert_matches am
                 JOIN watchlists w ON am.watchlist_id = w.id
-                JOIN signals s ON am.signal_id = i.id
+                JOIN signals s ON am.signal_id = s.id
                 JOIN posts p ON s.post_id = p.id
                 WHERE am.notified = 0
             """
@@ -802,6 +2591,9 @@ class AsyncStore:
     async def mark_matches_notified(self, match_ids: list[int]) -> None:
         """Mark alert matches as notified.
 
+        The IDs are passed as one JSON array, so any number of matches is
+        marked in a single statement without hitting SQLite's variable limit.
+
         Args:
             match_ids: List of match IDs to mark
         """
@@ -810,12 +2602,96 @@ class AsyncStore:
 
         async with self.connection() as conn:
             now = datetime.now(UTC).isoformat()
-            placeholders = ",".join("?" * len(match_ids))
             await conn.execute(
-                f"UPDATE alert_matches SET notified = 1, notified_at = ? WHERE id IN ({placeholders})",
-                [now] + match_ids,
+                """
+                UPDATE alert_matches SET notified = 1, notified_at = ?
+                WHERE id IN (SELECT value FROM json_each(?))
+                """,
+                (now, json.dumps(match_ids)),
+            )
+            await conn.commit()
+
+    # --- Subreddit State Methods ---
+
+    async def get_high_water_marks(self, listing: str) -> dict[str, tuple[int, str]]:
+        """Get the newest post seen in each subreddit's listing.
+
+        Args:
+            listing: Listing type (e.g. "new")
+
+        Returns:
+            Lowercased subreddit name to (created_utc, post ID)
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                "SELECT subreddit, last_created_utc, last_post_id FROM subreddit_state WHERE listing = ?",
+                (listing,),
+            )
+            rows = await cursor.fetchall()
+        return {row["subreddit"]: (row["last_created_utc"], row["last_post_id"]) for row in rows}
+
+    async def update_high_water_marks(self, listing: str, marks: dict[str, tuple[int, str]]) -> None:
+        """Advance subreddits' high-water marks; a mark never moves back.
+
+        Args:
+            listing: Listing type the posts came from
+            marks: Lowercased subreddit name to (created_utc, post ID) of its newest post
+        """
+        if not marks:
+            return
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO subreddit_state (subreddit, listing, last_created_utc, last_post_id, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (subreddit, listing) DO UPDATE SET
+                    last_created_utc = excluded.last_created_utc,
+                    last_post_id = excluded.last_post_id,
+                    updated_at = excluded.updated_at
+                WHERE excluded.last_created_utc >= subreddit_state.last_created_utc
+                """,
+                [(sub, listing, created_utc, post_id, now) for sub, (created_utc, post_id) in marks.items()],
             )
             await conn.commit()
+        logger.debug("high_water_marks_updated", listing=listing, subreddits=len(marks))
+
+    async def get_post_velocity(self, since_utc: int) -> dict[str, dict]:
+        """Summarize each subreddit's posts created since a time, for poll scheduling.
+
+        Args:
+            since_utc: Start of the window (unix timestamp)
+
+        Returns:
+            Lowercased subreddit name to {"posts", "oldest_utc", "newest_utc"}
+        """
+        async with self.connection() as conn:
+            cursor = await conn.execute(
+                """
+                SELECT subreddit, COUNT(*) AS posts, MIN(created_utc) AS oldest_utc, MAX(created_utc) AS newest_utc
+                FROM posts
+                WHERE created_utc >= ?
+                GROUP BY subreddit
+                """,
+                (since_utc,),
+            )
+            rows = await cursor.fetchall()
+        velocity: dict[str, dict] = {}
+        for row in rows:
+            sub = row["subreddit"].lower()
+            if sub in velocity:
+                # Same subreddit stored under another capitalization
+                v = velocity[sub]
+                v["posts"] += row["posts"]
+                v["oldest_utc"] = min(v["oldest_utc"], row["oldest_utc"])
+                v["newest_utc"] = max(v["newest_utc"], row["newest_utc"])
+            else:
+                velocity[sub] = {
+                    "posts": row["posts"],
+                    "oldest_utc": row["oldest_utc"],
+                    "newest_utc": row["newest_utc"],
+                }
+        return velocity
 
     # --- Source Sets Methods ---
 
@@ -827,6 +2703,7 @@ class AsyncStore:
         preset_key: str | None = None,
         listing: str = "new",
         limit_per_sub: int = 25,
+        fetcher: str = "rss",
     ) -> int:
         """Create a new source set.
 
@@ -837,6 +2714,7 @@ class AsyncStore:
             preset_key: If created from a preset, the preset key
             listing: Reddit listing type (new, hot, top)
             limit_per_sub: Posts to fetch per subreddit
+            fetcher: How posts are fetched ("rss" or "json", see reddit_async.FETCHERS)
 
         Returns:
             Source set ID
@@ -846,8 +2724,8 @@ class AsyncStore:
             cursor = await conn.execute(
                 """
                 INSERT INTO source_sets
-                (name, description, preset_key, subreddits, listing, limit_per_sub, is_active, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                (name, description, preset_key, subreddits, listing, limit_per_sub, fetcher, is_active, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
                 """,
                 (
                     name,
@@ -856,6 +2734,7 @@ class AsyncStore:
                     json.dumps(subreddits),
                     listing,
                     limit_per_sub,
+                    fetcher,
                     now,
                 ),
             )
@@ -937,6 +2816,7 @@ class AsyncStore:
         description: str | None = None,
         listing: str | None = None,
         limit_per_sub: int | None = None,
+        fetcher: str | None = None,
     ) -> bool:
         """Update a source set.
 
@@ -947,6 +2827,7 @@ class AsyncStore:
             description: New description (if updating)
             listing: New listing type (if updating)
             limit_per_sub: New limit (if updating)
+            fetcher: New fetcher (if updating)
 
         Returns:
             True if updated
@@ -969,6 +2850,9 @@ class AsyncStore:
         if limit_per_sub is not None:
             updates.append("limit_per_sub = ?")
             params.append(limit_per_sub)
+        if fetcher is not None:
+            updates.append("fetcher = ?")
+            params.append(fetcher)
 
         if not updates:
             return False
@@ -1009,3 +2893,19 @@ class AsyncStore:
         for ss in source_sets:
             all_subs.update(ss["subreddits"])
         return sorted(list(all_subs))
+
+    async def get_active_subreddit_fetchers(self) -> dict[str, str]:
+        """Get the fetcher for each subreddit of the active source sets.
+
+        A subreddit in several sets uses the JSON listing if any of them asks
+        for it, since it returns everything RSS does and more.
+
+        Returns:
+            Subreddit name to fetcher ("rss" or "json")
+        """
+        fetchers: dict[str, str] = {}
+        for ss in await self.get_source_sets(active_only=True):
+            for sub in ss["subreddits"]:
+                if fetchers.get(sub) != "json":
+                    fetchers[sub] = ss.get("fetcher") or "rss"
+        return dict(sorted(fetchers.items()))
@@ -0,0 +1,1912 @@
+"""Postgres implementation of the AsyncStore interface.
+
+Used instead of the SQLite store when ``database_url`` is set. Queries run on
+an asyncpg connection pool, so concurrent API requests and pipeline tasks each
+borrow their own connection, and posts are bulk loaded with ``COPY`` into a
+staging table and merged with a single ``INSERT ... ON CONFLICT``.
+
+Implements the same methods as AsyncStore. Where SQLite needs machinery of
+its own, the Postgres equivalent is used instead: search runs on tsvectors
+(see schema_postgres.SEARCH_SCHEMA), large values are compressed by Postgres
+itself, and watchlists are matched by check_watchlists only, not as signals
+are saved.
+
+asyncpg is an optional dependency: ``pip install 'pain-radar[postgres]'``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from datetime import UTC, date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ..logging_config import get_logger
+from ..matching import SemanticMatcher
+from ..models import Cluster, ClusterItem, EvidenceSignal
+from ..query import DEFAULT_FIELDS, And, Node, Not, QuerySyntaxError, Term, compile_query
+from ..reddit_async import RedditPost
+from ..vectors import centroid, from_blob, to_blob
+from .compression import COMPRESSED_COLUMNS, TRAIN_SAMPLES
+from .core import (
+    AsyncStore,
+    cluster_id_for,
+    decode_cursor,
+    encode_cursor,
+    evidence_rows,
+    match_watchlists,
+    signal_select_list,
+    signal_values,
+)
+from .schema_postgres import (
+    COMMENTS_JSON,
+    IMPORT_COMMENTS_TABLE,
+    POSTGRES_SCHEMA,
+    SEARCH_BACKFILL,
+    SEARCH_SCHEMA,
+    STATS_AGGREGATE,
+)
+
+if TYPE_CHECKING:
+    import asyncpg
+
+logger = get_logger(__name__)
+
+# Post columns that signal listings can project (see core._POST_FIELDS)
+_POST_FIELDS = {
+    "post_title": "p.title",
+    "subreddit": "p.subreddit",
+    "permalink": "p.permalink",
+    "post_body": "p.body",
+    "top_comments": COMMENTS_JSON.format(post="p"),
+}
+
+_POST_COLUMNS = (
+    "id",
+    "subreddit",
+    "title",
+    "body",
+    "created_utc",
+    "score",
+    "num_comments",
+    "url",
+    "permalink",
+    "fetched_at",
+)
+
+# Month of a post's created_utc as "YYYY-MM", for archive partitions
+_MONTH = "to_char(to_timestamp({post}.created_utc) AT TIME ZONE 'UTC', 'YYYY-MM')"
+
+# Text search configuration created by SEARCH_SCHEMA
+_TS_CONFIG = "pain_radar"
+
+# ts_rank weights of the D, C, B and A labels in signals_search.document,
+# in the ratios of the SQLite search's BM25 column weights
+_RANK_WEIGHTS = "{0.125, 0.25, 0.5, 1.0}"
+
+# Snippets like the SQLite search's: matches in brackets, about 12 words
+_HEADLINE_OPTIONS = 'StartSel="[", StopSel="]", MaxWords=12, MinWords=4, ShortWord=0, MaxFragments=1'
+
+_NEGATIVE_ONLY = "NOT needs a positive term to apply to in search queries"
+
+
+def _row_count(status: str) -> int:
+    """Rows affected, from a command status like "DELETE 3" or "INSERT 0 3"."""
+    return int(status.rsplit(" ", 1)[-1])
+
+
+def _tsquery(term: Term) -> str:
+    """A term as to_tsquery input: its words in sequence, the last a prefix if starred."""
+    words = list(term.words)
+    if term.prefix:
+        words[-1] += ":*"
+    return " <-> ".join(words)
+
+
+def _search_prefilter(node: Node) -> str:
+    """tsquery over a signal's whole search document that every match of a query satisfies.
+
+    Field scopes and negations are left to _search_condition; this is what
+    the GIN index can answer, and what results are ranked by.
+
+    Raises:
+        QuerySyntaxError: If the query has no positive term to search for
+            (like query.And.to_fts)
+    """
+    if isinstance(node, Term):
+        return f"({_tsquery(node)})"
+    if isinstance(node, Not):
+        raise QuerySyntaxError(_NEGATIVE_ONLY)
+    if isinstance(node, And):
+        positive = [child for child in node.children if not isinstance(child, Not)]
+        if not positive:
+            raise QuerySyntaxError(_NEGATIVE_ONLY)
+        return "(" + " & ".join(_search_prefilter(child) for child in positive) + ")"
+    return "(" + " | ".join(_search_prefilter(child) for child in node.children) + ")"
+
+
+def _search_condition(node: Node, params: list[Any]) -> str:
+    """SQL condition on signals_search (alias ss) that matches a query, appending its tsqueries to params."""
+    if isinstance(node, Term):
+        params.append(_tsquery(node))
+        columns = (node.field,) if node.field else DEFAULT_FIELDS
+        matches = (f"ss.{column} @@ to_tsquery('{_TS_CONFIG}', ${len(params)})" for column in columns)
+        return "(" + " OR ".join(matches) + ")"
+    if isinstance(node, Not):
+        return f"NOT {_search_condition(node.child, params)}"
+    joiner = " AND " if isinstance(node, And) else " OR "
+    return "(" + joiner.join(_search_condition(child, params) for child in node.children) + ")"
+
+
+def _import_asyncpg():
+    try:
+        import asyncpg
+    except ImportError as e:
+        raise ImportError("PostgresStore requires asyncpg: pip install 'pain-radar[postgres]'") from e
+    return asyncpg
+
+
+class PostgresStore:
+    """Async Postgres storage for posts and signals."""
+
+    def __init__(self, database_url: str, min_pool_size: int = 1, max_pool_size: int = 10):
+        """Initialize the store.
+
+        Args:
+            database_url: Postgres connection URL
+            min_pool_size: Connections the pool keeps open
+            max_pool_size: Maximum concurrent connections
+        """
+        self.database_url = database_url
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self._pool: asyncpg.Pool | None = None
+        self._signal_columns: frozenset[str] | None = None
+
+    async def connect(self) -> None:
+        """Open the connection pool."""
+        asyncpg = _import_asyncpg()
+        self._pool = await asyncpg.create_pool(
+            self.database_url, min_size=self.min_pool_size, max_size=self.max_pool_size
+        )
+        logger.info("database_connected", backend="postgres", max_pool_size=self.max_pool_size)
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._pool:
+            await self._pool.close()
+            self._pool = None
+            logger.info("database_closed")
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[asyncpg.Connection]:
+        """Context manager borrowing a connection from the pool."""
+        if not self._pool:
+            await self.connect()
+        async with self._pool.acquire() as conn:
+            yield conn
+
+    async def init_db(self) -> None:
+        """Initialize database schema."""
+        async with self.connection() as conn:
+            await conn.execute(POSTGRES_SCHEMA)
+            await conn.execute(SEARCH_SCHEMA)
+            indexed = await conn.fetchval(SEARCH_BACKFILL)
+        if indexed:
+            logger.info("search_index_backfilled", signals=indexed)
+
+    # --- Post Methods ---
+
+    async def upsert_posts(self, posts: list[RedditPost]) -> int:
+        """Insert or update posts and replace their comments.
+
+        Rows are copied into a temporary staging table and merged in one
+        statement, so a batch costs a few round trips however large it is.
+
+        Args:
+            posts: List of RedditPost objects
+
+        Returns:
+            Number of posts upserted
+        """
+        # The merge can't touch a row twice; the last copy of a post wins
+        latest = {post.id: post for post in posts}
+        if not latest:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        updates = ", ".join(f"{c} = EXCLUDED.{c}" for c in _POST_COLUMNS if c != "id")
+        async with self.connection() as conn, conn.transaction():
+            await conn.execute("CREATE TEMP TABLE posts_staging (LIKE posts INCLUDING DEFAULTS) ON COMMIT DROP")
+            await conn.copy_records_to_table(
+                "posts_staging",
+                records=[
+                    (
+                        p.id,
+                        p.subreddit,
+                        p.title,
+                        p.body,
+                        p.created_utc,
+                        p.score,
+                        p.num_comments,
+                        p.url,
+                        p.permalink,
+                        now,
+                    )
+                    for p in latest.values()
+                ],
+                columns=_POST_COLUMNS,
+            )
+            await conn.execute(
+                f"""
+                INSERT INTO posts ({", ".join(_POST_COLUMNS)})
+                SELECT {", ".join(_POST_COLUMNS)} FROM posts_staging
+                ON CONFLICT (id) DO UPDATE SET {updates}
+                """
+            )
+            # A refetch replaces the post's comments
+            await conn.execute("DELETE FROM comments WHERE post_id IN (SELECT id FROM posts_staging)")
+            await conn.copy_records_to_table(
+                "comments",
+                records=[
+                    (p.id, position, body) for p in latest.values() for position, body in enumerate(p.top_comments)
+                ],
+                columns=("post_id", "position", "body"),
+            )
+        logger.info("posts_upserted", count=len(latest))
+        return len(latest)
+
+    async def get_unprocessed_posts(self, limit: int = 100) -> list[RedditPost]:
+        """Get posts that haven't been processed yet.
+
+        Args:
+            limit: Maximum number of posts to return
+
+        Returns:
+            List of unprocessed RedditPost objects
+        """
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT * FROM posts WHERE processed = 0 ORDER BY score DESC LIMIT $1",
+                limit,
+            )
+            comments: dict[str, list[str]] = {}
+            for comment in await conn.fetch(
+                "SELECT post_id, body FROM comments WHERE post_id = ANY($1::text[]) ORDER BY post_id, position",
+                [row["id"] for row in rows],
+            ):
+                comments.setdefault(comment["post_id"], []).append(comment["body"])
+
+        return [
+            RedditPost(
+                id=row["id"],
+                subreddit=row["subreddit"],
+                title=row["title"],
+                body=row["body"] or "",
+                created_utc=row["created_utc"],
+                score=row["score"],
+                num_comments=row["num_comments"],
+                url=row["url"] or "",
+                permalink=row["permalink"] or "",
+                top_comments=comments.get(row["id"], []),
+            )
+            for row in rows
+        ]
+
+    async def mark_post_processed(self, post_id: str) -> None:
+        """Mark a post as processed.
+
+        Args:
+            post_id: Reddit post ID
+        """
+        async with self.connection() as conn:
+            await conn.execute("UPDATE posts SET processed = 1 WHERE id = $1", post_id)
+
+    # --- Signal Methods ---
+
+    async def save_signal(
+        self,
+        post: RedditPost,
+        extraction: Any,
+        score: Any | None = None,
+        cluster_id: str | None = None,
+        run_id: int | None = None,
+    ) -> int:
+        """Save an extracted and scored signal and mark its post processed.
+
+        Args:
+            post: Source Reddit post
+            extraction: PainSignal Pydantic model
+            score: SignalScore Pydantic model (None if not_extractable)
+            cluster_id: Optional cluster identifier
+            run_id: Optional run ID to associate with this signal
+
+        Returns:
+            ID of the inserted signal
+        """
+        values = signal_values(
+            post, extraction, score, cluster_id=cluster_id, run_id=run_id, created_at=datetime.now(UTC).isoformat()
+        )
+        placeholders = ", ".join(f"${n}" for n in range(1, len(values) + 1))
+        async with self.connection() as conn, conn.transaction():
+            signal_id = await conn.fetchval(
+                f"INSERT INTO signals ({', '.join(values)}) VALUES ({placeholders}) RETURNING id",
+                *values.values(),
+            )
+            await conn.executemany(
+                """
+                INSERT INTO evidence (signal_id, position, quote, source, comment_index, signal_type)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                """,
+                [(signal_id, *row) for row in evidence_rows(extraction)],
+            )
+            await conn.execute("UPDATE posts SET processed = 1 WHERE id = $1", post.id)
+
+        logger.info(
+            "signal_saved",
+            signal_id=signal_id,
+            post_id=post.id,
+            extraction_state=values["extraction_state"],
+            total_score=values["total_score"],
+            evidence_strength=extraction.evidence_strength,
+            disqualified=bool(values["disqualified"]),
+        )
+        return signal_id
+
+    async def get_top_signals(
+        self,
+        limit: int = 20,
+        include_disqualified: bool = False,
+        fields: Sequence[str] | None = None,
+        after: str | None = None,
+    ) -> list[dict]:
+        """Get top-scored signals (see AsyncStore.get_top_signals)."""
+        signals, _ = await self.get_signals_page(
+            limit=limit, include_disqualified=include_disqualified, fields=fields, after=after
+        )
+        return signals
+
+    async def get_signals_page(
+        self,
+        limit: int = 20,
+        after: str | None = None,
+        fields: Sequence[str] | None = None,
+        include_disqualified: bool = False,
+        run_id: int | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Get one page of signals in score order (see AsyncStore.get_signals_page).
+
+        Raises:
+            ValueError: If the cursor or a field name is invalid
+        """
+        async with self.connection() as conn:
+            columns = await self._signal_select_list(conn, fields)
+            conditions: list[str] = []
+            params: list[Any] = []
+            if run_id is not None:
+                params.append(run_id)
+                conditions.append(f"i.run_id = ${len(params)}")
+            if not include_disqualified:
+                conditions.append("i.disqualified = 0")
+            if after:
+                score, last_id = decode_cursor(after)
+                params.extend([score, last_id])
+                n = len(params)
+                conditions.append(f"i.total_score <= ${n - 1} AND (i.total_score < ${n - 1} OR i.id > ${n})")
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params.append(limit + 1)
+            rows = await conn.fetch(
+                f"""
+                SELECT {columns}, i.total_score AS _rank_score, i.id AS _rank_id
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                {where}
+                ORDER BY i.total_score DESC, i.id
+                LIMIT ${len(params)}
+                """,
+                *params,
+            )
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1]["_rank_score"], rows[-1]["_rank_id"])
+
+        signals = []
+        for row in rows:
+            signal = dict(row)
+            del signal["_rank_score"], signal["_rank_id"]
+            signals.append(signal)
+        return signals, next_cursor
+
+    async def _signal_select_list(self, conn: asyncpg.Connection, fields: Sequence[str] | None) -> str:
+        if fields is not None and self._signal_columns is None:
+            rows = await conn.fetch(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = 'signals' "
+                "AND table_schema = current_schema()"
+            )
+            self._signal_columns = frozenset(row["column_name"] for row in rows)
+        return signal_select_list(fields, self._signal_columns or frozenset(), _POST_FIELDS)
+
+    async def get_signal_column_types(self) -> dict[str, str]:
+        """Get the declared SQL type of each signals column (see AsyncStore.get_signal_column_types)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = 'signals' "
+                "AND table_schema = current_schema()"
+            )
+        return {row["column_name"]: row["data_type"] for row in rows}
+
+    async def iter_signals(
+        self,
+        fields: Sequence[str] | None = None,
+        include_disqualified: bool = False,
+        run_id: int | None = None,
+        limit: int | None = None,
+        with_post_text: bool = False,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[list[dict]]:
+        """Stream signals in score order, a chunk of rows at a time (see AsyncStore.iter_signals).
+
+        Rows are read through a server-side cursor, which asyncpg only allows
+        inside a transaction, so one pooled connection is held until the
+        iteration ends.
+
+        Raises:
+            ValueError: If a field name is invalid
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if run_id is not None:
+            params.append(run_id)
+            conditions.append(f"i.run_id = ${len(params)}")
+        if not include_disqualified:
+            conditions.append("i.disqualified = 0")
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
+        async with self.connection() as conn, conn.transaction():
+            columns = await self._signal_select_list(conn, fields)
+            if fields is None and with_post_text:
+                columns += f", p.body as post_body, {_POST_FIELDS['top_comments']} AS top_comments"
+            cursor = await conn.cursor(
+                f"""
+                SELECT {columns}
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                {where}
+                ORDER BY i.total_score DESC, i.id
+                LIMIT ${len(params)}
+                """,
+                *params,
+            )
+            while rows := await cursor.fetch(chunk_size):
+                yield [dict(row) for row in rows]
+
+    async def get_signals_for_run(self, run_id: int, fields: Sequence[str] | None = None) -> list[dict]:
+        """Get all signals from a specific run (see AsyncStore.get_signals_for_run)."""
+        async with self.connection() as conn:
+            columns = await self._signal_select_list(conn, fields)
+            if fields is None:
+                columns += f", p.body as post_body, {_POST_FIELDS['top_comments']} AS top_comments"
+            rows = await conn.fetch(
+                f"""
+                SELECT {columns}
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE i.run_id = $1
+                ORDER BY i.total_score DESC, i.id
+                """,
+                run_id,
+            )
+        return [dict(row) for row in rows]
+
+    async def get_signal_detail(self, signal_id: int) -> dict | None:
+        """Get detailed information about a specific signal.
+
+        Args:
+            signal_id: Signal ID
+
+        Returns:
+            Detailed signal dictionary or None
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow(
+                f"""
+                SELECT i.*, p.title as post_title, p.subreddit, p.permalink,
+                       p.body as post_body, {_POST_FIELDS["top_comments"]} AS top_comments, p.url as post_url
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE i.id = $1
+                """,
+                signal_id,
+            )
+        return dict(row) if row else None
+
+    async def search_signals(
+        self,
+        query: str,
+        subreddit: str | None = None,
+        min_score: int | None = None,
+        include_disqualified: bool = False,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Full-text search over signals and their post titles, best match first (see AsyncStore.search_signals).
+
+        Matching is stemmed and case insensitive, over the signals_search
+        tsvectors (see schema_postgres.SEARCH_SCHEMA). Results are ranked with
+        ts_rank, weighting the fields like the SQLite search; rank is negated
+        so that lower is better there too.
+
+        Raises:
+            QuerySyntaxError: If the query is malformed or only negative
+        """
+        if not query.strip():
+            return []
+        node = compile_query(query)
+        params: list[Any] = [_search_prefilter(node)]
+        conditions = [f"ss.document @@ to_tsquery('{_TS_CONFIG}', $1)", _search_condition(node, params)]
+        if subreddit:
+            params.append(subreddit)
+            conditions.append(f"p.subreddit = ${len(params)}")
+        if min_score is not None:
+            params.append(min_score)
+            conditions.append(f"i.total_score >= ${len(params)}")
+        if not include_disqualified:
+            conditions.append("i.disqualified = 0")
+        params.append(limit)
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                WITH hits AS (
+                    SELECT ss.signal_id,
+                           -ts_rank('{_RANK_WEIGHTS}', ss.document, to_tsquery('{_TS_CONFIG}', $1)) AS rank
+                    FROM signals_search ss
+                    JOIN signals i ON i.id = ss.signal_id
+                    JOIN posts p ON i.post_id = p.id
+                    WHERE {" AND ".join(conditions)}
+                    ORDER BY rank, ss.signal_id
+                    LIMIT ${len(params)}
+                )
+                SELECT i.id, i.signal_summary, i.pain_point, i.target_user, i.total_score,
+                       i.disqualified, i.created_at, p.title as post_title, p.subreddit, p.permalink,
+                       h.rank,
+                       ts_headline(
+                           '{_TS_CONFIG}',
+                           concat_ws(' ', i.signal_summary, i.pain_point, i.target_user,
+                                     pain_radar_evidence_text(i.evidence), p.title),
+                           to_tsquery('{_TS_CONFIG}', $1),
+                           '{_HEADLINE_OPTIONS}'
+                       ) AS snippet
+                FROM hits h
+                JOIN signals i ON i.id = h.signal_id
+                JOIN posts p ON i.post_id = p.id
+                ORDER BY h.rank, i.id
+                """,
+                *params,
+            )
+        return [dict(row) for row in rows]
+
+    async def get_unclustered_pain_points(self, subreddit: str | None = None, days: int = 7) -> list[ClusterItem]:
+        """Get extraction items available for clustering.
+
+        Args:
+            subreddit: Filter by subreddit
+            days: Look back days
+
+        Returns:
+            List of ClusterItems
+        """
+        query = """
+            SELECT i.id, i.signal_summary, i.pain_point, p.subreddit, p.url,
+                   e.quote, e.source, e.comment_index, e.signal_type
+            FROM signals i
+            JOIN posts p ON i.post_id = p.id
+            LEFT JOIN evidence e ON e.signal_id = i.id
+            WHERE i.cluster_id IS NULL
+            AND i.disqualified = 0
+            AND i.created_at > $1
+        """
+        params: list[Any] = [(datetime.now(UTC) - timedelta(days=days)).isoformat()]
+        if subreddit:
+            params.append(subreddit)
+            query += " AND p.subreddit = $2"
+        query += " ORDER BY i.id, e.position"
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(query, *params)
+
+        items: dict[int, ClusterItem] = {}
+        for row in rows:
+            item = items.get(row["id"])
+            if item is None:
+                item = items[row["id"]] = ClusterItem(
+                    id=row["id"],
+                    summary=row["signal_summary"],
+                    pain_point=row["pain_point"],
+                    subreddit=row["subreddit"],
+                    url=row["url"],
+                    evidence=[],
+                )
+            if row["quote"] is not None:
+                item.evidence.append(
+                    EvidenceSignal.model_construct(
+                        quote=row["quote"],
+                        source=row["source"],
+                        comment_index=row["comment_index"],
+                        signal_type=row["signal_type"],
+                    )
+                )
+        return list(items.values())
+
+    async def get_evidence(
+        self,
+        signal_type: str | None = None,
+        days: int | None = None,
+        subreddit: str | None = None,
+        limit: int = 100,
+    ) -> list[dict]:
+        """Get evidence quotes of qualified signals, newest first (see AsyncStore.get_evidence)."""
+        conditions = ["i.disqualified = 0"]
+        params: list[Any] = []
+        if signal_type:
+            params.append(signal_type)
+            conditions.append(f"e.signal_type = ${len(params)}")
+        if days is not None:
+            params.append((datetime.now(UTC) - timedelta(days=days)).isoformat())
+            conditions.append(f"i.created_at > ${len(params)}")
+        if subreddit:
+            params.append(subreddit)
+            conditions.append(f"p.subreddit = ${len(params)}")
+        params.append(limit)
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT e.quote, e.signal_type, e.source, e.comment_index, e.signal_id,
+                       i.signal_summary, i.total_score, i.created_at, p.subreddit, p.permalink
+                FROM evidence e
+                JOIN signals i ON i.id = e.signal_id
+                JOIN posts p ON p.id = i.post_id
+                WHERE {" AND ".join(conditions)}
+                ORDER BY e.signal_id DESC, e.position
+                LIMIT ${len(params)}
+                """,
+                *params,
+            )
+        return [dict(row) for row in rows]
+
+    async def get_stats(self) -> dict:
+        """Get database statistics.
+
+        Returns:
+            Dictionary of statistics
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow(STATS_AGGREGATE)
+        return AsyncStore._stats_from_counts(tuple(row))
+
+    async def recompute_stats(self) -> dict:
+        """Get database statistics; Postgres counts on every call, so there is nothing to reset."""
+        return await self.get_stats()
+
+    # --- Storage / Compression Methods ---
+
+    async def compress_blobs(
+        self, retrain: bool = False, sample_size: int = TRAIN_SAMPLES, batch_size: int = 500
+    ) -> dict[str, dict]:
+        """Report how much the large JSON columns are compressed.
+
+        Postgres compresses large values itself when it stores them out of
+        line (TOAST), so unlike AsyncStore.compress_blobs nothing is trained or
+        rewritten; the arguments are accepted for the same call signature.
+
+        Returns:
+            "table.column" -> {"rows": values compressed, "before": bytes, "after": bytes}
+        """
+        report: dict[str, dict] = {}
+        async with self.connection() as conn:
+            for table, columns in COMPRESSED_COLUMNS.items():
+                for column in columns:
+                    row = await conn.fetchrow(
+                        f"""
+                        SELECT COUNT(*), COALESCE(SUM(octet_length({column})), 0)::bigint,
+                               COALESCE(SUM(pg_column_size({column})), 0)::bigint
+                        FROM {table}
+                        WHERE pg_column_size({column}) < octet_length({column})
+                        """
+                    )
+                    report[f"{table}.{column}"] = {"rows": row[0], "before": row[1], "after": row[2]}
+
+        logger.info("blobs_compressed", rows=sum(s["rows"] for s in report.values()))
+        return report
+
+    async def vacuum(self) -> None:
+        """Vacuum and analyze the database, making space freed by deletes reusable.
+
+        A plain VACUUM rather than VACUUM FULL, which would lock every table
+        while it rewrites them.
+        """
+        async with self.connection() as conn:
+            await conn.execute("VACUUM (ANALYZE)")
+
+    async def incremental_vacuum(self) -> None:
+        """Vacuum the tables archiving deletes from (see AsyncStore.incremental_vacuum)."""
+        async with self.connection() as conn:
+            await conn.execute("VACUUM posts, comments, signals, evidence, signals_search, signal_embeddings")
+
+    async def get_storage_report(self) -> dict:
+        """Report database size, per-table size and compressed column sizes (see AsyncStore.get_storage_report).
+
+        free_bytes is always 0: Postgres reuses space freed by deletes within
+        each table rather than keeping a free list for the whole database.
+        """
+        async with self.connection() as conn:
+            file_bytes = await conn.fetchval("SELECT pg_database_size(current_database())")
+            rows = await conn.fetch(
+                """
+                SELECT c.relname, pg_total_relation_size(c.oid) AS size
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname = current_schema() AND c.relkind = 'r'
+                ORDER BY size DESC
+                """
+            )
+            tables = {row["relname"]: row["size"] for row in rows}
+
+            columns = []
+            for table, names in COMPRESSED_COLUMNS.items():
+                for column in names:
+                    rows, compressed, size = await conn.fetchrow(
+                        f"""
+                        SELECT COUNT({column}),
+                               COUNT(*) FILTER (WHERE pg_column_size({column}) < octet_length({column})),
+                               COALESCE(SUM(pg_column_size({column})), 0)::bigint
+                        FROM {table}
+                        """
+                    )
+                    columns.append(
+                        {"table": table, "column": column, "rows": rows, "compressed": compressed, "bytes": size}
+                    )
+
+        return {"file_bytes": file_bytes, "free_bytes": 0, "tables": tables, "columns": columns}
+
+    # --- Archive Methods ---
+
+    async def get_archive_partitions(self, before_utc: int) -> list[dict]:
+        """Group posts created before a cutoff by month and subreddit (see AsyncStore.get_archive_partitions)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                f"""
+                SELECT {_MONTH.format(post="posts")} AS month, subreddit, COUNT(*) AS posts
+                FROM posts
+                WHERE created_utc < $1
+                GROUP BY month, subreddit
+                ORDER BY month, subreddit
+                """,
+                before_utc,
+            )
+        return [dict(row) for row in rows]
+
+    async def get_archive_rows(self, month: str, subreddit: str, before_utc: int) -> tuple[list[dict], list[dict]]:
+        """Get one archive partition's posts and their signals (see AsyncStore.get_archive_rows)."""
+        condition = f"p.subreddit = $1 AND p.created_utc < $2 AND {_MONTH.format(post='p')} = $3"
+        async with self.connection() as conn:
+            posts = await conn.fetch(
+                f"""
+                SELECT p.id, p.subreddit, p.title, p.body, p.created_utc, p.score, p.num_comments,
+                       p.url, p.permalink, {_POST_FIELDS["top_comments"]} AS top_comments,
+                       p.fetched_at, p.processed
+                FROM posts p
+                WHERE {condition}
+                ORDER BY p.created_utc
+                """,
+                subreddit,
+                before_utc,
+                month,
+            )
+            signals = await conn.fetch(
+                f"""
+                SELECT i.*, p.subreddit, p.title AS post_title, p.created_utc AS post_created_utc
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                WHERE {condition}
+                ORDER BY i.id
+                """,
+                subreddit,
+                before_utc,
+                month,
+            )
+        return [dict(row) for row in posts], [dict(row) for row in signals]
+
+    async def delete_posts(self, post_ids: list[str]) -> dict:
+        """Delete posts with their signals and everything attached to them.
+
+        Comments, evidence, search rows, embeddings and watchlist matches
+        follow through ON DELETE CASCADE. The version of every embedding model
+        that loses vectors is bumped, so cached vector indexes (see
+        embeddings.load_index) are rebuilt.
+
+        Args:
+            post_ids: Reddit post IDs
+
+        Returns:
+            Dict with the posts and signals deleted
+        """
+        async with self.connection() as conn, conn.transaction():
+            await conn.execute(
+                """
+                UPDATE embedding_models SET version = version + 1, updated_at = $1
+                WHERE model IN (
+                    SELECT DISTINCT e.model FROM signal_embeddings e
+                    JOIN signals s ON s.id = e.signal_id
+                    WHERE s.post_id = ANY($2::text[])
+                )
+                """,
+                datetime.now(UTC).isoformat(),
+                post_ids,
+            )
+            signals = _row_count(await conn.execute("DELETE FROM signals WHERE post_id = ANY($1::text[])", post_ids))
+            posts = _row_count(await conn.execute("DELETE FROM posts WHERE id = ANY($1::text[])", post_ids))
+        logger.info("posts_deleted", posts=posts, signals=signals)
+        return {"posts": posts, "signals": signals}
+
+    # --- Bulk Import Methods ---
+
+    async def import_posts(self, posts: Sequence[RedditPost]) -> int:
+        """Insert a batch of posts from an offline dump, leaving stored posts untouched.
+
+        Rows are copied into a staging table like upsert_posts, but merged with
+        ON CONFLICT DO NOTHING (see AsyncStore.import_posts).
+
+        Args:
+            posts: Posts to insert
+
+        Returns:
+            Number of new posts inserted
+        """
+        if not posts:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn, conn.transaction():
+            await conn.execute("CREATE TEMP TABLE posts_staging (LIKE posts INCLUDING DEFAULTS) ON COMMIT DROP")
+            await conn.copy_records_to_table(
+                "posts_staging",
+                records=[
+                    (
+                        p.id,
+                        p.subreddit,
+                        p.title,
+                        p.body,
+                        p.created_utc,
+                        p.score,
+                        p.num_comments,
+                        p.url,
+                        p.permalink,
+                        now,
+                    )
+                    for p in posts
+                ],
+                columns=_POST_COLUMNS,
+            )
+            status = await conn.execute(
+                f"""
+                INSERT INTO posts ({", ".join(_POST_COLUMNS)})
+                SELECT {", ".join(_POST_COLUMNS)} FROM posts_staging
+                ON CONFLICT (id) DO NOTHING
+                """
+            )
+        return _row_count(status)
+
+    async def stage_import_comments(self, comments: Sequence[tuple[str, int, str]]) -> None:
+        """Stage top-level comments from a dump until their posts are imported.
+
+        Comments are copied into the import_comments table, which lives until
+        attach_import_comments drops it (see schema_postgres.IMPORT_COMMENTS_TABLE).
+
+        Args:
+            comments: (post_id, score, body) tuples
+        """
+        async with self.connection() as conn:
+            await conn.execute(IMPORT_COMMENTS_TABLE)
+            await conn.copy_records_to_table("import_comments", records=comments, columns=("post_id", "score", "body"))
+
+    async def attach_import_comments(self, per_post: int) -> int:
+        """Join staged comments to their posts and drop the staging table (see AsyncStore.attach_import_comments)."""
+        async with self.connection() as conn, conn.transaction():
+            await conn.execute(IMPORT_COMMENTS_TABLE)
+            status = await conn.execute(
+                """
+                INSERT INTO comments (post_id, position, body)
+                SELECT post_id, rank - 1, body FROM (
+                    SELECT s.post_id, s.body,
+                           ROW_NUMBER() OVER (PARTITION BY s.post_id ORDER BY s.score DESC NULLS LAST, s.seq) AS rank
+                    FROM import_comments s
+                    WHERE s.post_id IN (SELECT id FROM posts)
+                      AND s.post_id NOT IN (SELECT post_id FROM comments)
+                ) ranked
+                WHERE rank <= $1
+                """,
+                per_post,
+            )
+            await conn.execute("DROP TABLE import_comments")
+        return _row_count(status)
+
+    # --- Run Management ---
+
+    async def create_run(self, subreddits: list[str]) -> int:
+        """Create a new pipeline run record.
+
+        Args:
+            subreddits: List of subreddits being processed
+
+        Returns:
+            Run ID
+        """
+        async with self.connection() as conn:
+            return await conn.fetchval(
+                "INSERT INTO runs (started_at, subreddits, status) VALUES ($1, $2, 'running') RETURNING id",
+                datetime.now(UTC).isoformat(),
+                json.dumps(subreddits),
+            )
+
+    async def update_run(
+        self,
+        run_id: int,
+        posts_fetched: int = 0,
+        posts_analyzed: int = 0,
+        signals_saved: int = 0,
+        qualified_signals: int = 0,
+        errors: int = 0,
+        status: str = "completed",
+        report_path: str | None = None,
+    ) -> None:
+        """Update a run record with results (see AsyncStore.update_run)."""
+        async with self.connection() as conn:
+            await conn.execute(
+                """
+                UPDATE runs SET
+                    completed_at = $1,
+                    posts_fetched = $2,
+                    posts_analyzed = $3,
+                    signals_saved = $4,
+                    qualified_signals = $5,
+                    errors = $6,
+                    status = $7,
+                    report_path = $8
+                WHERE id = $9
+                """,
+                datetime.now(UTC).isoformat(),
+                posts_fetched,
+                posts_analyzed,
+                signals_saved,
+                qualified_signals,
+                errors,
+                status,
+                report_path,
+                run_id,
+            )
+
+    async def get_runs(self, limit: int = 10) -> list[dict]:
+        """Get recent pipeline runs.
+
+        Args:
+            limit: Maximum runs to return
+
+        Returns:
+            List of run dictionaries
+        """
+        async with self.connection() as conn:
+            rows = await conn.fetch("SELECT * FROM runs ORDER BY started_at DESC LIMIT $1", limit)
+        return [dict(row) for row in rows]
+
+    async def get_run(self, run_id: int) -> dict | None:
+        """Get a specific run by ID.
+
+        Args:
+            run_id: Run ID
+
+        Returns:
+            Run dictionary or None
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow("SELECT * FROM runs WHERE id = $1", run_id)
+        return dict(row) if row else None
+
+    async def save_clusters(self, clusters: list[Cluster], week_start: str) -> list[str]:
+        """Save generated clusters and link signals in a single transaction (see AsyncStore.save_clusters).
+
+        Returns:
+            IDs of the saved clusters, in input order
+        """
+        if not clusters:
+            return []
+
+        now = datetime.now(UTC).isoformat()
+        cluster_ids = [cluster_id_for(week_start, cluster.signal_ids) for cluster in clusters]
+        member_ids = [signal_id for cluster in clusters for signal_id in cluster.signal_ids]
+
+        async with self.connection() as conn, conn.transaction():
+            # Clusters the members belonged to before, possibly from another week
+            rows = await conn.fetch(
+                "SELECT DISTINCT cluster_id FROM signals WHERE id = ANY($1::bigint[]) AND cluster_id IS NOT NULL",
+                member_ids,
+            )
+            previous = [row["cluster_id"] for row in rows]
+
+            await conn.executemany(
+                """
+                INSERT INTO clusters (id, title, summary, week_start, target_audience, why_it_matters,
+                                      generated_report, created_at, centroid, signal_count)
+                VALUES ($1, $2, $3, $4, $5, $6, '', $7, $8, $9)
+                ON CONFLICT (id) DO UPDATE SET
+                    title = EXCLUDED.title,
+                    summary = EXCLUDED.summary,
+                    target_audience = EXCLUDED.target_audience,
+                    why_it_matters = EXCLUDED.why_it_matters,
+                    centroid = EXCLUDED.centroid,
+                    signal_count = EXCLUDED.signal_count,
+                    updated_at = $7
+                """,
+                [
+                    (
+                        cluster_id,
+                        cluster.title,
+                        cluster.summary,
+                        week_start,
+                        cluster.target_audience,
+                        cluster.why_it_matters,
+                        now,
+                        to_blob(cluster.centroid) if cluster.centroid is not None else None,
+                        len(cluster.signal_ids),
+                    )
+                    for cluster_id, cluster in zip(cluster_ids, clusters, strict=True)
+                ],
+            )
+            await conn.executemany(
+                "UPDATE signals SET cluster_id = $1 WHERE id = $2",
+                [
+                    (cluster_id, signal_id)
+                    for cluster_id, cluster in zip(cluster_ids, clusters, strict=True)
+                    for signal_id in cluster.signal_ids
+                ],
+            )
+            affected = "(week_start = $1 OR id = ANY($2::text[]))"
+            await conn.execute(
+                f"""
+                DELETE FROM clusters
+                WHERE {affected} AND NOT EXISTS (SELECT 1 FROM signals s WHERE s.cluster_id = clusters.id)
+                """,
+                week_start,
+                previous,
+            )
+            await conn.execute(
+                f"""
+                UPDATE clusters
+                SET signal_count = (SELECT COUNT(*) FROM signals s WHERE s.cluster_id = clusters.id)
+                WHERE {affected}
+                """,
+                week_start,
+                previous,
+            )
+
+        logger.info("clusters_saved", week_start=week_start, clusters=len(clusters))
+        return cluster_ids
+
+    async def get_cluster_centroids(self, days: int = 7) -> list[dict]:
+        """Get persisted cluster centroids for incremental assignment (see AsyncStore.get_cluster_centroids)."""
+        since = (datetime.now(UTC).date() - timedelta(days=days)).isoformat()
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, title, week_start, signal_count, centroid
+                FROM clusters
+                WHERE centroid IS NOT NULL
+                AND week_start >= $1
+                ORDER BY week_start DESC, id
+                """,
+                since,
+            )
+        return [{**dict(row), "centroid": from_blob(row["centroid"])} for row in rows]
+
+    async def attach_signals_to_clusters(
+        self,
+        assignments: dict[str, list[int]],
+        centroids: dict[str, Any],
+    ) -> int:
+        """Attach signals to existing clusters and store their updated centroids.
+
+        Args:
+            assignments: Mapping of cluster ID to signal IDs to attach
+            centroids: Mapping of cluster ID to its updated centroid vector
+
+        Returns:
+            Number of signals attached
+        """
+        if not assignments:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn, conn.transaction():
+            await conn.executemany(
+                "UPDATE signals SET cluster_id = $1 WHERE id = $2",
+                [(cluster_id, signal_id) for cluster_id, ids in assignments.items() for signal_id in ids],
+            )
+            await conn.executemany(
+                """
+                UPDATE clusters
+                SET centroid = $1, signal_count = COALESCE(signal_count, 0) + $2, updated_at = $3
+                WHERE id = $4
+                """,
+                [
+                    (to_blob(centroids[cluster_id]), len(ids), now, cluster_id)
+                    for cluster_id, ids in assignments.items()
+                ],
+            )
+
+        attached = sum(len(ids) for ids in assignments.values())
+        logger.info("signals_attached", clusters=len(assignments), signals=attached)
+        return attached
+
+    # --- Cluster Lineage Methods ---
+
+    async def get_weeks_with_unlinked_clusters(self) -> list[str]:
+        """Get weeks that have clusters not yet linked to a lineage.
+
+        Returns:
+            ISO week start dates, oldest first
+        """
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT DISTINCT week_start FROM clusters
+                WHERE lineage_id IS NULL AND centroid IS NOT NULL
+                ORDER BY week_start
+                """
+            )
+        return [row["week_start"] for row in rows]
+
+    async def _get_member_subreddits(self, conn: asyncpg.Connection, query: str, *params: Any) -> dict[Any, set[str]]:
+        """Collect member subreddits keyed by the first selected column."""
+        subreddits: dict[Any, set[str]] = {}
+        for key, subreddit in await conn.fetch(query, *params):
+            subreddits.setdefault(key, set()).add(subreddit)
+        return subreddits
+
+    async def get_unlinked_clusters(self, week_start: str) -> list[dict]:
+        """Get a week's clusters that are not yet linked to a lineage (see AsyncStore.get_unlinked_clusters)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, title, signal_count, centroid FROM clusters
+                WHERE week_start = $1 AND lineage_id IS NULL AND centroid IS NOT NULL
+                ORDER BY id
+                """,
+                week_start,
+            )
+            subreddits = await self._get_member_subreddits(
+                conn,
+                """
+                SELECT DISTINCT s.cluster_id, p.subreddit FROM signals s
+                JOIN clusters c ON s.cluster_id = c.id
+                JOIN posts p ON s.post_id = p.id
+                WHERE c.week_start = $1 AND c.lineage_id IS NULL
+                """,
+                week_start,
+            )
+
+        return [
+            {**dict(row), "centroid": from_blob(row["centroid"]), "subreddits": subreddits.get(row["id"], set())}
+            for row in rows
+        ]
+
+    async def get_lineage_candidates(self, week_start: str, lookback_days: int = 28) -> list[dict]:
+        """Get lineages recent enough to be continued by a week's clusters (see AsyncStore.get_lineage_candidates)."""
+        since = (date.fromisoformat(week_start) - timedelta(days=lookback_days)).isoformat()
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT id, title, last_week, centroid FROM cluster_lineages
+                WHERE last_week >= $1 AND last_week <= $2 AND centroid IS NOT NULL
+                ORDER BY id
+                """,
+                since,
+                week_start,
+            )
+            subreddits = await self._get_member_subreddits(
+                conn,
+                """
+                SELECT DISTINCT c.lineage_id, p.subreddit FROM signals s
+                JOIN clusters c ON s.cluster_id = c.id
+                JOIN posts p ON s.post_id = p.id
+                WHERE c.lineage_id IS NOT NULL AND c.week_start >= $1 AND c.week_start <= $2
+                """,
+                since,
+                week_start,
+            )
+
+        return [
+            {**dict(row), "centroid": from_blob(row["centroid"]), "subreddits": subreddits.get(row["id"], set())}
+            for row in rows
+        ]
+
+    async def link_clusters_to_lineages(
+        self,
+        clusters: list[dict],
+        matches: dict[str, int],
+        week_start: str,
+        lineage_centroids: dict[int, np.ndarray],
+    ) -> int:
+        """Link clusters to lineages, starting new ones as needed (see AsyncStore.link_clusters_to_lineages).
+
+        Returns:
+            Number of new lineages created
+        """
+        if not clusters:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        links: list[tuple[int, str]] = []
+        blended: list[tuple[bytes, str, int]] = []
+        created = 0
+        async with self.connection() as conn, conn.transaction():
+            for cluster in clusters:
+                lineage_id = matches.get(cluster["id"])
+                if lineage_id is None:
+                    lineage_id = await conn.fetchval(
+                        """
+                        INSERT INTO cluster_lineages (title, centroid, first_week, last_week, created_at, updated_at)
+                        VALUES ($1, $2, $3, $3, $4, $4)
+                        RETURNING id
+                        """,
+                        cluster["title"],
+                        to_blob(cluster["centroid"]),
+                        week_start,
+                        now,
+                    )
+                    created += 1
+                else:
+                    mixed = centroid(np.vstack([lineage_centroids[lineage_id], cluster["centroid"]]))
+                    blended.append((to_blob(mixed), now, lineage_id))
+                links.append((lineage_id, cluster["id"]))
+
+            await conn.executemany("UPDATE cluster_lineages SET centroid = $1, updated_at = $2 WHERE id = $3", blended)
+            await conn.executemany("UPDATE clusters SET lineage_id = $1 WHERE id = $2", links)
+
+        logger.info("clusters_linked", week_start=week_start, clusters=len(clusters), new_lineages=created)
+        return created
+
+    async def get_lineage_week_totals(self, week_start: str) -> list[dict]:
+        """Get lineages with clusters in a week and the week's signal total (see AsyncStore.get_lineage_week_totals)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT l.id, l.last_week, l.weeks_seen, l.last_signal_count, l.prev_signal_count,
+                       l.prev_streak, l.growth_streak, SUM(c.signal_count)::bigint AS week_total
+                FROM cluster_lineages l
+                JOIN clusters c ON c.lineage_id = l.id
+                WHERE c.week_start = $1
+                GROUP BY l.id
+                """,
+                week_start,
+            )
+        return [dict(row) for row in rows]
+
+    async def update_lineage_metrics(self, updates: dict[int, dict]) -> None:
+        """Store recomputed lineage growth metrics.
+
+        Args:
+            updates: Mapping of lineage ID to metric columns (see recurrence.advance_growth)
+        """
+        if not updates:
+            return
+
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn:
+            await conn.executemany(
+                """
+                UPDATE cluster_lineages
+                SET last_week = $1, weeks_seen = $2, last_signal_count = $3, prev_signal_count = $4,
+                    prev_streak = $5, growth_streak = $6, growth_rate = $7, updated_at = $8
+                WHERE id = $9
+                """,
+                [
+                    (
+                        m["last_week"],
+                        m["weeks_seen"],
+                        m["last_signal_count"],
+                        m["prev_signal_count"],
+                        m["prev_streak"],
+                        m["growth_streak"],
+                        m["growth_rate"],
+                        now,
+                        lineage_id,
+                    )
+                    for lineage_id, m in updates.items()
+                ],
+            )
+
+    async def get_growing_lineages(
+        self,
+        min_streak: int = 3,
+        since_week: str | None = None,
+        limit: int = 20,
+    ) -> list[dict]:
+        """Get pain clusters that grew for at least min_streak weeks (see AsyncStore.get_growing_lineages)."""
+        query = """
+            SELECT id, title, first_week, last_week, weeks_seen, last_signal_count,
+                   prev_signal_count, growth_streak, growth_rate
+            FROM cluster_lineages
+            WHERE growth_streak >= $1
+        """
+        params: list[Any] = [min_streak]
+        if since_week:
+            params.append(since_week)
+            query += f" AND last_week >= ${len(params)}"
+        params.append(limit)
+        query += f" ORDER BY growth_streak DESC, last_week DESC LIMIT ${len(params)}"
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(query, *params)
+        return [dict(row) for row in rows]
+
+    # --- Embedding Methods ---
+
+    async def get_signals_missing_embeddings(self, model: str, limit: int | None = None) -> list[dict]:
+        """Get signals that have no stored embedding for a model (see AsyncStore.get_signals_missing_embeddings)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT i.id, i.signal_summary, i.pain_point
+                FROM signals i
+                LEFT JOIN signal_embeddings e ON e.signal_id = i.id AND e.model = $1
+                WHERE e.signal_id IS NULL
+                ORDER BY i.id
+                LIMIT $2
+                """,
+                model,
+                limit or None,
+            )
+        return [dict(row) for row in rows]
+
+    async def get_cached_embeddings(self, model: str, content_hashes: list[str]) -> dict[str, np.ndarray]:
+        """Look up already-computed vectors by content hash (see AsyncStore.get_cached_embeddings)."""
+        if not content_hashes:
+            return {}
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT content_hash, vector FROM signal_embeddings
+                WHERE model = $1 AND content_hash = ANY($2::text[])
+                """,
+                model,
+                content_hashes,
+            )
+        return {row["content_hash"]: from_blob(row["vector"], dtype="<f2") for row in rows}
+
+    async def save_embeddings(self, model: str, rows: list[tuple[int, str, np.ndarray]]) -> int:
+        """Store signal embeddings as float16 blobs.
+
+        Args:
+            model: Embedder name
+            rows: (signal_id, content_hash, vector) tuples
+
+        Returns:
+            Number of embeddings stored
+        """
+        if not rows:
+            return 0
+
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn, conn.transaction():
+            await conn.executemany(
+                """
+                INSERT INTO signal_embeddings (signal_id, model, content_hash, dim, vector, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (signal_id, model) DO UPDATE SET
+                    content_hash = EXCLUDED.content_hash,
+                    dim = EXCLUDED.dim,
+                    vector = EXCLUDED.vector,
+                    created_at = EXCLUDED.created_at
+                """,
+                [
+                    (signal_id, model, content_hash, len(vector), to_blob(vector, dtype="<f2"), now)
+                    for signal_id, content_hash, vector in rows
+                ],
+            )
+            # Bump the model's version so cached vector indexes know they are stale
+            await conn.execute(
+                """
+                INSERT INTO embedding_models (model, version, updated_at) VALUES ($1, 1, $2)
+                ON CONFLICT (model) DO UPDATE SET
+                    version = embedding_models.version + 1, updated_at = EXCLUDED.updated_at
+                """,
+                model,
+                now,
+            )
+        logger.info("embeddings_saved", model=model, count=len(rows))
+        return len(rows)
+
+    async def get_embedding_version(self, model: str) -> int:
+        """Get a counter that changes whenever a model's embeddings change (see AsyncStore.get_embedding_version)."""
+        async with self.connection() as conn:
+            version = await conn.fetchval("SELECT version FROM embedding_models WHERE model = $1", model)
+        return version or 0
+
+    async def get_embeddings(self, model: str) -> tuple[np.ndarray, np.ndarray]:
+        """Load all stored embeddings for a model into a contiguous matrix (see AsyncStore.get_embeddings)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT signal_id, dim, vector FROM signal_embeddings WHERE model = $1 ORDER BY signal_id",
+                model,
+            )
+
+        if not rows:
+            return np.zeros(0, dtype=np.int64), np.zeros((0, 0), dtype=np.float32)
+
+        ids = np.fromiter((row["signal_id"] for row in rows), dtype=np.int64, count=len(rows))
+        dim = rows[0]["dim"]
+        matrix = np.frombuffer(b"".join(row["vector"] for row in rows), dtype="<f2").reshape(len(rows), dim)
+        return ids, matrix.astype(np.float32)
+
+    # --- Watchlist / Alerting Methods ---
+
+    async def create_watchlist(
+        self,
+        name: str,
+        keywords: list[str],
+        subreddits: list[str] | None = None,
+        notification_email: str | None = None,
+        notification_webhook: str | None = None,
+        tier: str = "free",
+        description: str | None = None,
+        description_vector: np.ndarray | None = None,
+        embedding_model: str | None = None,
+        semantic_threshold: float | None = None,
+        query: str | None = None,
+    ) -> int:
+        """Create a new watchlist for keyword alerts (see AsyncStore.create_watchlist).
+
+        Raises:
+            QuerySyntaxError: If the query is malformed
+        """
+        if query:
+            compile_query(query)
+
+        async with self.connection() as conn:
+            watchlist_id = await conn.fetchval(
+                """
+                INSERT INTO watchlists
+                (name, keywords, subreddits, notification_email, notification_webhook, tier, is_active, created_at,
+                 description, description_vector, embedding_model, semantic_threshold, query)
+                VALUES ($1, $2, $3, $4, $5, $6, 1, $7, $8, $9, $10, $11, $12)
+                RETURNING id
+                """,
+                name,
+                json.dumps(keywords),
+                json.dumps(subreddits) if subreddits else None,
+                notification_email,
+                notification_webhook,
+                tier,
+                datetime.now(UTC).isoformat(),
+                description,
+                to_blob(description_vector) if description_vector is not None else None,
+                embedding_model,
+                semantic_threshold,
+                query,
+            )
+        logger.info("watchlist_created", id=watchlist_id, name=name, keywords=keywords)
+        return watchlist_id
+
+    async def get_watchlists(self, active_only: bool = True) -> list[dict]:
+        """Get all watchlists.
+
+        Args:
+            active_only: Only return active watchlists
+
+        Returns:
+            List of watchlist dictionaries
+        """
+        query = "SELECT * FROM watchlists"
+        if active_only:
+            query += " WHERE is_active = 1"
+        query += " ORDER BY created_at DESC"
+        async with self.connection() as conn:
+            rows = await conn.fetch(query)
+        return [AsyncStore._decode_watchlist(row) for row in rows]
+
+    async def get_watchlist(self, watchlist_id: int) -> dict | None:
+        """Get a specific watchlist by ID.
+
+        Args:
+            watchlist_id: Watchlist ID
+
+        Returns:
+            Watchlist dictionary or None
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow("SELECT * FROM watchlists WHERE id = $1", watchlist_id)
+        return AsyncStore._decode_watchlist(row) if row else None
+
+    async def get_semantic_watchlist_models(self) -> set[str]:
+        """Get the embedding models of active semantic watchlists (see AsyncStore.get_semantic_watchlist_models)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT DISTINCT embedding_model FROM watchlists
+                WHERE is_active = 1 AND description_vector IS NOT NULL
+                """
+            )
+        return {row[0] for row in rows}
+
+    async def delete_watchlist(self, watchlist_id: int) -> bool:
+        """Delete (deactivate) a watchlist.
+
+        Args:
+            watchlist_id: Watchlist ID
+
+        Returns:
+            True if deleted
+        """
+        async with self.connection() as conn:
+            await conn.execute(
+                "UPDATE watchlists SET is_active = 0, updated_at = $1 WHERE id = $2",
+                datetime.now(UTC).isoformat(),
+                watchlist_id,
+            )
+        logger.info("watchlist_deleted", id=watchlist_id)
+        return True
+
+    async def check_watchlists(
+        self, since_hours: int = 24, rescan: bool = False, embedding_model: str | None = None
+    ) -> list[dict]:
+        """Check active watchlists against signals added since their last check (see AsyncStore.check_watchlists).
+
+        Watchlists are only matched here; there is no write-time matching on
+        Postgres.
+
+        Returns:
+            List of matches with watchlist and signal info
+        """
+        watchlists = await self.get_watchlists(active_only=True)
+        if not watchlists:
+            return []
+
+        cutoff = (datetime.now(UTC) - timedelta(hours=since_hours)).isoformat()
+        semantic = SemanticMatcher(
+            [wl for wl in watchlists if embedding_model and wl.get("embedding_model") == embedding_model]
+        )
+
+        async with self.connection() as conn:
+            high_water = await conn.fetchval("SELECT COALESCE(MAX(id), 0) FROM signals")
+            first = await conn.fetchval(
+                "SELECT id FROM signals WHERE created_at > $1 ORDER BY created_at, id LIMIT 1", cutoff
+            )
+            window_start = first - 1 if first is not None else high_water
+
+            starts = {
+                wl["id"]: window_start if rescan or not wl.get("last_signal_id") else wl["last_signal_id"]
+                for wl in watchlists
+            }
+            signals = await conn.fetch(
+                """
+                SELECT i.id, i.signal_summary, i.pain_point, i.target_user, i.evidence,
+                       p.subreddit, p.url, p.title as post_title, e.vector AS embedding
+                FROM signals i
+                JOIN posts p ON i.post_id = p.id
+                LEFT JOIN signal_embeddings e ON e.signal_id = i.id AND e.model = $1
+                WHERE i.id > $2 AND i.id <= $3
+                AND i.disqualified = 0
+                ORDER BY i.id
+                """,
+                embedding_model if len(semantic) else None,
+                min(starts.values()),
+                high_water,
+            )
+
+        matches = match_watchlists(signals, watchlists, starts, semantic, embedding_model)
+        by_watchlist: dict[int, list[dict]] = {}
+        for m in matches:
+            by_watchlist.setdefault(m["watchlist_id"], []).append(m)
+
+        # Record matches, advance cursors and counters in one transaction
+        now = datetime.now(UTC).isoformat()
+        recorded = 0
+        async with self.connection() as conn, conn.transaction():
+            if signals:
+                updates = []
+                for wl_id in starts:
+                    inserted = 0
+                    wl_matches = by_watchlist.get(wl_id)
+                    if wl_matches:
+                        status = await conn.execute(
+                            """
+                            INSERT INTO alert_matches (watchlist_id, signal_id, keyword_matched, created_at)
+                            SELECT $1, signal_id, keyword_matched, $4
+                            FROM unnest($2::bigint[], $3::text[]) AS m(signal_id, keyword_matched)
+                            ON CONFLICT (watchlist_id, signal_id) DO NOTHING
+                            """,
+                            wl_id,
+                            [m["signal_id"] for m in wl_matches],
+                            [m["keyword_matched"] for m in wl_matches],
+                            now,
+                        )
+                        inserted = _row_count(status)
+                    recorded += inserted
+                    updates.append((high_water, now, inserted, wl_id))
+                await conn.executemany(
+                    """
+                    UPDATE watchlists
+                    SET last_signal_id = GREATEST(COALESCE(last_signal_id, 0), $1),
+                        last_checked_at = $2,
+                        total_matches = COALESCE(total_matches, 0) + $3
+                    WHERE id = $4
+                    """,
+                    updates,
+                )
+            else:
+                await conn.executemany(
+                    "UPDATE watchlists SET last_checked_at = $1 WHERE id = $2",
+                    [(now, wl_id) for wl_id in starts],
+                )
+
+        logger.info(
+            "watchlists_checked",
+            watchlists=len(watchlists),
+            signals_scanned=len(signals),
+            total_matches=len(matches),
+            new_matches=recorded,
+        )
+        return matches
+
+    async def get_unnotified_matches(self, watchlist_id: int | None = None) -> list[dict]:
+        """Get alert matches that haven't been notified yet.
+
+        Args:
+            watchlist_id: Optional filter by watchlist
+
+        Returns:
+            List of unnotified matches
+        """
+        query = """
+            SELECT am.*, w.name as watchlist_name, w.notification_email, w.notification_webhook,
+                   s.signal_summary, s.pain_point, p.subreddit, p.url
+            FROM alert_matches am
+            JOIN watchlists w ON am.watchlist_id = w.id
+            JOIN signals s ON am.signal_id = s.id
+            JOIN posts p ON s.post_id = p.id
+            WHERE am.notified = 0
+        """
+        params = []
+        if watchlist_id:
+            query += " AND am.watchlist_id = $1"
+            params.append(watchlist_id)
+        query += " ORDER BY am.created_at DESC"
+
+        async with self.connection() as conn:
+            rows = await conn.fetch(query, *params)
+        return [dict(row) for row in rows]
+
+    async def mark_matches_notified(self, match_ids: list[int]) -> None:
+        """Mark alert matches as notified.
+
+        Args:
+            match_ids: List of match IDs to mark
+        """
+        if not match_ids:
+            return
+
+        async with self.connection() as conn:
+            await conn.execute(
+                "UPDATE alert_matches SET notified = 1, notified_at = $1 WHERE id = ANY($2::bigint[])",
+                datetime.now(UTC).isoformat(),
+                match_ids,
+            )
+
+    # --- Subreddit State Methods ---
+
+    async def get_high_water_marks(self, listing: str) -> dict[str, tuple[int, str]]:
+        """Get the newest post seen in each subreddit's listing (see AsyncStore.get_high_water_marks)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                "SELECT subreddit, last_created_utc, last_post_id FROM subreddit_state WHERE listing = $1", listing
+            )
+        return {row["subreddit"]: (row["last_created_utc"], row["last_post_id"]) for row in rows}
+
+    async def update_high_water_marks(self, listing: str, marks: dict[str, tuple[int, str]]) -> None:
+        """Advance subreddits' high-water marks (see AsyncStore.update_high_water_marks)."""
+        if not marks:
+            return
+        now = datetime.now(UTC).isoformat()
+        async with self.connection() as conn:
+            await conn.executemany(
+                """
+                INSERT INTO subreddit_state (subreddit, listing, last_created_utc, last_post_id, updated_at)
+                VALUES ($1, $2, $3, $4, $5)
+                ON CONFLICT (subreddit, listing) DO UPDATE SET
+                    last_created_utc = excluded.last_created_utc,
+                    last_post_id = excluded.last_post_id,
+                    updated_at = excluded.updated_at
+                WHERE excluded.last_created_utc >= subreddit_state.last_created_utc
+                """,
+                [(sub, listing, created_utc, post_id, now) for sub, (created_utc, post_id) in marks.items()],
+            )
+
+    async def get_post_velocity(self, since_utc: int) -> dict[str, dict]:
+        """Summarize each subreddit's recent posts (see AsyncStore.get_post_velocity)."""
+        async with self.connection() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT lower(subreddit) AS subreddit, COUNT(*) AS posts,
+                       MIN(created_utc) AS oldest_utc, MAX(created_utc) AS newest_utc
+                FROM posts
+                WHERE created_utc >= $1
+                GROUP BY lower(subreddit)
+                """,
+                since_utc,
+            )
+        return {
+            row["subreddit"]: {"posts": row["posts"], "oldest_utc": row["oldest_utc"], "newest_utc": row["newest_utc"]}
+            for row in rows
+        }
+
+    # --- Source Sets Methods ---
+
+    async def create_source_set(
+        self,
+        name: str,
+        subreddits: list[str],
+        description: str | None = None,
+        preset_key: str | None = None,
+        listing: str = "new",
+        limit_per_sub: int = 25,
+        fetcher: str = "rss",
+    ) -> int:
+        """Create a new source set (see AsyncStore.create_source_set)."""
+        async with self.connection() as conn:
+            source_set_id = await conn.fetchval(
+                """
+                INSERT INTO source_sets
+                (name, description, preset_key, subreddits, listing, limit_per_sub, fetcher, is_active, created_at)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, 1, $8)
+                RETURNING id
+                """,
+                name,
+                description,
+                preset_key,
+                json.dumps(subreddits),
+                listing,
+                limit_per_sub,
+                fetcher,
+                datetime.now(UTC).isoformat(),
+            )
+        logger.info("source_set_created", id=source_set_id, name=name, subreddits=subreddits)
+        return source_set_id
+
+    async def get_source_sets(self, active_only: bool = True) -> list[dict]:
+        """Get all source sets.
+
+        Args:
+            active_only: Only return active source sets
+
+        Returns:
+            List of source set dictionaries
+        """
+        query = "SELECT * FROM source_sets"
+        if active_only:
+            query += " WHERE is_active = 1"
+        query += " ORDER BY created_at DESC"
+        async with self.connection() as conn:
+            rows = await conn.fetch(query)
+        return [self._source_set(row) for row in rows]
+
+    async def get_source_set(self, source_set_id: int) -> dict | None:
+        """Get a specific source set by ID.
+
+        Args:
+            source_set_id: Source set ID
+
+        Returns:
+            Source set dictionary or None
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow("SELECT * FROM source_sets WHERE id = $1", source_set_id)
+        return self._source_set(row) if row else None
+
+    async def get_source_set_by_preset(self, preset_key: str) -> dict | None:
+        """Get a source set by its preset key.
+
+        Args:
+            preset_key: The preset key (e.g., 'indie_saas')
+
+        Returns:
+            Source set dictionary or None
+        """
+        async with self.connection() as conn:
+            row = await conn.fetchrow(
+                "SELECT * FROM source_sets WHERE preset_key = $1 AND is_active = 1 LIMIT 1", preset_key
+            )
+        return self._source_set(row) if row else None
+
+    async def update_source_set(
+        self,
+        source_set_id: int,
+        subreddits: list[str] | None = None,
+        name: str | None = None,
+        description: str | None = None,
+        listing: str | None = None,
+        limit_per_sub: int | None = None,
+        fetcher: str | None = None,
+    ) -> bool:
+        """Update a source set (see AsyncStore.update_source_set).
+
+        Returns:
+            True if updated
+        """
+        changes = {
+            "subreddits": json.dumps(subreddits) if subreddits is not None else None,
+            "name": name,
+            "description": description,
+            "listing": listing,
+            "limit_per_sub": limit_per_sub,
+            "fetcher": fetcher,
+        }
+        changes = {column: value for column, value in changes.items() if value is not None}
+        if not changes:
+            return False
+        changes["updated_at"] = datetime.now(UTC).isoformat()
+
+        assignments = ", ".join(f"{column} = ${n}" for n, column in enumerate(changes, start=1))
+        async with self.connection() as conn:
+            await conn.execute(
+                f"UPDATE source_sets SET {assignments} WHERE id = ${len(changes) + 1}",
+                *changes.values(),
+                source_set_id,
+            )
+        logger.info("source_set_updated", id=source_set_id)
+        return True
+
+    async def delete_source_set(self, source_set_id: int) -> bool:
+        """Delete (deactivate) a source set.
+
+        Args:
+            source_set_id: Source set ID
+
+        Returns:
+            True if deleted
+        """
+        async with self.connection() as conn:
+            await conn.execute("UPDATE source_sets SET is_active = 0 WHERE id = $1", source_set_id)
+        logger.info("source_set_deleted", id=source_set_id)
+        return True
+
+    async def get_all_active_subreddits(self) -> list[str]:
+        """Get all unique subreddits from active source sets.
+
+        Returns:
+            Deduplicated list of subreddit names
+        """
+        source_sets = await self.get_source_sets(active_only=True)
+        return sorted({sub for ss in source_sets for sub in ss["subreddits"]})
+
+    async def get_active_subreddit_fetchers(self) -> dict[str, str]:
+        """Get the fetcher for each active subreddit (see AsyncStore.get_active_subreddit_fetchers)."""
+        fetchers: dict[str, str] = {}
+        for ss in await self.get_source_sets(active_only=True):
+            for sub in ss["subreddits"]:
+                if fetchers.get(sub) != "json":
+                    fetchers[sub] = ss.get("fetcher") or "rss"
+        return dict(sorted(fetchers.items()))
+
+    @staticmethod
+    def _source_set(row: Any) -> dict:
+        ss = dict(row)
+        ss["subreddits"] = json.loads(ss["subreddits"])
+        return ss
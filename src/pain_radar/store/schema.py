@@ -11,7 +11,7 @@ CREATE TABLE IF NOT EXISTS posts (
     num_comments INTEGER NOT NULL,
     url TEXT,
     permalink TEXT,
-    top_comments TEXT,  -- JSON array
+    top_comments TEXT,  -- legacy JSON array; comments now live in the comments table
     fetched_at TEXT NOT NULL,
     processed INTEGER DEFAULT 0
 );
@@ -63,7 +63,7 @@ CREATE TABLE IF NOT EXISTS signals (
 
     -- Metadata
     created_at TEXT NOT NULL,
-    raw_extraction TEXT,  -- Full JSON
+    raw_extraction TEXT,  -- Full JSON (this and the other compressed columns: see compression.py)
     raw_score TEXT,  -- Full JSON
 
     FOREIGN KEY (post_id) REFERENCES posts(id),
@@ -96,12 +96,18 @@ CREATE TABLE IF NOT EXISTS processing_log (
 );
 
 CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts(subreddit);
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit_created ON posts(subreddit, created_utc);
 CREATE INDEX IF NOT EXISTS idx_posts_processed ON posts(processed);
 CREATE INDEX IF NOT EXISTS idx_signals_post_id ON signals(post_id);
 CREATE INDEX IF NOT EXISTS idx_signals_run_id ON signals(run_id);
 CREATE INDEX IF NOT EXISTS idx_signals_total_score ON signals(total_score DESC);
 CREATE INDEX IF NOT EXISTS idx_signals_disqualified ON signals(disqualified);
 CREATE INDEX IF NOT EXISTS idx_signals_extraction_state ON signals(extraction_state);
+CREATE INDEX IF NOT EXISTS idx_signals_cluster_id ON signals(cluster_id);
+CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at);
+-- Score-ordered listings and their keyset cursors (rowid breaks ties)
+CREATE INDEX IF NOT EXISTS idx_signals_rank ON signals(disqualified, total_score DESC);
+CREATE INDEX IF NOT EXISTS idx_signals_run_rank ON signals(run_id, total_score DESC);
 
 -- Prevent duplicate signals for the same post in the same run
 CREATE UNIQUE INDEX IF NOT EXISTS idx_signals_post_run_unique ON signals(post_id, run_id);
@@ -114,7 +120,29 @@ CREATE TABLE IF NOT EXISTS clusters (
     target_audience TEXT,
     why_it_matters TEXT,
     created_at TEXT NOT NULL,
-    generated_report TEXT  -- Full Markdown output
+    generated_report TEXT,  -- Full Markdown output
+    centroid BLOB,  -- float32 vector of member signals (see vectors.py)
+    signal_count INTEGER DEFAULT 0,
+    updated_at TEXT,
+    lineage_id INTEGER,  -- cluster_lineages.id once linked across weeks
+    FOREIGN KEY (lineage_id) REFERENCES cluster_lineages(id)
+);
+
+-- Chains of clusters describing the same pain across weeks (see recurrence.py)
+CREATE TABLE IF NOT EXISTS cluster_lineages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL,  -- title of the cluster that started the lineage
+    centroid BLOB,  -- float32, blended with each linked cluster's centroid
+    first_week TEXT NOT NULL,
+    last_week TEXT NOT NULL,
+    weeks_seen INTEGER DEFAULT 1,
+    last_signal_count INTEGER DEFAULT 0,  -- signals in last_week
+    prev_signal_count INTEGER,  -- signals in the week before last_week (null if not seen)
+    prev_streak INTEGER DEFAULT 0,  -- growth_streak as of the week before last_week
+    growth_streak INTEGER DEFAULT 0,  -- consecutive week-over-week increases ending at last_week
+    growth_rate REAL,  -- (last - prev) / prev
+    created_at TEXT NOT NULL,
+    updated_at TEXT
 );
 
 CREATE TABLE IF NOT EXISTS alerts (
@@ -139,7 +167,24 @@ CREATE TABLE IF NOT EXISTS watchlists (
     created_at TEXT NOT NULL,
     updated_at TEXT,
     last_checked_at TEXT,
-    total_matches INTEGER DEFAULT 0
+    total_matches INTEGER DEFAULT 0,
+    last_signal_id INTEGER DEFAULT 0,  -- highest signal ID already checked against this watchlist
+    description TEXT,  -- natural-language description for semantic matching
+    description_vector BLOB,  -- float32 embedding of description
+    embedding_model TEXT,  -- model that produced description_vector
+    semantic_threshold REAL,  -- minimum cosine similarity (null = default)
+    query TEXT  -- boolean query (see query.py), matched in addition to keywords
+);
+
+-- zstd dictionaries for compressed columns (see compression.py); the newest row
+-- per column compresses new values, older ones keep earlier frames readable
+CREATE TABLE IF NOT EXISTS compression_dicts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    column_name TEXT NOT NULL,
+    dict_id INTEGER NOT NULL,  -- zstd dictionary ID recorded in each frame (0 = no dictionary)
+    dictionary BLOB,
+    created_at TEXT NOT NULL
 );
 
 -- Track which signals matched which watchlists
@@ -163,13 +208,47 @@ CREATE TABLE IF NOT EXISTS source_sets (
     preset_key TEXT,           -- null if custom, e.g. 'indie_saas'
     subreddits TEXT NOT NULL,  -- JSON array of subreddit names
     listing TEXT DEFAULT 'new', -- new, hot, top
+    fetcher TEXT DEFAULT 'rss', -- rss (one ~25-post page) or json (paginated listing with scores)
     limit_per_sub INTEGER DEFAULT 25,
     is_active INTEGER DEFAULT 1,
     created_at TEXT NOT NULL,
     updated_at TEXT
 );
 
+-- Newest post seen per subreddit (lowercased) and listing, so polls of a
+-- newest-first listing stop at posts already fetched
+CREATE TABLE IF NOT EXISTS subreddit_state (
+    subreddit TEXT NOT NULL,
+    listing TEXT NOT NULL,
+    last_created_utc INTEGER NOT NULL,
+    last_post_id TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (subreddit, listing)
+);
+
+-- Signal embeddings for similarity lookups (one row per signal per embedding model)
+CREATE TABLE IF NOT EXISTS signal_embeddings (
+    signal_id INTEGER NOT NULL,
+    model TEXT NOT NULL,         -- embedder name, e.g. 'hashing-512' or 'openai:text-embedding-3-small'
+    content_hash TEXT NOT NULL,  -- sha256 of the embedded text, used as a cache key
+    dim INTEGER NOT NULL,
+    vector BLOB NOT NULL,        -- float16 little-endian
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (signal_id, model),
+    FOREIGN KEY (signal_id) REFERENCES signals(id)
+);
+
+-- Write counter per embedding model, used to invalidate cached vector indexes
+CREATE TABLE IF NOT EXISTS embedding_models (
+    model TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
+
 CREATE INDEX IF NOT EXISTS idx_clusters_week ON clusters(week_start);
+CREATE INDEX IF NOT EXISTS idx_cluster_lineages_growth ON cluster_lineages(growth_streak DESC, last_week DESC);
+CREATE INDEX IF NOT EXISTS idx_cluster_lineages_last_week ON cluster_lineages(last_week);
+CREATE INDEX IF NOT EXISTS idx_signal_embeddings_hash ON signal_embeddings(model, content_hash);
 CREATE INDEX IF NOT EXISTS idx_alerts_email ON alerts(email);
 CREATE INDEX IF NOT EXISTS idx_watchlists_active ON watchlists(is_active);
 CREATE INDEX IF NOT EXISTS idx_alert_matches_watchlist ON alert_matches(watchlist_id);
@@ -178,6 +257,257 @@ CREATE INDEX IF NOT EXISTS idx_source_sets_active ON source_sets(is_active);
 CREATE INDEX IF NOT EXISTS idx_source_sets_preset ON source_sets(preset_key);
 """
 
+# Columns added after a table was first released: (table, column, definition).
+# Applied by AsyncStore.init_db to databases created by an older schema.
+COLUMN_MIGRATIONS = [
+    ("clusters", "centroid", "BLOB"),
+    ("clusters", "signal_count", "INTEGER DEFAULT 0"),
+    ("clusters", "updated_at", "TEXT"),
+    ("clusters", "lineage_id", "INTEGER"),
+    ("watchlists", "last_signal_id", "INTEGER DEFAULT 0"),
+    ("watchlists", "description", "TEXT"),
+    ("watchlists", "description_vector", "BLOB"),
+    ("watchlists", "embedding_model", "TEXT"),
+    ("watchlists", "semantic_threshold", "REAL"),
+    ("watchlists", "query", "TEXT"),
+    ("source_sets", "fetcher", "TEXT DEFAULT 'rss'"),
+]
+
+# Unique indexes added after release: (index, table, columns). AsyncStore.init_db
+# drops duplicate rows (keeping the lowest rowid) before creating a missing index.
+UNIQUE_INDEX_MIGRATIONS = [
+    ("idx_alert_matches_unique", "alert_matches", "watchlist_id, signal_id"),
+]
+
+# Indexes on migrated columns; run by AsyncStore.init_db after COLUMN_MIGRATIONS.
+MIGRATED_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_clusters_lineage ON clusters(lineage_id, week_start);
+"""
+
+# Evidence quotes of a signal row as one text, for the full-text index.
+# {row} is NEW or OLD inside triggers, or a table alias in the backfill.
+_EVIDENCE_TEXT = """(
+    SELECT group_concat(
+        CASE WHEN type = 'object' THEN json_extract(value, '$.quote') WHEN type = 'text' THEN value END, ' '
+    )
+    FROM json_each(CASE WHEN json_valid({row}.evidence) THEN {row}.evidence ELSE '[]' END)
+)"""
+
+# Full-text index over signals and their posts; rowid is signals.id. Column
+# names match the query language fields (see query.FIELDS). Kept in sync by
+# triggers, which are recreated on every init so column changes take effect.
+FTS_COLUMNS = "signal_summary, pain_point, target_user, evidence, post_title, subreddit"
+
+FTS_SCHEMA = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS signals_fts USING fts5(
+    {FTS_COLUMNS},
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+
+DROP TRIGGER IF EXISTS signals_fts_insert;
+CREATE TRIGGER signals_fts_insert AFTER INSERT ON signals BEGIN
+    INSERT INTO signals_fts (rowid, {FTS_COLUMNS})
+    SELECT NEW.id, NEW.signal_summary, NEW.pain_point, NEW.target_user, {_EVIDENCE_TEXT.format(row="NEW")},
+           p.title, p.subreddit
+    FROM (SELECT 1) LEFT JOIN posts p ON p.id = NEW.post_id;
+END;
+
+DROP TRIGGER IF EXISTS signals_fts_update;
+CREATE TRIGGER signals_fts_update
+AFTER UPDATE OF signal_summary, pain_point, target_user, evidence, post_id ON signals BEGIN
+    DELETE FROM signals_fts WHERE rowid = OLD.id;
+    INSERT INTO signals_fts (rowid, {FTS_COLUMNS})
+    SELECT NEW.id, NEW.signal_summary, NEW.pain_point, NEW.target_user, {_EVIDENCE_TEXT.format(row="NEW")},
+           p.title, p.subreddit
+    FROM (SELECT 1) LEFT JOIN posts p ON p.id = NEW.post_id;
+END;
+
+DROP TRIGGER IF EXISTS signals_fts_delete;
+CREATE TRIGGER signals_fts_delete AFTER DELETE ON signals BEGIN
+    DELETE FROM signals_fts WHERE rowid = OLD.id;
+END;
+
+-- upsert_posts uses INSERT OR REPLACE, which fires the insert trigger
+DROP TRIGGER IF EXISTS posts_fts_insert;
+CREATE TRIGGER posts_fts_insert AFTER INSERT ON posts BEGIN
+    UPDATE signals_fts SET post_title = NEW.title, subreddit = NEW.subreddit
+    WHERE rowid IN (SELECT id FROM signals WHERE post_id = NEW.id);
+END;
+
+DROP TRIGGER IF EXISTS posts_fts_update;
+CREATE TRIGGER posts_fts_update AFTER UPDATE OF title, subreddit ON posts BEGIN
+    UPDATE signals_fts SET post_title = NEW.title, subreddit = NEW.subreddit
+    WHERE rowid IN (SELECT id FROM signals WHERE post_id = NEW.id);
+END;
+"""
+
+# Indexes signals that existed before signals_fts was (re)created
+FTS_BACKFILL = f"""
+INSERT INTO signals_fts (rowid, {FTS_COLUMNS})
+SELECT s.id, s.signal_summary, s.pain_point, s.target_user, {_EVIDENCE_TEXT.format(row="s")}, p.title, p.subreddit
+FROM signals s
+LEFT JOIN posts p ON s.post_id = p.id
+"""
+
+# Evidence quotes and post comments as rows, so they can be filtered and
+# joined in SQL (see AsyncStore.get_evidence). signals.evidence keeps a JSON
+# copy for detail views and the full-text index; posts.top_comments is legacy
+# and emptied by the backfill. Created by AsyncStore.init_db, which backfills
+# both tables the first time.
+NORMALIZED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evidence (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    signal_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,  -- order within the signal's evidence list
+    quote TEXT NOT NULL,
+    source TEXT,  -- post, comment
+    comment_index INTEGER,  -- comments.position when source = 'comment'
+    signal_type TEXT,  -- pain, willingness_to_pay, alternatives, urgency, repetition, budget
+    FOREIGN KEY (signal_id) REFERENCES signals(id)
+);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    post_id TEXT NOT NULL,
+    position INTEGER NOT NULL,  -- 0-based rank as fetched
+    body TEXT NOT NULL,
+    FOREIGN KEY (post_id) REFERENCES posts(id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_evidence_signal_id ON evidence(signal_id, position);
+CREATE INDEX IF NOT EXISTS idx_evidence_signal_type ON evidence(signal_type, signal_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id, position);
+
+DROP TRIGGER IF EXISTS evidence_signal_delete;
+CREATE TRIGGER evidence_signal_delete AFTER DELETE ON signals BEGIN
+    DELETE FROM evidence WHERE signal_id = OLD.id;
+END;
+
+DROP TRIGGER IF EXISTS comments_post_delete;
+CREATE TRIGGER comments_post_delete AFTER DELETE ON posts BEGIN
+    DELETE FROM comments WHERE post_id = OLD.id;
+END;
+"""
+
+EVIDENCE_BACKFILL = """
+INSERT INTO evidence (signal_id, position, quote, source, comment_index, signal_type)
+SELECT s.id, j.key,
+       CASE WHEN j.type = 'object' THEN json_extract(j.value, '$.quote') ELSE j.value END,
+       CASE WHEN j.type = 'object' THEN json_extract(j.value, '$.source') END,
+       CASE WHEN j.type = 'object' THEN json_extract(j.value, '$.comment_index') END,
+       CASE WHEN j.type = 'object' THEN json_extract(j.value, '$.signal_type') END
+FROM signals s, json_each(CASE WHEN json_valid(s.evidence) THEN s.evidence ELSE '[]' END) j
+WHERE j.type = 'text' OR (j.type = 'object' AND json_extract(j.value, '$.quote') IS NOT NULL)
+"""
+
+# Comments stored as JSON text; compressed ones (see compression.py) are moved in Python
+COMMENTS_BACKFILL = """
+INSERT INTO comments (post_id, position, body)
+SELECT p.id, j.key, j.value
+FROM posts p, json_each(p.top_comments) j
+WHERE typeof(p.top_comments) = 'text' AND json_valid(p.top_comments) AND j.type = 'text'
+"""
+
+# A post's comments as a JSON array, in the shape posts.top_comments used to have
+COMMENTS_JSON = """(
+    SELECT json_group_array(body) FROM (SELECT body FROM comments c WHERE c.post_id = {post}.id ORDER BY c.position)
+)"""
+
+# Single-row running totals behind AsyncStore.get_stats, kept in sync by
+# triggers so stats never scan posts or signals. Recreated on every init like
+# the FTS triggers. AsyncStore.connect enables recursive_triggers so the
+# delete half of upsert_posts' INSERT OR REPLACE is counted too.
+STATS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS stats_counters (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total_posts INTEGER NOT NULL DEFAULT 0,
+    processed_posts INTEGER NOT NULL DEFAULT 0,
+    total_signals INTEGER NOT NULL DEFAULT 0,
+    qualified_signals INTEGER NOT NULL DEFAULT 0,
+    scored_signals INTEGER NOT NULL DEFAULT 0,  -- qualified with a non-NULL total_score
+    score_sum INTEGER NOT NULL DEFAULT 0,  -- of qualified total_score
+    updated_at TEXT
+);
+
+DROP TRIGGER IF EXISTS stats_posts_insert;
+CREATE TRIGGER stats_posts_insert AFTER INSERT ON posts BEGIN
+    UPDATE stats_counters SET
+        total_posts = total_posts + 1,
+        processed_posts = processed_posts + (NEW.processed IS 1)
+    WHERE id = 1;
+END;
+
+DROP TRIGGER IF EXISTS stats_posts_delete;
+CREATE TRIGGER stats_posts_delete AFTER DELETE ON posts BEGIN
+    UPDATE stats_counters SET
+        total_posts = total_posts - 1,
+        processed_posts = processed_posts - (OLD.processed IS 1)
+    WHERE id = 1;
+END;
+
+DROP TRIGGER IF EXISTS stats_posts_update;
+CREATE TRIGGER stats_posts_update AFTER UPDATE OF processed ON posts BEGIN
+    UPDATE stats_counters SET
+        processed_posts = processed_posts + (NEW.processed IS 1) - (OLD.processed IS 1)
+    WHERE id = 1;
+END;
+
+DROP TRIGGER IF EXISTS stats_signals_insert;
+CREATE TRIGGER stats_signals_insert AFTER INSERT ON signals BEGIN
+    UPDATE stats_counters SET
+        total_signals = total_signals + 1,
+        qualified_signals = qualified_signals + (NEW.disqualified IS 0),
+        scored_signals = scored_signals + (NEW.disqualified IS 0 AND NEW.total_score IS NOT NULL),
+        score_sum = score_sum + CASE WHEN NEW.disqualified IS 0 THEN COALESCE(NEW.total_score, 0) ELSE 0 END
+    WHERE id = 1;
+END;
+
+DROP TRIGGER IF EXISTS stats_signals_delete;
+CREATE TRIGGER stats_signals_delete AFTER DELETE ON signals BEGIN
+    UPDATE stats_counters SET
+        total_signals = total_signals - 1,
+        qualified_signals = qualified_signals - (OLD.disqualified IS 0),
+        scored_signals = scored_signals - (OLD.disqualified IS 0 AND OLD.total_score IS NOT NULL),
+        score_sum = score_sum - CASE WHEN OLD.disqualified IS 0 THEN COALESCE(OLD.total_score, 0) ELSE 0 END
+    WHERE id = 1;
+END;
+
+DROP TRIGGER IF EXISTS stats_signals_update;
+CREATE TRIGGER stats_signals_update AFTER UPDATE OF disqualified, total_score ON signals BEGIN
+    UPDATE stats_counters SET
+        qualified_signals = qualified_signals + (NEW.disqualified IS 0) - (OLD.disqualified IS 0),
+        scored_signals = scored_signals
+            + (NEW.disqualified IS 0 AND NEW.total_score IS NOT NULL)
+            - (OLD.disqualified IS 0 AND OLD.total_score IS NOT NULL),
+        score_sum = score_sum
+            + CASE WHEN NEW.disqualified IS 0 THEN COALESCE(NEW.total_score, 0) ELSE 0 END
+            - CASE WHEN OLD.disqualified IS 0 THEN COALESCE(OLD.total_score, 0) ELSE 0 END
+    WHERE id = 1;
+END;
+"""
+
+# Full aggregation over posts and signals, in stats_counters' column order.
+# Used to seed the counters, by AsyncStore.recompute_stats, and as the
+# fallback for databases that predate stats_counters.
+STATS_AGGREGATE = """
+SELECT
+    (SELECT COUNT(*) FROM posts),
+    (SELECT COUNT(*) FROM posts WHERE processed = 1),
+    (SELECT COUNT(*) FROM signals),
+    (SELECT COUNT(*) FROM signals WHERE disqualified = 0),
+    (SELECT COUNT(total_score) FROM signals WHERE disqualified = 0),
+    (SELECT COALESCE(SUM(total_score), 0) FROM signals WHERE disqualified = 0)
+"""
+
+# Catalog of per-tenant shard files, kept in its own small database (see sharding.py)
+SHARD_CATALOG_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenant_shards (
+    tenant_id TEXT PRIMARY KEY,
+    db_path TEXT NOT NULL UNIQUE,  -- relative to the shard directory
+    created_at TEXT NOT NULL
+);
+"""
+
 # Migration from old schema (ideas -> signals)
 MIGRATION_V2 = """
 -- Rename ideas table to signals if it exists
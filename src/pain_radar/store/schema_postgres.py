@@ -0,0 +1,367 @@
+"""Postgres schema used by PostgresStore.
+
+Mirrors the tables of schema.SCHEMA so both stores return rows of the same
+shape: timestamps stay ISO text, JSON columns stay serialized text and vectors
+stay little-endian blobs (BYTEA), as callers already decode them.
+
+Full-text search uses a signals_search table of tsvectors in place of the
+FTS5 index (see SEARCH_SCHEMA).
+"""
+
+POSTGRES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id TEXT PRIMARY KEY,
+    subreddit TEXT NOT NULL,
+    title TEXT NOT NULL,
+    body TEXT,
+    created_utc BIGINT NOT NULL,
+    score INTEGER NOT NULL,
+    num_comments INTEGER NOT NULL,
+    url TEXT,
+    permalink TEXT,
+    fetched_at TEXT NOT NULL,
+    processed INTEGER DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS comments (
+    id BIGSERIAL PRIMARY KEY,
+    post_id TEXT NOT NULL REFERENCES posts(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    body TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS runs (
+    id BIGSERIAL PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    completed_at TEXT,
+    subreddits TEXT,  -- JSON array
+    posts_fetched INTEGER DEFAULT 0,
+    posts_analyzed INTEGER DEFAULT 0,
+    signals_saved INTEGER DEFAULT 0,
+    qualified_signals INTEGER DEFAULT 0,
+    not_extractable INTEGER DEFAULT 0,
+    errors INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'running',  -- running, completed, failed
+    report_path TEXT
+);
+
+CREATE TABLE IF NOT EXISTS signals (
+    id BIGSERIAL PRIMARY KEY,
+    post_id TEXT NOT NULL REFERENCES posts(id),
+    run_id BIGINT REFERENCES runs(id),
+    cluster_id TEXT,
+    extraction_state TEXT NOT NULL DEFAULT 'extracted',
+    not_extractable_reason TEXT,
+    signal_summary TEXT NOT NULL,
+    target_user TEXT,
+    pain_point TEXT,
+    proposed_solution TEXT,
+    evidence TEXT,  -- JSON array of EvidenceSignal objects
+    evidence_strength INTEGER DEFAULT 0,
+    evidence_strength_reason TEXT,
+    risk_flags TEXT,
+    evidence_signals TEXT,
+    disqualified INTEGER DEFAULT 0,
+    disqualify_reasons TEXT,
+    practicality INTEGER,
+    profitability INTEGER,
+    distribution INTEGER,
+    competition INTEGER,
+    moat INTEGER,
+    total_score INTEGER,
+    confidence DOUBLE PRECISION,
+    distribution_wedge TEXT,
+    distribution_wedge_detail TEXT,
+    competition_landscape TEXT,
+    why TEXT,
+    next_validation_steps TEXT,
+    created_at TEXT NOT NULL,
+    raw_extraction TEXT,
+    raw_score TEXT
+);
+
+CREATE TABLE IF NOT EXISTS evidence (
+    id BIGSERIAL PRIMARY KEY,
+    signal_id BIGINT NOT NULL REFERENCES signals(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    quote TEXT NOT NULL,
+    source TEXT,
+    comment_index INTEGER,
+    signal_type TEXT
+);
+
+CREATE TABLE IF NOT EXISTS source_sets (
+    id BIGSERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    description TEXT,
+    preset_key TEXT,
+    subreddits TEXT NOT NULL,  -- JSON array of subreddit names
+    listing TEXT DEFAULT 'new',
+    fetcher TEXT DEFAULT 'rss',
+    limit_per_sub INTEGER DEFAULT 25,
+    is_active INTEGER DEFAULT 1,
+    created_at TEXT NOT NULL,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS subreddit_state (
+    subreddit TEXT NOT NULL,
+    listing TEXT NOT NULL,
+    last_created_utc BIGINT NOT NULL,
+    last_post_id TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (subreddit, listing)
+);
+
+-- Clusters of similar signals, one set per week (see clustering.py)
+CREATE TABLE IF NOT EXISTS cluster_lineages (
+    id BIGSERIAL PRIMARY KEY,
+    title TEXT NOT NULL,
+    centroid BYTEA,  -- float32 (see vectors.py)
+    first_week TEXT NOT NULL,
+    last_week TEXT NOT NULL,
+    weeks_seen INTEGER DEFAULT 1,
+    last_signal_count INTEGER DEFAULT 0,
+    prev_signal_count INTEGER,
+    prev_streak INTEGER DEFAULT 0,
+    growth_streak INTEGER DEFAULT 0,
+    growth_rate DOUBLE PRECISION,
+    created_at TEXT NOT NULL,
+    updated_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS clusters (
+    id TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    week_start TEXT NOT NULL,  -- ISO date YYYY-MM-DD for the week
+    target_audience TEXT,
+    why_it_matters TEXT,
+    created_at TEXT NOT NULL,
+    generated_report TEXT,
+    centroid BYTEA,  -- float32 (see vectors.py)
+    signal_count INTEGER DEFAULT 0,
+    updated_at TEXT,
+    lineage_id BIGINT REFERENCES cluster_lineages(id)
+);
+
+CREATE TABLE IF NOT EXISTS watchlists (
+    id BIGSERIAL PRIMARY KEY,
+    name TEXT NOT NULL,
+    keywords TEXT NOT NULL,  -- JSON array
+    subreddits TEXT,  -- JSON array (null = all tracked subreddits)
+    notification_email TEXT,
+    notification_webhook TEXT,
+    tier TEXT DEFAULT 'free',
+    is_active INTEGER DEFAULT 1,
+    created_at TEXT NOT NULL,
+    updated_at TEXT,
+    last_checked_at TEXT,
+    total_matches INTEGER DEFAULT 0,
+    last_signal_id BIGINT DEFAULT 0,
+    description TEXT,
+    description_vector BYTEA,  -- float32
+    embedding_model TEXT,
+    semantic_threshold DOUBLE PRECISION,
+    query TEXT
+);
+
+CREATE TABLE IF NOT EXISTS alert_matches (
+    id BIGSERIAL PRIMARY KEY,
+    watchlist_id BIGINT NOT NULL REFERENCES watchlists(id),
+    signal_id BIGINT NOT NULL REFERENCES signals(id) ON DELETE CASCADE,
+    keyword_matched TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    notified INTEGER DEFAULT 0,
+    notified_at TEXT
+);
+
+CREATE TABLE IF NOT EXISTS signal_embeddings (
+    signal_id BIGINT NOT NULL REFERENCES signals(id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    dim INTEGER NOT NULL,
+    vector BYTEA NOT NULL,  -- float16 little-endian
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (signal_id, model)
+);
+
+CREATE TABLE IF NOT EXISTS embedding_models (
+    model TEXT PRIMARY KEY,
+    version INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT
+);
+
+-- Columns added after release
+ALTER TABLE source_sets ADD COLUMN IF NOT EXISTS fetcher TEXT DEFAULT 'rss';
+
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit ON posts(subreddit);
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit_created ON posts(subreddit, created_utc);
+CREATE INDEX IF NOT EXISTS idx_posts_unprocessed ON posts(score DESC) WHERE processed = 0;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id, position);
+CREATE INDEX IF NOT EXISTS idx_signals_post_id ON signals(post_id);
+CREATE INDEX IF NOT EXISTS idx_signals_cluster_id ON signals(cluster_id);
+CREATE INDEX IF NOT EXISTS idx_signals_created_at ON signals(created_at);
+CREATE INDEX IF NOT EXISTS idx_signals_rank ON signals(disqualified, total_score DESC, id);
+CREATE INDEX IF NOT EXISTS idx_signals_run_rank ON signals(run_id, total_score DESC, id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_signals_post_run_unique ON signals(post_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_evidence_signal_id ON evidence(signal_id, position);
+CREATE INDEX IF NOT EXISTS idx_evidence_signal_type ON evidence(signal_type);
+CREATE INDEX IF NOT EXISTS idx_source_sets_active ON source_sets(is_active);
+CREATE INDEX IF NOT EXISTS idx_source_sets_preset ON source_sets(preset_key);
+CREATE INDEX IF NOT EXISTS idx_clusters_week ON clusters(week_start);
+CREATE INDEX IF NOT EXISTS idx_clusters_lineage_id ON clusters(lineage_id);
+CREATE INDEX IF NOT EXISTS idx_cluster_lineages_growth ON cluster_lineages(growth_streak DESC, last_week DESC);
+CREATE INDEX IF NOT EXISTS idx_cluster_lineages_last_week ON cluster_lineages(last_week);
+CREATE INDEX IF NOT EXISTS idx_signal_embeddings_hash ON signal_embeddings(model, content_hash);
+CREATE INDEX IF NOT EXISTS idx_watchlists_active ON watchlists(is_active);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_alert_matches_unique ON alert_matches(watchlist_id, signal_id);
+CREATE INDEX IF NOT EXISTS idx_alert_matches_signal_id ON alert_matches(signal_id);
+CREATE INDEX IF NOT EXISTS idx_alert_matches_notified ON alert_matches(notified);
+"""
+
+# Staging table for bulk-imported comments (see PostgresStore.stage_import_comments).
+# A regular table rather than TEMP, as each call may borrow a different pooled
+# connection; UNLOGGED because it is dropped once the import ends.
+IMPORT_COMMENTS_TABLE = """
+CREATE UNLOGGED TABLE IF NOT EXISTS import_comments (
+    seq BIGSERIAL,
+    post_id TEXT NOT NULL,
+    score INTEGER,
+    body TEXT
+)
+"""
+
+# Full-text search over signals and their posts, in place of the FTS5 index.
+# signals_search keeps one tsvector per query language field (see
+# query.FIELDS), which field-scoped terms match against, and a weighted
+# document of all of them, which the GIN index prefilters and ranks on.
+# Triggers keep it in sync and are recreated on every init. Stemming follows
+# the porter tokenizer of the SQLite index: English stems, no stop words.
+SEARCH_SCHEMA = """
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_dict WHERE dictname = 'pain_radar_stem') THEN
+        CREATE TEXT SEARCH DICTIONARY pain_radar_stem (TEMPLATE = snowball, LANGUAGE = english);
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_ts_config WHERE cfgname = 'pain_radar') THEN
+        CREATE TEXT SEARCH CONFIGURATION pain_radar (COPY = english);
+        ALTER TEXT SEARCH CONFIGURATION pain_radar
+            ALTER MAPPING FOR asciiword, asciihword, hword_asciipart, word, hword, hword_part WITH pain_radar_stem;
+    END IF;
+END
+$$;
+
+CREATE TABLE IF NOT EXISTS signals_search (
+    signal_id BIGINT PRIMARY KEY REFERENCES signals(id) ON DELETE CASCADE,
+    signal_summary TSVECTOR NOT NULL,
+    pain_point TSVECTOR NOT NULL,
+    target_user TSVECTOR NOT NULL,
+    evidence TSVECTOR NOT NULL,
+    post_title TSVECTOR NOT NULL,
+    subreddit TSVECTOR NOT NULL,
+    document TSVECTOR NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_signals_search_document ON signals_search USING GIN (document);
+
+-- Evidence quotes of a signals.evidence JSON array as one text (null if it isn't valid JSON)
+CREATE OR REPLACE FUNCTION pain_radar_evidence_text(evidence TEXT) RETURNS TEXT
+LANGUAGE plpgsql IMMUTABLE AS $$
+BEGIN
+    RETURN (
+        SELECT string_agg(
+            CASE jsonb_typeof(e) WHEN 'object' THEN e ->> 'quote' WHEN 'string' THEN e #>> '{}' END, ' '
+        )
+        FROM jsonb_array_elements(evidence::jsonb) e
+    );
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION pain_radar_index_signals(signal_ids BIGINT[]) RETURNS BIGINT
+LANGUAGE sql AS $$
+    WITH indexed AS (
+        INSERT INTO signals_search
+            (signal_id, signal_summary, pain_point, target_user, evidence, post_title, subreddit, document)
+        SELECT s.id, v.signal_summary, v.pain_point, v.target_user, v.evidence, v.post_title, v.subreddit,
+               setweight(v.signal_summary, 'A') || setweight(v.pain_point, 'A') || setweight(v.target_user, 'B')
+               || setweight(v.evidence, 'C') || setweight(v.post_title, 'C') || setweight(v.subreddit, 'D')
+        FROM signals s
+        LEFT JOIN posts p ON p.id = s.post_id
+        CROSS JOIN LATERAL (
+            SELECT to_tsvector('pain_radar', COALESCE(s.signal_summary, '')) AS signal_summary,
+                   to_tsvector('pain_radar', COALESCE(s.pain_point, '')) AS pain_point,
+                   to_tsvector('pain_radar', COALESCE(s.target_user, '')) AS target_user,
+                   to_tsvector('pain_radar', COALESCE(pain_radar_evidence_text(s.evidence), '')) AS evidence,
+                   to_tsvector('pain_radar', COALESCE(p.title, '')) AS post_title,
+                   to_tsvector('pain_radar', COALESCE(p.subreddit, '')) AS subreddit
+        ) v
+        WHERE s.id = ANY(signal_ids)
+        ON CONFLICT (signal_id) DO UPDATE SET
+            signal_summary = EXCLUDED.signal_summary,
+            pain_point = EXCLUDED.pain_point,
+            target_user = EXCLUDED.target_user,
+            evidence = EXCLUDED.evidence,
+            post_title = EXCLUDED.post_title,
+            subreddit = EXCLUDED.subreddit,
+            document = EXCLUDED.document
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM indexed
+$$;
+
+CREATE OR REPLACE FUNCTION signals_search_signal_changed() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pain_radar_index_signals(ARRAY[NEW.id]);
+    RETURN NULL;
+END
+$$;
+
+CREATE OR REPLACE FUNCTION signals_search_post_changed() RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM pain_radar_index_signals(ARRAY(SELECT id FROM signals WHERE post_id = NEW.id));
+    RETURN NULL;
+END
+$$;
+
+DROP TRIGGER IF EXISTS signals_search_insert ON signals;
+CREATE TRIGGER signals_search_insert AFTER INSERT ON signals
+    FOR EACH ROW EXECUTE FUNCTION signals_search_signal_changed();
+
+DROP TRIGGER IF EXISTS signals_search_update ON signals;
+CREATE TRIGGER signals_search_update
+    AFTER UPDATE OF signal_summary, pain_point, target_user, evidence, post_id ON signals
+    FOR EACH ROW EXECUTE FUNCTION signals_search_signal_changed();
+
+-- upsert_posts rewrites every refetched post, so only real changes reindex
+DROP TRIGGER IF EXISTS posts_search_update ON posts;
+CREATE TRIGGER posts_search_update AFTER UPDATE OF title, subreddit ON posts
+    FOR EACH ROW WHEN (OLD.title IS DISTINCT FROM NEW.title OR OLD.subreddit IS DISTINCT FROM NEW.subreddit)
+    EXECUTE FUNCTION signals_search_post_changed();
+"""
+
+# Indexes signals that existed before signals_search was created
+SEARCH_BACKFILL = """
+SELECT pain_radar_index_signals(ARRAY(
+    SELECT s.id FROM signals s WHERE NOT EXISTS (SELECT 1 FROM signals_search ss WHERE ss.signal_id = s.id)
+))
+"""
+
+# Comments of post alias {post} as a JSON array, like schema.COMMENTS_JSON
+COMMENTS_JSON = """(
+    SELECT COALESCE(json_agg(c.body ORDER BY c.position), '[]')::text FROM comments c WHERE c.post_id = {post}.id
+)"""
+
+STATS_AGGREGATE = """
+SELECT
+    (SELECT COUNT(*) FROM posts),
+    (SELECT COUNT(*) FROM posts WHERE processed = 1),
+    (SELECT COUNT(*) FROM signals),
+    (SELECT COUNT(*) FROM signals WHERE disqualified = 0),
+    (SELECT COUNT(total_score) FROM signals WHERE disqualified = 0),
+    (SELECT COALESCE(SUM(total_score), 0)::bigint FROM signals WHERE disqualified = 0)
+"""
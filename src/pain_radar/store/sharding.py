@@ -0,0 +1,204 @@
+"""Per-tenant SQLite shards behind a routing layer.
+
+In SQLite mode every tenant sharing one file would also share its single write
+lock. ShardRouter gives each tenant its own database file instead, recorded in
+a small catalog database, so writes for different tenants never wait on each
+other. Shard stores are opened on first use and kept in an LRU of open
+connections; stores in use are pinned and never closed under a caller.
+Admin queries fan out over every shard concurrently.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from collections import Counter, OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TypeVar
+
+import aiosqlite
+
+from ..logging_config import get_logger
+from .core import AsyncStore
+from .schema import SHARD_CATALOG_SCHEMA
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CATALOG_FILE = "catalog.sqlite3"
+
+# Open shard stores kept before the least recently used unpinned one is closed
+MAX_OPEN_SHARDS = 32
+
+# Tenant IDs become file names; UUIDs and slugs both fit
+_TENANT_ID = re.compile(r"[A-Za-z0-9][A-Za-z0-9_-]{0,63}")
+
+
+class ShardRouter:
+    """Maps tenants to their own SQLite databases."""
+
+    def __init__(self, shard_dir: str, max_open: int = MAX_OPEN_SHARDS, match_on_write: bool = True):
+        """Initialize the router.
+
+        Args:
+            shard_dir: Directory holding the catalog and shard files
+            max_open: Open shard stores kept in the LRU
+            match_on_write: Passed to each shard's AsyncStore
+        """
+        self.shard_dir = Path(shard_dir)
+        self.max_open = max_open
+        self.match_on_write = match_on_write
+        self._catalog: aiosqlite.Connection | None = None
+        self._open: OrderedDict[str, AsyncStore] = OrderedDict()
+        self._pins: Counter[str] = Counter()
+        self._lock = asyncio.Lock()
+
+    async def connect(self) -> None:
+        """Open the catalog, creating the shard directory if needed."""
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        self._catalog = await aiosqlite.connect(self.shard_dir / CATALOG_FILE)
+        self._catalog.row_factory = aiosqlite.Row
+        await self._catalog.executescript(SHARD_CATALOG_SCHEMA)
+        await self._catalog.commit()
+
+    async def close(self) -> None:
+        """Close every open shard and the catalog."""
+        async with self._lock:
+            while self._open:
+                _, store = self._open.popitem(last=False)
+                await store.close()
+            self._pins.clear()
+        if self._catalog:
+            await self._catalog.close()
+            self._catalog = None
+
+    async def _get_catalog(self) -> aiosqlite.Connection:
+        if not self._catalog:
+            await self.connect()
+        return self._catalog
+
+    async def tenants(self) -> list[dict]:
+        """List tenants with a shard.
+
+        Returns:
+            Catalog rows (tenant_id, db_path, created_at), oldest first
+        """
+        catalog = await self._get_catalog()
+        cursor = await catalog.execute("SELECT * FROM tenant_shards ORDER BY created_at, tenant_id")
+        return [dict(row) for row in await cursor.fetchall()]
+
+    async def _shard_path(self, tenant_id: str, create: bool) -> Path:
+        """Look up a tenant's shard file, registering a new one if allowed.
+
+        Raises:
+            ValueError: If the tenant ID is not a valid shard name
+            KeyError: If the tenant has no shard and create is False
+        """
+        if not _TENANT_ID.fullmatch(tenant_id):
+            raise ValueError(f"Invalid tenant ID: {tenant_id!r}")
+
+        catalog = await self._get_catalog()
+        cursor = await catalog.execute("SELECT db_path FROM tenant_shards WHERE tenant_id = ?", (tenant_id,))
+        row = await cursor.fetchone()
+        if row:
+            return self.shard_dir / row["db_path"]
+        if not create:
+            raise KeyError(f"No shard for tenant {tenant_id!r}")
+
+        db_path = f"tenant_{tenant_id}.sqlite3"
+        await catalog.execute(
+            "INSERT INTO tenant_shards (tenant_id, db_path, created_at) VALUES (?, ?, ?)",
+            (tenant_id, db_path, datetime.now(UTC).isoformat()),
+        )
+        await catalog.commit()
+        logger.info("shard_created", tenant_id=tenant_id, db_path=db_path)
+        return self.shard_dir / db_path
+
+    async def _acquire(self, tenant_id: str, create: bool) -> AsyncStore:
+        async with self._lock:
+            store = self._open.get(tenant_id)
+            if store is not None:
+                self._open.move_to_end(tenant_id)
+            else:
+                path = await self._shard_path(tenant_id, create)
+                store = AsyncStore(str(path), match_on_write=self.match_on_write)
+                await store.connect()
+                await store.init_db()
+                self._open[tenant_id] = store
+            self._pins[tenant_id] += 1
+            await self._evict()
+        return store
+
+    async def _release(self, tenant_id: str) -> None:
+        async with self._lock:
+            self._pins[tenant_id] -= 1
+            if self._pins[tenant_id] <= 0:
+                del self._pins[tenant_id]
+            await self._evict()
+
+    async def _evict(self) -> None:
+        """Close least recently used unpinned shards beyond max_open (lock held)."""
+        excess = len(self._open) - self.max_open
+        for tenant_id in [t for t in self._open if not self._pins[t]][: max(excess, 0)]:
+            await self._open.pop(tenant_id).close()
+            logger.debug("shard_closed", tenant_id=tenant_id)
+
+    @asynccontextmanager
+    async def store(self, tenant_id: str, create: bool = True) -> AsyncIterator[AsyncStore]:
+        """Borrow a tenant's store, opening (and on first use creating) its shard.
+
+        Args:
+            tenant_id: Tenant ID
+            create: Create the shard if the tenant has none yet
+
+        Yields:
+            Connected AsyncStore for the tenant's shard
+
+        Raises:
+            ValueError: If the tenant ID is not a valid shard name
+            KeyError: If the tenant has no shard and create is False
+        """
+        store = await self._acquire(tenant_id, create)
+        try:
+            yield store
+        finally:
+            await self._release(tenant_id)
+
+    async def fan_out(self, query: Callable[[AsyncStore], Awaitable[T]], concurrency: int = 8) -> dict[str, T]:
+        """Run a query against every shard.
+
+        Args:
+            query: Coroutine function taking a shard's store
+            concurrency: Shards queried at once
+
+        Returns:
+            Tenant ID to the query's result
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run(tenant_id: str) -> tuple[str, T]:
+            async with semaphore, self.store(tenant_id, create=False) as store:
+                return tenant_id, await query(store)
+
+        results = await asyncio.gather(*(_run(t["tenant_id"]) for t in await self.tenants()))
+        return dict(results)
+
+    async def get_stats(self) -> dict:
+        """Get statistics per tenant and across all shards.
+
+        Returns:
+            {"tenants": tenant ID to get_stats dict, "total": combined stats}
+        """
+        per_tenant = await self.fan_out(lambda store: store.get_stats())
+        total = {
+            key: sum(stats[key] for stats in per_tenant.values())
+            for key in ("total_posts", "processed_posts", "total_signals", "qualified_signals")
+        }
+        # Each shard's average is over its qualified signals
+        weighted = sum(stats["avg_score"] * stats["qualified_signals"] for stats in per_tenant.values())
+        total["avg_score"] = round(weighted / total["qualified_signals"], 2) if total["qualified_signals"] else 0
+        return {"tenants": per_tenant, "total": total}
@@ -0,0 +1,247 @@
+"""Local text vectors and deterministic grouping for pain signals.
+
+Uses feature hashing over word unigrams and bigrams, so vectors need no
+fitted vocabulary and stay comparable across runs. Grouping is average-linkage
+agglomerative clustering on cosine similarity, which is reproducible for the
+same input.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import zlib
+from collections import Counter
+from collections.abc import Sequence
+
+import numpy as np
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Number of hashed feature buckets per vector
+DEFAULT_DIM = 512
+
+# Minimum average cosine similarity for two groups to be merged
+DEFAULT_SIMILARITY_THRESHOLD = 0.3
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'+#.-]*[a-z0-9+#]|[a-z0-9]")
+
+STOPWORDS = frozenset(
+    """
+    a about above after again against all am an and any are as at be because been before being below between
+    both but by can could did do does doing during each few for from further had has have having he her
+    here hers him his how i if in into is it its itself just me more most my no nor not now of off on once only
+    or other our ours out over own same she should so some such than that the their theirs them then there these
+    they this those through to too under until very was we were what when where which while who whom why will
+    with would you your yours get gets got really much many also even still way want wants need needs user users
+    people someone something thing things one lot lots
+    """.split()
+)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens, dropping stopwords.
+
+    Args:
+        text: Input text
+
+    Returns:
+        List of tokens
+    """
+    return [t for t in _TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def _features(tokens: list[str]) -> Counter[str]:
+    """Count unigram and bigram features for a token list."""
+    feats: Counter[str] = Counter(tokens)
+    feats.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:], strict=False))
+    return feats
+
+
+class HashingVectorizer:
+    """Stateless hashed n-gram vectorizer.
+
+    Each feature is hashed with CRC32 (stable across processes, unlike
+    ``hash()``) into one of ``dim`` buckets with a hash-derived sign, weighted
+    by sublinear term frequency, and the vector is L2-normalized.
+    """
+
+    def __init__(self, dim: int = DEFAULT_DIM):
+        """Initialize the vectorizer.
+
+        Args:
+            dim: Number of hash buckets (vector dimensionality)
+        """
+        self.dim = dim
+
+    def transform_one(self, text: str) -> np.ndarray:
+        """Vectorize a single text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            L2-normalized float32 vector of length ``dim`` (all zeros for empty text)
+        """
+        vec = np.zeros(self.dim, dtype=np.float32)
+        for feat, count in _features(tokenize(text)).items():
+            h = zlib.crc32(feat.encode("utf-8"))
+            sign = 1.0 if h & 0x80000000 else -1.0
+            vec[h % self.dim] += sign * (1.0 + math.log(count))
+        norm = float(np.linalg.norm(vec))
+        if norm > 0:
+            vec /= norm
+        return vec
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """Vectorize a batch of texts.
+
+        Args:
+            texts: Input texts
+
+        Returns:
+            Matrix of shape (len(texts), dim)
+        """
+        if not texts:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.transform_one(t) for t in texts])
+
+
+def signal_text(summary: str | None, pain_point: str | None) -> str:
+    """Build the text used to vectorize a pain signal.
+
+    Args:
+        summary: Signal summary
+        pain_point: Pain point description
+
+    Returns:
+        Combined text
+    """
+    return f"{summary or ''} {pain_point or ''}".strip()
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """L2-normalize each row of a matrix, leaving zero rows untouched."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def agglomerative_groups(
+    vectors: np.ndarray,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    min_size: int = 2,
+) -> list[list[int]]:
+    """Group row vectors with average-linkage agglomerative clustering.
+
+    Repeatedly merges the pair of groups with the highest mean pairwise cosine
+    similarity until no pair reaches ``threshold``. Ties are broken by lowest
+    index, so the result is deterministic.
+
+    Group similarities are updated in place with the Lance-Williams formula
+    and each row caches its most similar neighbour, so a merge costs O(n)
+    apart from the few rows whose cached neighbour was one of the merged
+    groups. Clustering a few thousand signals takes well under a second.
+
+    Args:
+        vectors: L2-normalized row vectors
+        threshold: Minimum average similarity for a merge
+        min_size: Groups smaller than this are dropped
+
+    Returns:
+        Lists of row indices, largest group first
+    """
+    n = vectors.shape[0]
+    if n == 0:
+        return []
+
+    # sim[i, j] holds the average pairwise similarity between groups i and j
+    sim = (vectors @ vectors.T).astype(np.float64)
+    np.fill_diagonal(sim, -np.inf)
+    sizes = np.ones(n, dtype=np.float64)
+    active = np.ones(n, dtype=bool)
+    members: list[list[int]] = [[i] for i in range(n)]
+
+    best_idx = np.argmax(sim, axis=1)
+    best_val = sim[np.arange(n), best_idx]
+
+    while True:
+        i = int(np.argmax(best_val))
+        if not best_val[i] >= threshold:
+            break
+        j = int(best_idx[i])
+        if j < i:
+            i, j = j, i
+
+        # Merge j into i
+        merged = (sizes[i] * sim[i] + sizes[j] * sim[j]) / (sizes[i] + sizes[j])
+        merged[~active] = -np.inf
+        merged[[i, j]] = -np.inf
+        sim[i, :] = merged
+        sim[:, i] = merged
+        sim[j, :] = -np.inf
+        sim[:, j] = -np.inf
+        sizes[i] += sizes[j]
+        members[i].extend(members[j])
+        members[j] = []
+        active[j] = False
+        best_val[j] = -np.inf
+
+        # Rows whose cached neighbour was merged need a full rescan
+        stale = active & ((best_idx == i) | (best_idx == j))
+        stale[i] = True
+        for k in np.flatnonzero(stale):
+            best_idx[k] = int(np.argmax(sim[k]))
+            best_val[k] = sim[k, best_idx[k]]
+
+        # Everyone else only needs comparing against the merged group
+        better = active & ~stale & ((merged > best_val) | ((merged == best_val) & (i < best_idx)))
+        best_idx[better] = i
+        best_val[better] = merged[better]
+
+    groups = [sorted(m) for m in members if len(m) >= min_size]
+    groups.sort(key=lambda g: (-len(g), g[0]))
+    logger.debug("agglomerative_grouping_complete", items=n, groups=len(groups))
+    return groups
+
+
+def centroid(vectors: np.ndarray) -> np.ndarray:
+    """Compute the L2-normalized mean of row vectors.
+
+    Args:
+        vectors: Row vectors
+
+    Returns:
+        Normalized centroid vector
+    """
+    mean = vectors.mean(axis=0)
+    norm = float(np.linalg.norm(mean))
+    return (mean / norm).astype(np.float32) if norm > 0 else mean.astype(np.float32)
+
+
+def to_blob(vec: np.ndarray, dtype: str = "<f4") -> bytes:
+    """Serialize a vector as raw little-endian float bytes for storage.
+
+    Args:
+        vec: Vector to serialize
+        dtype: Storage dtype ("<f4" for float32, "<f2" for float16)
+
+    Returns:
+        Raw bytes
+    """
+    return np.asarray(vec, dtype=dtype).tobytes()
+
+
+def from_blob(blob: bytes, dtype: str = "<f4") -> np.ndarray:
+    """Deserialize a vector stored with ``to_blob``.
+
+    Args:
+        blob: Raw bytes
+        dtype: Storage dtype used when serializing
+
+    Returns:
+        float32 vector
+    """
+    return np.frombuffer(blob, dtype=dtype).astype(np.float32)
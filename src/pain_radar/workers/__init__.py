@@ -1,7 +1,7 @@
 """Pain Radar Pro background workers.
 
 This package contains background job workers:
-- scheduler.py: Cron job scheduler for weekly runs
+- scheduler.py: Adaptive per-subreddit polling scheduler
 - pipeline_worker.py: Pipeline execution worker
 - delivery_worker.py: Email/webhook delivery worker
 """
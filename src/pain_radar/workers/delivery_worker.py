@@ -0,0 +1,209 @@
+"""Webhook delivery of watchlist matches.
+
+Unnotified alert matches are grouped per recipient into digest payloads (one
+POST per webhook instead of one per match), sent concurrently over a single
+pooled ``httpx.AsyncClient`` with a per-host concurrency limit, retried with
+exponential backoff on transient failures, and marked notified in one bulk
+update once delivered.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..logging_config import get_logger
+from ..retry_policy import HTTP_TRANSIENT_EXCEPTIONS, TransientHTTPError, check_response_for_retry
+from ..store import AsyncStore
+
+logger = get_logger(__name__)
+
+# Matches per webhook payload; larger groups are split into several digests
+DIGEST_SIZE = 200
+
+# Concurrent requests to any one host
+PER_HOST_LIMIT = 4
+
+# Delivery attempts per digest before giving up until the next run
+MAX_ATTEMPTS = 4
+
+DEFAULT_TIMEOUT = httpx.Timeout(timeout=15.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+
+@dataclass
+class DeliveryResult:
+    """Outcome of one delivery pass."""
+
+    digests_sent: int = 0
+    digests_failed: int = 0
+    matches_notified: int = 0
+    matches_pending: int = 0  # Left for a later run (failed, or no webhook to deliver to)
+    failures: dict[str, str] = field(default_factory=dict)  # webhook URL -> last error
+
+
+def build_digest(recipient: str, matches: list[dict]) -> dict:
+    """Build the JSON payload delivered to one recipient.
+
+    Args:
+        recipient: Webhook URL the digest is for
+        matches: Unnotified match rows (from get_unnotified_matches)
+
+    Returns:
+        Payload dict
+    """
+    return {
+        "recipient": recipient,
+        "generated_at": datetime.now(UTC).isoformat(),
+        "count": len(matches),
+        "matches": [
+            {
+                "match_id": m["id"],
+                "watchlist_id": m["watchlist_id"],
+                "watchlist_name": m["watchlist_name"],
+                "keyword_matched": m["keyword_matched"],
+                "signal_id": m["signal_id"],
+                "signal_summary": m["signal_summary"],
+                "pain_point": m["pain_point"],
+                "subreddit": m["subreddit"],
+                "url": m["url"],
+            }
+            for m in matches
+        ],
+    }
+
+
+class DeliveryWorker:
+    """Sends pending watchlist matches to their webhooks."""
+
+    def __init__(
+        self,
+        store: AsyncStore,
+        client: httpx.AsyncClient | None = None,
+        per_host_limit: int = PER_HOST_LIMIT,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff: float = 1.0,
+        digest_size: int = DIGEST_SIZE,
+    ):
+        """Initialize the worker.
+
+        Args:
+            store: Connected store
+            client: HTTP client to reuse (a pooled client is created per run if not given)
+            per_host_limit: Maximum concurrent requests per webhook host
+            max_attempts: Attempts per digest, including the first
+            backoff: Base delay in seconds, doubled after each failed attempt
+            digest_size: Maximum matches per payload
+        """
+        self.store = store
+        self.client = client
+        self.per_host_limit = per_host_limit
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.digest_size = digest_size
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._host_limits[host]
+
+    async def _send(self, client: httpx.AsyncClient, url: str, payload: dict) -> None:
+        """POST one digest, retrying transient failures with exponential backoff.
+
+        Raises:
+            httpx.HTTPError or TransientHTTPError: If every attempt failed
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                async with self._host_limit(url):
+                    response = await client.post(url, json=payload)
+                check_response_for_retry(response)
+                response.raise_for_status()
+                return
+            except (*HTTP_TRANSIENT_EXCEPTIONS, TransientHTTPError) as e:
+                if attempt == self.max_attempts:
+                    raise
+                retry_after = getattr(e, "retry_after", None)
+                delay = retry_after if retry_after is not None else self.backoff * 2 ** (attempt - 1)
+                logger.warning("delivery_retry", url=url, attempt=attempt, wait_seconds=delay, error=str(e)[:100])
+                await asyncio.sleep(delay)
+
+    async def run_once(self, watchlist_id: int | None = None) -> DeliveryResult:
+        """Deliver all unnotified matches that have a webhook.
+
+        Args:
+            watchlist_id: Only deliver this watchlist's matches
+
+        Returns:
+            DeliveryResult with counts
+        """
+        pending = await self.store.get_unnotified_matches(watchlist_id=watchlist_id)
+        result = DeliveryResult()
+
+        by_recipient: dict[str, list[dict]] = defaultdict(list)
+        for match in pending:
+            if match.get("notification_webhook"):
+                by_recipient[match["notification_webhook"]].append(match)
+            else:
+                # Email delivery needs an outbound mail setup this tool doesn't have
+                result.matches_pending += 1
+
+        batches = [
+            (url, matches[start : start + self.digest_size])
+            for url, matches in by_recipient.items()
+            for start in range(0, len(matches), self.digest_size)
+        ]
+        if not batches:
+            return result
+
+        async def _deliver(client: httpx.AsyncClient, url: str, matches: list[dict]) -> list[int]:
+            try:
+                await self._send(client, url, build_digest(url, matches))
+            except (httpx.HTTPError, TransientHTTPError) as e:
+                result.digests_failed += 1
+                result.matches_pending += len(matches)
+                result.failures[url] = str(e)[:200]
+                logger.error("delivery_failed", url=url, matches=len(matches), error=str(e)[:200])
+                return []
+            result.digests_sent += 1
+            return [m["id"] for m in matches]
+
+        if self.client is not None:
+            delivered = await asyncio.gather(*(_deliver(self.client, url, m) for url, m in batches))
+        else:
+            async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT, limits=DEFAULT_LIMITS) as client:
+                delivered = await asyncio.gather(*(_deliver(client, url, m) for url, m in batches))
+
+        notified = [match_id for ids in delivered for match_id in ids]
+        await self.store.mark_matches_notified(notified)
+        result.matches_notified = len(notified)
+
+        logger.info(
+            "deliveries_completed",
+            digests_sent=result.digests_sent,
+            digests_failed=result.digests_failed,
+            matches_notified=result.matches_notified,
+            matches_pending=result.matches_pending,
+        )
+        return result
+
+
+async def deliver_pending(store: AsyncStore, watchlist_id: int | None = None, **kwargs) -> DeliveryResult:
+    """Run one delivery pass with a fresh worker.
+
+    Args:
+        store: Connected store
+        watchlist_id: Only deliver this watchlist's matches
+        **kwargs: DeliveryWorker options
+
+    Returns:
+        DeliveryResult with counts
+    """
+    return await DeliveryWorker(store, **kwargs).run_once(watchlist_id=watchlist_id)
@@ -0,0 +1,313 @@
+"""Adaptive per-subreddit polling.
+
+Each subreddit is polled on its own interval, sized from how fast it gets
+new posts: the arrival rate is learned from the ``created_utc`` of the posts
+already stored, and the next poll is scheduled for when about half a page of
+new posts is expected. A busy subreddit is then polled before posts can
+scroll off its ``new`` listing, and a quiet one isn't fetched every run for
+nothing.
+
+After each poll the rate is corrected with the number of new posts found. A
+poll that comes back with a full page may have missed posts, so the rate is
+doubled rather than trusted.
+
+``pain-radar poll`` runs the scheduler as a long-lived loop that fetches only
+the subreddits that are due, through the same incremental path as ``fetch``
+(see pipeline.fetch_and_store).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from ..config import Settings
+from ..logging_config import get_logger
+from ..pipeline import fetch_and_store
+from ..reddit_async import RSS_PAGE_SIZE
+from ..store import AsyncStore
+
+logger = get_logger(__name__)
+
+# Polls always read the newest-first listing, where high-water marks apply
+POLL_LISTING = "new"
+
+# How far back stored posts are used to learn each subreddit's rate
+VELOCITY_WINDOW = 7 * 86400
+
+# Fraction of a page expected to be new by the next poll
+HEADROOM = 0.5
+
+MIN_INTERVAL = 300
+MAX_INTERVAL = 86400
+
+# Shortest span a rate is measured over, so a handful of posts can't imply a burst
+MIN_SPAN = 3600
+
+# Weight of the latest poll's observed rate against the current estimate
+RATE_SMOOTHING = 0.5
+
+# How often the subreddit list and stored rates are reloaded
+REFRESH_INTERVAL = 3600
+
+
+@dataclass
+class SubredditSchedule:
+    """Polling state of one subreddit."""
+
+    subreddit: str
+    fetcher: str
+    rate: float  # Expected new posts per second
+    next_poll: float
+    last_poll: float | None = None
+    last_new_posts: int = 0
+
+    @property
+    def posts_per_hour(self) -> float:
+        """Expected new posts per hour."""
+        return self.rate * 3600
+
+
+@dataclass
+class PollResult:
+    """Outcome of one polling pass."""
+
+    subreddits_polled: int = 0
+    posts_new: int = 0
+    saturated: list[str] = field(default_factory=list)  # Polls that returned a full page
+    next_poll_in: float | None = None  # Seconds until the next subreddit is due
+
+
+@dataclass
+class _PollSettings:
+    """pipeline.FetchSettings for the due subreddits."""
+
+    subreddits: list[str]
+    fetchers: dict[str, str]
+    posts_per_subreddit: int
+    top_comments: int
+    max_concurrency: int
+    user_agent: str
+    listing: str = POLL_LISTING
+
+
+class PollScheduler:
+    """Polls each subreddit when enough new posts are expected."""
+
+    def __init__(
+        self,
+        store: AsyncStore,
+        settings: Settings,
+        fetchers: dict[str, str] | None = None,
+        min_interval: float = MIN_INTERVAL,
+        max_interval: float = MAX_INTERVAL,
+        headroom: float = HEADROOM,
+        window: int = VELOCITY_WINDOW,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            store: Connected store
+            settings: Application settings (posts_per_subreddit, top_comments,
+                max_concurrency, user_agent)
+            fetchers: Subreddits to poll and their fetchers (None = the active
+                source sets, reloaded on each refresh)
+            min_interval: Shortest time between polls of a subreddit, in seconds
+            max_interval: Longest time between polls of a subreddit, in seconds
+            headroom: Fraction of a page expected to be new by the next poll
+            window: How far back stored posts are used to learn rates, in seconds
+            clock: Returns the current unix time
+        """
+        self.store = store
+        self.settings = settings
+        self.fetchers = fetchers
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.headroom = headroom
+        self.window = window
+        self.clock = clock
+        self.schedules: dict[str, SubredditSchedule] = {}
+        self._refreshed_at: float | None = None
+
+    def capacity(self, fetcher: str) -> int:
+        """Most posts one poll can return with a fetcher."""
+        limit = self.settings.posts_per_subreddit
+        return limit if fetcher == "json" else min(limit, RSS_PAGE_SIZE)
+
+    def interval(self, schedule: SubredditSchedule) -> float:
+        """Seconds until a subreddit is expected to have filled the headroom."""
+        if schedule.rate <= 0:
+            return self.max_interval
+        expected = self.capacity(schedule.fetcher) * self.headroom
+        return min(max(expected / schedule.rate, self.min_interval), self.max_interval)
+
+    async def refresh(self) -> None:
+        """Reload the subreddits to poll and learn their rates from stored posts.
+
+        Polling state of subreddits already scheduled is kept. A new subreddit
+        is first due one interval after its newest stored post, or now if it
+        has none.
+        """
+        now = self.clock()
+        since = int(now - self.window)
+        fetchers = self.fetchers if self.fetchers is not None else await self.store.get_active_subreddit_fetchers()
+        velocity = await self.store.get_post_velocity(since)
+
+        schedules: dict[str, SubredditSchedule] = {}
+        for subreddit, fetcher in fetchers.items():
+            key = subreddit.lower()
+            stats = velocity.get(key)
+            rate = 0.0
+            if stats:
+                span = max(now - max(since, stats["oldest_utc"]), MIN_SPAN)
+                rate = stats["posts"] / span
+
+            schedule = self.schedules.get(key)
+            if schedule is not None:
+                schedule.subreddit, schedule.fetcher = subreddit, fetcher
+                if schedule.last_poll is None:
+                    schedule.rate = rate
+            else:
+                schedule = SubredditSchedule(subreddit=subreddit, fetcher=fetcher, rate=rate, next_poll=now)
+                if stats:
+                    schedule.next_poll = min(stats["newest_utc"] + self.interval(schedule), now + self.max_interval)
+            schedules[key] = schedule
+
+        self.schedules = schedules
+        self._refreshed_at = now
+        logger.info("poll_schedule_refreshed", subreddits=len(schedules), with_history=len(velocity))
+
+    def due(self, now: float | None = None) -> list[SubredditSchedule]:
+        """Subreddits whose next poll time has passed, most overdue first."""
+        now = self.clock() if now is None else now
+        return sorted((s for s in self.schedules.values() if s.next_poll <= now), key=lambda s: s.next_poll)
+
+    def next_poll_in(self, now: float | None = None) -> float | None:
+        """Seconds until the next subreddit is due (None if none are scheduled)."""
+        now = self.clock() if now is None else now
+        if not self.schedules:
+            return None
+        return max(min(s.next_poll for s in self.schedules.values()) - now, 0.0)
+
+    def _update(self, schedule: SubredditSchedule, new_posts: int, now: float) -> bool:
+        """Fold one poll's result into a subreddit's rate and schedule its next poll.
+
+        Returns:
+            Whether the poll returned a full page
+        """
+        saturated = new_posts >= self.capacity(schedule.fetcher)
+        if schedule.last_poll is not None:
+            observed = new_posts / max(now - schedule.last_poll, 1.0)
+            if saturated:
+                # More posts may have arrived than one page holds
+                schedule.rate = max(schedule.rate * 2, observed)
+            else:
+                schedule.rate = RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * schedule.rate
+        elif saturated:
+            schedule.rate = max(schedule.rate * 2, 1 / self.min_interval)
+
+        schedule.last_poll = now
+        schedule.last_new_posts = new_posts
+        schedule.next_poll = now + self.interval(schedule)
+        return saturated
+
+    async def poll(self, due: list[SubredditSchedule]) -> PollResult:
+        """Fetch and store new posts of the given subreddits, then reschedule them.
+
+        Args:
+            due: Schedules to poll (see due)
+
+        Returns:
+            PollResult with counts
+        """
+        result = PollResult()
+        if not due:
+            return result
+
+        settings = _PollSettings(
+            subreddits=[s.subreddit for s in due],
+            fetchers={s.subreddit: s.fetcher for s in due},
+            posts_per_subreddit=self.settings.posts_per_subreddit,
+            top_comments=self.settings.top_comments,
+            max_concurrency=self.settings.max_concurrency,
+            user_agent=self.settings.user_agent,
+        )
+        posts = await fetch_and_store(self.store, settings)
+        counts = Counter(post.subreddit.lower() for post in posts)
+
+        now = self.clock()
+        for schedule in due:
+            new_posts = counts[schedule.subreddit.lower()]
+            if self._update(schedule, new_posts, now):
+                result.saturated.append(schedule.subreddit)
+            logger.debug(
+                "subreddit_polled",
+                subreddit=schedule.subreddit,
+                new_posts=new_posts,
+                posts_per_hour=round(schedule.posts_per_hour, 2),
+                next_poll_in=round(schedule.next_poll - now),
+            )
+
+        result.subreddits_polled = len(due)
+        result.posts_new = len(posts)
+        result.next_poll_in = self.next_poll_in(now)
+        logger.info(
+            "poll_completed",
+            subreddits=result.subreddits_polled,
+            new_posts=result.posts_new,
+            saturated=len(result.saturated),
+            next_poll_in=round(result.next_poll_in or 0),
+        )
+        return result
+
+    async def run_once(self) -> PollResult:
+        """Poll the subreddits that are due now, loading the schedule first if needed."""
+        if self._refreshed_at is None:
+            await self.refresh()
+        result = await self.poll(self.due())
+        result.next_poll_in = self.next_poll_in()
+        return result
+
+    async def run_forever(self, stop: asyncio.Event | None = None, refresh_every: float = REFRESH_INTERVAL) -> None:
+        """Poll due subreddits until stopped, sleeping until the next one is due.
+
+        A failed poll is logged and its subreddits retried after the minimum
+        interval, and so is a failed refresh, which keeps the current
+        schedules; one bad pass doesn't end the loop.
+
+        Args:
+            stop: Event that ends the loop when set
+            refresh_every: Seconds between reloads of the subreddit list and rates
+        """
+        stop = stop or asyncio.Event()
+        next_refresh = self.clock() if self._refreshed_at is None else self._refreshed_at + refresh_every
+        while not stop.is_set():
+            now = self.clock()
+            if now >= next_refresh:
+                try:
+                    await self.refresh()
+                    next_refresh = now + refresh_every
+                except Exception as e:
+                    logger.error("poll_refresh_failed", error=str(e)[:200])
+                    next_refresh = self.clock() + self.min_interval
+
+            due = self.due(now)
+            if due:
+                try:
+                    await self.poll(due)
+                except Exception as e:
+                    logger.error("poll_failed", subreddits=len(due), error=str(e)[:200])
+                    for schedule in due:
+                        schedule.next_poll = self.clock() + self.min_interval
+                continue
+
+            wait = self.next_poll_in(now)
+            wait = next_refresh - now if wait is None else min(wait, next_refresh - now)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=wait)
+            except TimeoutError:
+                pass
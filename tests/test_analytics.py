@@ -0,0 +1,79 @@
+import dataclasses
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from pain_radar.analytics import TrendEngine, trends
+from pain_radar.archive import archive_older_than
+from pain_radar.store import AsyncStore
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+
+def _monday(ts: int) -> str:
+    day = datetime.fromtimestamp(ts, UTC).date()
+    return (day - timedelta(days=day.weekday())).isoformat()
+
+
+@pytest.fixture
+async def trend_db(tmp_path, sample_post, sample_full_analysis_extracted):
+    """A database with signals three weeks ago (archived) and this week (live)."""
+    now = int(datetime.now(UTC).timestamp())
+    old, recent = now - 21 * 86400, now - 3600
+    posts = [
+        dataclasses.replace(sample_post, id="old1", created_utc=old),
+        dataclasses.replace(sample_post, id="new1", created_utc=recent),
+        dataclasses.replace(sample_post, id="new2", created_utc=recent, subreddit="other"),
+    ]
+    db_path = str(tmp_path / "test.db")
+    store = AsyncStore(db_path)
+    await store.init_db()
+    try:
+        await store.upsert_posts(posts)
+        for post in posts:
+            await store.save_signal(
+                post=post,
+                extraction=sample_full_analysis_extracted.extraction,
+                score=sample_full_analysis_extracted.score,
+            )
+        async with store.connection() as conn:
+            for post, total in zip(posts, (30, 40, 20), strict=True):
+                await conn.execute("UPDATE signals SET total_score = ? WHERE post_id = ?", (total, post.id))
+            await conn.commit()
+        await archive_older_than(store, tmp_path / "archive", timedelta(days=14), vacuum=False)
+    finally:
+        await store.close()
+    return db_path, str(tmp_path / "archive"), _monday(old), _monday(recent)
+
+
+def test_signals_per_subreddit_include_archive(trend_db):
+    db_path, archive_dir, old_week, new_week = trend_db
+
+    rows = trends(db_path, "signals", archive_dir=archive_dir)
+    assert [(r["week"], r["subreddit"], r["signals"], r["avg_score"]) for r in rows] == [
+        (old_week, "test_subreddit", 1, 30.0),
+        (new_week, "other", 1, 20.0),
+        (new_week, "test_subreddit", 1, 40.0),
+    ]
+
+    # Without the archive only live rows are counted
+    assert [r["week"] for r in trends(db_path, "signals")] == [new_week, new_week]
+    assert trends(db_path, "signals", weeks=1, subreddit="other", archive_dir=archive_dir)[0]["signals"] == 1
+
+
+def test_scores_and_wedges(trend_db):
+    db_path, archive_dir, old_week, new_week = trend_db
+
+    with TrendEngine(db_path, archive_dir=archive_dir) as engine:
+        scores = engine.query("scores")
+        wedges = engine.query("wedges")
+        with pytest.raises(ValueError, match="Unknown metric"):
+            engine.query("velocity")
+
+    assert [(s["week"], s["signals"], s["min"], s["max"]) for s in scores] == [
+        (old_week, 1, 30, 30),
+        (new_week, 2, 20, 40),
+    ]
+    assert scores[1]["median"] == 30
+    assert sum(w["signals"] for w in wedges) == 3
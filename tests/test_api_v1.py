@@ -15,7 +15,7 @@ async def test_list_signals():
         mock_store = mock_store_cls.return_value
         mock_store.connect = AsyncMock()
         mock_store.close = AsyncMock()
-        mock_store.get_top_signals = AsyncMock(return_value=[{"id": 1, "summary": "test"}])
+        mock_store.get_signals_page = AsyncMock(return_value=([{"id": 1, "summary": "test"}], None))
 
         response = client.get("/v1/signals")
 
@@ -25,6 +25,27 @@ async def test_list_signals():
         # Correct assertion
         assert len(data) == 1
         assert data[0]["summary"] == "test"
+        assert "X-Next-Cursor" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_list_signals_cursor_and_fields():
+    """Test paging through signals with a cursor and field projection."""
+    with patch("pain_radar.api.v1.endpoints.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.get_signals_page = AsyncMock(return_value=([{"id": 3, "total_score": 40}], "next"))
+
+        response = client.get("/v1/signals?limit=1&cursor=abc&fields=id,total_score")
+
+        assert response.status_code == 200
+        assert response.headers["X-Next-Cursor"] == "next"
+        mock_store.get_signals_page.assert_awaited_once_with(limit=1, after="abc", fields=["id", "total_score"])
+
+        mock_store.get_signals_page = AsyncMock(side_effect=ValueError("Unknown signal field(s): nope"))
+        response = client.get("/v1/signals?fields=nope")
+        assert response.status_code == 400
 
 
 @pytest.mark.asyncio
@@ -54,3 +75,50 @@ async def test_get_signal_not_found():
         response = client.get("/v1/signals/999")
 
         assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_search_signals():
+    """Test full-text search is routed before the signal detail route."""
+    with patch("pain_radar.api.v1.endpoints.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.search_signals = AsyncMock(return_value=[{"id": 3, "snippet": "[stripe] payouts"}])
+
+        response = client.get("/v1/signals/search", params={"q": "stripe", "subreddit": "SaaS"})
+
+        assert response.status_code == 200
+        assert response.json()[0]["id"] == 3
+        mock_store.search_signals.assert_awaited_once_with("stripe", subreddit="SaaS", min_score=None, limit=20)
+
+
+@pytest.mark.asyncio
+async def test_search_signals_bad_query():
+    """Test malformed search queries are rejected with 400."""
+    from pain_radar.query import QuerySyntaxError
+
+    with patch("pain_radar.api.v1.endpoints.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.search_signals = AsyncMock(side_effect=QuerySyntaxError("Missing closing parenthesis in query"))
+
+        response = client.get("/v1/signals/search", params={"q": "(stripe"})
+
+        assert response.status_code == 400
+        assert "parenthesis" in response.json()["detail"]
+
+
+def test_trends():
+    """Test the trends endpoint returns the aggregated series."""
+    rows = [{"week": "2026-10-12", "wedge": "seo", "signals": 3}]
+    with patch("pain_radar.api.v1.endpoints.trends", return_value=rows) as mock_trends:
+        response = client.get("/v1/trends?metric=wedges&weeks=8")
+        assert response.status_code == 200
+        assert response.json() == rows
+        assert mock_trends.call_args.args[1] == "wedges"
+        assert mock_trends.call_args.kwargs["weeks"] == 8
+
+    with patch("pain_radar.api.v1.endpoints.trends", side_effect=ValueError("Unknown metric")):
+        assert client.get("/v1/trends?metric=nope").status_code == 400
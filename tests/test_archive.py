@@ -0,0 +1,93 @@
+import dataclasses
+from datetime import timedelta
+
+import pytest
+
+from pain_radar import embeddings
+from pain_radar.archive import archive_older_than, archived_files, load_manifest, parse_age, read_archive
+from pain_radar.embeddings import HashingEmbedder, embed_signals, load_index
+from pain_radar.store import AsyncStore
+
+
+def test_parse_age():
+    assert parse_age("90d") == timedelta(days=90)
+    assert parse_age(" 12W ") == timedelta(weeks=12)
+    for bad in ("90", "3m", "d", "-1d"):
+        with pytest.raises(ValueError, match="Invalid age"):
+            parse_age(bad)
+
+
+def test_empty_archive(tmp_path):
+    assert load_manifest(tmp_path) == {"version": 1, "files": []}
+    assert read_archive(tmp_path, "posts") == []
+
+
+@pytest.mark.asyncio
+async def test_archive_round_trip(tmp_path, sample_post, sample_full_analysis_extracted):
+    pytest.importorskip("pyarrow")
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        posts = [
+            dataclasses.replace(sample_post, id="jan", created_utc=1704153600),  # 2024-01-02
+            dataclasses.replace(sample_post, id="feb", created_utc=1706918400),  # 2024-02-03
+            dataclasses.replace(sample_post, id="new", created_utc=4102444800),  # 2100-01-01
+        ]
+        await store.upsert_posts(posts)
+        for post in posts:
+            await store.save_signal(
+                post=post,
+                extraction=sample_full_analysis_extracted.extraction,
+                score=sample_full_analysis_extracted.score,
+            )
+
+        archive_dir = tmp_path / "archive"
+        result = await archive_older_than(store, archive_dir, timedelta(days=90))
+        assert (result.partitions, result.posts, result.signals, result.files) == (2, 2, 2, 4)
+        assert (await store.get_stats())["total_posts"] == 1
+
+        # A second pass finds nothing left to move
+        assert (await archive_older_than(store, archive_dir, timedelta(days=90))).partitions == 0
+    finally:
+        await store.close()
+
+    files = archived_files(archive_dir, "signals", since_month="2024-02")
+    assert [f.relative_to(archive_dir).parts[:3] for f in files] == [("signals", "2024-02", "test_subreddit")]
+    assert {p["id"] for p in read_archive(archive_dir, "posts")} == {"jan", "feb"}
+    signals = read_archive(archive_dir, "signals", subreddit="test_subreddit")
+    assert sorted(s["post_id"] for s in signals) == ["feb", "jan"]
+    assert signals[0]["signal_summary"] == sample_full_analysis_extracted.extraction.signal_summary
+
+
+@pytest.mark.asyncio
+async def test_archive_invalidates_vector_index(tmp_path, sample_post, sample_full_analysis_extracted):
+    pytest.importorskip("pyarrow")
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        posts = [
+            dataclasses.replace(sample_post, id="jan", created_utc=1704153600),  # 2024-01-02
+            dataclasses.replace(sample_post, id="new", created_utc=4102444800),  # 2100-01-01
+        ]
+        await store.upsert_posts(posts)
+        signal_ids = {}
+        for post in posts:
+            signal_ids[post.id] = await store.save_signal(
+                post=post,
+                extraction=sample_full_analysis_extracted.extraction,
+                score=sample_full_analysis_extracted.score,
+            )
+
+        embedder = HashingEmbedder(dim=64)
+        await embed_signals(store, embedder)
+        assert len(await load_index(store, embedder)) == 2
+
+        await archive_older_than(store, tmp_path / "archive", timedelta(days=90))
+
+        # The cached index is stale once archived signals lose their embeddings
+        index = await load_index(store, embedder)
+        assert index.ids.tolist() == [signal_ids["new"]]
+        assert index.vector(signal_ids["jan"]) is None
+    finally:
+        await store.close()
+        embeddings._INDEX_CACHE.clear()
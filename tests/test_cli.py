@@ -32,7 +32,7 @@ def test_fetch_command_success():
             mock_store = mock_store_cls.return_value
             mock_store.connect = AsyncMock()
             mock_store.close = AsyncMock()
-            mock_store.get_all_active_subreddits = AsyncMock(return_value=["test_sub"])
+            mock_store.get_active_subreddit_fetchers = AsyncMock(return_value={"test_sub": "json"})
 
             with patch("pain_radar.cli.fetch.run_fetch_only", new_callable=AsyncMock) as mock_run_fetch:
                 mock_run_fetch.return_value = 5  # Returned 5 posts
@@ -42,6 +42,7 @@ def test_fetch_command_success():
                 assert result.exit_code == 0
                 assert "Fetched 5 posts" in result.stdout
                 mock_run_fetch.assert_called_once()
+                assert mock_run_fetch.call_args[0][0].fetchers == {"test_sub": "json"}
 
 
 def test_fetch_command_args():
@@ -54,6 +55,7 @@ def test_fetch_command_args():
         settings.top_comments = 5
         settings.max_concurrency = 2
         settings.user_agent = "test-agent"
+        settings.fetcher = "rss"
         mock_settings.return_value = settings
 
         with patch("pain_radar.cli.fetch.AsyncStore") as _:
@@ -70,6 +72,7 @@ def test_fetch_command_args():
                 fetch_settings = call_args[0][0]
                 assert fetch_settings.subreddits == ["specific_sub"]
                 assert fetch_settings.posts_per_subreddit == 20
+                assert fetch_settings.fetchers == {"specific_sub": "rss"}
 
 
 def test_fetch_command_error():
@@ -82,7 +85,7 @@ def test_fetch_command_error():
             mock_store = _.return_value
             mock_store.connect = AsyncMock()
             mock_store.close = AsyncMock()
-            mock_store.get_all_active_subreddits = AsyncMock(return_value=["test"])
+            mock_store.get_active_subreddit_fetchers = AsyncMock(return_value={"test": "rss"})
 
             with patch("pain_radar.cli.fetch.run_fetch_only", new_callable=AsyncMock) as mock_run_fetch:
                 mock_run_fetch.side_effect = Exception("Fetch failed")
@@ -158,14 +161,20 @@ def test_sources_add_custom():
             mock_store.close = AsyncMock()
             mock_store.create_source_set = AsyncMock(return_value=2)
 
-            result = runner.invoke(app, ["sources-add", "custom", "--subreddits", "sub1,sub2", "--name", "My Custom"])
+            result = runner.invoke(
+                app, ["sources-add", "custom", "--subreddits", "sub1,sub2", "--name", "My Custom", "--fetcher", "json"]
+            )
 
             assert result.exit_code == 0
             assert "Added source set 'My Custom'" in result.stdout
             mock_store.create_source_set.assert_called_with(
-                name="My Custom", subreddits=["sub1", "sub2"], description=None, preset_key=None
+                name="My Custom", subreddits=["sub1", "sub2"], description=None, preset_key=None, fetcher="json"
             )
 
+            result = runner.invoke(app, ["sources-add", "custom", "--subreddits", "sub1", "--fetcher", "api"])
+            assert result.exit_code == 1
+            assert "--fetcher must be one of rss, json" in result.stdout
+
 
 def test_sources_remove():
     """Test removing a source set."""
@@ -1,9 +1,13 @@
+from datetime import timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from typer.testing import CliRunner
 
+from pain_radar.archive import ArchiveResult
 from pain_radar.cli import app
+from pain_radar.reddit_dumps import ImportResult
+from pain_radar.workers.scheduler import PollResult, SubredditSchedule
 
 runner = CliRunner()
 
@@ -40,6 +44,55 @@ def test_db_stats(mock_settings):
         assert "Total Posts" in result.stdout
 
 
+def test_db_stats_recompute(mock_settings):
+    """Test db stats --recompute resets the counters."""
+    with patch("pain_radar.cli.db.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.init_db = AsyncMock()
+        mock_store.get_stats = AsyncMock()
+        mock_store.recompute_stats = AsyncMock(return_value={"total_posts": 10, "total_signals": 4})
+
+        result = runner.invoke(app, ["stats", "--recompute"])
+        assert result.exit_code == 0
+        assert "Total Signals" in result.stdout
+        mock_store.recompute_stats.assert_awaited_once()
+        mock_store.get_stats.assert_not_called()
+
+
+def test_db_compress_and_size(mock_settings):
+    """Test db-compress and db-size commands."""
+    with patch("pain_radar.cli.db.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.init_db = AsyncMock()
+        mock_store.vacuum = AsyncMock()
+        mock_store.compress_blobs = AsyncMock(
+            return_value={"signals.raw_score": {"rows": 10, "before": 40_000, "after": 8_000}}
+        )
+        mock_store.get_storage_report = AsyncMock(
+            return_value={
+                "file_bytes": 3_000_000,
+                "free_bytes": 0,
+                "tables": {"signals": 2_000_000},
+                "columns": [{"table": "signals", "column": "raw_score", "rows": 10, "compressed": 10, "bytes": 8_000}],
+            }
+        )
+
+        result = runner.invoke(app, ["db-compress", "--no-vacuum"])
+        assert result.exit_code == 0
+        assert "5.0x" in result.stdout
+        mock_store.compress_blobs.assert_awaited_once_with(retrain=False)
+        mock_store.vacuum.assert_not_called()
+
+        result = runner.invoke(app, ["db-size"])
+        assert result.exit_code == 0
+        assert "2.9 MB" in result.stdout
+        assert "signals.raw_score" in result.stdout
+
+
 def test_ideas_top(mock_settings):
     """Test top signals command."""
     with patch("pain_radar.cli.ideas.AsyncStore") as mock_store_cls:
@@ -87,11 +140,67 @@ def test_cluster_command(mock_settings):
             cluster.why_it_matters = "Why"
             mock_clusterer.cluster_items = AsyncMock(return_value=[cluster])
 
-            result = runner.invoke(app, ["cluster", "--dry-run"])
+            result = runner.invoke(app, ["cluster", "--dry-run", "--full"])
             assert result.exit_code == 0
             assert "Cluster Title" in result.stdout
 
 
+def test_cluster_command_attaches_to_existing(mock_settings):
+    """Test cluster command attaches signals to existing clusters before clustering leftovers."""
+    from pain_radar.cluster import IncrementalAssignment
+
+    with patch("pain_radar.cli.cluster.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        item = MagicMock(id=1)
+        mock_store.get_unclustered_pain_points = AsyncMock(return_value=[item])
+        mock_store.get_cluster_centroids = AsyncMock(return_value=[{"id": "c1", "week_start": "2026-10-12"}])
+        mock_store.attach_signals_to_clusters = AsyncMock(return_value=1)
+
+        with (
+            patch("pain_radar.cli.cluster.Clusterer") as mock_clusterer_cls,
+            patch("pain_radar.cli.cluster.track_recurrence", new_callable=AsyncMock) as mock_track,
+        ):
+            mock_clusterer = mock_clusterer_cls.return_value
+            mock_clusterer.assign_incremental.return_value = IncrementalAssignment(
+                attached={"c1": [item]}, centroids={"c1": [1.0]}
+            )
+            mock_clusterer.cluster_items = AsyncMock()
+
+            result = runner.invoke(app, ["cluster"])
+            assert result.exit_code == 0
+            assert "Attached 1 signals to 1 existing clusters" in result.stdout
+            mock_store.attach_signals_to_clusters.assert_awaited_once_with({"c1": [1]}, {"c1": [1.0]})
+            mock_clusterer.cluster_items.assert_not_called()
+            mock_track.assert_awaited_once_with(mock_store, weeks=["2026-10-12"])
+
+
+def test_clusters_growing(mock_settings):
+    """Test listing clusters that grew several weeks in a row."""
+    with patch("pain_radar.cli.cluster.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.get_growing_lineages = AsyncMock(
+            return_value=[
+                {
+                    "title": "Stripe payout failures",
+                    "growth_streak": 3,
+                    "last_signal_count": 12,
+                    "growth_rate": 0.5,
+                    "first_week": "2026-09-14",
+                    "last_week": "2026-10-12",
+                }
+            ]
+        )
+
+        result = runner.invoke(app, ["clusters-growing", "--min-streak", "3"])
+        assert result.exit_code == 0
+        assert "Stripe payout failures" in result.stdout
+        assert mock_store.get_growing_lineages.await_args.kwargs["min_streak"] == 3
+
+
 def test_alerts_list(mock_settings):
     """Test alerts list command."""
     with patch("pain_radar.cli.alerts.AsyncStore") as mock_store_cls:
@@ -131,12 +240,31 @@ def test_alerts_add(mock_settings):
         mock_store.create_watchlist.assert_called_once()
 
 
+def test_alerts_add_query(mock_settings):
+    """Test alerts-add --query validates the query before saving."""
+    with patch("pain_radar.cli.alerts.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.create_watchlist = AsyncMock(return_value=5)
+
+        result = runner.invoke(app, ["alerts-add", "--query", 'stripe AND "bank transfer"'])
+        assert result.exit_code == 0
+        assert mock_store.create_watchlist.await_args.kwargs["query"] == 'stripe AND "bank transfer"'
+
+        result = runner.invoke(app, ["alerts-add", "--query", "(stripe"])
+        assert result.exit_code == 1
+        assert "Invalid query" in result.stdout
+        mock_store.create_watchlist.assert_awaited_once()
+
+
 def test_alerts_check(mock_settings):
     """Test alerts-check command."""
     with patch("pain_radar.cli.alerts.AsyncStore") as mock_store_cls:
         mock_store = mock_store_cls.return_value
         mock_store.connect = AsyncMock()
         mock_store.close = AsyncMock()
+        mock_store.get_semantic_watchlist_models = AsyncMock(return_value=set())
         mock_store.check_watchlists = AsyncMock(
             return_value=[
                 {
@@ -152,6 +280,62 @@ def test_alerts_check(mock_settings):
         result = runner.invoke(app, ["alerts-check"])
         assert result.exit_code == 0
         assert "Found 1 matches" in result.stdout
+        assert mock_store.check_watchlists.await_args.kwargs["embedding_model"] is None
+
+
+def test_alerts_semantic_watchlist(mock_settings):
+    """Test --describe embeds the description once and checks embed signals first."""
+    mock_settings.embedding_provider = "hashing"
+    with (
+        patch("pain_radar.cli.alerts.AsyncStore") as mock_store_cls,
+        patch("pain_radar.cli.alerts.embed_signals", new_callable=AsyncMock) as mock_embed,
+    ):
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.create_watchlist = AsyncMock(return_value=7)
+
+        result = runner.invoke(app, ["alerts-add", "--describe", "payment failures"])
+        assert result.exit_code == 0
+        kwargs = mock_store.create_watchlist.await_args.kwargs
+        assert kwargs["keywords"] == []
+        assert kwargs["description"] == "payment failures"
+        assert kwargs["description_vector"].shape == (512,)
+        assert kwargs["embedding_model"] == "hashing-512"
+
+        mock_store.get_semantic_watchlist_models = AsyncMock(return_value={"hashing-512"})
+        mock_store.check_watchlists = AsyncMock(return_value=[])
+        result = runner.invoke(app, ["alerts-check"])
+        assert result.exit_code == 0
+        mock_embed.assert_awaited_once()
+        assert mock_store.check_watchlists.await_args.kwargs["embedding_model"] == "hashing-512"
+
+        result = runner.invoke(app, ["alerts-add"])
+        assert result.exit_code == 1
+
+
+def test_alerts_check_notify(mock_settings):
+    """Test --notify delivers pending matches even when the check finds nothing new."""
+    from pain_radar.workers.delivery_worker import DeliveryResult
+
+    with (
+        patch("pain_radar.cli.alerts.AsyncStore") as mock_store_cls,
+        patch("pain_radar.cli.alerts.deliver_pending", new_callable=AsyncMock) as mock_deliver,
+    ):
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.get_semantic_watchlist_models = AsyncMock(return_value=set())
+        mock_store.check_watchlists = AsyncMock(return_value=[])
+        mock_deliver.return_value = DeliveryResult(
+            digests_sent=2, matches_notified=12, matches_pending=1, failures={"http://x/hook": "410"}
+        )
+
+        result = runner.invoke(app, ["alerts-check", "--notify"])
+        assert result.exit_code == 0
+        assert "Delivered 12 matches in 2 webhook digests" in result.stdout
+        assert "http://x/hook" in result.stdout
+        mock_deliver.assert_awaited_once_with(mock_store)
 
 
 def test_ideas_show(mock_settings):
@@ -177,12 +361,29 @@ def test_ideas_export(mock_settings, tmp_path):
         mock_store = mock_store_cls.return_value
         mock_store.connect = AsyncMock()
         mock_store.close = AsyncMock()
-        mock_store.get_top_signals = AsyncMock(return_value=[{"id": 1, "summary": "test"}])
+        calls = []
+
+        async def iter_signals(**kwargs):
+            calls.append(kwargs)
+            yield [{"id": 1, "summary": "test"}]
+
+        mock_store.iter_signals = iter_signals
 
         result = runner.invoke(app, ["export", "--output", str(export_file)])
         assert result.exit_code == 0
         assert "Exported 1 signals" in result.stdout
         assert export_file.exists()
+        assert calls[0]["limit"] == 50
+
+        ndjson_file = tmp_path / "export.ndjson"
+        result = runner.invoke(app, ["export", "--output", str(ndjson_file), "--all"])
+        assert result.exit_code == 0
+        assert ndjson_file.read_text() == '{"id":1,"summary":"test"}\n'
+        assert calls[1]["limit"] is None
+
+        result = runner.invoke(app, ["export", "--output", str(tmp_path / "export.xml")])
+        assert result.exit_code == 1
+        assert "Unsupported export format" in result.stdout
 
 
 def test_alerts_matches(mock_settings):
@@ -233,3 +434,147 @@ def test_digest_command(mock_settings):
                     result = runner.invoke(app, ["digest", "test_sub"])
                     assert result.exit_code == 0
                     assert "Digest Content" in result.stdout
+
+
+def test_evidence_command(mock_settings):
+    """Test listing evidence quotes by type."""
+    with patch("pain_radar.cli.ideas.AsyncStore") as mock_store_cls:
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.get_evidence = AsyncMock(
+            return_value=[
+                {"signal_id": 7, "signal_type": "willingness_to_pay", "quote": "I'd pay $50", "subreddit": "SaaS"}
+            ]
+        )
+
+        result = runner.invoke(app, ["evidence", "--type", "willingness_to_pay"])
+        assert result.exit_code == 0
+        assert "I'd pay $50" in result.stdout
+        mock_store.get_evidence.assert_awaited_once_with(
+            signal_type="willingness_to_pay", days=7, subreddit=None, limit=50
+        )
+
+
+def test_shards(mock_settings):
+    """Test shards command lists per-tenant stats and the total."""
+    mock_settings.shard_dir = "shards"
+    with patch("pain_radar.cli.db.ShardRouter") as mock_router_cls:
+        mock_router = mock_router_cls.return_value
+        mock_router.connect = AsyncMock()
+        mock_router.close = AsyncMock()
+        stats = {"total_posts": 5, "total_signals": 2, "qualified_signals": 1, "avg_score": 30.0}
+        mock_router.get_stats = AsyncMock(return_value={"tenants": {"acme": stats}, "total": stats})
+
+        result = runner.invoke(app, ["shards"])
+        assert result.exit_code == 0
+        assert "acme" in result.stdout
+        assert "Total" in result.stdout
+        mock_router_cls.assert_called_once_with("shards")
+
+
+def test_db_archive(mock_settings):
+    """Test db-archive parses the age and reports what was moved."""
+    mock_settings.archive_dir = "archive"
+    with (
+        patch("pain_radar.cli.db.AsyncStore") as mock_store_cls,
+        patch("pain_radar.cli.db.archive_older_than", new_callable=AsyncMock) as mock_archive,
+    ):
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.init_db = AsyncMock()
+        mock_archive.return_value = ArchiveResult(partitions=2, posts=40, signals=12, files=4, bytes_written=2048)
+
+        result = runner.invoke(app, ["db-archive", "--older-than", "30d", "--no-vacuum"])
+        assert result.exit_code == 0
+        assert "Archived 40 posts and 12 signals" in result.stdout
+        mock_archive.assert_awaited_once_with(mock_store, "archive", timedelta(days=30), vacuum=False)
+
+        result = runner.invoke(app, ["db-archive", "--older-than", "soon"])
+        assert result.exit_code == 1
+        assert "Invalid age" in result.stdout
+
+
+def test_import(tmp_path):
+    """Test import passes the filters through and reports the rate."""
+    dump = tmp_path / "RS_2024-01.zst"
+    dump.write_bytes(b"")
+    with (
+        patch("pain_radar.cli.fetch.get_settings") as mock_get_settings,
+        patch("pain_radar.cli.fetch.AsyncStore") as mock_store_cls,
+        patch("pain_radar.cli.fetch.import_dumps", new_callable=AsyncMock) as mock_import,
+    ):
+        mock_get_settings.return_value.db_path = ":memory:"
+        mock_get_settings.return_value.top_comments = 15
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.init_db = AsyncMock()
+        mock_import.return_value = ImportResult(lines=2_000_000, posts=120, comments=600, seconds=4.0)
+
+        result = runner.invoke(app, ["import", str(dump), "-s", "SaaS", "--since", "2024-01-01"])
+        assert result.exit_code == 0
+        assert "Imported 120 posts and 600 comments" in result.stdout
+        assert "500,000" in result.stdout
+        kwargs = mock_import.await_args.kwargs
+        assert kwargs["subreddits"] == ["SaaS"]
+        assert kwargs["since_utc"] == 1704067200
+        assert kwargs["until_utc"] is None
+        assert kwargs["comments_per_post"] == 15
+
+        result = runner.invoke(app, ["import", str(tmp_path / "missing.zst")])
+        assert result.exit_code != 0
+
+
+def test_trends(mock_settings):
+    """Test trends command renders the aggregated rows."""
+    mock_settings.archive_dir = "archive"
+    rows = [{"week": "2026-10-12", "subreddit": "SaaS", "signals": 7, "qualified": 5, "avg_score": None}]
+    with patch("pain_radar.cli.report.compute_trends", return_value=rows) as mock_trends:
+        result = runner.invoke(app, ["trends", "--weeks", "4", "--no-archive"])
+        assert result.exit_code == 0
+        assert "2026-10-12" in result.stdout
+        assert "SaaS" in result.stdout
+        mock_trends.assert_called_once_with(":memory:", "signals", weeks=4, subreddit=None, archive_dir=None)
+
+    with patch("pain_radar.cli.report.compute_trends", side_effect=ValueError("Unknown metric 'x'")):
+        result = runner.invoke(app, ["trends", "-m", "x"])
+        assert result.exit_code == 1
+        assert "Unknown metric" in result.stdout
+
+
+def test_poll_once():
+    """Test poll --once polls due subreddits and shows the schedule."""
+    schedule = SubredditSchedule(subreddit="SaaS", fetcher="json", rate=2 / 3600, next_poll=1000.0 + 7200)
+    with (
+        patch("pain_radar.cli.fetch.get_settings") as mock_get_settings,
+        patch("pain_radar.cli.fetch.AsyncStore") as mock_store_cls,
+        patch("pain_radar.cli.fetch.PollScheduler") as mock_scheduler_cls,
+    ):
+        mock_get_settings.return_value.db_path = ":memory:"
+        mock_get_settings.return_value.fetcher = "rss"
+        mock_store = mock_store_cls.return_value
+        mock_store.connect = AsyncMock()
+        mock_store.close = AsyncMock()
+        mock_store.init_db = AsyncMock()
+        scheduler = mock_scheduler_cls.return_value
+        scheduler.refresh = AsyncMock()
+        scheduler.schedules = {"saas": schedule}
+        scheduler.run_once = AsyncMock(return_value=PollResult(subreddits_polled=1, posts_new=12))
+        scheduler.clock.return_value = 1000.0
+        scheduler.interval.return_value = 3600.0
+
+        result = runner.invoke(app, ["poll", "--once", "-s", "SaaS", "--min-interval", "600"])
+        assert result.exit_code == 0
+        assert "Polled 1 subreddits, 12 new posts" in result.stdout
+        assert "SaaS" in result.stdout
+        assert "120m" in result.stdout
+        kwargs = mock_scheduler_cls.call_args.kwargs
+        assert kwargs["fetchers"] == {"SaaS": "rss"}
+        assert kwargs["min_interval"] == 600
+
+        scheduler.schedules = {}
+        result = runner.invoke(app, ["poll", "--once"])
+        assert result.exit_code == 1
+        assert "No subreddits to poll" in result.stdout
@@ -1,40 +1,86 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 from pain_radar.cluster import Clusterer
-from pain_radar.models import Cluster
+from pain_radar.models import ClusterItem, ClusterName, EvidenceSignal
 
 
-@pytest.mark.asyncio
-async def test_cluster_signals_success(sample_cluster_item, mock_llm):
-    """Test successful clustering of signals."""
-    expected_cluster = Cluster(
+def _item(item_id: int, summary: str, pain_point: str, quote: str = "") -> ClusterItem:
+    evidence = [EvidenceSignal(quote=quote, signal_type="pain", source="post")] if quote else []
+    return ClusterItem(
+        id=item_id,
+        summary=summary,
+        pain_point=pain_point,
+        subreddit="sub1",
+        url=f"http://test.url/{item_id}",
+        evidence=evidence,
+    )
+
+
+@pytest.fixture
+def stripe_items():
+    return [
+        _item(1, "Stripe Connect onboarding is painful", "Stripe Connect onboarding breaks", "Connect ate my week"),
+        _item(2, "Stripe Connect payouts are confusing", "Stripe Connect payouts fail silently", "Payouts vanished"),
+        _item(3, "Finding a good podcast host", "Podcast hosting is expensive"),
+    ]
+
+
+@pytest.fixture
+def cluster_name():
+    return ClusterName(
         title="Test Cluster",
         summary="Test Summary",
         target_audience="Test Audience",
         why_it_matters="Test Importance",
-        signal_ids=[sample_cluster_item.id],
-        quotes=["Quote 1"],
-        urls=[sample_cluster_item.url],
     )
-    mock_response = {"clusters": [expected_cluster.model_dump()]}
 
-    # Patch ChatPromptTemplate.from_messages to control the chain
-    with patch("pain_radar.cluster.ChatPromptTemplate.from_messages") as mock_from_messages:
-        mock_prompt = MagicMock()
-        mock_from_messages.return_value = mock_prompt
 
-        mock_chain = AsyncMock()
-        mock_chain.ainvoke.return_value = mock_response
-        mock_prompt.__or__.return_value = mock_chain
+def test_group_items_is_deterministic(stripe_items):
+    """Test that similar items are grouped locally and unrelated ones dropped."""
+    clusterer = Clusterer(llm=MagicMock())
 
-        clusterer = Clusterer(llm=mock_llm)
-        results = await clusterer.cluster_items([sample_cluster_item])
+    groups = clusterer.group_items(stripe_items)
+    assert [sorted(i.id for i in g) for g in groups] == [[1, 2]]
 
-        assert len(results) == 1
-        assert results[0].title == "Test Cluster"
-        mock_chain.ainvoke.assert_called_once()
+    # Input order does not change the grouping
+    regrouped = clusterer.group_items(list(reversed(stripe_items)))
+    assert [sorted(i.id for i in g) for g in regrouped] == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_cluster_signals_success(stripe_items, mock_llm, cluster_name):
+    """Test successful clustering of signals."""
+    mock_llm.ainvoke.return_value = cluster_name
+
+    clusterer = Clusterer(llm=mock_llm)
+    results = await clusterer.cluster_items(stripe_items)
+
+    assert len(results) == 1
+    assert results[0].title == "Test Cluster"
+    assert sorted(results[0].signal_ids) == [1, 2]
+    assert set(results[0].quotes) == {"Connect ate my week", "Payouts vanished"}
+    assert set(results[0].urls) == {"http://test.url/1", "http://test.url/2"}
+    mock_llm.ainvoke.assert_called_once()
+
+    # Naming prompt only contains the grouped signals
+    prompt_value = mock_llm.ainvoke.call_args[0][0]
+    content = " ".join(m.content for m in prompt_value.to_messages())
+    assert "Stripe Connect" in content
+    assert "podcast" not in content.lower()
+
+
+@pytest.mark.asyncio
+async def test_cluster_names_are_cached(stripe_items, mock_llm, cluster_name):
+    """Test that re-clustering the same items reuses cached names."""
+    mock_llm.ainvoke.return_value = cluster_name
+
+    clusterer = Clusterer(llm=mock_llm)
+    await clusterer.cluster_items(stripe_items)
+    await clusterer.cluster_items(stripe_items)
+
+    mock_llm.ainvoke.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -46,16 +92,30 @@ async def test_cluster_signals_empty():
 
 
 @pytest.mark.asyncio
-async def test_cluster_signals_error(sample_cluster_item, mock_llm):
+async def test_cluster_signals_error(stripe_items, mock_llm):
     """Test handling of errors during clustering."""
-    with patch("pain_radar.cluster.ChatPromptTemplate.from_messages") as mock_from_messages:
-        mock_prompt = MagicMock()
-        mock_from_messages.return_value = mock_prompt
+    mock_llm.ainvoke.side_effect = Exception("Clustering failed")
+
+    clusterer = Clusterer(llm=mock_llm)
+    results = await clusterer.cluster_items(stripe_items)
+    assert results == []
+
+
+def test_assign_incremental(stripe_items):
+    """Test new items attach to similar existing clusters and the rest are left over."""
+    clusterer = Clusterer(llm=MagicMock())
+    existing_vec = clusterer.vectorize(stripe_items[:1])[0]
+    existing = [{"id": "c1", "centroid": existing_vec, "signal_count": 3}]
+
+    result = clusterer.assign_incremental(stripe_items[1:], existing)
+
+    assert [item.id for item in result.attached["c1"]] == [2]
+    assert [item.id for item in result.leftovers] == [3]
+    assert result.centroids["c1"].shape == existing_vec.shape
 
-        mock_chain = AsyncMock()
-        mock_chain.ainvoke.side_effect = Exception("Clustering failed")
-        mock_prompt.__or__.return_value = mock_chain
 
-        clusterer = Clusterer(llm=mock_llm)
-        results = await clusterer.cluster_items([sample_cluster_item])
-        assert results == []
+def test_assign_incremental_without_existing(stripe_items):
+    """Test all items are leftovers when no clusters exist."""
+    result = Clusterer(llm=MagicMock()).assign_incremental(stripe_items, [])
+    assert result.attached == {}
+    assert result.leftovers == stripe_items
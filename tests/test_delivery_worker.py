@@ -0,0 +1,89 @@
+import time
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request, Response
+
+from pain_radar.models import ExtractionState, PainSignal
+from pain_radar.reddit_async import RedditPost
+from pain_radar.store.core import AsyncStore
+from pain_radar.workers.delivery_worker import DeliveryWorker
+
+
+def _receiver(received: dict[str, list[dict]], flaky: dict[str, int]) -> FastAPI:
+    """Stand-in webhook receiver; each hook in `flaky` fails that many times first."""
+    receiver = FastAPI()
+
+    @receiver.post("/hooks/{name}")
+    async def hook(name: str, request: Request):
+        if flaky.get(name, 0) > 0:
+            flaky[name] -= 1
+            return Response(status_code=503)
+        if name == "gone":
+            return Response(status_code=410)
+        received.setdefault(name, []).append(await request.json())
+        return {"ok": True}
+
+    return receiver
+
+
+async def _seed(store: AsyncStore, hooks: list[str], signals: int) -> None:
+    """Create one 'stripe' watchlist per hook and signals that all match."""
+    for name in hooks:
+        await store.create_watchlist(name, ["stripe"], notification_webhook=f"http://hooks.test/hooks/{name}")
+    await store.create_watchlist("No webhook", ["stripe"])
+
+    post = RedditPost(
+        id="p1",
+        title="Payouts",
+        body="",
+        url="https://reddit.com/p1",
+        subreddit="SaaS",
+        created_utc=0,
+        score=1,
+        num_comments=0,
+        permalink="",
+        top_comments=[],
+    )
+    await store.upsert_posts([post])
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe payouts", pain_point="Late")
+    for run_id in range(signals):
+        await store.save_signal(post, ext, run_id=run_id)
+
+
+@pytest.mark.asyncio
+async def test_delivery_worker_batches_retries_and_marks_in_bulk():
+    """Test thousands of matches clear as per-recipient digests, with retries and failures kept pending."""
+    store = AsyncStore(":memory:")
+    received: dict[str, list[dict]] = {}
+    flaky = {"h0": 2}
+    hooks = [f"h{i}" for i in range(20)] + ["gone"]
+    transport = httpx.ASGITransport(app=_receiver(received, flaky))
+    try:
+        await store.init_db()
+        await _seed(store, hooks, signals=150)
+        assert len(await store.get_unnotified_matches()) == 150 * 22
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            worker = DeliveryWorker(store, client=client, backoff=0.01, digest_size=100)
+            started = time.perf_counter()
+            result = await worker.run_once()
+            elapsed = time.perf_counter() - started
+
+        assert elapsed < 10
+        # 20 healthy hooks x 2 digests (150 matches / 100 per digest)
+        assert result.digests_sent == 40
+        assert result.matches_notified == 20 * 150
+        assert sum(len(digests) for digests in received.values()) == 40
+        assert sorted(d["count"] for d in received["h0"]) == [50, 100]
+        assert flaky["h0"] == 0  # Retried through the 503s
+
+        # The 410 hook fails without retries; matches without a webhook stay pending
+        assert result.digests_failed == 2
+        assert set(result.failures) == {"http://hooks.test/hooks/gone"}
+        assert result.matches_pending == 150 * 2
+
+        pending = await store.get_unnotified_matches()
+        assert {m["watchlist_name"] for m in pending} == {"gone", "No webhook"}
+    finally:
+        await store.close()
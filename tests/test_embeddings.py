@@ -0,0 +1,124 @@
+import numpy as np
+import pytest
+
+from pain_radar import embeddings
+from pain_radar.embeddings import (
+    HashingEmbedder,
+    VectorIndex,
+    embed_signals,
+    find_similar_signals,
+    get_embedder,
+    load_index,
+)
+from pain_radar.models import ExtractionState, PainSignal
+from pain_radar.store.core import AsyncStore
+
+
+def test_vector_index_search():
+    """Test top-k search returns nearest rows first and honours exclusions."""
+    matrix = np.array([[1.0, 0.0], [0.8, 0.6], [0.0, 1.0]], dtype=np.float32)
+    index = VectorIndex(np.array([10, 11, 12]), matrix)
+
+    assert [sid for sid, _ in index.search(np.array([1.0, 0.0]), k=2)] == [10, 11]
+    assert [sid for sid, _ in index.search(np.array([1.0, 0.0]), k=2, exclude={10})] == [11, 12]
+    assert VectorIndex(np.zeros(0), np.zeros((0, 2))).search(np.array([1.0, 0.0])) == []
+
+
+def test_get_embedder_rejects_unknown_provider():
+    """Test provider selection from settings."""
+
+    class _Settings:
+        embedding_provider = "nope"
+
+    with pytest.raises(ValueError):
+        get_embedder(_Settings())
+
+    _Settings.embedding_provider = "hashing"
+    assert get_embedder(_Settings()).name.startswith("hashing-")
+
+
+class _CountingEmbedder(HashingEmbedder):
+    def __init__(self):
+        super().__init__(dim=64)
+        self.calls: list[list[str]] = []
+
+    async def embed(self, texts):
+        self.calls.append(list(texts))
+        return await super().embed(texts)
+
+
+@pytest.mark.asyncio
+async def test_embed_signals_caches_by_content(sample_post):
+    """Test embeddings are stored, reused for identical text, and searchable."""
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    await store.upsert_posts([sample_post])
+
+    def _signal(summary: str, pain: str) -> PainSignal:
+        return PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary=summary, pain_point=pain)
+
+    stripe_a = await store.save_signal(sample_post, _signal("Stripe payouts fail", "Payouts vanish"), run_id=1)
+    stripe_b = await store.save_signal(sample_post, _signal("Stripe payouts fail", "Payouts vanish"), run_id=2)
+    await store.save_signal(sample_post, _signal("Podcast hosting costs", "Hosting is expensive"), run_id=3)
+
+    embedder = _CountingEmbedder()
+    assert await embed_signals(store, embedder) == 3
+    # Identical text embedded once
+    assert sorted(len(c) for c in embedder.calls) == [2]
+
+    # Nothing left to embed on the second pass
+    assert await embed_signals(store, embedder) == 0
+    assert len(embedder.calls) == 1
+
+    index = await load_index(store, embedder)
+    assert len(index) == 3
+    assert index.matrix.shape == (3, 64)
+
+    neighbours = await find_similar_signals(store, embedder, stripe_a, k=1, index=index)
+    assert neighbours[0][0] == stripe_b
+    assert neighbours[0][1] == pytest.approx(1.0, abs=1e-3)
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_index_is_built_once_and_memory_mapped(tmp_path, sample_post, monkeypatch):
+    """Test lookups reuse the built index instead of re-reading embeddings from SQLite."""
+    db_path = str(tmp_path / "radar.sqlite3")
+    store = AsyncStore(db_path)
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+        for run_id, summary in enumerate(["Stripe payouts fail", "Podcast hosting costs"], start=1):
+            ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary=summary, pain_point=summary)
+            await store.save_signal(sample_post, ext, run_id=run_id)
+
+        embedder = HashingEmbedder(dim=64)
+        await embed_signals(store, embedder)
+
+        reads = []
+        original = store.get_embeddings
+
+        async def _counting_get_embeddings(model):
+            reads.append(model)
+            return await original(model)
+
+        monkeypatch.setattr(store, "get_embeddings", _counting_get_embeddings)
+
+        # Same process: served from memory
+        assert len(await load_index(store, embedder)) == 2
+        # New process: served from the memory-mapped file written by embed
+        embeddings._INDEX_CACHE.clear()
+        index = await load_index(store, embedder)
+        assert isinstance(index.matrix, np.memmap)
+        assert reads == []
+
+        # New embeddings invalidate the index
+        ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Churn", pain_point="Churn")
+        await store.save_signal(sample_post, ext, run_id=3)
+        await embed_signals(store, embedder)
+        assert len(await load_index(store, embedder)) == 3
+        assert reads == [embedder.name]
+    finally:
+        await store.close()
+        embeddings._INDEX_CACHE.clear()
@@ -0,0 +1,90 @@
+import csv
+import dataclasses
+import json
+
+import pytest
+
+from pain_radar.export import export_format, export_signals
+from pain_radar.store import AsyncStore
+
+
+def test_export_format():
+    assert export_format("out/signals.JSONL") == "ndjson"
+    assert export_format("signals.parquet") == "parquet"
+    with pytest.raises(ValueError, match="Unsupported export format"):
+        export_format("signals.xml")
+
+
+@pytest.fixture
+async def store_with_signals(tmp_path, sample_post, sample_full_analysis_extracted):
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        posts = [dataclasses.replace(sample_post, id=f"post{i}") for i in range(5)]
+        await store.upsert_posts(posts)
+        for post in posts:
+            await store.save_signal(
+                post=post,
+                extraction=sample_full_analysis_extracted.extraction,
+                score=sample_full_analysis_extracted.score,
+            )
+        yield store
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_export_json_formats(tmp_path, store_with_signals):
+    path = tmp_path / "signals.ndjson"
+    assert await export_signals(store_with_signals, path, chunk_size=2) == 5
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(lines) == 5
+    assert isinstance(lines[0]["why"], list)
+
+    path = tmp_path / "signals.json"
+    assert await export_signals(store_with_signals, path, limit=3, chunk_size=2) == 3
+    assert [s["id"] for s in json.loads(path.read_text())] == [s["id"] for s in lines[:3]]
+
+    path = tmp_path / "empty.json"
+    assert await export_signals(store_with_signals, path, run_id=999) == 0
+    assert json.loads(path.read_text()) == []
+
+
+@pytest.mark.asyncio
+async def test_export_csv(tmp_path, store_with_signals):
+    path = tmp_path / "signals.csv"
+    assert await export_signals(store_with_signals, path, fields=["id", "total_score", "why"], chunk_size=2) == 5
+    with open(path, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 5
+    assert set(rows[0]) == {"id", "total_score", "why"}
+    assert isinstance(json.loads(rows[0]["why"]), list)
+
+
+@pytest.mark.asyncio
+async def test_export_parquet(tmp_path, store_with_signals):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "signals.parquet"
+    assert await export_signals(store_with_signals, path, chunk_size=2) == 5
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 5
+    assert parquet.metadata.num_row_groups == 3
+    assert parquet.schema_arrow.field("total_score").type == "int64"
+
+
+@pytest.mark.asyncio
+async def test_export_parquet_types_from_schema(tmp_path, store_with_signals):
+    pq = pytest.importorskip("pyarrow.parquet")
+    # The first chunk only has NULL practicality scores, the later ones have values
+    async with store_with_signals.connection() as conn:
+        await conn.execute("UPDATE signals SET practicality = NULL, confidence = NULL WHERE id <= 2")
+        await conn.commit()
+
+    path = tmp_path / "signals.parquet"
+    assert await export_signals(store_with_signals, path, chunk_size=2) == 5
+    table = pq.read_table(path)
+    assert table.schema.field("practicality").type == "int64"
+    assert table.schema.field("confidence").type == "double"
+    practicality = table.column("practicality").to_pylist()
+    assert practicality[:2] == [None, None]
+    assert all(isinstance(value, int) for value in practicality[2:])
@@ -46,6 +46,7 @@ def test_fetch_integration(mock_reddit_fetch, tmp_path):
     with patch("pain_radar.cli.fetch.get_settings") as mock_settings:
         settings = MagicMock()
         settings.db_path = str(db_file)
+        settings.database_url = None
         settings.listing = "new"
         settings.posts_per_subreddit = 10
         settings.top_comments = 5
@@ -99,6 +100,7 @@ def test_run_integration(mock_reddit_fetch, tmp_path):
     with patch("pain_radar.cli.pipeline.get_settings") as mock_settings:
         settings = MagicMock()
         settings.db_path = str(db_file)
+        settings.database_url = None
         settings.listing = "new"
         settings.posts_per_subreddit = 10
         settings.top_comments = 5
@@ -0,0 +1,107 @@
+import random
+
+import numpy as np
+
+from pain_radar.matching import AhoCorasick, SemanticMatcher, WatchlistMatcher
+
+
+def test_aho_corasick_overlapping_patterns():
+    """Test all overlapping occurrences are reported."""
+    automaton = AhoCorasick(["he", "she", "his", "hers", ""])
+    found = sorted((end, automaton.patterns[pid]) for end, pid in automaton.iter_matches("ushers"))
+    assert found == [(4, "he"), (4, "she"), (6, "hers")]
+
+
+def test_watchlist_matcher_first_keyword_and_subreddits():
+    """Test each watchlist reports its first matching keyword and honours subreddit filters."""
+    watchlists = [
+        {"id": 1, "keywords": ["invoice", "Stripe"], "subreddits": ["SaaS"]},
+        {"id": 2, "keywords": ["stripe"], "subreddits": None},
+        {"id": 3, "keywords": ["podcast"], "subreddits": []},
+    ]
+    matcher = WatchlistMatcher(watchlists)
+
+    hits = matcher.match("STRIPE invoice emails bounce", subreddit="SaaS")
+    assert [(wl["id"], kw) for wl, kw in hits] == [(1, "invoice"), (2, "stripe")]
+
+    hits = matcher.match("STRIPE invoice emails bounce", subreddit="Entrepreneur")
+    assert [(wl["id"], kw) for wl, kw in hits] == [(2, "stripe")]
+
+
+def test_watchlist_matcher_word_boundary():
+    """Test word-boundary and case-sensitive options."""
+    watchlists = [{"id": 1, "keywords": ["api"]}]
+
+    assert WatchlistMatcher(watchlists).match("rapid growth")
+    assert not WatchlistMatcher(watchlists, word_boundary=True).match("rapid growth")
+    assert WatchlistMatcher(watchlists, word_boundary=True).match("the API, again")
+    assert not WatchlistMatcher(watchlists, case_sensitive=True).match("the API")
+
+
+def test_watchlist_matcher_matches_naive_substring_search():
+    """Test the compiled matcher agrees with per-keyword substring checks."""
+    rng = random.Random(7)
+    vocab = ["stripe", "pay", "payout", "api", "rapid", "invoice", "voice", "churn", "ch", "seo"]
+    watchlists = [{"id": i, "keywords": rng.sample(vocab, 3)} for i in range(20)]
+    matcher = WatchlistMatcher(watchlists)
+
+    for _ in range(200):
+        text = " ".join(rng.choices(vocab + ["the", "a", "Stripe"], k=6))
+        expected = []
+        for wl in watchlists:
+            for keyword in wl["keywords"]:
+                if keyword.lower() in text.lower():
+                    expected.append((wl["id"], keyword))
+                    break
+        assert [(wl["id"], kw) for wl, kw in matcher.match(text)] == expected
+
+
+def test_semantic_matcher_thresholds_and_subreddits():
+    """Test vector matches honour per-watchlist thresholds and subreddit filters."""
+    watchlists = [
+        {"id": 1, "description_vector": np.array([1.0, 0.0]), "semantic_threshold": 0.9},
+        {"id": 2, "description_vector": np.array([0.6, 0.8]), "subreddits": ["SaaS"]},
+        {"id": 3, "keywords": ["no vector"]},
+    ]
+    matcher = SemanticMatcher(watchlists, default_threshold=0.5)
+    assert len(matcher) == 2
+
+    signal = np.array([0.8, 0.6])
+    assert [(wl["id"], round(sim, 2)) for wl, sim in matcher.match(signal, "SaaS")] == [(2, 0.96)]
+    assert matcher.match(signal, "Entrepreneur") == []
+
+    hits = matcher.match_many(np.array([[1.0, 0.0], [0.0, -1.0]]), ["SaaS", "SaaS"])
+    assert [[wl["id"] for wl, _ in row] for row in hits] == [[1, 2], []]
+    assert SemanticMatcher([]).match_many(np.zeros((2, 4))) == [[], []]
+
+    # An explicit zero threshold is kept rather than replaced by the default
+    zero = SemanticMatcher([{"id": 4, "description_vector": np.array([1.0, 0.0]), "semantic_threshold": 0.0}])
+    assert [wl["id"] for wl, _ in zero.match(np.array([0.0, 1.0]))] == [4]
+
+
+def test_watchlist_matcher_queries():
+    """Test query watchlists are prefiltered by their anchors and evaluated on fields."""
+    watchlists = [
+        {"id": 1, "keywords": [], "query": "stripe -refund"},
+        {"id": 2, "keywords": ["payout"], "query": "quote:payroll"},
+        {"id": 3, "keywords": [], "query": "NOT stripe", "subreddits": ["SaaS"]},
+    ]
+    matcher = WatchlistMatcher(watchlists)
+    fields = {
+        "signal_summary": "Stripe payouts late",
+        "pain_point": "Cash flow",
+        "evidence": "can't make payroll",
+        "post_title": "Help",
+    }
+    text = "Stripe payouts late Cash flow Help"
+
+    hits = matcher.match(text, "SaaS", fields)
+    assert [(wl["id"], kw) for wl, kw in hits] == [(1, "stripe -refund"), (2, "payout")]
+
+    refund = {**fields, "signal_summary": "Stripe refund", "evidence": "payroll"}
+    hits = matcher.match("Stripe refund Cash flow Help", "SaaS", refund)
+    assert [(wl["id"], kw) for wl, kw in hits] == [(2, "quote:payroll")]
+
+    # Keywords never match text that only appears in the extra query fields
+    hits = matcher.match("Podcast hosting", "SaaS", {"signal_summary": "Podcast hosting", "evidence": "payout"})
+    assert [(wl["id"], kw) for wl, kw in hits] == [(3, "NOT stripe")]
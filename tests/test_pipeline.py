@@ -71,10 +71,12 @@ async def test_run_pipeline_fetch_new(mock_llm, sample_post, sample_full_analysi
         def __init__(self):
             self.subreddits = ["test"]
             self.listing = "new"
+            self.fetchers = {}
             self.posts_per_subreddit = 5
             self.top_comments = 5
             self.max_concurrency = 1
             self.db_path = ":memory:"
+            self.database_url = None
             self.user_agent = "test-agent"
 
     settings = MockRunSettings()
@@ -90,6 +92,8 @@ async def test_run_pipeline_fetch_new(mock_llm, sample_post, sample_full_analysi
             mock_store.close = AsyncMock()
             mock_store.create_run = AsyncMock(return_value=1)
             mock_store.upsert_posts = AsyncMock()
+            mock_store.get_high_water_marks = AsyncMock(return_value={})
+            mock_store.update_high_water_marks = AsyncMock()
             mock_store.save_signal = AsyncMock()
             mock_store.get_top_signals = AsyncMock(return_value=[])
             mock_store.get_stats = AsyncMock(return_value={})
@@ -111,10 +115,12 @@ async def test_run_pipeline_error(mock_llm):
         def __init__(self):
             self.subreddits = ["test"]
             self.listing = "new"
+            self.fetchers = {}
             self.posts_per_subreddit = 5
             self.top_comments = 5
             self.max_concurrency = 1
             self.db_path = ":memory:"
+            self.database_url = None
             self.user_agent = "test-agent"
 
     settings = MockRunSettings()
@@ -126,6 +132,7 @@ async def test_run_pipeline_error(mock_llm):
         mock_store.close = AsyncMock()
         mock_store.create_run = AsyncMock(return_value=1)
         mock_store.update_run = AsyncMock()
+        mock_store.get_high_water_marks = AsyncMock(return_value={})
 
         # Force an error in fetch
         with patch("pain_radar.pipeline.fetch_all_subreddits", side_effect=Exception("Fetch failed")):
@@ -152,10 +159,12 @@ async def test_run_pipeline_existing_posts(mock_llm, sample_post, sample_full_an
         def __init__(self):
             self.subreddits = ["test"]
             self.listing = "new"
+            self.fetchers = {}
             self.posts_per_subreddit = 5
             self.top_comments = 5
             self.max_concurrency = 1
             self.db_path = ":memory:"
+            self.database_url = None
             self.user_agent = "test-agent"
 
     settings = MockRunSettings()
@@ -191,10 +200,12 @@ async def test_run_pipeline_process_limit(mock_llm, sample_post, sample_full_ana
         def __init__(self):
             self.subreddits = ["test"]
             self.listing = "new"
+            self.fetchers = {}
             self.posts_per_subreddit = 5
             self.top_comments = 5
             self.max_concurrency = 1
             self.db_path = ":memory:"
+            self.database_url = None
             self.user_agent = "test-agent"
 
     settings = MockRunSettings()
@@ -232,10 +243,12 @@ async def test_run_fetch_only(sample_post):
         def __init__(self):
             self.subreddits = ["test"]
             self.listing = "new"
+            self.fetchers = {}
             self.posts_per_subreddit = 5
             self.top_comments = 5
             self.max_concurrency = 1
             self.db_path = ":memory:"
+            self.database_url = None
             self.user_agent = "test-agent"
 
     settings = MockRunSettings()
@@ -247,9 +260,14 @@ async def test_run_fetch_only(sample_post):
             mock_store.init_db = AsyncMock()
             mock_store.close = AsyncMock()
             mock_store.upsert_posts = AsyncMock()
+            mock_store.get_high_water_marks = AsyncMock(return_value={})
+            mock_store.update_high_water_marks = AsyncMock()
 
             count = await run_fetch_only(settings)
 
             assert count == 1
             mock_fetch.assert_called_once()
             mock_store.upsert_posts.assert_called_once()
+            mock_store.update_high_water_marks.assert_awaited_once_with(
+                "new", {sample_post.subreddit.lower(): (sample_post.created_utc, sample_post.id)}
+            )
@@ -0,0 +1,351 @@
+"""Tests for the Postgres store.
+
+Set PAIN_RADAR_TEST_DATABASE_URL to a scratch database (its tables are
+dropped) to run the tests that need a server.
+"""
+
+import dataclasses
+import importlib.util
+import json
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from pain_radar import embeddings
+from pain_radar.archive import archive_older_than, read_archive
+from pain_radar.embeddings import HashingEmbedder, embed_signals, load_index
+from pain_radar.export import export_signals
+from pain_radar.models import Cluster, ExtractionState, PainSignal
+from pain_radar.query import QuerySyntaxError
+from pain_radar.recurrence import track_recurrence
+from pain_radar.report import generate_json_report
+from pain_radar.store import AsyncStore, PostgresStore
+
+TEST_DATABASE_URL = os.environ.get("PAIN_RADAR_TEST_DATABASE_URL")
+
+needs_postgres = pytest.mark.skipif(
+    not TEST_DATABASE_URL or importlib.util.find_spec("asyncpg") is None,
+    reason="needs asyncpg and PAIN_RADAR_TEST_DATABASE_URL",
+)
+
+
+@pytest.fixture
+async def pg_store():
+    store = PostgresStore(TEST_DATABASE_URL, max_pool_size=4)
+    async with store.connection() as conn:
+        await conn.execute(
+            """
+            DROP TABLE IF EXISTS alert_matches, watchlists, signal_embeddings, embedding_models, signals_search,
+                clusters, cluster_lineages, import_comments, evidence, signals, comments, runs, source_sets, posts
+            CASCADE
+            """
+        )
+    await store.init_db()
+    try:
+        yield store
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(importlib.util.find_spec("asyncpg") is not None, reason="asyncpg is installed")
+async def test_connect_without_asyncpg_names_the_extra():
+    store = PostgresStore("postgresql://localhost/pain_radar")
+    with pytest.raises(ImportError, match=r"pain-radar\[postgres\]"):
+        await store.connect()
+
+
+def test_postgres_store_has_every_store_method():
+    missing = [name for name in vars(AsyncStore) if not name.startswith("_") and not hasattr(PostgresStore, name)]
+    assert missing == []
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_posts_and_signals(pg_store, sample_post, sample_full_analysis_extracted):
+    posts = [
+        dataclasses.replace(sample_post, id=f"p{i}", score=i, top_comments=[f"comment {i}", "second"]) for i in range(5)
+    ]
+    # Duplicates in a batch collapse to the last copy
+    assert await pg_store.upsert_posts([*posts, dataclasses.replace(posts[0], title="Retitled")]) == 5
+    assert await pg_store.upsert_posts(posts[:2]) == 2
+
+    unprocessed = await pg_store.get_unprocessed_posts(limit=10)
+    assert [p.id for p in unprocessed] == ["p4", "p3", "p2", "p1", "p0"]
+    assert unprocessed[0].top_comments == ["comment 4", "second"]
+
+    run_id = await pg_store.create_run(["test"])
+    extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+    ids = [await pg_store.save_signal(post, extraction, score, run_id=run_id) for post in posts]
+    await pg_store.update_run(run_id, posts_fetched=5, signals_saved=5)
+
+    first, cursor = await pg_store.get_signals_page(limit=3, fields=["id", "post_title"])
+    rest, last_cursor = await pg_store.get_signals_page(limit=3, after=cursor, fields=["id"])
+    assert [s["id"] for s in first + rest] == sorted(ids)
+    assert last_cursor is None
+    with pytest.raises(ValueError, match="Unknown signal field"):
+        await pg_store.get_signals_page(fields=["nope"])
+
+    detail = await pg_store.get_signal_detail(ids[0])
+    assert detail["post_title"] == sample_post.title
+    assert detail["top_comments"] == '["comment 0", "second"]'
+    assert len(await pg_store.get_signals_for_run(run_id)) == 5
+    assert (await pg_store.get_run(run_id))["signals_saved"] == 5
+
+    stats = await pg_store.get_stats()
+    assert stats["total_posts"] == 5
+    assert stats["processed_posts"] == 5
+    assert stats["qualified_signals"] == 5
+
+    items = await pg_store.get_unclustered_pain_points()
+    assert len(items) == 5
+    assert [e.quote for e in items[0].evidence] == [e.quote for e in extraction.evidence]
+    assert len(await pg_store.get_evidence(limit=100)) == 5 * len(extraction.evidence)
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_iter_signals_and_exports(tmp_path, pg_store, sample_post, sample_full_analysis_extracted):
+    posts = [dataclasses.replace(sample_post, id=f"p{i}") for i in range(5)]
+    await pg_store.upsert_posts(posts)
+    run_id = await pg_store.create_run(["test"])
+    extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+    ids = [await pg_store.save_signal(post, extraction, score, run_id=run_id) for post in posts]
+
+    chunks = [chunk async for chunk in pg_store.iter_signals(fields=["id", "post_title"], chunk_size=2)]
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [s["id"] for chunk in chunks for s in chunk] == ids
+    assert set(chunks[0][0]) == {"id", "post_title"}
+
+    chunks = [chunk async for chunk in pg_store.iter_signals(run_id=run_id, limit=3, with_post_text=True)]
+    assert [s["id"] for chunk in chunks for s in chunk] == ids[:3]
+    assert json.loads(chunks[0][0]["top_comments"]) == sample_post.top_comments
+
+    report_path = await generate_json_report(pg_store, run_id=run_id, output_dir=str(tmp_path))
+    with open(report_path) as f:
+        assert [idea["id"] for idea in json.load(f)["ideas"]] == ids
+
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "signals.parquet"
+    assert await export_signals(pg_store, path, chunk_size=2) == 5
+    table = pq.read_table(path)
+    assert table.schema.field("total_score").type == "int64"
+    assert table.schema.field("confidence").type == "double"
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_source_sets(pg_store):
+    source_set_id = await pg_store.create_source_set("SaaS", ["SaaS", "startups"], preset_key="indie_saas")
+    assert (await pg_store.get_source_set_by_preset("indie_saas"))["id"] == source_set_id
+
+    assert await pg_store.update_source_set(source_set_id, subreddits=["SaaS", "microsaas"], listing="top")
+    updated = await pg_store.get_source_set(source_set_id)
+    assert updated["subreddits"] == ["SaaS", "microsaas"]
+    assert updated["listing"] == "top"
+    assert await pg_store.get_all_active_subreddits() == ["SaaS", "microsaas"]
+
+    await pg_store.delete_source_set(source_set_id)
+    assert await pg_store.get_source_sets() == []
+
+
+async def _save_signals(store, post, summaries):
+    ids = []
+    for summary in summaries:
+        signal = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary=summary, pain_point=summary)
+        ids.append(await store.save_signal(post, signal, run_id=await store.create_run([post.subreddit])))
+    return ids
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_search_signals(pg_store, sample_post, sample_full_analysis_extracted):
+    await pg_store.upsert_posts([sample_post])
+    analysis = sample_full_analysis_extracted
+    found_id = await pg_store.save_signal(sample_post, analysis.extraction, score=analysis.score)
+    payouts = PainSignal(
+        extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe payouts delayed", pain_point="Cash flow"
+    )
+    payouts_id = await pg_store.save_signal(sample_post, payouts, run_id=await pg_store.create_run(["test"]))
+
+    # Stemmed summary match, evidence quote, post title
+    assert [r["id"] for r in await pg_store.search_signals("payout")] == [payouts_id]
+    assert [r["id"] for r in await pg_store.search_signals("can't find")] == [found_id]
+    assert {r["id"] for r in await pg_store.search_signals("test title")} == {found_id, payouts_id}
+    assert await pg_store.search_signals("   ") == []
+
+    # Query language: boolean operators, field scoping, malformed and negative-only input
+    assert [r["id"] for r in await pg_store.search_signals("title:test -stripe")] == [found_id]
+    assert [r["id"] for r in await pg_store.search_signals("pain:cash OR user:nobody")] == [payouts_id]
+    assert [r["id"] for r in await pg_store.search_signals("sub:test_subreddit strip*")] == [payouts_id]
+    with pytest.raises(QuerySyntaxError):
+        await pg_store.search_signals('"stripe* (')
+    with pytest.raises(QuerySyntaxError, match="positive term"):
+        await pg_store.search_signals("-stripe")
+
+    results = await pg_store.search_signals("stripe")
+    assert "[Stripe]" in results[0]["snippet"]
+    assert results[0]["rank"] < 0
+    assert await pg_store.search_signals("stripe", subreddit="other") == []
+    assert await pg_store.search_signals("stripe", min_score=1) == []
+
+    # Post title changes and deletes are reflected
+    await pg_store.upsert_posts([dataclasses.replace(sample_post, title="Invoicing woes")])
+    assert len(await pg_store.search_signals("invoicing")) == 2
+    async with pg_store.connection() as conn:
+        await conn.execute("DELETE FROM signals WHERE id = $1", payouts_id)
+    assert await pg_store.search_signals("payout") == []
+
+    # Signals stored before the search table existed are backfilled on init
+    async with pg_store.connection() as conn:
+        await conn.execute("DROP TABLE signals_search")
+    await pg_store.init_db()
+    assert [r["id"] for r in await pg_store.search_signals("find")] == [found_id]
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_watchlists(pg_store, sample_post):
+    await pg_store.upsert_posts([sample_post])
+    stripe_id, podcast_id = await _save_signals(pg_store, sample_post, ["Stripe payouts delayed", "Podcast hosting"])
+
+    embedder = HashingEmbedder(dim=64)
+    keyword_id = await pg_store.create_watchlist("Payments", ["stripe"])
+    semantic_id = await pg_store.create_watchlist(
+        "Podcasts",
+        [],
+        description="Podcast hosting",
+        description_vector=(await embedder.embed(["Podcast hosting"]))[0],
+        embedding_model=embedder.name,
+        semantic_threshold=0.9,
+    )
+    assert await pg_store.get_semantic_watchlist_models() == {embedder.name}
+    with pytest.raises(QuerySyntaxError):
+        await pg_store.create_watchlist("Bad", [], query="(stripe")
+
+    await embed_signals(pg_store, embedder)
+    matches = await pg_store.check_watchlists(embedding_model=embedder.name)
+    assert {(m["watchlist_id"], m["signal_id"]) for m in matches} == {
+        (keyword_id, stripe_id),
+        (semantic_id, podcast_id),
+    }
+    assert (await pg_store.get_watchlist(keyword_id))["last_signal_id"] == podcast_id
+
+    # Cursors advanced: a second check records nothing, a rescan finds the same matches again
+    assert await pg_store.check_watchlists(embedding_model=embedder.name) == []
+    assert len(await pg_store.check_watchlists(rescan=True, embedding_model=embedder.name)) == 2
+    assert (await pg_store.get_watchlist(keyword_id))["total_matches"] == 1
+
+    pending = await pg_store.get_unnotified_matches()
+    assert len(pending) == 2
+    await pg_store.mark_matches_notified([m["id"] for m in pending])
+    assert await pg_store.get_unnotified_matches() == []
+
+    await pg_store.delete_watchlist(semantic_id)
+    assert [wl["id"] for wl in await pg_store.get_watchlists()] == [keyword_id]
+    embeddings._INDEX_CACHE.clear()
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_clusters_and_lineages(pg_store, sample_post):
+    stripe, podcast = [1.0, 0.0], [0.0, 1.0]
+    weeks = ["2026-09-14", "2026-09-21", "2026-09-28", "2026-10-05"]
+    for week_index, week_start in enumerate(weeks):
+        clusters = []
+        for title, vec, size in (("Stripe payouts", stripe, week_index + 1), ("Podcast hosting", podcast, 2)):
+            post = dataclasses.replace(sample_post, id=f"{title[:3]}_{week_start}")
+            await pg_store.upsert_posts([post])
+            ids = await _save_signals(pg_store, post, [title] * size)
+            clusters.append(
+                Cluster(
+                    title=f"{title} {week_start}",
+                    summary="s",
+                    target_audience="a",
+                    why_it_matters="w",
+                    signal_ids=ids,
+                    quotes=[],
+                    urls=[],
+                    centroid=vec,
+                )
+            )
+        cluster_ids = await pg_store.save_clusters(clusters, week_start)
+        # Saving the same clustering again updates the rows in place
+        assert await pg_store.save_clusters(clusters, week_start) == cluster_ids
+
+    result = await track_recurrence(pg_store)
+    assert result.weeks == weeks
+    assert (result.created, result.linked) == (2, 6)
+    growing = await pg_store.get_growing_lineages(min_streak=3)
+    assert [lin["title"] for lin in growing] == ["Stripe payouts 2026-09-14"]
+    assert growing[0]["last_signal_count"] == 4
+
+    # Recent centroids take incremental assignments
+    week = (datetime.now(UTC).date() - timedelta(days=1)).isoformat()
+    post = dataclasses.replace(sample_post, id="recent")
+    await pg_store.upsert_posts([post])
+    first, second = await _save_signals(pg_store, post, ["Stripe payouts", "Stripe payouts"])
+    [cluster_id] = await pg_store.save_clusters(
+        [
+            Cluster(
+                title="Recent",
+                summary="s",
+                target_audience="a",
+                why_it_matters="w",
+                signal_ids=[first],
+                quotes=[],
+                urls=[],
+                centroid=stripe,
+            )
+        ],
+        week,
+    )
+    assert [c["id"] for c in await pg_store.get_cluster_centroids(days=7)] == [cluster_id]
+    assert await pg_store.attach_signals_to_clusters({cluster_id: [second]}, {cluster_id: stripe}) == 1
+    assert (await pg_store.get_cluster_centroids(days=7))[0]["signal_count"] == 2
+
+
+@needs_postgres
+@pytest.mark.asyncio
+async def test_postgres_archive_import_and_storage(tmp_path, pg_store, sample_post, sample_full_analysis_extracted):
+    pytest.importorskip("pyarrow")
+    posts = [
+        dataclasses.replace(sample_post, id="jan", created_utc=1704153600),  # 2024-01-02
+        dataclasses.replace(sample_post, id="new", created_utc=4102444800),  # 2100-01-01
+    ]
+    await pg_store.upsert_posts(posts)
+    extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+    signal_ids = {post.id: await pg_store.save_signal(post, extraction, score) for post in posts}
+    embedder = HashingEmbedder(dim=64)
+    await embed_signals(pg_store, embedder)
+    assert len(await load_index(pg_store, embedder)) == 2
+
+    result = await archive_older_than(pg_store, tmp_path / "archive", timedelta(days=90))
+    assert (result.partitions, result.posts, result.signals) == (1, 1, 1)
+    assert [p["id"] for p in read_archive(tmp_path / "archive", "posts")] == ["jan"]
+    assert (await pg_store.get_stats())["total_posts"] == 1
+    assert (await load_index(pg_store, embedder)).ids.tolist() == [signal_ids["new"]]
+    embeddings._INDEX_CACHE.clear()
+
+    # Imports skip stored posts and attach the best staged comments
+    await pg_store.stage_import_comments([("a1", 1, "low"), ("a1", 9, "high"), ("new", 3, "not replacing")])
+    await pg_store.stage_import_comments([("a1", 5, "middle"), ("gone", 3, "no post")])
+    imported = [dataclasses.replace(sample_post, id="a1", top_comments=[]), posts[1], posts[1]]
+    assert await pg_store.import_posts(imported) == 1
+    assert await pg_store.attach_import_comments(per_post=2) == 2
+    unprocessed = {p.id: p for p in await pg_store.get_unprocessed_posts()}
+    assert unprocessed["a1"].top_comments == ["high", "middle"]
+
+    report = await pg_store.get_storage_report()
+    assert report["file_bytes"] > 0
+    assert "signals" in report["tables"]
+    assert [c["rows"] for c in report["columns"] if c["column"] == "raw_extraction"] == [1]
+    assert set(await pg_store.compress_blobs()) == {
+        "signals.raw_extraction",
+        "signals.raw_score",
+        "signals.evidence_signals",
+        "signals.competition_landscape",
+    }
+    await pg_store.vacuum()
+    await pg_store.incremental_vacuum()
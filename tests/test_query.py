@@ -0,0 +1,73 @@
+import pytest
+
+from pain_radar.query import Document, QuerySyntaxError, compile_query
+
+
+@pytest.fixture
+def doc():
+    return Document(
+        {
+            "signal_summary": "Stripe payouts delayed for weeks",
+            "pain_point": "Cash flow breaks when a bank transfer stalls",
+            "evidence": "we can't make payroll",
+            "post_title": "Invoicing is a nightmare",
+            "subreddit": "SaaS",
+        }
+    )
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("stripe payouts", True),
+        ("stripe AND refund", False),
+        ("stripe OR refund", True),
+        ('"bank transfer"', True),
+        ('"transfer bank"', False),
+        ("stripe -refund", True),
+        ("stripe NOT payouts", False),
+        ("NOT refund", True),
+        ("(refund OR payroll) AND sub:saas", True),
+        ("sub:Entrepreneur", False),
+        ('pain:"cash flow"', True),
+        ("summary:cash", False),
+        ("title:invoic*", True),
+        ("title:voic*", False),
+        ("pay", False),
+    ],
+)
+def test_query_matches_document(doc, query, expected):
+    """Test boolean operators, phrases, prefixes and field scoping."""
+    assert compile_query(query).matches(doc) is expected
+
+
+def test_query_anchors_and_fts_translation():
+    """Test required-word anchors and FTS5 translation."""
+    query = compile_query('stripe AND (payout OR "bank transfer") -refund')
+    assert query.anchors() == {"stripe"}
+    assert compile_query("payout OR bank").anchors() == {"payout", "bank"}
+    assert compile_query("payout OR NOT bank").anchors() is None
+    assert compile_query("sub:saas").anchors() is None
+
+    assert (
+        compile_query('pain:"cash flow" sub:SaaS').to_fts() == '({pain_point} : "cash flow") AND ({subreddit} : "saas")'
+    )
+    assert (
+        compile_query("stripe -refund")
+        .to_fts()
+        .endswith('NOT ({signal_summary pain_point evidence post_title} : "refund")')
+    )
+    with pytest.raises(QuerySyntaxError):
+        compile_query("NOT refund").to_fts()
+
+
+@pytest.mark.parametrize("query", ["", "(stripe", "stripe)", '"unterminated', "stripe OR", "pain:", "AND"])
+def test_query_syntax_errors(query):
+    """Test malformed queries are rejected."""
+    with pytest.raises(QuerySyntaxError):
+        compile_query(query)
+
+
+def test_compile_query_is_cached():
+    """Test identical query text compiles once."""
+    assert compile_query("stripe -refund") is compile_query("stripe -refund")
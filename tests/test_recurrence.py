@@ -0,0 +1,119 @@
+import numpy as np
+import pytest
+
+from pain_radar.models import Cluster, ExtractionState, PainSignal
+from pain_radar.recurrence import advance_growth, match_lineages, track_recurrence
+from pain_radar.reddit_async import RedditPost
+from pain_radar.store.core import AsyncStore
+
+
+def test_match_lineages_is_one_to_one():
+    """Test clusters match the best lineage above threshold, each lineage used once."""
+    clusters = [
+        {"id": "a", "centroid": np.array([1.0, 0.0]), "subreddits": {"SaaS"}},
+        {"id": "b", "centroid": np.array([0.9, 0.1]) / np.linalg.norm([0.9, 0.1]), "subreddits": set()},
+        {"id": "c", "centroid": np.array([0.0, 1.0]), "subreddits": set()},
+    ]
+    lineages = [{"id": 7, "centroid": np.array([1.0, 0.0]), "subreddits": {"SaaS", "startups"}}]
+
+    assert match_lineages(clusters, lineages, threshold=0.5) == {"a": 7}
+    assert match_lineages(clusters, [], threshold=0.5) == {}
+
+
+def test_match_lineages_prefers_shared_subreddits():
+    """Test subreddit overlap breaks near-ties in centroid similarity."""
+    lineage = {"id": 7, "centroid": np.array([1.0, 0.0]), "subreddits": {"SaaS"}}
+    elsewhere = {"id": "x", "centroid": np.array([1.0, 0.0]), "subreddits": {"podcasting"}}
+    same_sub = {"id": "y", "centroid": np.array([0.99, 0.141]), "subreddits": {"SaaS"}}
+
+    assert match_lineages([elsewhere, same_sub], [lineage], threshold=0.5) == {"y": 7}
+
+
+def test_advance_growth_streaks():
+    """Test growth streak across consecutive, repeated and skipped weeks."""
+    lineage = {"last_week": "2026-09-07", "weeks_seen": 1, "last_signal_count": 2}
+
+    lineage.update(advance_growth(lineage, "2026-09-14", 3))
+    assert (lineage["growth_streak"], lineage["weeks_seen"]) == (1, 2)
+    assert lineage["growth_rate"] == pytest.approx(0.5)
+
+    lineage.update(advance_growth(lineage, "2026-09-21", 5))
+    assert lineage["growth_streak"] == 2
+
+    # Re-observing the same week with more signals does not double count
+    lineage.update(advance_growth(lineage, "2026-09-21", 6))
+    assert (lineage["growth_streak"], lineage["weeks_seen"]) == (2, 3)
+
+    # A drop resets the streak
+    assert advance_growth(lineage, "2026-09-28", 1)["growth_streak"] == 0
+    # A skipped week breaks it too
+    assert advance_growth(lineage, "2026-10-05", 10)["growth_streak"] == 0
+    # Older weeks are ignored
+    assert advance_growth(lineage, "2026-09-14", 10) is None
+
+
+def _post(post_id: str) -> RedditPost:
+    return RedditPost(
+        id=post_id,
+        title="Stripe payouts",
+        body="",
+        url="",
+        subreddit="SaaS",
+        created_utc=0,
+        score=1,
+        num_comments=0,
+        permalink="",
+        top_comments=[],
+    )
+
+
+@pytest.mark.asyncio
+async def test_track_recurrence_finds_growing_clusters():
+    """Test clusters are linked across weeks and a three-week growth streak is queryable."""
+    store = AsyncStore(":memory:")
+    await store.init_db()
+
+    stripe = [1.0, 0.0]
+    podcast = [0.0, 1.0]
+    weeks = ["2026-09-14", "2026-09-21", "2026-09-28", "2026-10-05"]
+    run_id = 0
+
+    for week_index, week_start in enumerate(weeks):
+        clusters = []
+        for title, vec, size in (("Stripe payouts", stripe, week_index + 1), ("Podcast hosting", podcast, 2)):
+            ids = []
+            for n in range(size):
+                post = _post(f"{title[:3]}_{week_start}_{n}")
+                await store.upsert_posts([post])
+                run_id += 1
+                signal = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary=title, pain_point=title)
+                ids.append(await store.save_signal(post, signal, run_id=run_id))
+            clusters.append(
+                Cluster(
+                    title=f"{title} {week_start}",
+                    summary="s",
+                    target_audience="a",
+                    why_it_matters="w",
+                    signal_ids=ids,
+                    quotes=[],
+                    urls=[],
+                    centroid=vec,
+                )
+            )
+        await store.save_clusters(clusters, week_start)
+
+    result = await track_recurrence(store)
+    assert result.weeks == weeks
+    assert result.created == 2
+    assert result.linked == 6
+
+    growing = await store.get_growing_lineages(min_streak=3)
+    assert [lin["title"] for lin in growing] == ["Stripe payouts 2026-09-14"]
+    assert growing[0]["last_signal_count"] == 4
+    assert growing[0]["weeks_seen"] == 4
+
+    # Idempotent: nothing left to link on a second pass
+    again = await track_recurrence(store)
+    assert again.weeks == [] and again.linked == 0
+
+    await store.close()
@@ -2,7 +2,16 @@ import httpx
 import pytest
 import respx
 
-from pain_radar.reddit_async import RedditPost, _clean_html, _extract_post_id, _parse_rss_entry, fetch_all_subreddits
+from pain_radar.reddit_async import (
+    RedditPost,
+    _clean_html,
+    _extract_post_id,
+    _parse_listing_child,
+    _parse_rss_entry,
+    fetch_all_subreddits,
+    high_water_marks,
+    is_seen,
+)
 
 
 def test_extract_post_id():
@@ -65,3 +74,109 @@ async def test_fetch_all_subreddits():
         assert len(posts) == 1
         assert posts[0].id == "post1"
         assert posts[0].top_comments == ["Comment 1"]
+
+
+def _listing_child(post_id, score=10, created_utc=1704153600.0):
+    return {
+        "kind": "t3",
+        "data": {
+            "id": post_id,
+            "subreddit": "test",
+            "title": "Invoices & receipts",
+            "selftext": "Body",
+            "created_utc": created_utc,
+            "score": score,
+            "num_comments": 4,
+            "permalink": f"/r/test/comments/{post_id}/title/",
+            "url": f"https://www.reddit.com/r/test/comments/{post_id}/title/",
+        },
+    }
+
+
+def test_parse_listing_child():
+    """Test parsing a JSON listing child keeps the engagement data RSS lacks."""
+    post = _parse_listing_child(_listing_child("abc123", score=42), "test")
+    assert post.id == "abc123"
+    assert post.title == "Invoices & receipts"
+    assert post.score == 42
+    assert post.num_comments == 4
+    assert post.created_utc == 1704153600
+    assert post.permalink == "https://www.reddit.com/r/test/comments/abc123/title/"
+    assert _parse_listing_child({"kind": "t1", "data": {"id": "c1"}}, "test") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_all_subreddits_json_listing(monkeypatch):
+    """Test the JSON fetcher follows after cursors up to the limit."""
+    monkeypatch.setattr("pain_radar.reddit_async.REQUEST_DELAY", 0)
+    monkeypatch.setattr("pain_radar.reddit_async.LISTING_PAGE_SIZE", 2)
+    pages = {
+        None: ([_listing_child("p1"), _listing_child("p2")], "t3_p2"),
+        "t3_p2": ([_listing_child("p3"), _listing_child("p4")], "t3_p4"),
+    }
+
+    def listing(request):
+        children, after = pages[request.url.params.get("after")]
+        assert request.url.params["raw_json"] == "1"
+        return httpx.Response(200, json={"kind": "Listing", "data": {"children": children, "after": after}})
+
+    with respx.mock(base_url="https://www.reddit.com") as respx_mock:
+        route = respx_mock.get("/r/test/new.json").mock(side_effect=listing)
+
+        posts = await fetch_all_subreddits(
+            subreddits=["test"],
+            listing="new",
+            limit=3,
+            top_comments=0,
+            max_concurrency=1,
+            user_agent="test-agent",
+            fetchers={"test": "json"},
+        )
+
+        assert [p.id for p in posts] == ["p1", "p2", "p3"]
+        assert route.call_count == 2
+        assert [call.request.url.params["limit"] for call in route.calls] == ["2", "1"]
+        assert posts[0].score == 10
+
+
+def test_high_water_marks():
+    """Test marks pick each subreddit's newest post and tell seen posts apart."""
+    posts = [
+        _parse_listing_child(_listing_child(post_id, created_utc=created), "test")
+        for post_id, created in (("zz", 100), ("10a", 200), ("10b", 200), ("9z", 150))
+    ]
+    marks = high_water_marks(posts)
+    assert marks == {"test": (200, "10b")}
+    assert is_seen(posts[1], marks["test"])
+    assert not is_seen(posts[1], (200, "zz"))
+    assert not is_seen(posts[0], None)
+
+
+@pytest.mark.asyncio
+async def test_fetch_stops_at_high_water_mark(monkeypatch):
+    """Test a poll with a mark fetches one page and skips comments of seen posts."""
+    monkeypatch.setattr("pain_radar.reddit_async.REQUEST_DELAY", 0)
+    children = [_listing_child(f"p{i}", created_utc=1000 - i) for i in range(1, 5)]
+
+    with respx.mock(base_url="https://www.reddit.com") as respx_mock:
+        route = respx_mock.get("/r/Test/new.json").mock(
+            return_value=httpx.Response(200, json={"data": {"children": children, "after": "t3_p4"}})
+        )
+        comments = respx_mock.get("/r/test/comments/p1/title/.json").mock(
+            return_value=httpx.Response(200, json=[{}, {"data": {"children": []}}])
+        )
+
+        posts = await fetch_all_subreddits(
+            subreddits=["Test"],
+            listing="new",
+            limit=100,
+            top_comments=1,
+            max_concurrency=1,
+            user_agent="test-agent",
+            fetchers={"Test": "json"},
+            marks={"test": (998, "p2")},
+        )
+
+        assert [p.id for p in posts] == ["p1"]
+        assert route.call_count == 1
+        assert comments.call_count == 1
@@ -0,0 +1,106 @@
+import dataclasses
+
+import orjson
+import pytest
+import zstandard
+
+from pain_radar.reddit_dumps import import_dumps, iter_dump_lines, parse_comment, parse_submission
+from pain_radar.store import AsyncStore
+
+
+def _submission(post_id, subreddit="SaaS", created_utc=1704153600, **extra):
+    return {
+        "id": post_id,
+        "subreddit": subreddit,
+        "title": f"Post {post_id}",
+        "selftext": "Invoicing is painful",
+        "created_utc": created_utc,
+        "score": 12,
+        "num_comments": 3,
+        "permalink": f"/r/{subreddit}/comments/{post_id}/post/",
+        **extra,
+    }
+
+
+def _comment(post_id, body, score, subreddit="SaaS", parent_id=None):
+    return {
+        "link_id": f"t3_{post_id}",
+        "parent_id": parent_id or f"t3_{post_id}",
+        "subreddit": subreddit,
+        "body": body,
+        "score": score,
+        "created_utc": 1704160000,
+    }
+
+
+def _write_dump(path, entries):
+    data = b"".join(orjson.dumps(entry) + b"\n" for entry in entries)
+    path.write_bytes(zstandard.ZstdCompressor().compress(data) if path.suffix == ".zst" else data)
+    return path
+
+
+def test_parse_dump_entries(tmp_path):
+    post = parse_submission(_submission("abc", selftext="[removed]", created_utc="1704153600.0"))
+    assert post.body == ""
+    assert post.created_utc == 1704153600
+    assert post.permalink == "https://www.reddit.com/r/SaaS/comments/abc/post/"
+    assert parse_submission({"title": "no id"}) is None
+
+    assert parse_comment(_comment("abc", "Same here", 4)) == ("abc", 4, "Same here")
+    assert parse_comment(_comment("abc", "A reply", 4, parent_id="t1_xyz")) is None
+    assert parse_comment(_comment("abc", "[deleted]", 4)) is None
+
+    path = _write_dump(tmp_path / "RS.zst", [_submission(str(i)) for i in range(3)])
+    assert [orjson.loads(line)["id"] for line in iter_dump_lines(path)] == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_import_dumps(tmp_path, sample_post):
+    submissions = _write_dump(
+        tmp_path / "RS_2024-01.zst",
+        [
+            _submission("a1"),
+            _submission("a2", subreddit="saas"),
+            _submission("old", created_utc=1600000000),
+            _submission("b1", subreddit="Other"),
+            _submission("live"),
+        ],
+    )
+    comments = _write_dump(
+        tmp_path / "RC_2024-01.ndjson",
+        [
+            _comment("a1", "low", 1),
+            _comment("a1", "high", 9),
+            _comment("a1", "middle", 5),
+            _comment("a1", "reply", 50, parent_id="t1_x"),
+            _comment("old", "filtered post", 3),
+            _comment("live", "not replacing scraped comments", 3),
+        ],
+    )
+
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        await store.upsert_posts([dataclasses.replace(sample_post, id="live", top_comments=["scraped"])])
+        result = await import_dumps(
+            store,
+            [submissions, comments],
+            subreddits=["SAAS"],
+            since_utc=1700000000,
+            comments_per_post=2,
+            batch_size=2,
+        )
+
+        assert result.lines == 11
+        assert result.posts == 2
+        assert result.comments == 2
+        assert result.lines_per_second > 0
+
+        posts = {p.id: p for p in await store.get_unprocessed_posts(limit=10)}
+        assert set(posts) == {"a1", "a2", "live"}
+        assert posts["a1"].top_comments == ["high", "middle"]
+        assert posts["a1"].score == 12
+        assert posts["live"].title == sample_post.title
+        assert posts["live"].top_comments == ["scraped"]
+    finally:
+        await store.close()
@@ -137,9 +137,11 @@ async def test_generate_json_report(tmp_path):
     """Test generating a JSON report."""
     mock_store = MagicMock()
     mock_store.get_runs = AsyncMock(return_value=[{"id": 1}])
-    mock_store.get_signals_for_run = AsyncMock(
-        return_value=[{"id": 1, "signal_summary": "Test signal", "total_score": 40, "disqualified": False}]
-    )
+
+    async def iter_signals(**kwargs):
+        yield [{"id": 1, "signal_summary": "Test signal", "total_score": 40, "why": '["Recurring"]'}]
+
+    mock_store.iter_signals = iter_signals
     mock_store.get_stats = AsyncMock(return_value={"avg_score": 40})
 
     output_dir = tmp_path / "reports"
@@ -150,3 +152,5 @@ async def test_generate_json_report(tmp_path):
         data = json.load(f)
         assert data["run"]["id"] == 1
         assert data["ideas"][0]["signal_summary"] == "Test signal"
+        assert data["ideas"][0]["why"] == ["Recurring"]
+        assert data["stats"]["avg_score"] == 40
@@ -0,0 +1,140 @@
+import asyncio
+import dataclasses
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from pain_radar.store import AsyncStore
+from pain_radar.workers.scheduler import PollScheduler
+
+NOW = 1_750_000_000.0
+HOUR = 3600
+
+
+@pytest.fixture
+def settings():
+    return SimpleNamespace(posts_per_subreddit=50, top_comments=0, max_concurrency=2, user_agent="test-agent")
+
+
+@pytest.fixture
+async def store(tmp_path, sample_post):
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    # Busy: 48 posts over the last day; Quiet: 2 posts over the last week
+    posts = [
+        dataclasses.replace(sample_post, id=f"b{i}", subreddit="Busy", created_utc=int(NOW - 24 * HOUR + i * 1800))
+        for i in range(47)
+    ]
+    posts.append(dataclasses.replace(sample_post, id="b47", subreddit="busy", created_utc=int(NOW - 60)))
+    posts += [
+        dataclasses.replace(sample_post, id=f"q{i}", subreddit="Quiet", created_utc=int(NOW - days * 86400))
+        for i, days in enumerate((6, 0.5))
+    ]
+    posts.append(dataclasses.replace(sample_post, id="old", subreddit="Quiet", created_utc=int(NOW - 30 * 86400)))
+    await store.upsert_posts(posts)
+    try:
+        yield store
+    finally:
+        await store.close()
+
+
+def _scheduler(store, settings, clock):
+    fetchers = {"Busy": "rss", "Quiet": "json", "Fresh": "rss"}
+    return PollScheduler(store, settings, fetchers=fetchers, clock=lambda: clock[0])
+
+
+@pytest.mark.asyncio
+async def test_refresh_learns_rates(store, settings):
+    velocity = await store.get_post_velocity(int(NOW - 7 * 86400))
+    assert velocity["busy"]["posts"] == 48
+    assert velocity["quiet"]["posts"] == 2
+
+    scheduler = _scheduler(store, settings, [NOW])
+    await scheduler.refresh()
+    busy, quiet, fresh = (scheduler.schedules[k] for k in ("busy", "quiet", "fresh"))
+
+    assert busy.posts_per_hour == pytest.approx(2.0, rel=0.01)
+    # Half an RSS page (12.5 posts) at 2 posts/hour, counted from the newest post
+    assert scheduler.interval(busy) == pytest.approx(6.25 * HOUR, rel=0.01)
+    assert busy.next_poll == pytest.approx(NOW - 60 + scheduler.interval(busy))
+    # A JSON page holds posts_per_subreddit posts; at 2 a week that's past the maximum
+    assert scheduler.interval(quiet) == scheduler.max_interval
+    assert fresh.rate == 0
+    assert [s.subreddit for s in scheduler.due()] == ["Fresh"]
+
+
+@pytest.mark.asyncio
+async def test_poll_adapts_to_new_posts(store, settings, sample_post):
+    clock = [NOW]
+    scheduler = _scheduler(store, settings, clock)
+    new_posts = []
+
+    async def _fetch(_store, poll_settings):
+        assert poll_settings.listing == "new"
+        return [p for p in new_posts if p.subreddit in poll_settings.subreddits]
+
+    with patch("pain_radar.workers.scheduler.fetch_and_store", side_effect=_fetch) as mock_fetch:
+        # A full RSS page on the first poll: assume it is busier than measured
+        new_posts = [dataclasses.replace(sample_post, id=f"f{i}", subreddit="Fresh") for i in range(25)]
+        result = await scheduler.run_once()
+        assert mock_fetch.call_args.args[1].subreddits == ["Fresh"]
+        assert result.subreddits_polled == 1
+        assert result.posts_new == 25
+        assert result.saturated == ["Fresh"]
+        fresh = scheduler.schedules["fresh"]
+        assert fresh.next_poll - NOW == pytest.approx(12.5 * scheduler.min_interval)
+
+        # Busy then gets 3 posts per hour: the estimate moves halfway there
+        busy = scheduler.schedules["busy"]
+        for hour in (1, 2):
+            clock[0] = NOW + hour * 7 * HOUR
+            new_posts = [dataclasses.replace(sample_post, id=f"n{hour}{i}", subreddit="Busy") for i in range(21)]
+            result = await scheduler.poll([busy])
+            assert result.saturated == []
+        assert busy.last_new_posts == 21
+        assert busy.posts_per_hour == pytest.approx(2.5, rel=0.01)
+        assert busy.next_poll == pytest.approx(clock[0] + 5 * HOUR, rel=0.01)
+
+
+@pytest.mark.asyncio
+async def test_run_forever_survives_failed_poll(store, settings):
+    scheduler = _scheduler(store, settings, [NOW])
+    stop = asyncio.Event()
+
+    async def _fail(*args):
+        stop.set()
+        raise RuntimeError("database is locked")
+
+    with patch("pain_radar.workers.scheduler.fetch_and_store", side_effect=_fail):
+        await asyncio.wait_for(scheduler.run_forever(stop), timeout=5)
+
+    assert scheduler.schedules["fresh"].next_poll == NOW + scheduler.min_interval
+
+
+@pytest.mark.asyncio
+async def test_run_forever_survives_failed_refresh(store, settings):
+    scheduler = PollScheduler(store, settings, fetchers={"Fresh": "rss"}, min_interval=0, clock=lambda: NOW)
+    stop = asyncio.Event()
+    original = store.get_post_velocity
+    calls = []
+
+    async def _flaky_velocity(since_utc):
+        calls.append(since_utc)
+        if len(calls) == 1:
+            raise RuntimeError("database is locked")
+        return await original(since_utc)
+
+    async def _fetch(*args):
+        stop.set()
+        return []
+
+    with (
+        patch.object(store, "get_post_velocity", side_effect=_flaky_velocity),
+        patch("pain_radar.workers.scheduler.fetch_and_store", side_effect=_fetch) as mock_fetch,
+    ):
+        await asyncio.wait_for(scheduler.run_forever(stop), timeout=5)
+
+    # The failed refresh was retried and polling went ahead
+    assert len(calls) == 2
+    assert mock_fetch.call_args.args[1].subreddits == ["Fresh"]
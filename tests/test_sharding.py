@@ -0,0 +1,69 @@
+import dataclasses
+
+import pytest
+
+from pain_radar.store import ShardRouter
+
+
+@pytest.fixture
+async def router(tmp_path):
+    router = ShardRouter(str(tmp_path / "shards"), max_open=2)
+    await router.connect()
+    try:
+        yield router
+    finally:
+        await router.close()
+
+
+@pytest.mark.asyncio
+async def test_tenants_get_separate_shards(router, sample_post):
+    """Each tenant's posts land in its own database file."""
+    async with router.store("acme") as store:
+        await store.upsert_posts([sample_post])
+    async with router.store("globex") as store:
+        await store.upsert_posts([dataclasses.replace(sample_post, id=f"g{i}") for i in range(3)])
+
+    tenants = await router.tenants()
+    assert [t["tenant_id"] for t in tenants] == ["acme", "globex"]
+    assert all((router.shard_dir / t["db_path"]).exists() for t in tenants)
+
+    async with router.store("acme", create=False) as store:
+        assert (await store.get_stats())["total_posts"] == 1
+
+    with pytest.raises(KeyError):
+        async with router.store("initech", create=False):
+            pass
+    with pytest.raises(ValueError, match="Invalid tenant ID"):
+        async with router.store("../escape"):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_lru_closes_idle_shards_only(router):
+    """Shards beyond max_open are closed least recently used first, never while in use."""
+    async with router.store("a") as a:
+        async with router.store("b"), router.store("c"):
+            # All three are pinned, so none can be closed yet
+            assert list(router._open) == ["a", "b", "c"]
+        # c was released first, while it was the only idle shard
+        assert list(router._open) == ["a", "b"]
+        assert a._connection is not None
+
+    async with router.store("d"):
+        pass
+    assert list(router._open) == ["b", "d"]
+    assert a._connection is None
+
+
+@pytest.mark.asyncio
+async def test_fan_out_stats(router, sample_post):
+    """get_stats combines every shard's counts."""
+    for tenant_id, count in (("acme", 2), ("globex", 3), ("initech", 0)):
+        async with router.store(tenant_id) as store:
+            await store.upsert_posts([dataclasses.replace(sample_post, id=f"{tenant_id}{i}") for i in range(count)])
+
+    stats = await router.get_stats()
+    assert {t: s["total_posts"] for t, s in stats["tenants"].items()} == {"acme": 2, "globex": 3, "initech": 0}
+    assert stats["total"]["total_posts"] == 5
+    assert stats["total"]["avg_score"] == 0
+    assert len(router._open) == 2
@@ -1,14 +1,20 @@
+import dataclasses
+import json
+
 import aiosqlite
 import pytest
 
 from pain_radar.models import (
     CompetitorNote,
     DistributionWedge,
+    EvidenceSignal,
     ExtractionState,
     ExtractionType,
     PainSignal,
     SignalScore,
+    SignalType,
 )
+from pain_radar.query import QuerySyntaxError
 from pain_radar.store.core import AsyncStore
 
 
@@ -98,6 +104,85 @@ async def test_async_store_signal_crud(sample_post, sample_full_analysis_extract
     await store.close()
 
 
+@pytest.mark.asyncio
+async def test_stats_counters_track_writes(sample_post, sample_full_analysis_extracted):
+    """Trigger-maintained stats match a full recount after inserts, replaces, updates and deletes."""
+    store = AsyncStore(":memory:")
+    await store.init_db()
+
+    second = dataclasses.replace(sample_post, id="post2")
+    await store.upsert_posts([sample_post, second])
+    await store.upsert_posts([sample_post])  # INSERT OR REPLACE of an existing post
+    assert (await store.get_stats())["total_posts"] == 2
+
+    extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+    first_id = await store.save_signal(post=sample_post, extraction=extraction, score=score)
+    second_id = await store.save_signal(post=second, extraction=extraction, score=score)
+
+    stats = await store.get_stats()
+    assert stats["processed_posts"] == 2  # save_signal marks the post processed
+    assert stats["total_signals"] == 2
+    assert stats["qualified_signals"] == 2
+    assert stats["avg_score"] == score.total
+
+    async with store.connection() as conn:
+        await conn.execute("UPDATE signals SET disqualified = 1 WHERE id = ?", (first_id,))
+        await conn.execute("UPDATE signals SET total_score = total_score + 10 WHERE id = ?", (second_id,))
+        await conn.execute("DELETE FROM posts WHERE id = ?", (second.id,))
+        await conn.commit()
+
+    stats = await store.get_stats()
+    assert stats == await store.recompute_stats()
+    assert stats["total_posts"] == 1
+    assert stats["processed_posts"] == 1
+    assert stats["qualified_signals"] == 1
+    assert stats["avg_score"] == score.total + 10
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_signals_keyset_pagination(sample_post, sample_full_analysis_extracted):
+    """Cursor pages cover every signal once in score order, with only the requested fields."""
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+
+    posts = [dataclasses.replace(sample_post, id=f"post{i}") for i in range(7)]
+    await store.upsert_posts(posts)
+    for i, post in enumerate(posts):
+        signal_id = await store.save_signal(post=post, extraction=extraction, score=score, run_id=1)
+        async with store.connection() as conn:
+            # Three distinct scores so pages split ties
+            await conn.execute("UPDATE signals SET total_score = ? WHERE id = ?", (30 + i % 3, signal_id))
+            await conn.commit()
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await store.get_signals_page(limit=3, after=cursor, fields=["id", "total_score", "subreddit"])
+        assert all(set(row) == {"id", "total_score", "subreddit"} for row in page)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    assert [(r["total_score"], r["id"]) for r in seen] == sorted(
+        ((r["total_score"], r["id"]) for r in seen), key=lambda k: (-k[0], k[1])
+    )
+    assert [r["id"] for r in await store.get_signals_for_run(1, fields=["id"])] == [r["id"] for r in seen]
+
+    chunks = [chunk async for chunk in store.iter_signals(fields=["id"], chunk_size=3)]
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [r["id"] for chunk in chunks for r in chunk] == [r["id"] for r in seen]
+
+    with pytest.raises(ValueError, match="Unknown signal field"):
+        await store.get_signals_page(fields=["id", "nope"])
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        await store.get_signals_page(after="not-a-cursor")
+
+    await store.close()
+
+
 @pytest.mark.asyncio
 async def test_async_store_disqualified_signal(sample_post):
     """Test saving a disqualified signal."""
@@ -174,6 +259,20 @@ async def test_async_store_source_set_crud():
     all_subs = await store.get_all_active_subreddits()
     assert all_subs == ["sub3"]
 
+    # 6b. Fetchers: a subreddit uses the JSON listing if any active set asks for it
+    assert await store.get_active_subreddit_fetchers() == {"sub3": "rss"}
+    json_id = await store.create_source_set(name="JSON Set", subreddits=["sub3", "sub4"], fetcher="json")
+    assert await store.get_active_subreddit_fetchers() == {"sub3": "json", "sub4": "json"}
+    await store.update_source_set(json_id, fetcher="rss")
+    assert (await store.get_source_set(json_id))["fetcher"] == "rss"
+    await store.delete_source_set(json_id)
+
+    # 6c. High-water marks only move forward
+    await store.update_high_water_marks("new", {"sub3": (200, "b2")})
+    await store.update_high_water_marks("new", {"sub3": (100, "a1"), "sub4": (50, "x")})
+    assert await store.get_high_water_marks("new") == {"sub3": (200, "b2"), "sub4": (50, "x")}
+    assert await store.get_high_water_marks("hot") == {}
+
     # 7. Delete (Deactivate)
     await store.delete_source_set(ss_id)
     sets_active = await store.get_source_sets(active_only=True)
@@ -280,6 +379,200 @@ async def test_store_watchlist_check_integration(sample_post):
     await store.close()
 
 
+@pytest.mark.asyncio
+async def test_watchlist_check_is_incremental(sample_post):
+    """Test checks only read signals added since the last check and record matches once."""
+    from pain_radar.models import ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:", match_on_write=False)
+    await store.init_db()
+    wl_id = await store.create_watchlist("Billing", ["stripe"])
+    await store.upsert_posts([sample_post])
+
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe fees", pain_point="Fees")
+    first_id = await store.save_signal(sample_post, ext, run_id=1)
+
+    assert [m["signal_id"] for m in await store.check_watchlists()] == [first_id]
+    assert await store.check_watchlists() == []
+
+    second_id = await store.save_signal(sample_post, ext, run_id=2)
+    assert [m["signal_id"] for m in await store.check_watchlists()] == [second_id]
+
+    # Rescan re-reads the window but does not duplicate recorded matches
+    assert len(await store.check_watchlists(rescan=True)) == 2
+    wl = await store.get_watchlist(wl_id)
+    assert wl["total_matches"] == 2
+    assert wl["last_signal_id"] == second_id
+    assert wl["last_checked_at"]
+
+    # Nothing new to scan: only the check time moves
+    assert await store.check_watchlists() == []
+    again = await store.get_watchlist(wl_id)
+    assert (again["total_matches"], again["last_signal_id"]) == (2, second_id)
+    assert again["last_checked_at"] > wl["last_checked_at"]
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_semantic_watchlist_matches_embedded_signals(sample_post):
+    """Test described watchlists match signals by stored embedding similarity."""
+    import numpy as np
+
+    from pain_radar.models import ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:", match_on_write=False)
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+        wl_id = await store.create_watchlist(
+            "Payments",
+            [],
+            description="payment failures",
+            description_vector=np.array([1.0, 0.0, 0.0]),
+            embedding_model="test-3",
+            semantic_threshold=0.5,
+        )
+        assert await store.get_semantic_watchlist_models() == {"test-3"}
+        assert (await store.get_watchlist(wl_id))["description_vector"].tolist() == [1.0, 0.0, 0.0]
+
+        ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Cards declined", pain_point="x")
+        near = await store.save_signal(sample_post, ext, run_id=1)
+        far = await store.save_signal(sample_post, ext, run_id=2)
+        await store.save_embeddings(
+            "test-3", [(near, "h1", np.array([0.8, 0.6, 0.0])), (far, "h2", np.array([0.0, 0.0, 1.0]))]
+        )
+
+        # Keyword-only checks ignore semantic watchlists
+        assert await store.check_watchlists(rescan=True) == []
+
+        matches = await store.check_watchlists(rescan=True, embedding_model="test-3")
+        assert [(m["signal_id"], m["keyword_matched"]) for m in matches] == [(near, "semantic:0.80")]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_query_watchlists(sample_post):
+    """Test query watchlists are validated on creation and matched on write and on check."""
+    from pain_radar.models import ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+        with pytest.raises(QuerySyntaxError):
+            await store.create_watchlist("Broken", [], query="(stripe")
+
+        await store.create_watchlist("Stripe", [], query="stripe -refund sub:test_subreddit")
+        fees_id = await store.create_watchlist("Fees", [], query='pain:"hidden fees"')
+        assert (await store.get_watchlist(fees_id))["query"] == 'pain:"hidden fees"'
+
+        ext = PainSignal(
+            extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe fees", pain_point="Hidden fees"
+        )
+        await store.save_signal(sample_post, ext, run_id=1)
+        refund = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe refund", pain_point="x")
+        await store.save_signal(sample_post, refund, run_id=2)
+
+        recorded = [(m["watchlist_name"], m["keyword_matched"]) for m in await store.get_unnotified_matches()]
+        assert sorted(recorded) == [("Fees", 'pain:"hidden fees"'), ("Stripe", "stripe -refund sub:test_subreddit")]
+
+        # The check path agrees with write-time matching
+        matches = await store.check_watchlists(rescan=True)
+        assert sorted((m["watchlist_name"], m["signal_id"]) for m in matches) == [("Fees", 1), ("Stripe", 1)]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_watchlist_matches_recorded_on_write(sample_post):
+    """Test saving a signal records watchlist matches immediately and picks up watchlist changes."""
+    from pain_radar.models import ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+        billing_id = await store.create_watchlist("Billing", ["stripe"])
+
+        ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe fees", pain_point="Fees")
+        first_id = await store.save_signal(sample_post, ext, run_id=1)
+
+        unnotified = await store.get_unnotified_matches()
+        assert [(m["watchlist_id"], m["signal_id"]) for m in unnotified] == [(billing_id, first_id)]
+
+        # A new watchlist invalidates the cached matcher; a deleted one stops matching
+        fees_id = await store.create_watchlist("Fees", ["fees"])
+        await store.delete_watchlist(billing_id)
+        second_id = await store.save_signal(sample_post, ext, run_id=2)
+
+        async with store.connection() as conn:
+            cursor = await conn.execute("SELECT watchlist_id FROM alert_matches WHERE signal_id = ?", (second_id,))
+            assert [row[0] for row in await cursor.fetchall()] == [fees_id]
+
+        # A later pull check does not record the same matches twice
+        await store.check_watchlists()
+        assert (await store.get_watchlist(fees_id))["total_matches"] == 2
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_semantic_watchlists_skip_write_time_matching(sample_post):
+    """Test semantic watchlists are left to check_watchlists, keywords included."""
+    import numpy as np
+
+    from pain_radar.models import ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+        wl_id = await store.create_watchlist(
+            "Payments",
+            ["declined"],
+            description="payment failures",
+            description_vector=np.array([1.0, 0.0, 0.0]),
+            embedding_model="test-3",
+        )
+
+        ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Cards declined", pain_point="x")
+        signal_id = await store.save_signal(sample_post, ext, run_id=1)
+        assert await store.get_unnotified_matches() == []
+
+        matches = await store.check_watchlists()
+        assert [(m["watchlist_id"], m["signal_id"], m["keyword_matched"]) for m in matches] == [
+            (wl_id, signal_id, "declined")
+        ]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_init_db_dedupes_alert_matches(tmp_path):
+    """Test duplicate alert matches are removed before the unique index is created."""
+    db_path = str(tmp_path / "old.sqlite3")
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.execute(
+            "CREATE TABLE alert_matches (id INTEGER PRIMARY KEY AUTOINCREMENT, watchlist_id INTEGER NOT NULL, "
+            "signal_id INTEGER NOT NULL, keyword_matched TEXT NOT NULL, created_at TEXT NOT NULL, "
+            "notified INTEGER DEFAULT 0, notified_at TEXT)"
+        )
+        await conn.executemany(
+            "INSERT INTO alert_matches (watchlist_id, signal_id, keyword_matched, created_at) VALUES (?, ?, 'k', '')",
+            [(1, 1), (1, 1), (1, 2)],
+        )
+        await conn.commit()
+
+    store = AsyncStore(db_path)
+    await store.init_db()
+    async with store.connection() as conn:
+        cursor = await conn.execute("SELECT id FROM alert_matches ORDER BY id")
+        assert [row[0] for row in await cursor.fetchall()] == [1, 3]
+    await store.close()
+
+
 @pytest.mark.asyncio
 async def test_store_clustering_integration(sample_post):
     """Test unclustered retrieval and saving clusters."""
@@ -317,3 +610,388 @@ async def test_store_clustering_integration(sample_post):
     assert len(items_after) == 0
 
     await store.close()
+
+
+@pytest.mark.asyncio
+async def test_save_clusters_ids_are_collision_safe_and_upsert(sample_post):
+    """Test similarly titled clusters don't collide and re-saving a week updates in place."""
+    from pain_radar.models import Cluster, ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    await store.upsert_posts([sample_post])
+
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Summary", pain_point="Pain")
+    first_id = await store.save_signal(sample_post, ext, run_id=1)
+    second_id = await store.save_signal(sample_post, ext, run_id=2)
+
+    def _cluster(title: str, signal_ids: list[int]) -> Cluster:
+        return Cluster(
+            title=title,
+            summary="Summary",
+            target_audience="Users",
+            why_it_matters="Why",
+            signal_ids=signal_ids,
+            quotes=[],
+            urls=[],
+        )
+
+    # Same 10-char title prefix and size used to produce the same ID
+    ids = await store.save_clusters(
+        [_cluster("Stripe Connect onboarding", [first_id]), _cluster("Stripe Connect payouts", [second_id])],
+        "2023-01-02",
+    )
+    assert len(set(ids)) == 2
+
+    # Re-saving the same clustering with a new title upserts
+    again = await store.save_clusters([_cluster("Stripe onboarding", [first_id])], "2023-01-02")
+    assert again == ids[:1]
+
+    async with store.connection() as conn:
+        cursor = await conn.execute("SELECT id, title FROM clusters ORDER BY id")
+        rows = {row["id"]: row["title"] for row in await cursor.fetchall()}
+        cursor = await conn.execute("SELECT cluster_id FROM signals WHERE id = ?", (second_id,))
+        second_cluster = (await cursor.fetchone())["cluster_id"]
+    assert len(rows) == 2
+    assert rows[ids[0]] == "Stripe onboarding"
+    assert second_cluster == ids[1]
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_save_clusters_removes_stale_groups_on_recluster(sample_post):
+    """Test re-clustering a week into different groups leaves no empty clusters behind."""
+    from pain_radar.models import Cluster, ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    await store.upsert_posts([sample_post])
+
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Summary", pain_point="Pain")
+    signal_ids = [await store.save_signal(sample_post, ext, run_id=run_id) for run_id in (1, 2, 3)]
+
+    def _cluster(title: str, members: list[int]) -> Cluster:
+        return Cluster(
+            title=title, summary="s", target_audience="a", why_it_matters="w", signal_ids=members, quotes=[], urls=[]
+        )
+
+    await store.save_clusters([_cluster("A", signal_ids[:1]), _cluster("B", signal_ids[1:])], "2023-01-02")
+    await store.save_clusters([_cluster("AB", signal_ids[:2])], "2023-01-02")
+    await store.save_clusters([_cluster("Other week", signal_ids[2:])], "2023-01-09")
+
+    async with store.connection() as conn:
+        cursor = await conn.execute("SELECT title, signal_count FROM clusters ORDER BY title")
+        rows = [tuple(row) for row in await cursor.fetchall()]
+    # "A" lost its only signal to "AB", then "B" lost its last one to another week
+    assert rows == [("AB", 2), ("Other week", 1)]
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_incremental_cluster_assignment(sample_post):
+    """Test cluster centroids are persisted and new signals can be attached."""
+    from datetime import date
+
+    from pain_radar.models import Cluster, ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    await store.upsert_posts([sample_post])
+
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Summary", pain_point="Pain")
+    first_id = await store.save_signal(sample_post, ext, run_id=1)
+    second_id = await store.save_signal(sample_post, ext, run_id=2)
+
+    cluster = Cluster(
+        title="Test Cluster",
+        summary="Summary",
+        target_audience="Users",
+        why_it_matters="Why",
+        signal_ids=[first_id],
+        quotes=[],
+        urls=[],
+        centroid=[1.0, 0.0],
+    )
+    await store.save_clusters([cluster], date.today().isoformat())
+
+    centroids = await store.get_cluster_centroids(days=7)
+    assert len(centroids) == 1
+    assert centroids[0]["signal_count"] == 1
+    assert centroids[0]["centroid"].tolist() == [1.0, 0.0]
+
+    cluster_id = centroids[0]["id"]
+    attached = await store.attach_signals_to_clusters({cluster_id: [second_id]}, {cluster_id: [0.0, 1.0]})
+    assert attached == 1
+
+    centroids = await store.get_cluster_centroids(days=7)
+    assert centroids[0]["signal_count"] == 2
+    assert centroids[0]["centroid"].tolist() == [0.0, 1.0]
+    assert await store.get_unclustered_pain_points() == []
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_store_cluster_assignment_rolls_back_on_failure(sample_post):
+    """Test a failed assignment leaves no signal attached to a cluster."""
+    from datetime import date
+
+    from pain_radar.models import Cluster, ExtractionState, PainSignal
+
+    store = AsyncStore(":memory:")
+    await store.init_db()
+    await store.upsert_posts([sample_post])
+
+    ext = PainSignal(extraction_state=ExtractionState.EXTRACTED, signal_summary="Summary", pain_point="Pain")
+    first_id = await store.save_signal(sample_post, ext, run_id=1)
+    second_id = await store.save_signal(sample_post, ext, run_id=2)
+
+    cluster = Cluster(
+        title="Test Cluster",
+        summary="Summary",
+        target_audience="Users",
+        why_it_matters="Why",
+        signal_ids=[first_id],
+        quotes=[],
+        urls=[],
+        centroid=[1.0, 0.0],
+    )
+    await store.save_clusters([cluster], date.today().isoformat())
+    cluster_id = (await store.get_cluster_centroids(days=7))[0]["id"]
+
+    # The centroid is missing, so the cluster update fails after the signal update
+    with pytest.raises(KeyError):
+        await store.attach_signals_to_clusters({cluster_id: [second_id]}, {})
+
+    assert [item.id for item in await store.get_unclustered_pain_points()] == [second_id]
+    assert (await store.get_cluster_centroids(days=7))[0]["signal_count"] == 1
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_init_db_migrates_old_clusters_table(tmp_path):
+    """Test columns added later are migrated into an existing database."""
+    db_path = str(tmp_path / "old.sqlite3")
+    async with aiosqlite.connect(db_path) as conn:
+        await conn.execute(
+            "CREATE TABLE clusters (id TEXT PRIMARY KEY, title TEXT NOT NULL, summary TEXT NOT NULL, "
+            "week_start TEXT NOT NULL, target_audience TEXT, why_it_matters TEXT, created_at TEXT NOT NULL, "
+            "generated_report TEXT)"
+        )
+        await conn.commit()
+
+    store = AsyncStore(db_path)
+    await store.init_db()
+    async with store.connection() as conn:
+        cursor = await conn.execute("PRAGMA table_info(clusters)")
+        columns = {row[1] for row in await cursor.fetchall()}
+    assert {"centroid", "signal_count", "updated_at", "lineage_id"} <= columns
+
+    await store.close()
+
+
+@pytest.mark.asyncio
+async def test_search_signals_full_text(tmp_path, sample_post, sample_full_analysis_extracted):
+    """Test full-text search ranks matches, stays in sync with writes and backfills old databases."""
+    from pain_radar.models import ExtractionState, PainSignal
+
+    db_path = str(tmp_path / "radar.sqlite3")
+    store = AsyncStore(db_path)
+    try:
+        await store.init_db()
+        await store.upsert_posts([sample_post])
+
+        analysis = sample_full_analysis_extracted
+        found_id = await store.save_signal(sample_post, analysis.extraction, score=analysis.score, run_id=1)
+        payouts = PainSignal(
+            extraction_state=ExtractionState.EXTRACTED, signal_summary="Stripe payouts delayed", pain_point="Cash flow"
+        )
+        payouts_id = await store.save_signal(sample_post, payouts, run_id=2)
+
+        # Stemmed summary match, evidence quote, post title
+        assert [r["id"] for r in await store.search_signals("payout")] == [payouts_id]
+        assert [r["id"] for r in await store.search_signals("can't find")] == [found_id]
+        assert {r["id"] for r in await store.search_signals("test title")} == {found_id, payouts_id}
+        assert await store.search_signals("   ") == []
+
+        # Query language: boolean operators, field scoping, malformed input
+        assert [r["id"] for r in await store.search_signals("title:test -stripe")] == [found_id]
+        assert [r["id"] for r in await store.search_signals("pain:cash OR user:nobody")] == [payouts_id]
+        assert [r["id"] for r in await store.search_signals("sub:test_subreddit strip*")] == [payouts_id]
+        with pytest.raises(QuerySyntaxError):
+            await store.search_signals('"stripe* (')
+
+        results = await store.search_signals("stripe")
+        assert "[Stripe]" in results[0]["snippet"]
+        assert await store.search_signals("stripe", subreddit="other") == []
+        assert await store.search_signals("stripe", min_score=1) == []
+
+        # Post title changes and deletes are reflected
+        renamed = dataclasses.replace(sample_post, title="Invoicing woes")
+        await store.upsert_posts([renamed])
+        assert len(await store.search_signals("invoicing")) == 2
+        async with store.connection() as conn:
+            await conn.execute("DELETE FROM signals WHERE id = ?", (payouts_id,))
+            await conn.commit()
+        assert await store.search_signals("payout") == []
+
+        # A database created before the index is backfilled on init
+        async with store.connection() as conn:
+            await conn.execute("DROP TABLE signals_fts")
+            await conn.commit()
+        await store.init_db()
+        assert [r["id"] for r in await store.search_signals("find")] == [found_id]
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_compress_blobs_round_trip(tmp_path, sample_post, sample_full_analysis_extracted):
+    """Compressed JSON columns read back unchanged, before and after new writes."""
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        extraction, score = sample_full_analysis_extracted.extraction, sample_full_analysis_extracted.score
+        posts = [
+            dataclasses.replace(sample_post, id=f"post{i}", top_comments=[f"Comment {i} about invoices"] * 5)
+            for i in range(40)
+        ]
+        await store.upsert_posts(posts)
+        ids = [await store.save_signal(post=post, extraction=extraction, score=score) for post in posts]
+        before = await store.get_signal_detail(ids[0])
+
+        report = await store.compress_blobs()
+        assert report["signals.raw_extraction"]["rows"] == 40
+        assert report["signals.raw_extraction"]["after"] < report["signals.raw_extraction"]["before"]
+
+        assert await store.get_signal_detail(ids[0]) == before
+        top = await store.get_top_signals(limit=1, fields=["id", "raw_score", "top_comments"])
+        assert top[0]["raw_score"] == before["raw_score"]
+
+        # New writes are compressed too, and a fresh store reads them back
+        late = dataclasses.replace(sample_post, id="late", top_comments=["A late comment about invoices"] * 5)
+        pending = dataclasses.replace(late, id="pending")
+        await store.upsert_posts([late, pending])
+        late_id = await store.save_signal(post=late, extraction=extraction, score=score)
+        storage = await store.get_storage_report()
+        raw = next(c for c in storage["columns"] if c["column"] == "raw_extraction")
+        assert raw["compressed"] == raw["rows"] == 41
+
+        reopened = AsyncStore(store.db_path)
+        try:
+            detail = await reopened.get_signal_detail(late_id)
+            assert detail["raw_extraction"] == before["raw_extraction"]
+            assert json.loads(detail["top_comments"]) == late.top_comments
+            assert [p.top_comments for p in await reopened.get_unprocessed_posts()] == [pending.top_comments]
+        finally:
+            await reopened.close()
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_evidence_and_comments_tables(tmp_path, sample_post, sample_full_analysis_extracted):
+    """Evidence and comments are stored as rows, queried with joins, and backfilled from JSON."""
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        extraction = sample_full_analysis_extracted.extraction.model_copy(
+            update={
+                "evidence": [
+                    EvidenceSignal(quote="I can't find X", source="post", signal_type="pain"),
+                    EvidenceSignal(
+                        quote="I'd pay $50/mo", source="comment", comment_index=1, signal_type="willingness_to_pay"
+                    ),
+                ]
+            }
+        )
+        await store.upsert_posts([sample_post])
+        signal_id = await store.save_signal(
+            post=sample_post, extraction=extraction, score=sample_full_analysis_extracted.score
+        )
+
+        quotes = await store.get_evidence(signal_type="willingness_to_pay", days=7)
+        assert [(q["quote"], q["signal_id"], q["subreddit"]) for q in quotes] == [
+            ("I'd pay $50/mo", signal_id, "test_subreddit")
+        ]
+        items = await store.get_unclustered_pain_points()
+        assert [e.quote for e in items[0].evidence] == ["I can't find X", "I'd pay $50/mo"]
+        assert items[0].evidence[0].signal_type == SignalType.PAIN
+        detail = await store.get_signal_detail(signal_id)
+        assert json.loads(detail["top_comments"]) == sample_post.top_comments
+
+        # A database from before the tables existed is backfilled from the JSON columns
+        async with store.connection() as conn:
+            await conn.execute("DROP TABLE evidence")
+            await conn.execute("DROP TABLE comments")
+            await conn.execute("UPDATE posts SET top_comments = ?", (json.dumps(["Old comment"]),))
+            await conn.commit()
+        await store.init_db()
+
+        assert [q["quote"] for q in await store.get_evidence()] == ["I can't find X", "I'd pay $50/mo"]
+        detail = await store.get_signal_detail(signal_id)
+        assert json.loads(detail["top_comments"]) == ["Old comment"]
+
+        # Deleting a signal or post removes its rows
+        async with store.connection() as conn:
+            await conn.execute("DELETE FROM signals WHERE id = ?", (signal_id,))
+            await conn.execute("DELETE FROM posts WHERE id = ?", (sample_post.id,))
+            await conn.commit()
+            cursor = await conn.execute("SELECT (SELECT COUNT(*) FROM evidence), (SELECT COUNT(*) FROM comments)")
+            assert tuple(await cursor.fetchone()) == (0, 0)
+    finally:
+        await store.close()
+
+
+@pytest.mark.asyncio
+async def test_archive_partitions_and_delete_posts(tmp_path, sample_post, sample_full_analysis_extracted):
+    """Old posts are grouped by month and subreddit, and deleting them takes their signals along."""
+    store = AsyncStore(str(tmp_path / "test.db"))
+    await store.init_db()
+    try:
+        old = [
+            dataclasses.replace(sample_post, id="jan1", created_utc=1704153600),  # 2024-01-02
+            dataclasses.replace(sample_post, id="jan2", created_utc=1704240000, subreddit="other"),
+            dataclasses.replace(sample_post, id="feb1", created_utc=1706918400),  # 2024-02-03
+        ]
+        recent = dataclasses.replace(sample_post, id="new", created_utc=1767225600)  # 2026-01-01
+        await store.upsert_posts([*old, recent])
+        for post in [*old, recent]:
+            await store.save_signal(
+                post=post,
+                extraction=sample_full_analysis_extracted.extraction,
+                score=sample_full_analysis_extracted.score,
+            )
+
+        partitions = await store.get_archive_partitions(before_utc=1735689600)  # 2025-01-01
+        assert [(p["month"], p["subreddit"], p["posts"]) for p in partitions] == [
+            ("2024-01", "other", 1),
+            ("2024-01", "test_subreddit", 1),
+            ("2024-02", "test_subreddit", 1),
+        ]
+
+        posts, signals = await store.get_archive_rows("2024-01", "test_subreddit", before_utc=1735689600)
+        assert [p["id"] for p in posts] == ["jan1"]
+        assert json.loads(posts[0]["top_comments"]) == sample_post.top_comments
+        assert [(s["post_id"], s["subreddit"]) for s in signals] == [("jan1", "test_subreddit")]
+        assert json.loads(signals[0]["raw_extraction"])["signal_summary"]
+
+        assert await store.delete_posts([p.id for p in old]) == {"posts": 3, "signals": 3}
+        stats = await store.get_stats()
+        assert (stats["total_posts"], stats["total_signals"]) == (1, 1)
+        async with store.connection() as conn:
+            cursor = await conn.execute("SELECT (SELECT COUNT(*) FROM evidence), (SELECT COUNT(*) FROM comments)")
+            evidence, comments = await cursor.fetchone()
+        assert evidence == len(sample_full_analysis_extracted.extraction.evidence)
+        assert comments == len(sample_post.top_comments)
+
+        await store.incremental_vacuum()
+        async with store.connection() as conn:
+            cursor = await conn.execute("PRAGMA auto_vacuum")
+            assert (await cursor.fetchone())[0] == 2
+        await store.incremental_vacuum()
+    finally:
+        await store.close()
@@ -0,0 +1,85 @@
+import numpy as np
+
+from pain_radar.vectors import HashingVectorizer, agglomerative_groups, centroid, tokenize
+
+
+def test_tokenize_drops_stopwords():
+    """Test tokenization lowercases and removes stopwords."""
+    assert tokenize("The Stripe API is down for me") == ["stripe", "api", "down"]
+
+
+def test_hashing_vectorizer_is_stable_and_normalized():
+    """Test vectors are deterministic and unit length."""
+    vectorizer = HashingVectorizer(dim=64)
+    a = vectorizer.transform_one("stripe payouts fail")
+    b = vectorizer.transform_one("stripe payouts fail")
+
+    assert a.shape == (64,)
+    assert np.array_equal(a, b)
+    assert np.isclose(np.linalg.norm(a), 1.0)
+    assert not vectorizer.transform_one("").any()
+
+
+def test_agglomerative_groups():
+    """Test grouping by cosine similarity with a size floor."""
+    vectors = np.array(
+        [[1.0, 0.0, 0.0], [0.9, 0.1, 0.0], [0.0, 0.0, 1.0], [0.95, 0.05, 0.0]],
+        dtype=np.float32,
+    )
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    assert agglomerative_groups(vectors, threshold=0.8, min_size=2) == [[0, 1, 3]]
+    assert agglomerative_groups(vectors, threshold=0.8, min_size=1) == [[0, 1, 3], [2]]
+    assert agglomerative_groups(np.zeros((0, 3)), threshold=0.8) == []
+
+
+def test_centroid_is_normalized():
+    """Test centroid of row vectors."""
+    c = centroid(np.array([[1.0, 0.0], [0.0, 1.0]]))
+    assert np.allclose(c, [np.sqrt(0.5), np.sqrt(0.5)])
+
+
+def _naive_average_linkage(vectors, threshold, min_size):
+    n = len(vectors)
+    sims = vectors @ vectors.T
+    groups = [[i] for i in range(n)]
+    while True:
+        best = None
+        for a in range(len(groups)):
+            for b in range(a + 1, len(groups)):
+                score = float(np.mean(sims[np.ix_(groups[a], groups[b])]))
+                if score >= threshold and (best is None or score > best[0] + 1e-12):
+                    best = (score, a, b)
+        if best is None:
+            break
+        _, a, b = best
+        groups[a] = groups[a] + groups[b]
+        del groups[b]
+    result = [sorted(g) for g in groups if len(g) >= min_size]
+    return sorted(result, key=lambda g: (-len(g), g[0]))
+
+
+def test_agglomerative_groups_matches_naive_average_linkage():
+    """Test the cached-neighbour implementation agrees with a brute-force reference."""
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(4, 16))
+    vectors = np.vstack([c + rng.normal(scale=0.6, size=(12, 16)) for c in centers])
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    assert agglomerative_groups(vectors, threshold=0.4) == _naive_average_linkage(vectors, 0.4, 2)
+
+
+def test_agglomerative_groups_scales_to_thousands_of_signals():
+    """Test grouping 2,000 hashed signal vectors finishes in a few seconds."""
+    import time
+
+    rng = np.random.default_rng(0)
+    topics = [f"topic{t} pain{t} tool{t} workflow{t}" for t in range(40)]
+    texts = [f"{topics[rng.integers(40)]} detail{rng.integers(500)} extra{rng.integers(500)}" for _ in range(2000)]
+    vectors = HashingVectorizer().transform(texts)
+
+    start = time.perf_counter()
+    groups = agglomerative_groups(vectors, threshold=0.3)
+    assert time.perf_counter() - start < 5.0
+    assert groups
+    assert sum(len(g) for g in groups) <= 2000